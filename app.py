@@ -1,48 +1,57 @@
 import os
-from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for, session, flash
+import time
+_boot_started = time.perf_counter()
+from flask import Flask, render_template, request, jsonify, send_from_directory, send_file, redirect, url_for, session, flash, Response, stream_with_context
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime, timedelta
 from flask_mail import Mail, Message
-import googleapiclient.discovery
 import pytz
 import isodate
-import json
 from functools import lru_cache, wraps
-import time
 import hashlib
+import hmac
 import re
 import math
-from deep_translator import GoogleTranslator
 import uuid
-from google.oauth2 import id_token
-from google_auth_oauthlib.flow import Flow
-import google.auth.transport.requests
 import logging
 from logging.handlers import RotatingFileHandler
 import requests
 from werkzeug.middleware.proxy_fix import ProxyFix
 from concurrent.futures import ThreadPoolExecutor
-from pytube import YouTube
-import speech_recognition as sr
-import moviepy.editor as mp
-import tempfile
 from services.email_service import EmailService
 from services.notification_scheduler import NotificationScheduler
 from youtube_management import register_youtube_routes
 import fcntl
-from config.security import SecurityConfig, validate_required_environment, setup_secure_logging
+from config.security import SecurityConfig, SensitiveDataFilter, validate_required_environment, setup_secure_logging
 from sqlalchemy import text
 
 
 # 공통 기능 임포트
 from common_utils.search import get_recent_popular_shorts, get_cache_key, save_to_cache, get_from_cache
-from common_utils.search import api_keys, switch_to_next_api_key, get_youtube_api_service, get_cache_stats, get_api_key_info
+from common_utils.search import api_keys, init_quota_manager, switch_to_next_api_key, get_youtube_api_service, get_cache_stats, get_api_key_info
 from common_utils.user_search import UserSearchService
+from common_utils.search_stream import stream_search, format_sse
+from common_utils.http_optimization import init_response_optimization
+from common_utils.metrics import get_metrics_registry, init_request_metrics, init_multiprocess_metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from common_utils.request_profiler import init_request_profiler, list_profiles, get_profile_path, render_profile_text
+from common_utils.load_test_auth import init_load_test_auth
 from common_utils.quota_manager import get_quota_manager
 from common_utils.quota_monitoring import get_quota_monitor, initialize_quota_monitor
-from models import db, EmailNotification, NotificationSearch, User, ChannelCategory, Channel, CategoryChannel, SearchPreference, SearchHistory, ApiLog, SavedVideo, UserApiKey, ApiKeyUsage, ApiKeyRotation
+from common_utils.api_limits import get_daily_call_count
+from common_utils.api_stats import get_admin_stats
+from common_utils.saved_videos import (
+    get_saved_videos_page, build_saved_video_values, bulk_save_videos, bulk_delete_videos,
+    bulk_update_notes, SAVED_VIDEO_BULK_LIMIT
+)
+from common_utils.category_bulk import bulk_add_channels
+from common_utils.channel_index import find_local_channels, record_channel_lookup
+from common_utils.key_health import get_key_health_registry, probe_api_key, user_key_ref, ProbeStatus, PROBE_ENDPOINT, PROBE_QUOTA_COST
+from models import db, EmailNotification, NotificationSearch, User, ChannelCategory, CategoryChannel, SearchPreference, SearchHistory, SavedVideo, UserApiKey, ApiKeyUsage, ApiKeyRotation
 from services.user_api_service import UserApiKeyManager
+from services.key_health_prober import KeyHealthProber
+from services.audit_log_service import ApiAuditLogger
+from services.search_job_service import SearchJobService
 
 cache = {}
 CACHE_TIMEOUT = 28800  # 캐시 유효시간 (초)
@@ -58,15 +67,17 @@ if os.environ.get('FLASK_ENV') != 'production':
 # 보안 설정 초기화 및 환경변수 검증 (이제 .env 로드 이후 실행)
 setup_secure_logging()  # 보안 로깅 필터 적용
 validate_required_environment()  # 필수 환경변수 검증
+init_quota_manager()  # .env 로드 이후 YouTube API 키 할당량 관리자 초기화
 
-# 스레드풀 생성
-executor = ThreadPoolExecutor(max_workers=10)
+# 스레드풀 생성 (부하 테스트로 구성 비교 시 환경변수로 조정)
+SEARCH_EXECUTOR_WORKERS = int(os.environ.get('SEARCH_EXECUTOR_WORKERS', 10))
+executor = ThreadPoolExecutor(max_workers=SEARCH_EXECUTOR_WORKERS)
 
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-    'pool_size': 5,
-    'max_overflow': 10,
+    'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
     'pool_timeout': 30,
     'pool_pre_ping': True
 }
@@ -113,8 +124,19 @@ file_handler.setFormatter(logging.Formatter(
     '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
 ))
 file_handler.setLevel(logging.INFO)
+file_handler.addFilter(SensitiveDataFilter())
 app.logger.addHandler(file_handler)
 app.logger.setLevel(logging.INFO)
+
+# 검색 경로 등 common_utils 모듈 로그 (구조화 이벤트, SEARCH_LOG_LEVEL 미만은 메시지를 만들지 않음)
+# 루트 로거 필터는 하위 로거 레코드에 적용되지 않으므로 핸들러에 마스킹 필터 추가
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+console_handler.addFilter(SensitiveDataFilter())
+common_utils_logger = logging.getLogger('common_utils')
+common_utils_logger.setLevel(os.environ.get('SEARCH_LOG_LEVEL', 'INFO').upper())
+common_utils_logger.addHandler(file_handler)
+common_utils_logger.addHandler(console_handler)
 app.logger.info('애플리케이션 시작')
 
 # 할당량 모니터링 시스템 초기화
@@ -128,20 +150,41 @@ login_manager.login_view = 'login'
 # 정적 파일 경로 설정
 app.static_folder = 'static'
 
-with app.app_context():
-    db.create_all()
-    app.logger.info('데이터베이스 테이블 생성 완료')
-    
-    # 자동 마이그레이션 실행
-    try:
-        from auto_migrate import safe_migrate
-        safe_migrate(app, db)
-    except Exception as e:
-        app.logger.warning(f'자동 마이그레이션 실패: {str(e)}')
-    
+# 스키마 생성/마이그레이션은 워커 부팅 시 실행하지 않음
+# (gunicorn 마스터의 on_starting 훅 또는 `python schema_migrations.py`에서 한 번 실행)
+if __name__ == '__main__':
+    # 로컬 실행(python app.py)은 gunicorn 훅이 없으므로 스케줄러/프로버/감사 로그 기록기가 시작되기 전에 실행
+    from schema_migrations import run_migrations
+    run_migrations(app, db)
+
 # YouTube 관리 라우트 등록
 register_youtube_routes(app)
 
+# 응답 최적화 (ETag/304, gzip·brotli 압축)
+init_response_optimization(app)
+
+# /metrics: 라우트별 응답 시간과 실행기/캐시 상태 (gunicorn 워커 간 합산은 METRICS_MULTIPROC_DIR)
+init_request_metrics(app)
+init_multiprocess_metrics()
+get_metrics_registry().register_gauge('executor_queue_depth', '백그라운드 실행기 대기 작업 수',
+                                      lambda: executor._work_queue.qsize())
+get_metrics_registry().register_gauge('search_cache_entries', '검색 결과 캐시 항목 수',
+                                      lambda: get_cache_stats()['total_entries'])
+
+# 요청 프로파일링 (관리자 X-Profile 헤더 또는 REQUEST_PROFILE_SAMPLE_RATE 표본)
+init_request_profiler(app)
+
+# 부하 테스트 로그인 우회 (LOAD_TEST_AUTH_TOKEN 설정 시에만)
+init_load_test_auth(app, db, User, runtime_info=lambda: {
+    'executor_workers': SEARCH_EXECUTOR_WORKERS,
+    'db_pool_size': app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size'],
+    'db_max_overflow': app.config['SQLALCHEMY_ENGINE_OPTIONS']['max_overflow'],
+    'gunicorn_cmd_args': os.environ.get('GUNICORN_CMD_ARGS', ''),
+})
+
+# 비동기 검색 작업 서비스 (작업 상태는 DB에 저장되어 워커 간 공유)
+search_job_service = SearchJobService(app, executor, error_formatter=lambda e: format_search_error(e))
+
 # 사용자 로딩 콜백
 @login_manager.user_loader
 def load_user(user_id):
@@ -164,6 +207,8 @@ def get_google_flow():
             print("⚠️ 개발 환경: OAUTHLIB_INSECURE_TRANSPORT 활성화")
         redirect_uris.append(f"http://localhost:{port}/login/callback")
     
+    # OAuth 라이브러리는 로딩이 무거워 로그인 요청 시점에 임포트
+    from google_auth_oauthlib.flow import Flow
     flow = Flow.from_client_config(
         {
             "web": {
@@ -221,6 +266,9 @@ def login_callback():
         
     flow.fetch_token(authorization_response=request.url)
     
+    from google.oauth2 import id_token
+    import google.auth.transport.requests
+
     credentials = flow.credentials
     request_session = requests.session()
     token_request = google.auth.transport.requests.Request(session=request_session)
@@ -319,11 +367,7 @@ def admin_users():
         users_list.append(user_dict)
 
     # 오늘 API 호출 수 계산 (관리자 계정 기준 또는 전체 합산도 가능)
-    today = datetime.utcnow().date()
-    daily_api_calls = ApiLog.query.filter(
-        ApiLog.user_id == current_user.id,
-        db.func.date(ApiLog.timestamp) == today
-    ).count()
+    daily_api_calls = get_daily_call_count(current_user.id)
 
     return render_template('admin_users.html', users=users_list, daily_api_calls=daily_api_calls)
 
@@ -367,17 +411,8 @@ def log_api_call(endpoint, params=None):
         # 보안: 파라미터에서 민감한 정보 마스킹
         safe_params = SecurityConfig.safe_log_params(params) if params else None
         
-        # API 호출 로그 저장
-        api_log = ApiLog(
-            user_id=current_user.id,
-            endpoint=endpoint,
-            params=json.dumps(safe_params) if safe_params else None
-        )
-        db.session.add(api_log)
-        
-        # 사용자의 API 호출 횟수 증가
-        current_user.api_calls += 1
-        db.session.commit()
+        # API 호출 로그 기록 요청 (ApiLog / api_calls / 일일 카운터는 백그라운드에서 일괄 반영)
+        audit_logger.log(current_user.id, endpoint, safe_params)
         
         app.logger.info(f'🔍 API 호출: {endpoint} by {current_user.email}')
 
@@ -390,12 +425,8 @@ def check_api_limits():
         
         # 승인된 사용자는 일일 호출 제한 (예: 100회)
         if current_user.is_approved():
-            # 오늘 API 호출 횟수 확인
-            today = datetime.utcnow().date()
-            daily_calls = ApiLog.query.filter(
-                ApiLog.user_id == current_user.id,
-                db.func.date(ApiLog.timestamp) == today
-            ).count()
+            # 오늘 API 호출 횟수 확인 (일일 카운터 조회)
+            daily_calls = get_daily_call_count(current_user.id) + audit_logger.pending_calls(current_user.id)
             
             if daily_calls >= 100:  # 일일 API 호출 제한
                 return False
@@ -429,11 +460,7 @@ def index():
     # 대시보드 제거: 기본 진입 시 검색 페이지를 렌더링
     
     # 오늘 API 호출 횟수 계산
-    today = datetime.utcnow().date()
-    daily_api_calls = ApiLog.query.filter(
-        ApiLog.user_id == current_user.id,
-        db.func.date(ApiLog.timestamp) == today
-    ).count()
+    daily_api_calls = get_daily_call_count(current_user.id)
     
     # 기존 index 함수 로직 유지 (카테고리, 국가, 언어 리스트 등)
     categories = [
@@ -506,6 +533,60 @@ def admin_cache_stats():
         "api_key_info": api_key_info
     })
 
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus 수집용 메트릭 (모든 워커 합계, METRICS_TOKEN 설정 시 Bearer 토큰, 미설정 시 관리자 로그인 필요)"""
+    token = os.environ.get('METRICS_TOKEN')
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return Response('unauthorized\n', status=401, mimetype='text/plain')
+    elif not (current_user.is_authenticated and current_user.is_admin()):
+        return Response('unauthorized\n', status=401, mimetype='text/plain')
+    
+    return Response(get_metrics_registry().render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/admin/profiles')
+@login_required
+def admin_profiles():
+    """관리자용 최근 요청 프로파일 목록 API"""
+    if not current_user.is_admin():
+        return jsonify({"status": "error", "message": "관리자 권한이 필요합니다."})
+    
+    limit = min(200, max(1, request.args.get('limit', 50, type=int)))
+    return jsonify({"status": "success", "profiles": list_profiles(limit)})
+
+@app.route('/admin/profiles/<profile_id>')
+@login_required
+def admin_profile_download(profile_id):
+    """관리자용 프로파일 다운로드 (.prof, ?format=text 이면 pstats 보고서)"""
+    if not current_user.is_admin():
+        return jsonify({"status": "error", "message": "관리자 권한이 필요합니다."})
+    
+    path = get_profile_path(profile_id)
+    if path is None:
+        return jsonify({"status": "error", "message": "프로파일을 찾을 수 없습니다."}), 404
+    
+    if request.args.get('format') == 'text':
+        sort = request.args.get('sort', 'cumulative')
+        if sort not in ('cumulative', 'tottime', 'ncalls'):
+            sort = 'cumulative'
+        return Response(render_profile_text(path, sort=sort), mimetype='text/plain')
+    return send_file(os.path.abspath(path), mimetype='application/octet-stream',
+                     as_attachment=True, download_name=f"{profile_id}.prof")
+
+@app.route('/admin/key-health')
+@login_required
+def admin_key_health():
+    """관리자용 API 키 서킷 브레이커 상태 API"""
+    if not current_user.is_admin():
+        return jsonify({"status": "error", "message": "관리자 권한이 필요합니다."})
+    
+    return jsonify({
+        "status": "success",
+        "key_health": get_key_health_registry().get_status(),
+        "timestamp": datetime.utcnow().isoformat()
+    })
+
 @app.route('/admin/stats')
 @login_required
 def admin_stats():
@@ -513,23 +594,8 @@ def admin_stats():
         flash('관리자 권한이 필요합니다.', 'danger')
         return redirect(url_for('index'))
     
-    # 일별 API 호출 통계
-    daily_stats = db.session.query(
-        db.func.date(ApiLog.timestamp).label('date'),
-        db.func.count().label('count')
-    ).group_by(db.func.date(ApiLog.timestamp)).order_by(db.func.date(ApiLog.timestamp).desc()).limit(30).all()
-    
-    # 사용자별 API 호출 통계
-    user_stats = db.session.query(
-        User.email,
-        db.func.count(ApiLog.id).label('call_count')
-    ).join(ApiLog, User.id == ApiLog.user_id).group_by(User.id).order_by(db.func.count(ApiLog.id).desc()).limit(20).all()
-    
-    # 엔드포인트별 API 호출 통계
-    endpoint_stats = db.session.query(
-        ApiLog.endpoint,
-        db.func.count().label('count')
-    ).group_by(ApiLog.endpoint).order_by(db.func.count().desc()).all()
+    # 일별 / 사용자별 / 엔드포인트별 API 호출 통계 (집계 테이블 조회)
+    daily_stats, user_stats, endpoint_stats = get_admin_stats()
     
     return render_template('admin_stats.html', 
                          daily_stats=daily_stats,
@@ -714,24 +780,25 @@ def api_quota_info():
 # 정적 파일 경로 설정
 app.static_folder = 'static'
 
+def parse_search_params(data):
+    """검색 요청 파라미터 파싱 및 제한 적용"""
+    return {
+        'min_views': max(100000, int(data.get('min_views', '100000'))),  # 최소 10만 조회수
+        'days_ago': min(5, max(1, int(data.get('days_ago', 5)))),  # 최대 5일, 최소 1일
+        'max_results': min(20, max(1, int(data.get('max_results', 20)))),  # 최대 20개
+        'category_id': data.get('category_id') if data.get('category_id') != 'any' else None,
+        'region_code': data.get('region_code'),
+        'language': data.get('language') if data.get('language') != 'any' else None,
+        'keyword': data.get('keyword'),
+        'channel_ids': data.get('channel_ids') or None
+    }
+
 @app.route("/search", methods=["POST"])
 @api_login_required
 def search():
     try:
-        data = request.form
-        
         # 파라미터 파싱 및 제한 적용
-        params = {
-            'min_views': max(100000, int(data.get('min_views', '100000'))),  # 최소 10만 조회수
-            'days_ago': min(5, max(1, int(data.get('days_ago', 5)))),  # 최대 5일, 최소 1일
-            'max_results': min(20, max(1, int(data.get('max_results', 20)))),  # 최대 20개
-            'category_id': data.get('category_id') if data.get('category_id') != 'any' else None,
-            'region_code': data.get('region_code'),
-            'language': data.get('language') if data.get('language') != 'any' else None,
-            'keyword': data.get('keyword'),
-            'channel_ids': data.get('channel_ids') or None
-        }
-
+        params = parse_search_params(request.form)
         
         # API 호출 로깅
         log_api_call('search', params)
@@ -740,37 +807,79 @@ def search():
         cache_key = get_cache_key(params)
         cached_results = get_from_cache(cache_key)
         if cached_results:
-            return jsonify({"status": "success", "results": cached_results, "fromCache": True})
+            return jsonify({"status": "success", "results": cached_results, "count": len(cached_results), "fromCache": True})
 
-        # 비동기 작업 시작
-        future = executor.submit(get_recent_popular_shorts, **params)
-        results = future.result(timeout=30)  # 최대 30초 대기
-        
-        # 결과 캐싱
-        save_to_cache(cache_key, results)
+        # 검색 작업 등록 후 즉시 반환 (결과는 /search/jobs/<job_id>로 조회)
+        job = search_job_service.submit(
+            current_user.id, cache_key, params, get_recent_popular_shorts,
+            on_success=lambda results: save_to_cache(cache_key, results)
+        )
         
         return jsonify({
-            "status": "success",
-            "results": results,
-            "count": len(results), 
-            "fromCache": False
-        })
+            "status": "pending",
+            "job_id": job.id,
+            "poll_url": url_for('get_search_job', job_id=job.id)
+        }), 202
     except Exception as e:
-        error_message = str(e)
         print(f"오류 발생: {e}")
-        
-        # YouTube API 할당량 초과 오류 처리 (국문/영문 모두 인식)
-        lower_msg = error_message.lower()
-        if ("모든" in error_message and ("할당량" in error_message or "api 키" in error_message)) or \
-           ("quota" in lower_msg and ("exceeded" in lower_msg or "daily" in lower_msg)) or \
-           ("api key not valid" in lower_msg or "forbidden" in lower_msg or "invalid" in lower_msg):
-            return jsonify({
-                "status": "quota_exceeded",
-                "message": "모든 YouTube API 키의 할당량이 초과되었거나 사용이 제한되었습니다.",
-                "user_message": "YouTube API 일일 할당량이 소진되었거나 일시적으로 제한되었습니다. 잠시 후 다시 시도해주세요."
-            })
-        
-        return jsonify({"status": "error", "message": error_message})
+        return jsonify(format_search_error(e))
+
+
+@app.route('/search/stream', methods=['GET'])
+@api_login_required
+def search_stream():
+    """검색 결과를 채널/배치 단위로 스트리밍 (Server-Sent Events, EventSource 호환을 위해 GET)"""
+    try:
+        params = parse_search_params(request.args)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    
+    # API 호출 로깅
+    log_api_call('search', params)
+    
+    cache_key = get_cache_key(params)
+    cached_results = get_from_cache(cache_key)
+    
+    def generate():
+        if cached_results:
+            yield format_sse('done', {"status": "success", "results": cached_results,
+                                      "count": len(cached_results), "fromCache": True})
+            return
+        yield from stream_search(
+            executor, get_recent_popular_shorts, params, format_search_error,
+            on_success=lambda results: save_to_cache(cache_key, results)
+        )
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/search/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_search_job(job_id):
+    """검색 작업 상태/결과 조회"""
+    response = search_job_service.get_job_response(job_id, current_user.id)
+    if response is None:
+        return jsonify({"status": "error", "message": "검색 작업을 찾을 수 없습니다."}), 404
+    return jsonify(response)
+
+
+def format_search_error(e):
+    """검색 오류를 응답 JSON으로 변환"""
+    error_message = str(e)
+    
+    # YouTube API 할당량 초과 오류 처리 (국문/영문 모두 인식)
+    lower_msg = error_message.lower()
+    if ("모든" in error_message and ("할당량" in error_message or "api 키" in error_message)) or \
+       ("quota" in lower_msg and ("exceeded" in lower_msg or "daily" in lower_msg)) or \
+       ("api key not valid" in lower_msg or "forbidden" in lower_msg or "invalid" in lower_msg):
+        return {
+            "status": "quota_exceeded",
+            "message": "모든 YouTube API 키의 할당량이 초과되었거나 사용이 제한되었습니다.",
+            "user_message": "YouTube API 일일 할당량이 소진되었거나 일시적으로 제한되었습니다. 잠시 후 다시 시도해주세요."
+        }
+    
+    return {"status": "error", "message": error_message}
 
 
 @app.route('/api/categories', methods=['GET'])
@@ -865,43 +974,9 @@ def add_channels_to_category(category_id):
     if not data.get('channels') or not isinstance(data['channels'], list):
         return jsonify({"status": "error", "message": "채널 목록이 유효하지 않습니다."})
     
-    added_count = 0
-    errors = []
-    
     try:
-        for channel_data in data['channels']:
-            # 채널 ID가 없으면 스킵
-            if not channel_data.get('id'):
-                continue
-                
-            # 채널이 이미 데이터베이스에 있는지 확인
-            channel = Channel.query.get(channel_data['id'])
-            if not channel:
-                # 새 채널 추가
-                channel = Channel(
-                    id=channel_data['id'],
-                    title=channel_data.get('title', ''),
-                    description=channel_data.get('description', ''),
-                    thumbnail=channel_data.get('thumbnail', '')
-                )
-                db.session.add(channel)
-            
-            # 이미 카테고리에 추가되어 있는지 확인
-            existing = CategoryChannel.query.filter_by(
-                category_id=category.id, 
-                channel_id=channel.id
-            ).first()
-            
-            if not existing:
-                # 카테고리에 채널 연결 (id는 자동 생성되도록 지정하지 않음)
-                cat_channel = CategoryChannel(
-                    category_id=category.id,
-                    channel_id=channel.id
-                )
-                db.session.add(cat_channel)
-                added_count += 1
-        
-        # 모든 처리가 끝난 후 한 번에 커밋
+        # 기존 채널/연결을 미리 조회하고 없는 행만 일괄 삽입
+        added_count = bulk_add_channels({category.id: data['channels']})[category.id]
         db.session.commit()
         
     except Exception as e:
@@ -1082,6 +1157,12 @@ def channel_search():
         query = request.args.get('q', '')
         if not query:
             return jsonify({"status": "error", "message": "검색어가 필요합니다."})
+        
+        # 로컬 채널 인덱스를 먼저 확인 (없을 때만 YouTube API 호출, refresh=1이면 인덱스 건너뜀)
+        refresh = request.args.get('refresh', '').lower() in ('1', 'true')
+        local_channels = [] if refresh else find_local_channels(query)
+        if local_channels:
+            return jsonify({"status": "success", "channels": local_channels, "source": "index"})
             
         if not api_keys:
             return jsonify({"status": "error", "message": "YouTube API 키가 설정되지 않았습니다."})
@@ -1129,6 +1210,7 @@ def channel_search():
                                 'thumbnail': item['snippet']['thumbnails']['default']['url'] if 'default' in item['snippet']['thumbnails'] else '',
                                 'description': item['snippet']['description']
                             }
+                            record_channel_lookup([channel], handle=handle)
                             return jsonify({"status": "success", "channels": [channel]})
                     except Exception as handle_error:
                         # forHandle 검색 실패 시 대체 방법 사용
@@ -1170,6 +1252,7 @@ def channel_search():
                     filtered_channels = exact_matches if exact_matches else partial_matches[:3]  # 최대 3개로 제한
                     
                     if filtered_channels:
+                        record_channel_lookup(filtered_channels)
                         return jsonify({"status": "success", "channels": filtered_channels})
                 
                 # 일반 검색으로 진행
@@ -1187,6 +1270,7 @@ def channel_search():
                     'description': item['snippet']['description']
                 } for item in response.get('items', [])]
                 
+                record_channel_lookup(channels)
                 return jsonify({"status": "success", "channels": channels})
                 
             except Exception as e:
@@ -1221,50 +1305,29 @@ def import_categories():
     if not data or not data.get('categories') or not isinstance(data['categories'], list):
         return jsonify({"status": "error", "message": "유효하지 않은 데이터 형식입니다."})
     
-    # 기존 카테고리 삭제
-    ChannelCategory.query.filter_by(user_id=current_user.id).delete()
+    # 기존 카테고리 삭제 (일괄 삭제는 ORM cascade를 거치지 않으므로 연결도 직접 삭제)
+    old_category_ids = db.session.query(ChannelCategory.id).filter_by(user_id=current_user.id)
+    CategoryChannel.query.filter(CategoryChannel.category_id.in_(old_category_ids)).delete(synchronize_session=False)
+    ChannelCategory.query.filter_by(user_id=current_user.id).delete(synchronize_session=False)
     
-    imported_count = 0
+    # 새 카테고리 생성 (ID 할당을 위해 한 번에 플러시)
+    imported = []
     for cat_data in data['categories']:
         # 기본 정보 확인
         if not cat_data.get('name'):
             continue
-            
-        # 새 카테고리 생성
         category = ChannelCategory(
             user_id=current_user.id,
             name=cat_data['name'],
             description=cat_data.get('description', '')
         )
-        db.session.add(category)
-        db.session.flush()  # ID 할당을 위해 플러시
-        
-        # 채널 추가
-        channels = cat_data.get('channels', [])
-        for channel_data in channels:
-            if not channel_data.get('id'):
-                continue
-                
-            # 채널 존재 여부 확인
-            channel = Channel.query.get(channel_data['id'])
-            if not channel:
-                # 새 채널 추가
-                channel = Channel(
-                    id=channel_data['id'],
-                    title=channel_data.get('title', ''),
-                    description=channel_data.get('description', ''),
-                    thumbnail=channel_data.get('thumbnail', '')
-                )
-                db.session.add(channel)
-                
-            # 카테고리에 채널 연결
-            cat_channel = CategoryChannel(
-                category_id=category.id,
-                channel_id=channel.id
-            )
-            db.session.add(cat_channel)
-        
-        imported_count += 1
+        imported.append((category, cat_data.get('channels', [])))
+    db.session.add_all([category for category, _ in imported])
+    db.session.flush()
+    
+    # 채널 추가
+    bulk_add_channels({category.id: channels for category, channels in imported})
+    imported_count = len(imported)
     
     db.session.commit()
     
@@ -1286,67 +1349,40 @@ def merge_categories():
     new_categories_count = 0
     updated_categories_count = 0
     
+    # 사용자의 기존 카테고리를 이름으로 한 번에 조회
+    categories_by_name = {
+        category.name: category
+        for category in ChannelCategory.query.filter_by(user_id=current_user.id)
+    }
+    existing_ids = {category.id for category in categories_by_name.values()}
+    
+    channels_by_name = {}
     for cat_data in data['categories']:
         # 기본 정보 확인
         if not cat_data.get('name'):
             continue
             
-        # 동일한 이름의 카테고리가 있는지 확인
-        existing = ChannelCategory.query.filter_by(
-            user_id=current_user.id, 
-            name=cat_data['name']
-        ).first()
-        
-        if not existing:
+        if cat_data['name'] not in categories_by_name:
             # 새 카테고리 생성
-            category = ChannelCategory(
+            categories_by_name[cat_data['name']] = ChannelCategory(
                 user_id=current_user.id,
                 name=cat_data['name'],
                 description=cat_data.get('description', '')
             )
-            db.session.add(category)
-            db.session.flush()  # ID 할당을 위해 플러시
+            db.session.add(categories_by_name[cat_data['name']])
             new_categories_count += 1
-        else:
-            category = existing
-            
-        # 채널 추가
-        channels = cat_data.get('channels', [])
-        added_channels = 0
-        
-        for channel_data in channels:
-            if not channel_data.get('id'):
-                continue
-                
-            # 이미 카테고리에 추가된 채널인지 확인
-            existing_channel = CategoryChannel.query.filter_by(
-                category_id=category.id, 
-                channel_id=channel_data['id']
-            ).first()
-            
-            if not existing_channel:
-                # 채널 존재 여부 확인
-                channel = Channel.query.get(channel_data['id'])
-                if not channel:
-                    # 새 채널 추가
-                    channel = Channel(
-                        id=channel_data['id'],
-                        title=channel_data.get('title', ''),
-                        description=channel_data.get('description', ''),
-                        thumbnail=channel_data.get('thumbnail', '')
-                    )
-                    db.session.add(channel)
-                    
-                # 카테고리에 채널 연결
-                cat_channel = CategoryChannel(
-                    category_id=category.id,
-                    channel_id=channel.id
-                )
-                db.session.add(cat_channel)
-                added_channels += 1
-                
-        if added_channels > 0 and existing:
-            updated_categories_count += 1
+        channels_by_name.setdefault(cat_data['name'], []).extend(cat_data.get('channels', []))
+    
+    db.session.flush()  # ID 할당을 위해 플러시
+    
+    # 채널 추가
+    added_counts = bulk_add_channels({
+        categories_by_name[name].id: channels for name, channels in channels_by_name.items()
+    })
+    updated_categories_count = sum(
+        1 for category_id, added in added_counts.items()
+        if added > 0 and category_id in existing_ids
+    )
     
     db.session.commit()
     
@@ -1606,11 +1642,19 @@ try:
     app.logger.info(f"프로세스 {os.getpid()}에서 스케줄러 락 획득, 스케줄러 시작...")
     scheduler = NotificationScheduler(app, db, email_service)
     scheduler.start()
+
+    # API 키 상태 프로버도 락을 잡은 프로세스 하나에서만 실행 (워커 수만큼 확인 요청/할당량이 늘지 않도록)
+    key_health_prober = None
+    if os.environ.get('KEY_PROBE_ENABLED', 'true').lower() == 'true':
+        key_health_prober = KeyHealthProber(app)
+        key_health_prober.start()
     
     # 종료 시 정리
     def shutdown_scheduler():
         app.logger.info("애플리케이션 종료: 스케줄러 종료 중...")
-        if hasattr(scheduler, 'scheduler') and scheduler.scheduler.running:
+        if key_health_prober is not None:
+            key_health_prober.stop()
+        if scheduler.scheduler is not None and scheduler.scheduler.running:
             scheduler.scheduler.shutdown()
         # 잠금 해제
         fcntl.lockf(lock_file, fcntl.LOCK_UN)
@@ -1625,6 +1669,13 @@ except IOError:
     # 다른 프로세스가 이미 잠금을 획득함
     app.logger.info(f"프로세스 {os.getpid()}에서 스케줄러 락 획득 실패, 스케줄러 초기화 건너뜀")
 
+# API 호출 감사 로그 비동기 기록기 (종료 시 남은 로그 기록)
+audit_logger = ApiAuditLogger(app)
+audit_logger.start()
+
+import atexit
+atexit.register(audit_logger.stop)
+
 # ===================== 저장된 영상 관리 API =====================
 
 @app.route('/api/saved-videos', methods=['POST'])
@@ -1635,10 +1686,10 @@ def save_video():
         data = request.get_json()
         
         # 필수 데이터 검증
-        required_fields = ['video_id', 'video_title', 'channel_title', 'video_url']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'success': False, 'message': f'{field}는 필수 입력값입니다.'}), 400
+        try:
+            values = build_saved_video_values(data)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
         
         # 이미 저장된 영상인지 확인
         existing_video = SavedVideo.query.filter_by(
@@ -1650,19 +1701,7 @@ def save_video():
             return jsonify({'success': False, 'message': '이미 저장된 영상입니다.'}), 409
         
         # 새 저장된 영상 생성
-        saved_video = SavedVideo(
-            user_id=current_user.id,
-            video_id=data['video_id'],
-            video_title=data['video_title'],
-            channel_title=data['channel_title'],
-            channel_id=data.get('channel_id'),
-            thumbnail_url=data.get('thumbnail_url'),
-            video_url=data['video_url'],
-            view_count=data.get('view_count', 0),
-            duration=data.get('duration'),
-            published_at=datetime.fromisoformat(data['published_at'].replace('Z', '+00:00')) if data.get('published_at') else None,
-            notes=data.get('notes', '')
-        )
+        saved_video = SavedVideo(user_id=current_user.id, **values)
         
         db.session.add(saved_video)
         db.session.commit()
@@ -1683,35 +1722,146 @@ def save_video():
 @app.route('/api/saved-videos', methods=['GET'])
 @login_required
 def get_saved_videos():
-    """저장된 영상 목록 조회 API"""
+    """저장된 영상 목록 조회 API (cursor: 키셋 페이지네이션, page: 기존 페이지 번호 방식)"""
     try:
-        page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 20)), 50)  # 최대 50개
         
-        # 저장된 영상 조회 (최신순)
-        pagination = SavedVideo.query.filter_by(user_id=current_user.id)\
-            .order_by(SavedVideo.saved_at.desc())\
-            .paginate(page=page, per_page=per_page, error_out=False)
+        if 'page' in request.args and 'cursor' not in request.args:
+            # 기존 페이지 번호 방식 (COUNT + OFFSET)
+            page = int(request.args.get('page', 1))
+            pagination = SavedVideo.query.filter_by(user_id=current_user.id)\
+                .order_by(SavedVideo.saved_at.desc(), SavedVideo.id.desc())\
+                .paginate(page=page, per_page=per_page, error_out=False)
+            
+            return jsonify({
+                'success': True,
+                'videos': [video.to_dict() for video in pagination.items],
+                'pagination': {
+                    'page': page,
+                    'per_page': per_page,
+                    'total': pagination.total,
+                    'pages': pagination.pages,
+                    'has_next': pagination.has_next,
+                    'has_prev': pagination.has_prev
+                }
+            })
         
-        videos = [video.to_dict() for video in pagination.items]
+        # 키셋 페이지네이션: (saved_at, id) 기준으로 이전 페이지 마지막 영상 다음부터 조회
+        cursor = request.args.get('cursor') or None
+        try:
+            videos, next_cursor = get_saved_videos_page(current_user.id, cursor, per_page)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        
+        pagination = {
+            'per_page': per_page,
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
+        # 전체 개수는 첫 페이지에서만 계산
+        if not cursor:
+            pagination['total'] = SavedVideo.query.filter_by(user_id=current_user.id).count()
         
         return jsonify({
             'success': True,
-            'videos': videos,
-            'pagination': {
-                'page': page,
-                'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
-            }
+            'videos': [video.to_dict() for video in videos],
+            'pagination': pagination
         })
         
     except Exception as e:
         app.logger.error(f"저장된 영상 조회 중 오류: {str(e)}")
         return jsonify({'success': False, 'message': '저장된 영상 조회 중 오류가 발생했습니다.'}), 500
 
+def _get_bulk_items(data, key):
+    """일괄 작업 요청에서 목록 추출 (형식 오류/개수 초과 시 ValueError)"""
+    items = (data or {}).get(key)
+    if not isinstance(items, list) or not items:
+        raise ValueError(f'{key} 목록이 필요합니다.')
+    if len(items) > SAVED_VIDEO_BULK_LIMIT:
+        raise ValueError(f'한 번에 최대 {SAVED_VIDEO_BULK_LIMIT}개까지 처리할 수 있습니다.')
+    return items
+
+@app.route('/api/saved-videos/bulk', methods=['POST'])
+@login_required
+def bulk_save_saved_videos():
+    """영상 일괄 저장 API (이미 저장된 영상은 건너뜀)"""
+    try:
+        try:
+            items = _get_bulk_items(request.get_json(), 'videos')
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        
+        result = bulk_save_videos(current_user.id, items)
+        db.session.commit()
+        
+        app.logger.info(f"사용자 {current_user.email}가 영상 {len(result['saved'])}개를 일괄 저장했습니다.")
+        
+        return jsonify({
+            'success': True,
+            'message': f"{len(result['saved'])}개의 영상이 저장되었습니다.",
+            'saved_count': len(result['saved']),
+            'videos': [video.to_dict() for video in result['saved']],
+            'duplicates': result['duplicates'],
+            'invalid': result['invalid']
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"영상 일괄 저장 중 오류: {str(e)}")
+        return jsonify({'success': False, 'message': '영상 일괄 저장 중 오류가 발생했습니다.'}), 500
+
+@app.route('/api/saved-videos/bulk-delete', methods=['POST'])
+@login_required
+def bulk_delete_saved_videos():
+    """저장된 영상 일괄 삭제 API"""
+    try:
+        try:
+            ids = [int(video_id) for video_id in _get_bulk_items(request.get_json(), 'ids')]
+        except (ValueError, TypeError) as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        
+        deleted_count = bulk_delete_videos(current_user.id, ids)
+        db.session.commit()
+        
+        app.logger.info(f"사용자 {current_user.email}가 저장된 영상 {deleted_count}개를 일괄 삭제했습니다.")
+        
+        return jsonify({
+            'success': True,
+            'message': f'{deleted_count}개의 영상이 삭제되었습니다.',
+            'deleted_count': deleted_count
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"저장된 영상 일괄 삭제 중 오류: {str(e)}")
+        return jsonify({'success': False, 'message': '영상 일괄 삭제 중 오류가 발생했습니다.'}), 500
+
+@app.route('/api/saved-videos/bulk-notes', methods=['PUT'])
+@login_required
+def bulk_update_saved_video_notes():
+    """저장된 영상 메모 일괄 수정 API"""
+    try:
+        try:
+            items = _get_bulk_items(request.get_json(), 'videos')
+            notes_by_id = {int(item['id']): item.get('notes', '') for item in items}
+        except (ValueError, TypeError, KeyError) as e:
+            return jsonify({'success': False, 'message': f'유효하지 않은 요청입니다: {str(e)}'}), 400
+        
+        updated, not_found = bulk_update_notes(current_user.id, notes_by_id)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': f'{len(updated)}개의 메모가 업데이트되었습니다.',
+            'updated_count': len(updated),
+            'not_found': not_found
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"영상 메모 일괄 업데이트 중 오류: {str(e)}")
+        return jsonify({'success': False, 'message': '메모 일괄 업데이트 중 오류가 발생했습니다.'}), 500
+
 @app.route('/api/saved-videos/<int:video_id>', methods=['DELETE'])
 @login_required
 def delete_saved_video(video_id):
@@ -1894,52 +2044,39 @@ def test_user_api_key(key_id):
         manager = UserApiKeyManager(current_user.id)
         decrypted_key = manager.decrypt_api_key(api_key_obj.api_key)
         
-        # 간단한 API 호출 테스트
-        import googleapiclient.discovery
-        import time
-        
-        start_time = time.time()
-        youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=decrypted_key)
-        
         # 가벼운 테스트 요청 (할당량 1 소모)
-        test_response = youtube.search().list(
-            part="snippet",
-            q="test",
-            type="video",
-            maxResults=1
-        ).execute()
+        result = probe_api_key(decrypted_key)
+        response_time = round(result.response_time * 1000, 2)  # 밀리초 단위
         
-        response_time = round((time.time() - start_time) * 1000, 2)  # 밀리초 단위
-        
-        # 테스트 성공 기록
+        # 테스트 결과 기록 (키 상태 서킷 브레이커에도 반영)
+        get_key_health_registry().record_probe(user_key_ref(api_key_obj.id), result)
         manager.current_key = api_key_obj
-        manager.record_api_usage("search.list", success=True, response_time=response_time/1000)
-        
-        return jsonify({
-            'success': True, 
-            'message': 'API 키가 정상적으로 작동합니다.',
-            'response_time': f"{response_time}ms",
-            'items_found': len(test_response.get('items', []))
-        })
+        manager.record_api_usage(PROBE_ENDPOINT, quota_cost=PROBE_QUOTA_COST,
+                                 success=result.status == ProbeStatus.OK,
+                                 error_message=result.error_message or None,
+                                 response_time=result.response_time)
         
-    except Exception as e:
-        error_str = str(e).lower()
-        
-        # 테스트 실패 기록
-        if 'api_key_obj' in locals():
-            manager = UserApiKeyManager(current_user.id)
-            manager.current_key = api_key_obj
-            manager.record_api_usage("search.list", success=False, error_message=str(e))
+        if result.status == ProbeStatus.OK:
+            return jsonify({
+                'success': True, 
+                'message': 'API 키가 정상적으로 작동합니다.',
+                'response_time': f"{response_time}ms",
+                'items_found': result.items_found
+            })
         
-        if 'quota' in error_str or 'exceeded' in error_str:
+        if result.status == ProbeStatus.QUOTA_EXCEEDED:
             message = 'API 키는 유효하지만 할당량이 초과되었습니다.'
-        elif 'invalid' in error_str or 'forbidden' in error_str:
+        elif result.status == ProbeStatus.INVALID:
             message = '유효하지 않은 API 키입니다.'
         else:
-            message = f'API 키 테스트 중 오류가 발생했습니다: {str(e)}'
+            message = f'API 키 테스트 중 오류가 발생했습니다: {result.error_message}'
         
-        app.logger.error(f"API 키 테스트 중 오류: {str(e)}")
+        app.logger.error(f"API 키 테스트 중 오류: {result.error_message}")
         return jsonify({'success': False, 'message': message}), 400
+        
+    except Exception as e:
+        app.logger.error(f"API 키 테스트 중 오류: {str(e)}")
+        return jsonify({'success': False, 'message': f'API 키 테스트 중 오류가 발생했습니다: {str(e)}'}), 400
 
 @app.route('/api/user-api-keys/statistics', methods=['GET'])
 @login_required
@@ -2078,6 +2215,9 @@ def dashboard():
 def health():
     return jsonify({"status": "ok"})
 
+# 워커 부팅 시간 (모듈 로딩 시작부터 라우트 등록 완료까지)
+app.logger.info(f"워커 준비 완료: PID={os.getpid()}, 부팅 {time.perf_counter() - _boot_started:.2f}초")
+
 if __name__ == '__main__':
         # 이메일 서비스 및 스케줄러 설정
     email_service = EmailService(app)
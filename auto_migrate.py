@@ -208,7 +208,45 @@ def check_and_add_columns(app, db):
             except Exception as e:
                 print(f"⚠️ 사용자 API 키 테이블 마이그레이션 중 오류: {str(e)}")
                 db.session.rollback()
-            
+
+            # api_log 사용자별 기간 조회 인덱스 (기존 테이블에는 create_all이 추가하지 않음)
+            try:
+                db.session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_api_log_user_timestamp ON api_log (user_id, timestamp)"
+                ))
+                db.session.commit()
+                print("✅ api_log (user_id, timestamp) 인덱스 확인 완료")
+            except Exception as e:
+                print(f"⚠️ api_log 인덱스 생성 중 오류: {str(e)}")
+                db.session.rollback()
+
+            # saved_videos 조회수 갱신 일시 컬럼 (백그라운드 통계 갱신)
+            try:
+                if 'saved_videos' in tables:
+                    saved_video_columns = [col['name'] for col in inspector.get_columns('saved_videos')]
+                    if 'stats_updated_at' not in saved_video_columns:
+                        db.session.execute(text("ALTER TABLE saved_videos ADD COLUMN stats_updated_at TIMESTAMP"))
+                        print("✅ saved_videos.stats_updated_at 컬럼 추가 완료")
+                    db.session.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_saved_video_stats_updated ON saved_videos (stats_updated_at)"
+                    ))
+                    db.session.commit()
+            except Exception as e:
+                print(f"⚠️ saved_videos 컬럼 확인/추가 중 오류: {str(e)}")
+                db.session.rollback()
+
+            # category_channel 카테고리별 연결 조회 인덱스
+            try:
+                db.session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_category_channel_category "
+                    "ON category_channel (category_id, channel_id)"
+                ))
+                db.session.commit()
+                print("✅ category_channel (category_id, channel_id) 인덱스 확인 완료")
+            except Exception as e:
+                print(f"⚠️ category_channel 인덱스 생성 중 오류: {str(e)}")
+                db.session.rollback()
+
             return True
             
     except Exception as e:
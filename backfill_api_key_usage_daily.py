@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+API 키 일별 사용량 롤업 백필 스크립트
+api_key_usage 원본 기록으로부터 지정한 날짜 범위의 api_key_usage_daily 행을 재구성합니다.
+범위 밖의 롤업은 그대로 둡니다. 보존 기간 정리(API_KEY_USAGE_RETENTION_DAYS)로 원본이
+일부라도 삭제된 날짜는 롤업이 줄어들므로 원본이 온전히 남아 있는 날짜부터 지정하세요.
+
+사용법:
+    python backfill_api_key_usage_daily.py 2026-07-01                      # 시작일부터 전체 사용자
+    python backfill_api_key_usage_daily.py 2026-07-01 --end 2026-07-31     # 날짜 범위
+    python backfill_api_key_usage_daily.py 2026-07-01 --user <user_id>     # 특정 사용자
+"""
+
+import os
+import sys
+import argparse
+from datetime import date
+from flask import Flask
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models import db, ApiKeyUsage
+from services.user_api_service import rebuild_usage_rollup
+
+# Flask 앱 초기화
+app = Flask(__name__)
+
+# 환경 변수에서 데이터베이스 URL 가져오기
+db_url = os.environ.get('DATABASE_URL', '')
+if db_url.startswith('postgres://'):
+    db_url = db_url.replace('postgres://', 'postgresql://', 1)
+
+if not db_url:
+    print("❌ DATABASE_URL 환경변수가 설정되지 않았습니다.")
+    sys.exit(1)
+
+app.config['SQLALCHEMY_DATABASE_URI'] = db_url
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='API 키 일별 사용량 롤업 재구성')
+    parser.add_argument('start_date', type=date.fromisoformat, help='재구성 시작일 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--end', type=date.fromisoformat, help='재구성 종료일 (YYYY-MM-DD, 포함, 기본: 마지막 원본 날짜)')
+    parser.add_argument('--user', help='특정 사용자 ID만 재구성')
+    args = parser.parse_args(argv)
+
+    with app.app_context():
+        # 롤업 테이블이 없으면 생성
+        db.create_all()
+
+        earliest = db.session.query(db.func.min(ApiKeyUsage.timestamp)).scalar()
+        if earliest is not None and earliest.date() >= args.start_date:
+            print(f"⚠️ 가장 오래된 원본 기록: {earliest} (이 날짜가 보존 기간 정리로 일부만 남았다면 다음 날부터 지정)")
+
+        target = f"사용자 {args.user}" if args.user else "전체 사용자"
+        end = args.end or '마지막 원본 날짜'
+        print(f"🔄 API 키 일별 롤업 재구성 시작 ({target}, {args.start_date} ~ {end})...")
+
+        try:
+            row_count = rebuild_usage_rollup(args.start_date, args.end, args.user)
+            print(f"✅ 롤업 재구성 완료: {row_count}개 행 생성")
+            return True
+        except Exception as e:
+            print(f"❌ 롤업 재구성 실패: {str(e)}")
+            return False
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,61 @@
+# benchmarks/import_time.py
+"""
+워커 부팅 시 임포트 시간 측정 (python -X importtime)
+- 새 인터프리터에서 부팅 모듈을 임포트하고 누적 임포트 시간 상위 모듈 출력
+- tests/test_import_time.py가 같은 측정 함수로 예산/지연 임포트를 확인
+
+사용법:
+    python -m benchmarks.import_time [모듈 ...]
+"""
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.py가 부팅 시 임포트하는 모듈 (app.py 자체는 pytube 등 선택 의존성 때문에 제외)
+BOOT_MODULES = [
+    'common_utils.search',
+    'common_utils.user_search',
+    'services.user_api_service',
+    'services.notification_scheduler',
+    'services.key_health_prober',
+    'services.saved_video_stats_service',
+]
+
+_LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def measure_import_time(modules):
+    """새 인터프리터에서 -X importtime으로 임포트하고 모듈별 (이름, 자체 us, 누적 us, 깊이) 반환"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def total_import_ms(entries):
+    """최상위 임포트(깊이 0)의 누적 시간 합계 (ms)"""
+    return sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+
+
+def main(argv=None):
+    # 누적 임포트 시간 상위 모듈 출력
+    modules = (sys.argv[1:] if argv is None else argv) or BOOT_MODULES
+    entries = measure_import_time(modules)
+    print(f"⏱️ 부팅 모듈 임포트: 총 {total_import_ms(entries):.0f}ms")
+    for name, self_us, cumulative_us, depth in sorted(entries, key=lambda e: e[2], reverse=True)[:25]:
+        print(f"{cumulative_us / 1000:8.1f}ms {self_us / 1000:8.1f}ms  {'  ' * depth}{name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
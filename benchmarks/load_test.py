@@ -0,0 +1,357 @@
+# benchmarks/load_test.py
+"""
+로컬 인스턴스 부하 테스트
+- 가상 사용자(스레드)마다 /_loadtest/login 으로 로그인 후 트래픽 비율(mix)에 따라 작업 반복
+  search_hit: 자주 쓰는 검색 조건 (캐시 적중, 처음 한 번은 작업 등록 후 완료까지 대기)
+  search_miss: 매번 다른 검색 조건 (작업 등록 → /search/jobs 폴링 → 완료까지 시간)
+  categories: 카테고리 생성 → 목록 → 삭제
+  saved_videos: 영상 저장 → 목록 → 삭제
+  dashboard: 관리 대시보드 통계
+- 요청 종류별 처리량, p50/p95/p99 응답 시간, 오류율 보고 (--json / --baseline으로 구성 간 비교)
+
+서버 준비 (검색은 로컬 YouTube API 대역 서버 사용):
+    python -m benchmarks.youtube_api_server --port 8765 --latency-ms 100
+    YOUTUBE_API_BASE_URL=http://127.0.0.1:8765 YOUTUBE_API_KEY=load-key LOAD_TEST_AUTH_TOKEN=<16자 이상> \\
+        gunicorn app:app --workers 2 --threads 4
+
+사용법:
+    LOAD_TEST_AUTH_TOKEN=<토큰> python -m benchmarks.load_test --base-url http://127.0.0.1:8000 \\
+        --users 20 --duration 60 [--mix search_hit=30,search_miss=10,categories=20,saved_videos=25,dashboard=15] \\
+        [--label w2t4] [--json w2t4.json] [--baseline before.json]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+import requests
+
+DEFAULT_MIX = {'search_hit': 30, 'search_miss': 10, 'categories': 20, 'saved_videos': 25, 'dashboard': 15}
+# 로컬 대역 서버 합성 말뭉치의 채널 ID
+DEFAULT_CHANNEL_IDS = ['UCbench0000', 'UCbench0001', 'UCbench0002', 'UCbench0003', 'UCbench0004']
+# 캐시 적중용 고정 검색 조건 수
+HOT_QUERIES = 3
+PERCENTILES = (50, 95, 99)
+# HTTP 요청이 아닌 검색 단위 기록 (전체 요청 수/처리량 합계에서 제외)
+LOGICAL_OPERATIONS = ('search_hit', 'search_miss')
+
+
+def parse_mix(text):
+    """'search_hit=30,dashboard=10' 형식의 트래픽 비율 파싱"""
+    mix = {}
+    for part in (text or '').split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"알 수 없는 작업: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return mix or dict(DEFAULT_MIX)
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def classify_response(response):
+    """응답을 오류 이유로 분류 (정상이면 None)"""
+    if response.status_code >= 400:
+        return f"http_{response.status_code}"
+    if 300 <= response.status_code < 400:
+        # 로그인 세션이 풀린 경우 등
+        return 'redirect'
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if isinstance(body, dict):
+        if body.get('status') in ('error', 'quota_exceeded'):
+            return body['status']
+        if body.get('success') is False:
+            return 'failed'
+    return None
+
+
+class LoadStats:
+    """요청 종류별 응답 시간/오류 수집 (가상 사용자 스레드 간 공유)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, name, seconds, error=None):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            if error:
+                self.errors.setdefault(name, Counter())[error] += 1
+
+    def summary(self):
+        elapsed = max((self.finished or time.perf_counter()) - (self.started or 0), 1e-9)
+        rows = []
+        with self.lock:
+            for name in sorted(self.latencies):
+                values = sorted(self.latencies[name])
+                errors = self.errors.get(name, Counter())
+                row = {
+                    'name': name,
+                    'count': len(values),
+                    'rps': round(len(values) / elapsed, 2),
+                    'error_rate': round(sum(errors.values()) / len(values), 4),
+                    'errors': dict(errors),
+                }
+                for pct in PERCENTILES:
+                    row[f'p{pct}_ms'] = round(percentile(values, pct) * 1000, 1)
+                rows.append(row)
+            requests_only = [name for name in self.latencies if name not in LOGICAL_OPERATIONS]
+            total = sum(len(self.latencies[name]) for name in requests_only)
+            total_errors = sum(sum(self.errors.get(name, Counter()).values()) for name in requests_only)
+        return {
+            'elapsed_s': round(elapsed, 2),
+            'requests': total,
+            'rps': round(total / elapsed, 2),
+            'error_rate': round(total_errors / total, 4) if total else 0.0,
+            'operations': rows,
+        }
+
+
+class VirtualUser:
+    """로그인 세션 하나로 작업을 반복하는 가상 사용자"""
+
+    def __init__(self, index, options, stats):
+        self.index = index
+        self.options = options
+        self.stats = stats
+        self.session = requests.Session()
+        self.random = random.Random(options.seed + index)
+        self.server_info = None
+
+    def request(self, name, method, path, **kwargs):
+        """요청 1회 실행 후 응답 시간/오류 기록"""
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, self.options.base_url + path, allow_redirects=False,
+                                            timeout=self.options.timeout, **kwargs)
+            error = classify_response(response)
+        except requests.RequestException as e:
+            response, error = None, type(e).__name__
+        self.stats.record(name, time.perf_counter() - started, error)
+        return response if error is None else None
+
+    def login(self):
+        response = self.session.post(self.options.base_url + '/_loadtest/login', timeout=self.options.timeout,
+                                     json={'token': self.options.token, 'user': self.index, 'role': self.options.role})
+        if response.status_code != 200:
+            raise RuntimeError(f"부하 테스트 로그인 실패 (HTTP {response.status_code}): "
+                               f"서버에 같은 LOAD_TEST_AUTH_TOKEN이 설정되어 있는지 확인하세요")
+        self.server_info = response.json()
+
+    # ----- 작업 -----
+
+    def _search_params(self, hot):
+        params = {'days_ago': 5, 'max_results': 20, 'region_code': 'KR'}
+        if self.options.keyword:
+            params['keyword'] = self.options.keyword
+        else:
+            params['channel_ids'] = ','.join(self.options.channel_ids)
+        if hot:
+            params['min_views'] = 100000 + self.random.randrange(HOT_QUERIES)
+        else:
+            # 캐시 키가 매번 달라지도록 조회수 조건을 바꿈
+            params['min_views'] = 100000 + HOT_QUERIES + self.random.randrange(10 ** 9)
+        return params
+
+    def search(self, hot):
+        started = time.perf_counter()
+        response = self.request('search_submit', 'POST', '/search', data=self._search_params(hot))
+        if response is None:
+            return
+        body = response.json()
+        if body.get('fromCache'):
+            self.stats.record('search_hit', time.perf_counter() - started)
+            return
+
+        # 작업 완료까지 폴링 (등록부터 결과까지 시간을 search_miss로 기록)
+        poll_url = body.get('poll_url') or f"/search/jobs/{body.get('job_id')}"
+        deadline = started + self.options.search_timeout
+        while time.perf_counter() < deadline:
+            time.sleep(self.options.poll_interval)
+            poll = self.request('search_poll', 'GET', poll_url)
+            if poll is None:
+                self.stats.record('search_miss', time.perf_counter() - started, 'poll_error')
+                return
+            if poll.json().get('status') not in ('pending', 'running'):
+                self.stats.record('search_miss', time.perf_counter() - started)
+                return
+        self.stats.record('search_miss', time.perf_counter() - started, 'timeout')
+
+    def categories(self):
+        name = f"부하테스트-{uuid.uuid4().hex[:10]}"
+        created = self.request('category_create', 'POST', '/api/categories', json={'name': name, 'description': '부하 테스트'})
+        self.request('category_list', 'GET', '/api/categories')
+        if created is not None:
+            self.request('category_delete', 'DELETE', f"/api/categories/{created.json()['category']['id']}")
+
+    def saved_videos(self):
+        video_id = f"lt{uuid.uuid4().hex[:9]}"
+        saved = self.request('saved_video_create', 'POST', '/api/saved-videos', json={
+            'video_id': video_id,
+            'video_title': f"부하 테스트 영상 {video_id}",
+            'channel_title': '부하 테스트 채널',
+            'video_url': f"https://www.youtube.com/shorts/{video_id}",
+            'view_count': self.random.randrange(10 ** 6),
+        })
+        self.request('saved_video_list', 'GET', '/api/saved-videos', params={'per_page': 20})
+        if saved is not None:
+            self.request('saved_video_delete', 'DELETE', f"/api/saved-videos/{saved.json()['video']['id']}")
+
+    def dashboard(self):
+        self.request('dashboard', 'GET', '/api/youtube/dashboard')
+
+    def run_operation(self, name):
+        if name == 'search_hit':
+            self.search(hot=True)
+        elif name == 'search_miss':
+            self.search(hot=False)
+        else:
+            getattr(self, name)()
+
+
+def run_load_test(options, operation_runner=None):
+    """
+    가상 사용자 options.users명으로 options.duration초 동안 부하 실행 후 요약 반환
+    operation_runner(user, name): 작업 실행 함수 (기본 VirtualUser.run_operation, 테스트에서 교체)
+    """
+    stats = LoadStats()
+    names, weights = zip(*options.mix.items())
+    users = [VirtualUser(index, options, stats) for index in range(options.users)]
+    runner = operation_runner or (lambda user, name: user.run_operation(name))
+
+    if operation_runner is None:
+        for user in users:
+            user.login()
+
+    stop_at = time.perf_counter() + options.warmup + options.duration
+
+    def loop(user):
+        while time.perf_counter() < stop_at:
+            runner(user, user.random.choices(names, weights)[0])
+            if options.think_time:
+                time.sleep(user.random.uniform(0, 2 * options.think_time))
+
+    threads = [threading.Thread(target=loop, args=(user,), daemon=True) for user in users]
+    for thread in threads:
+        thread.start()
+
+    # 워밍업 구간 기록은 버리고 측정 시작
+    if options.warmup:
+        time.sleep(options.warmup)
+        with stats.lock:
+            stats.latencies.clear()
+            stats.errors.clear()
+    stats.started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    stats.finished = time.perf_counter()
+
+    summary = stats.summary()
+    summary.update({
+        'label': options.label,
+        'users': options.users,
+        'duration_s': options.duration,
+        'mix': dict(options.mix),
+        'server': users[0].server_info.get('config') if users and users[0].server_info else None,
+    })
+    return summary
+
+
+def format_report(summary, baseline=None):
+    """요청 종류별 결과 표 (baseline이 있으면 처리량/p95 변화율 표시)"""
+    previous = {row['name']: row for row in (baseline or {}).get('operations', [])}
+    lines = [f"📊 {summary.get('label') or '부하 테스트'}: 사용자 {summary['users']}명, {summary['elapsed_s']}초, "
+             f"요청 {summary['requests']}건, {summary['rps']} req/s, 오류율 {summary['error_rate'] * 100:.2f}%"]
+    if summary.get('server'):
+        lines.append(f"   서버 구성: {summary['server']}")
+    header = f"{'request':<20} {'count':>7} {'req/s':>8} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9} {'errors':>7}"
+    lines += [header, '-' * len(header)]
+    for row in summary['operations']:
+        line = f"{row['name']:<20} {row['count']:>7} {row['rps']:>8.2f} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} " \
+               f"{row['p99_ms']:>9.1f} {row['error_rate'] * 100:>6.1f}%"
+        if row['errors']:
+            line += f"  {row['errors']}"
+        before = previous.get(row['name'])
+        if before:
+            line += f"  Δreq/s {_change(before['rps'], row['rps'])} Δp95 {_change(before['p95_ms'], row['p95_ms'])}"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _change(before, after):
+    if not before:
+        return 'n/a'
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='로컬 인스턴스 부하 테스트')
+    parser.add_argument('--base-url', default='http://127.0.0.1:8080')
+    parser.add_argument('--token', default=os.environ.get('LOAD_TEST_AUTH_TOKEN', ''),
+                        help='서버의 LOAD_TEST_AUTH_TOKEN (기본값: 같은 환경변수)')
+    parser.add_argument('--users', type=int, default=10, help='동시 가상 사용자 수')
+    parser.add_argument('--duration', type=float, default=30, help='측정 시간(초)')
+    parser.add_argument('--warmup', type=float, default=5, help='측정 전 워밍업 시간(초)')
+    parser.add_argument('--think-time', type=float, default=0.0, help='작업 간 평균 대기 시간(초)')
+    parser.add_argument('--mix', type=parse_mix, default=dict(DEFAULT_MIX), help='작업 비율 (예: search_hit=30,dashboard=10)')
+    parser.add_argument('--role', choices=('approved', 'admin'), default='approved',
+                        help='가상 사용자 권한 (approved는 일일 검색 100회 제한 적용)')
+    parser.add_argument('--channel-ids', type=lambda text: [c.strip() for c in text.split(',') if c.strip()],
+                        default=DEFAULT_CHANNEL_IDS, help='검색할 채널 ID (쉼표 구분)')
+    parser.add_argument('--keyword', help='채널 대신 키워드로 검색')
+    parser.add_argument('--poll-interval', type=float, default=0.2, help='검색 작업 폴링 간격(초)')
+    parser.add_argument('--search-timeout', type=float, default=60, help='검색 작업 완료 대기 한도(초)')
+    parser.add_argument('--timeout', type=float, default=30, help='요청 타임아웃(초)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--label', default='', help='결과에 기록할 구성 이름 (예: w2t4-pool5)')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    if not options.token:
+        print("❌ LOAD_TEST_AUTH_TOKEN 환경변수 또는 --token이 필요합니다")
+        return 1
+
+    print(f"🚀 부하 테스트 시작: {options.base_url}, 사용자 {options.users}명, "
+          f"워밍업 {options.warmup}초 + 측정 {options.duration}초, 비율 {options.mix}")
+    summary = run_load_test(options)
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print(format_report(summary, baseline))
+
+    if options.json_path:
+        with open(options.json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=1)
+        print(f"💾 결과 저장: {options.json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+# benchmarks/micro_benchmarks.py
+"""
+단위 기능 비용 측정 모음 (단위 테스트는 같은 측정 함수로 예산만 확인하고 수치는 여기서 출력)
+- metrics: YouTube 호출 1회 메트릭 기록 비용 (카운터 2개 + 히스토그램 1개)
+- structured_log: 비활성 레벨 log_event 비용
+- http_polling: 같은 검색 결과를 반복 조회할 때 ETag/gzip 적용 전후 전송 바이트
+- category_import: 카테고리 20개에 채널 10,000개 가져오기 SQL 수/시간 (인메모리 SQLite)
+- schema_boot: 기존 워커 부팅 스키마 확인과 배포당 마이그레이션 확인 SQL 수/시간 (임시 파일 SQLite)
+
+사용법:
+    python -m benchmarks.micro_benchmarks [metrics structured_log http_polling category_import schema_boot]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def count_statements(engine, func):
+    """func 실행 중 engine으로 전송된 SQL 문 개수/소요 시간과 결과 반환"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_execute)
+    started = time.perf_counter()
+    try:
+        result = func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_execute)
+    return result, len(statements), time.perf_counter() - started
+
+
+def measure_metrics_overhead(registry, iterations=20000):
+    """YouTube 호출 1회분 메트릭 기록 비용 (µs, calls_total/latency_seconds가 정의된 레지스트리)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        registry.inc('calls_total', endpoint='search.list', key='system:0', status='success')
+        registry.inc('calls_total', 100, endpoint='search.list', key='system:0')
+        registry.observe('latency_seconds', 0.2, endpoint='search.list')
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def measure_disabled_log_event(logger, iterations=100000):
+    """logger에서 비활성인 DEBUG 이벤트 1건 비용 (µs)"""
+    from common_utils.structured_log import log_event
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        log_event(logger, logging.DEBUG, 'search.date_filtered', sample=100, video_id=i)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def make_search_results(count=20):
+    """검색 결과와 비슷한 크기의 응답 데이터"""
+    return [{
+        'id': f'video{i}',
+        'title': f'테스트 쇼츠 영상 {i}',
+        'channelTitle': '테스트 채널',
+        'description': '영상 설명 ' * 80,
+        'viewCount': 100000 + i,
+        'url': f'https://www.youtube.com/shorts/video{i}',
+    } for i in range(count)]
+
+
+def poll_bytes(client, times, headers=None, path='/search/jobs/job1'):
+    """같은 검색 결과를 반복 조회하며 전송된 바이트 수 합계 반환 (받은 ETag로 조건부 요청)"""
+    total_bytes = 0
+    etag = None
+    for _ in range(times):
+        request_headers = dict(headers or {})
+        if etag:
+            request_headers['If-None-Match'] = etag
+        response = client.get(path, headers=request_headers)
+        total_bytes += len(response.get_data())
+        etag = response.headers.get('ETag') or etag
+    return total_bytes
+
+
+def measure_polling_bytes(polls=10, results=None):
+    """응답 최적화 레이어 적용 전후 반복 조회 전송 바이트 {'plain', 'optimized', 'saved_ratio'}"""
+    from flask import Flask, jsonify
+    from common_utils.http_optimization import init_response_optimization
+
+    results = results if results is not None else make_search_results()
+
+    def create_client(optimized):
+        app = Flask(__name__)
+
+        @app.route('/search/jobs/<job_id>')
+        def job(job_id):
+            return jsonify({"status": "success", "results": results, "count": len(results)})
+
+        if optimized:
+            init_response_optimization(app)
+        return app.test_client()
+
+    plain = poll_bytes(create_client(False), polls)
+    optimized = poll_bytes(create_client(True), polls, headers={'Accept-Encoding': 'gzip'})
+    return {'plain': plain, 'optimized': optimized, 'saved_ratio': 1 - optimized / plain}
+
+
+def make_channels(start, count):
+    """카테고리 가져오기용 채널 데이터"""
+    return [{'id': f'UC{i:06d}', 'title': f'채널 {i}', 'description': '', 'thumbnail': ''}
+            for i in range(start, start + count)]
+
+
+def measure_category_import(user_id, categories=20, per_category=500, existing=1000):
+    """
+    현재 앱 컨텍스트의 DB에서 user_id 카테고리들에 채널을 일괄 추가 (일부 채널은 미리 등록)
+    Returns: {'added', 'statements', 'seconds'}
+    """
+    from models import db, Channel, ChannelCategory
+    from common_utils.category_bulk import bulk_add_channels
+
+    created = [ChannelCategory(user_id=user_id, name=f'카테고리 {i}') for i in range(categories)]
+    db.session.add_all(created)
+    db.session.flush()
+    # 일부 채널은 이미 다른 사용자가 등록해 둔 상태
+    db.session.add_all(Channel(id=row['id'], title=row['title']) for row in make_channels(0, existing))
+    db.session.commit()
+
+    channels_by_category = {
+        category.id: make_channels(index * per_category, per_category) for index, category in enumerate(created)
+    }
+
+    def run():
+        added = bulk_add_channels(channels_by_category)
+        db.session.commit()
+        return added
+
+    added, statements, seconds = count_statements(db.engine, run)
+    return {'added': sum(added.values()), 'statements': statements, 'seconds': seconds}
+
+
+def measure_schema_boot(app):
+    """
+    최신 스키마 DB에서 기존 워커 부팅 작업(create_all + safe_migrate)과 마이그레이션 확인 비교
+    Returns: {'legacy_statements', 'legacy_seconds', 'upgraded_statements', 'upgraded_seconds'}
+    """
+    from auto_migrate import safe_migrate
+    from models import db
+    from schema_migrations import run_migrations
+
+    run_migrations(app, db)
+    with app.app_context():
+        engine = db.engine
+
+    def legacy_boot():
+        with app.app_context():
+            db.create_all()
+        safe_migrate(app, db)
+
+    _, legacy_statements, legacy_seconds = count_statements(engine, legacy_boot)
+    _, upgraded_statements, upgraded_seconds = count_statements(engine, lambda: run_migrations(app, db))
+    return {'legacy_statements': legacy_statements, 'legacy_seconds': legacy_seconds,
+            'upgraded_statements': upgraded_statements, 'upgraded_seconds': upgraded_seconds}
+
+
+def bench_metrics():
+    from common_utils.metrics import MetricsRegistry
+
+    registry = MetricsRegistry()
+    registry.describe('calls_total', 'counter', '호출 수')
+    registry.describe('latency_seconds', 'histogram', '응답 시간', buckets=(0.1, 1.0))
+    print(f"⏱️ 호출당 메트릭 기록: {measure_metrics_overhead(registry):.2f}µs")
+
+
+def bench_structured_log():
+    logger = logging.getLogger('benchmarks.structured_log')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    print(f"⏱️ 비활성 이벤트당 비용: {measure_disabled_log_event(logger):.2f}µs")
+
+
+def bench_http_polling(polls=10):
+    result = measure_polling_bytes(polls)
+    print(f"📦 {polls}회 조회: 원본 {result['plain']:,} bytes → {result['optimized']:,} bytes "
+          f"({result['saved_ratio']:.1%} 절감)")
+
+
+def bench_category_import():
+    from flask import Flask
+    from models import db, User
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(id='bench', email='bench@test.com', name='벤치마크', role='approved'))
+        db.session.commit()
+        result = measure_category_import('bench')
+    print(f"📦 채널 {result['added']:,}개 가져오기: SQL {result['statements']}회, {result['seconds']:.2f}초")
+
+
+def bench_schema_boot():
+    from schema_migrations import create_migration_app
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, 'bench.db')
+        with patch.dict(os.environ, {'DATABASE_URL': f'sqlite:///{db_path}'}):
+            app = create_migration_app()
+        # 마이그레이션 진행 출력은 숨기고 결과만 표시
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure_schema_boot(app)
+    print(f"⏱️ 워커당 기존 스키마 확인: SQL {result['legacy_statements']}회 {result['legacy_seconds'] * 1000:.1f}ms / "
+          f"배포당 1회 마이그레이션 확인: SQL {result['upgraded_statements']}회 "
+          f"{result['upgraded_seconds'] * 1000:.1f}ms / 워커 부팅: 0회")
+
+
+BENCHMARKS = {
+    'metrics': bench_metrics,
+    'structured_log': bench_structured_log,
+    'http_polling': bench_http_polling,
+    'category_import': bench_category_import,
+    'schema_boot': bench_schema_boot,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='단위 기능 비용 측정')
+    parser.add_argument('names', nargs='*', help=f"실행할 측정 ({', '.join(BENCHMARKS)}, 기본: 전체)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 측정: {', '.join(unknown)}")
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
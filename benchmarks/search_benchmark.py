@@ -0,0 +1,216 @@
+# benchmarks/search_benchmark.py
+"""
+검색 엔진 오프라인 재생 벤치마크
+- YouTube API 호출을 말뭉치 재생(ReplayYouTube)으로 대체해 할당량 없이 검색 경로를 측정
+- 엔진: system (get_recent_popular_shorts / search_by_keyword_based_shorts, 시스템 키)
+        user (UserSearchService, 사용자 키 + DB 사용량 기록 포함)
+- 시나리오: 채널 1/5/20개, 키워드 검색
+- 보고: 실행 시간(중앙값/최소), API 호출 수, 할당량, 결과 쇼츠당 할당량, 최대 메모리 할당량(tracemalloc)
+
+사용법:
+    python -m benchmarks.search_benchmark [--fixture fixture.json] [--latency-ms 80] [--repeat 5]
+                                          [--engine system|user|all] [--json out.json] [--baseline before.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.youtube_replay import ReplayYouTube, YouTubeCorpus
+
+# 앱 기본 검색 조건과 같은 값
+SEARCH_ARGS = {'min_views': 100000, 'days_ago': 5, 'max_results': 20, 'region_code': 'KR'}
+SCENARIOS = {
+    'channels-1': {'channels': 1},
+    'channels-5': {'channels': 5},
+    'channels-20': {'channels': 20},
+    'keyword': {'keyword': '요리'},
+}
+ENGINES = ('system', 'user')
+BENCH_API_KEY = 'bench-replay-key'
+BENCH_USER_ID = 'bench-user'
+
+
+def _scenario_kwargs(corpus, scenario):
+    spec = SCENARIOS[scenario]
+    if 'channels' in spec:
+        channel_ids = sorted(corpus.channels)[:spec['channels']]
+        if len(channel_ids) < spec['channels']:
+            raise ValueError(f"말뭉치 채널 수({len(channel_ids)})가 시나리오({scenario})보다 적습니다")
+        return {'channel_ids': channel_ids}
+    return {'keyword': spec['keyword']}
+
+
+@contextlib.contextmanager
+def system_engine(replay):
+    """시스템 키 검색 엔진 (common_utils.search)"""
+    from common_utils import search
+
+    def reset():
+        # 실행마다 할당량 관리자를 새로 만들어 반복 실행이 일일 한도에 걸리지 않도록 함
+        with contextlib.redirect_stdout(io.StringIO()):
+            search.init_quota_manager(force=True)
+
+    def run(channel_ids=None, keyword=None):
+        if channel_ids:
+            return search.get_recent_popular_shorts(channel_ids=channel_ids, **SEARCH_ARGS)
+        return search.search_by_keyword_based_shorts(keyword=keyword, **SEARCH_ARGS)
+
+    with patch.dict(os.environ, {'YOUTUBE_API_KEY': BENCH_API_KEY}), \
+         patch.object(search, 'build_youtube_client', return_value=replay), \
+         patch.object(search, 'translate_text', side_effect=lambda text, target_lang='ko': text):
+        yield reset, run
+
+
+@contextlib.contextmanager
+def user_engine(replay):
+    """사용자 키 검색 엔진 (UserSearchService, 임시 파일 SQLite)"""
+    from cryptography.fernet import Fernet
+    from flask import Flask
+
+    from models import db, User, UserApiKey
+    from common_utils.user_search import UserSearchService
+    from services.user_api_service import UserApiKeyManager
+
+    with tempfile.TemporaryDirectory() as temp_dir, \
+         patch.dict(os.environ, {'API_ENCRYPTION_KEY': os.environ.get('API_ENCRYPTION_KEY') or Fernet.generate_key().decode()}), \
+         patch('googleapiclient.discovery.build', return_value=replay):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(app)
+
+        with app.app_context():
+            db.create_all()
+            manager = UserApiKeyManager(BENCH_USER_ID)
+            db.session.add(User(id=BENCH_USER_ID, email='bench@test.com', name='벤치마크', role='approved'))
+            db.session.add(UserApiKey(user_id=BENCH_USER_ID, name='벤치마크', daily_quota=10 ** 9,
+                                      api_key=manager.encrypt_api_key(BENCH_API_KEY)))
+            db.session.commit()
+
+            def run(channel_ids=None, keyword=None):
+                return UserSearchService(BENCH_USER_ID).search_recent_popular_shorts(
+                    channel_ids=channel_ids, keyword=keyword, **SEARCH_ARGS
+                )
+
+            try:
+                yield (lambda: None), run
+            finally:
+                db.session.remove()
+                db.engine.dispose()
+
+
+_ENGINE_FACTORIES = {'system': system_engine, 'user': user_engine}
+
+
+def run_scenario(engine, scenario, corpus, latency=0.0, repeat=3):
+    """한 엔진/시나리오 측정 결과 (repeat번 실행 시간 + 할당량 측정용 1회 추가 실행)"""
+    replay = ReplayYouTube(corpus, latency=latency)
+    kwargs = _scenario_kwargs(corpus, scenario)
+    walls = []
+
+    with _ENGINE_FACTORIES[engine](replay) as (reset, run):
+        for _ in range(max(1, repeat)):
+            reset()
+            replay.reset()
+            started = time.perf_counter()
+            results = run(**kwargs)
+            walls.append(time.perf_counter() - started)
+        calls = dict(replay.calls)
+        quota_units = replay.quota_units
+
+        # tracemalloc은 실행 시간을 늘리므로 별도 실행에서 측정
+        reset()
+        tracemalloc.start()
+        try:
+            run(**kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    shorts = len(results)
+    return {
+        'engine': engine,
+        'scenario': scenario,
+        'latency_ms': round(latency * 1000, 1),
+        'wall_ms': round(statistics.median(walls) * 1000, 1),
+        'wall_ms_min': round(min(walls) * 1000, 1),
+        'api_calls': sum(calls.values()),
+        'calls': calls,
+        'quota_units': quota_units,
+        'shorts': shorts,
+        'quota_per_short': round(quota_units / shorts, 1) if shorts else None,
+        'alloc_peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(corpus, engines=ENGINES, scenarios=tuple(SCENARIOS), latency=0.0, repeat=3):
+    return [run_scenario(engine, scenario, corpus, latency, repeat) for engine in engines for scenario in scenarios]
+
+
+def format_report(rows, baseline=None):
+    """결과 표 (baseline이 있으면 실행 시간/할당량 변화율 표시)"""
+    previous = {(row['engine'], row['scenario']): row for row in baseline or []}
+    header = f"{'engine':<7} {'scenario':<12} {'wall_ms':>9} {'min_ms':>9} {'calls':>6} {'quota':>6} " \
+             f"{'shorts':>6} {'quota/short':>11} {'alloc_kb':>9}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        line = f"{row['engine']:<7} {row['scenario']:<12} {row['wall_ms']:>9.1f} {row['wall_ms_min']:>9.1f} " \
+               f"{row['api_calls']:>6} {row['quota_units']:>6} {row['shorts']:>6} " \
+               f"{row['quota_per_short'] if row['quota_per_short'] is not None else '-':>11} {row['alloc_peak_kb']:>9.1f}"
+        before = previous.get((row['engine'], row['scenario']))
+        if before:
+            line += f"  Δwall {_change(before['wall_ms'], row['wall_ms'])} Δquota {_change(before['quota_units'], row['quota_units'])}"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _change(before, after):
+    if not before:
+        return 'n/a'
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='검색 엔진 오프라인 재생 벤치마크')
+    parser.add_argument('--fixture', help='말뭉치 JSON (없으면 재현 가능한 합성 말뭉치 사용)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='API 호출당 지연 시간(ms)')
+    parser.add_argument('--repeat', type=int, default=3, help='시나리오별 반복 횟수 (실행 시간은 중앙값)')
+    parser.add_argument('--engine', choices=ENGINES + ('all',), default='all')
+    parser.add_argument('--scenario', action='append', choices=tuple(SCENARIOS), help='실행할 시나리오 (반복 지정 가능)')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    args = parser.parse_args(argv)
+
+    corpus = YouTubeCorpus.load(args.fixture) if args.fixture else YouTubeCorpus.synthetic()
+    engines = ENGINES if args.engine == 'all' else (args.engine,)
+    scenarios = tuple(args.scenario or SCENARIOS)
+    print(f"🔁 재생 벤치마크: 채널 {len(corpus.channels)}개, 영상 {len(corpus.videos)}개, "
+          f"호출당 지연 {args.latency_ms}ms, 반복 {args.repeat}회")
+
+    rows = run_benchmark(corpus, engines, scenarios, latency=args.latency_ms / 1000, repeat=args.repeat)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print(format_report(rows, baseline))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=1)
+        print(f"💾 결과 저장: {args.json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
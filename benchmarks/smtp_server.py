@@ -0,0 +1,277 @@
+# benchmarks/smtp_server.py
+"""
+로컬 SMTP 대역 서버와 이메일 발송 처리량 측정
+- EHLO/HELO, AUTH PLAIN/LOGIN(모든 계정 허용), MAIL/RCPT/DATA/RSET/NOOP/QUIT 처리 (STARTTLS 없음)
+- 연결 수립 지연(TLS 핸드셰이크/로그인 왕복 대신), 명령당 지연, 연결당 최대 메시지 수(초과한 다음 MAIL에 421 후 종료) 설정
+- 받은 메시지는 메모리에 보관 (stats()로 연결/메시지 수 확인, drop_connections()로 연결 강제 종료)
+
+앱 설정 (.env):
+    SMTP_SERVER=127.0.0.1  SMTP_PORT=8025  SMTP_USE_TLS=false
+
+사용법:
+    python -m benchmarks.smtp_server [--port 8025] [--connect-latency-ms 0] [--latency-ms 0]
+                                     [--max-messages-per-connection 0]
+    python -m benchmarks.smtp_server --bench 200 [--workers 4] [--connect-latency-ms 150]
+        EmailService로 메시지를 보내 연결을 매번 새로 맺을 때와 배치 세션으로 재사용할 때의 초당 메시지 수 비교
+"""
+import argparse
+import os
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """SMTP 연결 하나 처리"""
+
+    def setup(self):
+        super().setup()
+        self.state = self.server.state
+        self.state.opened(self)
+
+    def finish(self):
+        self.state.closed(self)
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def reply(self, line):
+        if self.state.latency_ms:
+            time.sleep(self.state.latency_ms / 1000.0)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        if self.state.connect_latency_ms:
+            time.sleep(self.state.connect_latency_ms / 1000.0)
+        self.reply('220 standin ESMTP')
+        mail_from, recipients, delivered = None, [], 0
+
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            command = line[:4].upper()
+
+            if command == 'EHLO':
+                self.wfile.write(b'250-standin\r\n250-8BITMIME\r\n')
+                self.reply('250 AUTH PLAIN LOGIN')
+            elif command == 'HELO':
+                self.reply('250 standin')
+            elif command == 'AUTH':
+                if line.upper().startswith('AUTH LOGIN'):
+                    # 사용자명(초기 응답에 없을 때)/비밀번호 질의
+                    if len(line.split()) < 3:
+                        self.reply('334 VXNlcm5hbWU6')
+                        self.rfile.readline()
+                    self.reply('334 UGFzc3dvcmQ6')
+                    self.rfile.readline()
+                self.reply('235 Authentication successful')
+            elif command == 'MAIL':
+                if self.state.max_messages_per_connection and delivered >= self.state.max_messages_per_connection:
+                    # 연결당 제한을 넘는 다음 메시지는 받지 않고 연결 종료
+                    self.reply('421 Too many messages on this connection')
+                    return
+                mail_from, recipients = line.split(':', 1)[1].strip(), []
+                self.reply('250 OK')
+            elif command == 'RCPT':
+                recipients.append(line.split(':', 1)[1].strip())
+                self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    raw = self.rfile.readline()
+                    if not raw or raw in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(raw)
+                self.state.delivered(mail_from, recipients, b''.join(data))
+                delivered += 1
+                mail_from, recipients = None, []
+                self.reply('250 OK queued')
+            elif command == 'RSET':
+                mail_from, recipients = None, []
+                self.reply('250 OK')
+            elif command == 'NOOP':
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class SMTPStandInState:
+    """대역 서버 설정과 수신 기록"""
+
+    def __init__(self, connect_latency_ms=0.0, latency_ms=0.0, max_messages_per_connection=0):
+        self.connect_latency_ms = connect_latency_ms
+        self.latency_ms = latency_ms
+        self.max_messages_per_connection = max_messages_per_connection
+        self._lock = threading.Lock()
+        self._handlers = set()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connections = 0
+            self.messages = []
+
+    def opened(self, handler):
+        with self._lock:
+            self.connections += 1
+            self._handlers.add(handler)
+
+    def closed(self, handler):
+        with self._lock:
+            self._handlers.discard(handler)
+
+    def delivered(self, mail_from, recipients, data):
+        with self._lock:
+            self.messages.append({'from': mail_from, 'to': recipients, 'data': data})
+
+    def drop_connections(self):
+        """열린 연결을 모두 끊음 (재연결 확인용)"""
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            try:
+                handler.connection.shutdown(2)
+            except OSError:
+                pass
+        return len(handlers)
+
+    def stats(self):
+        with self._lock:
+            return {'connections': self.connections, 'open_connections': len(self._handlers),
+                    'messages': len(self.messages)}
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPStandInServer:
+    """백그라운드 스레드에서 실행되는 SMTP 대역 서버 (port=0이면 빈 포트 자동 선택)"""
+
+    def __init__(self, host='127.0.0.1', port=0, **options):
+        self.state = SMTPStandInState(**options)
+        self.server = _Server((host, port), _Handler)
+        self.server.state = self.state
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name='smtp-standin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.state.drop_connections()
+        self.server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def create_email_service(host, port, **env):
+    """대역 서버로 발송하는 EmailService (STARTTLS 없이)"""
+    from flask import Flask
+    from services.email_service import EmailService
+
+    settings = {'SMTP_SERVER': host, 'SMTP_PORT': str(port), 'SMTP_USE_TLS': 'false',
+                'SMTP_USERNAME': 'bench', 'SMTP_PASSWORD': 'bench'}
+    settings.update({key: str(value) for key, value in env.items()})
+    with patch.dict(os.environ, settings):
+        return EmailService(Flask(__name__))
+
+
+def measure_throughput(service, messages, workers=1, batch=True):
+    """
+    messages개 메시지를 workers개 스레드로 발송
+    batch=True면 EmailService.session() 안에서 연결 재사용, False면 메시지마다 새 연결
+    Returns: {'messages', 'sent', 'seconds', 'messages_per_second'}
+    """
+    html = '<html><body>' + '<p>벤치마크</p>' * 200 + '</body></html>'
+
+    def send(index):
+        return service.send_email(f'user{index}@bench.local', f'벤치마크 {index}', html)
+
+    started = time.perf_counter()
+    if batch:
+        with service.session():
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(send, range(messages)))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(send, range(messages)))
+    seconds = time.perf_counter() - started
+    return {'messages': messages, 'sent': sum(results), 'seconds': seconds,
+            'messages_per_second': messages / seconds if seconds else 0.0}
+
+
+def run_benchmark(args):
+    with SMTPStandInServer(connect_latency_ms=args.connect_latency_ms, latency_ms=args.latency_ms,
+                           max_messages_per_connection=args.max_messages_per_connection) as server:
+        service = create_email_service(*server.address, SMTP_POOL_SIZE=args.workers)
+        print(f"📨 SMTP 처리량: 메시지 {args.bench}개, 스레드 {args.workers}개, "
+              f"연결 지연 {args.connect_latency_ms}ms, 명령 지연 {args.latency_ms}ms")
+        for label, batch in (('per-message', False), ('session', True)):
+            server.state.reset()
+            result = measure_throughput(service, args.bench, workers=args.workers, batch=batch)
+            stats = server.state.stats()
+            print(f"  {label:<12} {result['messages_per_second']:8.1f} msg/s  "
+                  f"발송 {result['sent']}/{result['messages']}  연결 {stats['connections']}개  "
+                  f"{result['seconds']:.2f}s")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='로컬 SMTP 대역 서버 / 발송 처리량 측정')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8025)
+    parser.add_argument('--connect-latency-ms', type=float, default=0.0,
+                        help='연결 수립 지연(ms, TLS 핸드셰이크/로그인 비용 대신)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='명령 응답당 지연(ms)')
+    parser.add_argument('--max-messages-per-connection', type=int, default=0,
+                        help='연결당 최대 메시지 수 (초과 시 421로 연결 종료, 0=제한 없음)')
+    parser.add_argument('--bench', type=int, default=0, help='지정 시 내장 대역 서버로 메시지 N개 발송 처리량을 측정하고 종료')
+    parser.add_argument('--workers', type=int, default=4, help='처리량 측정 시 발송 스레드 수')
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        return run_benchmark(args)
+
+    server = SMTPStandInServer(host=args.host, port=args.port, connect_latency_ms=args.connect_latency_ms,
+                               latency_ms=args.latency_ms,
+                               max_messages_per_connection=args.max_messages_per_connection)
+    host, port = server.address
+    print(f"📨 SMTP 대역 서버: {host}:{port}")
+    print(f"   앱 설정: SMTP_SERVER={host} SMTP_PORT={port} SMTP_USE_TLS=false")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
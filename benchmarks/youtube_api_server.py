@@ -0,0 +1,262 @@
+# benchmarks/youtube_api_server.py
+"""
+로컬 YouTube Data API 대역 HTTP 서버
+- /youtube/v3/{search,videos,channels,playlistItems} 를 말뭉치(YouTubeCorpus)로 응답
+- 키별 일일 할당량/초당 요청 수 제한을 실제 API와 같은 quotaExceeded / rateLimitExceeded 오류 본문으로 반환
+- 호출당 지연, 무작위 backendError, 키별 강제 오류 주입
+- 앱은 YOUTUBE_API_BASE_URL=http://127.0.0.1:8765 으로 이 서버를 사용 (부하/키 전환 테스트용)
+
+제어 엔드포인트 (JSON):
+    GET  /_standin/stats   키별 사용량/엔드포인트별 호출 수
+    POST /_standin/config  설정 변경 (latency_ms, error_rate, daily_quota, rate_limit, key_quotas, fail_keys, valid_keys)
+    POST /_standin/reset   사용량 초기화
+
+사용법:
+    python -m benchmarks.youtube_api_server [--port 8765] [--fixture fixture.json] [--daily-quota 10000]
+                                            [--rate-limit 0] [--latency-ms 0] [--error-rate 0]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.youtube_replay import API_COSTS, YouTubeCorpus
+
+API_PREFIX = '/youtube/v3/'
+CONTROL_PREFIX = '/_standin/'
+RESOURCES = ('search', 'videos', 'channels', 'playlistItems')
+
+_QUOTA_MESSAGE = ('The request cannot be completed because you have exceeded your '
+                  '<a href="/youtube/v3/getting-started#quota">quota</a>.')
+
+# 실제 API 오류 응답 (상태 코드, 본문)
+ERRORS = {
+    'quotaExceeded': (403, {'code': 403, 'message': _QUOTA_MESSAGE, 'errors': [
+        {'message': _QUOTA_MESSAGE, 'domain': 'youtube.quota', 'reason': 'quotaExceeded'}]}),
+    'rateLimitExceeded': (403, {'code': 403, 'message': 'Rate Limit Exceeded', 'errors': [
+        {'message': 'Rate Limit Exceeded', 'domain': 'usageLimits', 'reason': 'rateLimitExceeded'}],
+        'status': 'PERMISSION_DENIED'}),
+    'keyInvalid': (400, {'code': 400, 'message': 'API key not valid. Please pass a valid API key.', 'errors': [
+        {'message': 'API key not valid. Please pass a valid API key.', 'domain': 'global', 'reason': 'badRequest'}],
+        'status': 'INVALID_ARGUMENT'}),
+    'forbidden': (403, {'code': 403, 'message': 'The request is missing a valid API key.', 'errors': [
+        {'message': 'The request is missing a valid API key.', 'domain': 'global', 'reason': 'forbidden'}],
+        'status': 'PERMISSION_DENIED'}),
+    'backendError': (500, {'code': 500, 'message': 'Backend Error', 'errors': [
+        {'message': 'Backend Error', 'domain': 'global', 'reason': 'backendError'}]}),
+}
+
+
+class StandInState:
+    """키별 사용량과 오류/지연 설정 (요청 스레드 간 공유)"""
+
+    def __init__(self, daily_quota=10000, rate_limit=0, latency_ms=0.0, error_rate=0.0, valid_keys=None, seed=None):
+        self.lock = threading.Lock()
+        self.daily_quota = daily_quota
+        self.rate_limit = rate_limit
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.valid_keys = set(valid_keys) if valid_keys else None
+        self.key_quotas = {}
+        self.fail_keys = {}
+        self._random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.quota_used = {}
+            self.calls = {}
+            self.errors = {}
+            self._recent = {}
+
+    def configure(self, **options):
+        with self.lock:
+            for name in ('daily_quota', 'rate_limit', 'latency_ms', 'error_rate'):
+                if name in options:
+                    setattr(self, name, options[name])
+            if 'valid_keys' in options:
+                self.valid_keys = set(options['valid_keys']) if options['valid_keys'] else None
+            self.key_quotas.update(options.get('key_quotas') or {})
+            self.fail_keys.update(options.get('fail_keys') or {})
+            for key in [key for key, reason in self.fail_keys.items() if not reason]:
+                del self.fail_keys[key]
+
+    def admit(self, key, endpoint):
+        """요청 허용 여부 판단 후 할당량 차감 (거부 시 오류 이유 반환)"""
+        cost = API_COSTS.get(endpoint, 1)
+        with self.lock:
+            reason = self._rejection(key, cost)
+            if reason is None and self.error_rate and self._random.random() < self.error_rate:
+                reason = 'backendError'
+            if reason:
+                self.errors[reason] = self.errors.get(reason, 0) + 1
+                return reason
+            self.quota_used[key] = self.quota_used.get(key, 0) + cost
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            return None
+
+    def _rejection(self, key, cost):
+        if not key:
+            return 'forbidden'
+        if self.valid_keys is not None and key not in self.valid_keys:
+            return 'keyInvalid'
+        if key in self.fail_keys:
+            return self.fail_keys[key]
+        if self.rate_limit:
+            now = time.monotonic()
+            recent = self._recent.setdefault(key, deque())
+            while recent and now - recent[0] >= 1.0:
+                recent.popleft()
+            if len(recent) >= self.rate_limit:
+                return 'rateLimitExceeded'
+            recent.append(now)
+        if self.quota_used.get(key, 0) + cost > self.key_quotas.get(key, self.daily_quota):
+            return 'quotaExceeded'
+        return None
+
+    def stats(self):
+        with self.lock:
+            return {
+                'quota_used': dict(self.quota_used),
+                'calls': dict(self.calls),
+                'errors': dict(self.errors),
+                'config': {'daily_quota': self.daily_quota, 'rate_limit': self.rate_limit,
+                           'latency_ms': self.latency_ms, 'error_rate': self.error_rate,
+                           'key_quotas': dict(self.key_quotas), 'fail_keys': dict(self.fail_keys),
+                           'valid_keys': sorted(self.valid_keys) if self.valid_keys is not None else None},
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'YouTubeStandIn/1.0'
+    # 연결 재사용 (httplib2 클라이언트가 keep-alive 사용)
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == CONTROL_PREFIX + 'stats':
+            return self._send_json(200, self.server.state.stats())
+        if not url.path.startswith(API_PREFIX) or url.path[len(API_PREFIX):] not in RESOURCES:
+            return self._send_json(404, {'error': {'code': 404, 'message': 'Not Found'}})
+
+        endpoint = f"{url.path[len(API_PREFIX):]}.list"
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        state = self.server.state
+        if state.latency_ms:
+            time.sleep(state.latency_ms / 1000)
+
+        reason = state.admit(params.pop('key', None), endpoint)
+        if reason:
+            status, error = ERRORS[reason]
+            return self._send_json(status, {'error': error})
+        try:
+            return self._send_json(200, self.server.corpus.respond(endpoint, params))
+        except (TypeError, ValueError) as e:
+            return self._send_json(400, {'error': {'code': 400, 'message': str(e), 'errors': [
+                {'message': str(e), 'domain': 'global', 'reason': 'badRequest'}]}})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            options = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return self._send_json(400, {'error': 'invalid JSON'})
+
+        if url.path == CONTROL_PREFIX + 'config':
+            self.server.state.configure(**options)
+        elif url.path == CONTROL_PREFIX + 'reset':
+            self.server.state.reset()
+        else:
+            return self._send_json(404, {'error': 'Not Found'})
+        return self._send_json(200, self.server.state.stats())
+
+
+class YouTubeStandInServer:
+    """백그라운드 스레드에서 실행되는 대역 서버 (port=0이면 빈 포트 자동 선택)"""
+
+    def __init__(self, corpus=None, host='127.0.0.1', port=0, verbose=False, **options):
+        self.corpus = corpus or YouTubeCorpus.synthetic()
+        self.state = StandInState(**options)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.corpus = self.corpus
+        self.httpd.state = self.state
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='youtube-standin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='로컬 YouTube Data API 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixture', help='말뭉치 JSON (없으면 합성 말뭉치)')
+    parser.add_argument('--daily-quota', type=int, default=10000, help='키별 일일 할당량')
+    parser.add_argument('--rate-limit', type=int, default=0, help='키별 초당 요청 수 제한 (0=제한 없음)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='요청당 지연 시간(ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='backendError 주입 비율 (0~1)')
+    parser.add_argument('--valid-keys', default='', help='허용할 API 키 (쉼표 구분, 비우면 모든 키 허용)')
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args(argv)
+
+    corpus = YouTubeCorpus.load(args.fixture) if args.fixture else YouTubeCorpus.synthetic()
+    server = YouTubeStandInServer(
+        corpus, host=args.host, port=args.port, verbose=args.verbose,
+        daily_quota=args.daily_quota, rate_limit=args.rate_limit, latency_ms=args.latency_ms,
+        error_rate=args.error_rate, valid_keys=[k.strip() for k in args.valid_keys.split(',') if k.strip()],
+    )
+    print(f"🎬 YouTube API 대역 서버: 채널 {len(corpus.channels)}개, 영상 {len(corpus.videos)}개")
+    print(f"   앱 설정: YOUTUBE_API_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
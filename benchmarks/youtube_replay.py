@@ -0,0 +1,444 @@
+# benchmarks/youtube_replay.py
+"""
+YouTube Data API 재생(replay) 대역
+- YouTubeCorpus: 채널/영상 말뭉치 (JSON 픽스처 또는 합성 데이터)와 search/videos/channels/playlistItems.list 응답 생성
+- ReplayYouTube: googleapiclient 리소스와 같은 형태(youtube.search().list(...).execute())로 말뭉치 응답 반환
+  호출당 지연 시간을 줄 수 있고 엔드포인트별 호출 수/할당량을 센다
+- RecordingYouTube: 실제 API 응답을 말뭉치로 기록 (할당량 사용)
+
+게시 시각은 기록 시점 기준 경과 분(age_minutes)으로 저장하고 불러올 때 현재 시각 기준으로 복원하므로
+오래된 픽스처도 days_ago 필터에 같은 결과를 낸다.
+
+사용법:
+    python -m benchmarks.youtube_replay --generate fixture.json [--channels 20 --videos-per-channel 50]
+    YOUTUBE_API_KEY=... python -m benchmarks.youtube_replay --record fixture.json --channel-ids UC..,UC.. --keywords 요리,먹방
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+# YouTubeQuotaManager.API_COSTS와 같은 값 (의존성 없이 단독 실행 가능하도록 복사)
+API_COSTS = {
+    'search.list': 100,
+    'videos.list': 1,
+    'channels.list': 1,
+    'playlistItems.list': 1,
+}
+
+# 합성 데이터용 키워드/제목
+SYNTHETIC_KEYWORDS = ['요리', '먹방', '여행', '게임', '운동', '음악']
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# videoDuration=short 기준 (4분 미만)
+_SHORT_DURATION_SECONDS = 240
+
+
+def _iso_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"PT{minutes}M{seconds}S" if minutes else f"PT{seconds}S"
+
+
+def uploads_playlist_id(channel_id):
+    """채널 업로드 재생목록 ID (UC... → UU...)"""
+    return 'UU' + channel_id[2:] if channel_id.startswith('UC') else channel_id
+
+
+def channel_id_from_uploads(playlist_id):
+    return 'UC' + playlist_id[2:] if playlist_id.startswith('UU') else playlist_id
+
+
+def _parse_iso_duration(value):
+    import isodate
+    return int(isodate.parse_duration(value).total_seconds())
+
+
+class YouTubeCorpus:
+    """채널/영상 말뭉치와 YouTube API 응답 생성"""
+
+    def __init__(self, channels, videos, now=None):
+        self.now = now or datetime.utcnow()
+        self.channels = {channel['id']: channel for channel in channels}
+        self.videos = {}
+        self._by_channel = {}
+        for video in videos:
+            self.add_video(video)
+
+    # ----- 불러오기/저장 -----
+
+    @classmethod
+    def load(cls, path, now=None):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('channels', []), data.get('videos', []), now=now)
+
+    def save(self, path):
+        data = {
+            'version': 1,
+            'channels': list(self.channels.values()),
+            'videos': [{key: value for key, value in video.items() if key != 'published_at'}
+                       for video in self.videos.values()],
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def synthetic(cls, channels=20, videos_per_channel=50, seed=42, now=None):
+        """재현 가능한 합성 말뭉치 (조회수/길이/게시 시각 분포가 실제 검색 필터를 고르게 통과/탈락하도록)"""
+        rng = random.Random(seed)
+        channel_list, videos = [], []
+        for c in range(channels):
+            channel_id = f"UCbench{c:04d}"
+            channel_list.append({
+                'id': channel_id,
+                'title': f"벤치마크 채널 {c}",
+                'handle': f"benchchannel{c}",
+                'description': f"{SYNTHETIC_KEYWORDS[c % len(SYNTHETIC_KEYWORDS)]} 채널",
+            })
+            for v in range(videos_per_channel):
+                keyword = SYNTHETIC_KEYWORDS[(c + v) % len(SYNTHETIC_KEYWORDS)]
+                videos.append({
+                    'id': f"vid{c:04d}x{v:04d}",
+                    'channelId': channel_id,
+                    'channelTitle': f"벤치마크 채널 {c}",
+                    'title': f"{keyword} 쇼츠 {c}-{v}",
+                    'description': f"{keyword} 영상 설명 " * 5,
+                    # 0~10일 사이, 최근 영상이 더 많도록
+                    'age_minutes': int(rng.triangular(0, 14400, 0)),
+                    'viewCount': int(rng.lognormvariate(11.5, 1.2)),
+                    'likeCount': rng.randint(0, 50000),
+                    'commentCount': rng.randint(0, 2000),
+                    # 80%는 쇼츠 길이, 나머지는 긴 영상
+                    'duration': rng.randint(10, 59) if rng.random() < 0.8 else rng.randint(61, 900),
+                    'keywords': [keyword],
+                })
+        return cls(channel_list, videos, now=now)
+
+    def add_video(self, video):
+        video = dict(video)
+        video['published_at'] = self.now - timedelta(minutes=video.get('age_minutes', 0))
+        self.videos[video['id']] = video
+        self._by_channel.setdefault(video['channelId'], [])
+        if video['id'] not in self._by_channel[video['channelId']]:
+            self._by_channel[video['channelId']].append(video['id'])
+        return video
+
+    # ----- API 응답 -----
+
+    def _video_resource(self, video):
+        return {
+            'kind': 'youtube#video',
+            'id': video['id'],
+            'snippet': {
+                'publishedAt': video['published_at'].strftime(_TIME_FORMAT),
+                'channelId': video['channelId'],
+                'title': video['title'],
+                'description': video.get('description', ''),
+                'channelTitle': video.get('channelTitle', ''),
+                'thumbnails': {
+                    'default': {'url': f"https://i.ytimg.com/vi/{video['id']}/default.jpg"},
+                    'high': {'url': f"https://i.ytimg.com/vi/{video['id']}/hqdefault.jpg"},
+                },
+            },
+            'statistics': {
+                'viewCount': str(video.get('viewCount', 0)),
+                'likeCount': str(video.get('likeCount', 0)),
+                'commentCount': str(video.get('commentCount', 0)),
+            },
+            'contentDetails': {'duration': _iso_duration(video.get('duration', 0))},
+        }
+
+    def _channel_resource(self, channel):
+        return {
+            'kind': 'youtube#channel',
+            'id': channel['id'],
+            'snippet': {
+                'title': channel['title'],
+                'description': channel.get('description', ''),
+                'customUrl': f"@{channel['handle']}" if channel.get('handle') else '',
+                'thumbnails': {'default': {'url': f"https://yt3.ggpht.com/{channel['id']}"}},
+            },
+            'contentDetails': {'relatedPlaylists': {'uploads': uploads_playlist_id(channel['id'])}},
+            'statistics': {'videoCount': str(len(self._by_channel.get(channel['id'], [])))},
+        }
+
+    def _search_item(self, video):
+        resource = self._video_resource(video)
+        return {'kind': 'youtube#searchResult', 'id': {'kind': 'youtube#video', 'videoId': video['id']},
+                'snippet': resource['snippet']}
+
+    @staticmethod
+    def _page(items, params):
+        """pageToken(오프셋)/maxResults 페이지 처리"""
+        max_results = max(1, min(50, int(params.get('maxResults', 5))))
+        offset = int(params.get('pageToken') or 0)
+        page = items[offset:offset + max_results]
+        response = {'kind': 'youtube#searchListResponse',
+                    'pageInfo': {'totalResults': len(items), 'resultsPerPage': max_results},
+                    'items': page}
+        if offset + max_results < len(items):
+            response['nextPageToken'] = str(offset + max_results)
+        return response
+
+    def search(self, params):
+        """search.list 응답"""
+        if params.get('type') == 'channel':
+            query = (params.get('q') or '').lower()
+            channels = [self._channel_resource(channel) for channel in self.channels.values()
+                        if query in channel['title'].lower() or query in (channel.get('handle') or '')]
+            items = [{'kind': 'youtube#searchResult', 'id': {'kind': 'youtube#channel', 'channelId': c['id']},
+                      'snippet': c['snippet']} for c in channels]
+            return self._page(items, params)
+
+        if params.get('channelId'):
+            videos = [self.videos[video_id] for video_id in self._by_channel.get(params['channelId'], [])]
+        else:
+            query = (params.get('q') or '').lower()
+            videos = [video for video in self.videos.values()
+                      if query in video['title'].lower() or query in video.get('keywords', [])]
+
+        if params.get('publishedAfter'):
+            published_after = datetime.strptime(params['publishedAfter'][:19], "%Y-%m-%dT%H:%M:%S")
+            videos = [video for video in videos if video['published_at'] >= published_after]
+        if params.get('videoDuration') == 'short':
+            videos = [video for video in videos if video.get('duration', 0) < _SHORT_DURATION_SECONDS]
+
+        if params.get('order') == 'viewCount':
+            videos.sort(key=lambda video: video.get('viewCount', 0), reverse=True)
+        else:
+            videos.sort(key=lambda video: video['published_at'], reverse=True)
+
+        return self._page([self._search_item(video) for video in videos], params)
+
+    def videos_list(self, params):
+        """videos.list 응답 (요청한 ID 순서, 없는 ID는 생략)"""
+        ids = [video_id for video_id in (params.get('id') or '').split(',') if video_id]
+        return {'kind': 'youtube#videoListResponse',
+                'items': [self._video_resource(self.videos[video_id]) for video_id in ids if video_id in self.videos]}
+
+    def channels_list(self, params):
+        """channels.list 응답 (id 또는 forHandle)"""
+        if params.get('forHandle'):
+            handle = params['forHandle'].lstrip('@').lower()
+            channels = [channel for channel in self.channels.values() if (channel.get('handle') or '').lower() == handle]
+        else:
+            ids = [channel_id for channel_id in (params.get('id') or '').split(',') if channel_id]
+            channels = [self.channels[channel_id] for channel_id in ids if channel_id in self.channels]
+        return {'kind': 'youtube#channelListResponse', 'items': [self._channel_resource(c) for c in channels]}
+
+    def playlist_items(self, params):
+        """playlistItems.list 응답 (채널 업로드 재생목록, 최신순)"""
+        channel_id = channel_id_from_uploads(params.get('playlistId') or '')
+        videos = sorted((self.videos[video_id] for video_id in self._by_channel.get(channel_id, [])),
+                        key=lambda video: video['published_at'], reverse=True)
+        items = [{
+            'kind': 'youtube#playlistItem',
+            'id': f"{params.get('playlistId')}.{video['id']}",
+            'snippet': dict(self._video_resource(video)['snippet'], playlistId=params.get('playlistId'),
+                            resourceId={'kind': 'youtube#video', 'videoId': video['id']}),
+            'contentDetails': {'videoId': video['id'],
+                               'videoPublishedAt': video['published_at'].strftime(_TIME_FORMAT)},
+        } for video in videos]
+        response = self._page(items, params)
+        response['kind'] = 'youtube#playlistItemListResponse'
+        return response
+
+    def respond(self, endpoint, params):
+        """엔드포인트 이름('search.list' 등)으로 응답 생성"""
+        handler = {'search.list': self.search, 'videos.list': self.videos_list,
+                   'channels.list': self.channels_list, 'playlistItems.list': self.playlist_items}.get(endpoint)
+        if handler is None:
+            raise ValueError(f"지원하지 않는 엔드포인트: {endpoint}")
+        return handler(params)
+
+
+class _Request:
+    def __init__(self, client, endpoint, params):
+        self._client = client
+        self._endpoint = endpoint
+        self._params = params
+
+    def execute(self, **kwargs):
+        return self._client._execute(self._endpoint, self._params)
+
+
+class _Resource:
+    def __init__(self, client, name):
+        self._client = client
+        self._name = name
+
+    def list(self, **params):
+        return _Request(self._client, f"{self._name}.list", params)
+
+
+class ReplayYouTube:
+    """googleapiclient YouTube 리소스 대역 (말뭉치 응답 + 호출당 지연)"""
+
+    def __init__(self, corpus, latency=0.0):
+        self.corpus = corpus
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.calls = {}
+
+    def search(self):
+        return _Resource(self, 'search')
+
+    def videos(self):
+        return _Resource(self, 'videos')
+
+    def channels(self):
+        return _Resource(self, 'channels')
+
+    def playlistItems(self):
+        return _Resource(self, 'playlistItems')
+
+    def _execute(self, endpoint, params):
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.corpus.respond(endpoint, params)
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    @property
+    def quota_units(self):
+        return sum(API_COSTS.get(endpoint, 1) * count for endpoint, count in self.calls.items())
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+
+
+class RecordingYouTube:
+    """실제 YouTube 리소스를 감싸 응답의 영상/채널을 말뭉치에 기록"""
+
+    def __init__(self, youtube, corpus):
+        self._youtube = youtube
+        self.corpus = corpus
+        self._keyword_by_video = {}
+
+    def search(self):
+        return _RecordingResource(self, self._youtube.search(), 'search.list')
+
+    def videos(self):
+        return _RecordingResource(self, self._youtube.videos(), 'videos.list')
+
+    def channels(self):
+        return _RecordingResource(self, self._youtube.channels(), 'channels.list')
+
+    def _record(self, endpoint, params, response):
+        if endpoint == 'search.list' and params.get('q'):
+            for item in response.get('items', []):
+                video_id = item.get('id', {}).get('videoId')
+                if video_id:
+                    self._keyword_by_video[video_id] = params['q']
+        elif endpoint == 'videos.list':
+            for item in response.get('items', []):
+                self._record_video(item)
+        elif endpoint == 'channels.list':
+            for item in response.get('items', []):
+                self.corpus.channels[item['id']] = {
+                    'id': item['id'],
+                    'title': item['snippet']['title'],
+                    'handle': item['snippet'].get('customUrl', '').lstrip('@'),
+                    'description': item['snippet'].get('description', ''),
+                }
+
+    def _record_video(self, item):
+        snippet, statistics = item['snippet'], item.get('statistics', {})
+        published_at = datetime.strptime(snippet['publishedAt'], _TIME_FORMAT)
+        keyword = self._keyword_by_video.get(item['id'])
+        self.corpus.channels.setdefault(snippet['channelId'], {
+            'id': snippet['channelId'], 'title': snippet.get('channelTitle', ''), 'handle': '', 'description': ''
+        })
+        self.corpus.add_video({
+            'id': item['id'],
+            'channelId': snippet['channelId'],
+            'channelTitle': snippet.get('channelTitle', ''),
+            'title': snippet['title'],
+            'description': snippet.get('description', ''),
+            'age_minutes': max(0, int((self.corpus.now - published_at).total_seconds() // 60)),
+            'viewCount': int(statistics.get('viewCount', 0)),
+            'likeCount': int(statistics.get('likeCount', 0)),
+            'commentCount': int(statistics.get('commentCount', 0)),
+            'duration': _parse_iso_duration(item['contentDetails']['duration']),
+            'keywords': [keyword] if keyword else [],
+        })
+
+
+class _RecordingResource:
+    def __init__(self, recorder, resource, endpoint):
+        self._recorder = recorder
+        self._resource = resource
+        self._endpoint = endpoint
+
+    def list(self, **params):
+        request = self._resource.list(**params)
+        recorder, endpoint = self._recorder, self._endpoint
+
+        class _RecordingRequest:
+            def execute(self, **kwargs):
+                response = request.execute(**kwargs)
+                recorder._record(endpoint, params, response)
+                return response
+
+        return _RecordingRequest()
+
+
+def record_corpus(api_key, channel_ids, keywords, days_ago=5):
+    """실제 API로 채널/키워드 검색을 실행해 말뭉치 기록 (채널당 101, 키워드당 101 할당량 사용)"""
+    import googleapiclient.discovery
+
+    corpus = YouTubeCorpus([], [])
+    youtube = RecordingYouTube(googleapiclient.discovery.build("youtube", "v3", developerKey=api_key), corpus)
+    published_after = (datetime.utcnow() - timedelta(days=days_ago)).isoformat("T") + "Z"
+
+    searches = [{'channelId': channel_id, 'order': 'date'} for channel_id in channel_ids]
+    searches += [{'q': keyword, 'order': 'viewCount', 'videoDuration': 'short'} for keyword in keywords]
+    for extra in searches:
+        response = youtube.search().list(part='snippet', type='video', maxResults=50,
+                                         publishedAfter=published_after, **extra).execute()
+        video_ids = [item['id']['videoId'] for item in response.get('items', [])]
+        if video_ids:
+            youtube.videos().list(part='snippet,statistics,contentDetails', id=','.join(video_ids)).execute()
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='YouTube API 재생용 말뭉치 생성/기록')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--generate', metavar='PATH', help='합성 말뭉치를 PATH에 저장')
+    group.add_argument('--record', metavar='PATH', help='실제 API 응답을 기록해 PATH에 저장 (YOUTUBE_API_KEY 필요)')
+    parser.add_argument('--channels', type=int, default=20, help='합성 채널 수')
+    parser.add_argument('--videos-per-channel', type=int, default=50, help='합성 채널당 영상 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--channel-ids', default='', help='기록할 채널 ID (쉼표 구분)')
+    parser.add_argument('--keywords', default='', help='기록할 검색 키워드 (쉼표 구분)')
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        corpus = YouTubeCorpus.synthetic(args.channels, args.videos_per_channel, seed=args.seed)
+        corpus.save(args.generate)
+        print(f"✅ 합성 말뭉치 저장: 채널 {len(corpus.channels)}개, 영상 {len(corpus.videos)}개 → {args.generate}")
+        return 0
+
+    import os
+    api_key = os.environ.get('YOUTUBE_API_KEY', '').split(',')[0].strip()
+    if not api_key:
+        print("❌ YOUTUBE_API_KEY 환경변수가 필요합니다")
+        return 1
+    channel_ids = [c.strip() for c in args.channel_ids.split(',') if c.strip()]
+    keywords = [k.strip() for k in args.keywords.split(',') if k.strip()]
+    corpus = record_corpus(api_key, channel_ids, keywords)
+    corpus.save(args.record)
+    print(f"✅ 기록 완료: 채널 {len(corpus.channels)}개, 영상 {len(corpus.videos)}개 → {args.record}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# common_utils/api_limits.py
+from datetime import datetime, time, timedelta
+from models import db, ApiLog, ApiCallCounter
+from common_utils.db_helpers import increment_counters, insert_ignore_conflicts
+
+
+def _day_range(day):
+    """날짜의 [시작, 다음날 시작) 범위 (timestamp 인덱스를 그대로 사용할 수 있는 조건)"""
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+def record_daily_call(user_id, now=None, count=1):
+    """사용자의 해당 날짜 API 호출 수 증가 (호출자가 커밋)
+
+    그날 카운터가 아직 없으면 (배포 당일 등) 이미 기록된 ApiLog 수로 먼저 채운 뒤 증가시킨다.
+    이번 호출의 ApiLog 행을 넣기 전에 호출해야 중복 집계되지 않는다.
+    """
+    day = (now or datetime.utcnow()).date()
+    keys = {'user_id': user_id, 'call_date': day}
+
+    exists = db.session.query(ApiCallCounter.id).filter(
+        ApiCallCounter.user_id == user_id,
+        ApiCallCounter.call_date == day
+    ).first()
+    if exists is None:
+        # 동시에 만들어도 시작값은 한 번만 들어가도록 충돌 무시 INSERT 후 증가
+        insert_ignore_conflicts(ApiCallCounter, [{**keys, 'call_count': _count_logged_calls(user_id, day)}],
+                                index_elements=['user_id', 'call_date'])
+
+    increment_counters(ApiCallCounter, keys=keys, increments={'call_count': count})
+
+
+def _count_logged_calls(user_id, day):
+    """ApiLog에 기록된 해당 날짜 호출 수 ((user_id, timestamp) 인덱스 범위 조건)"""
+    start, end = _day_range(day)
+    return ApiLog.query.filter(
+        ApiLog.user_id == user_id,
+        ApiLog.timestamp >= start,
+        ApiLog.timestamp < end
+    ).count()
+
+
+def get_daily_call_count(user_id, now=None):
+    """사용자의 오늘 API 호출 수 조회
+
+    카운터 행은 (user_id, call_date) 유니크 인덱스로 한 번에 찾는다.
+    카운터가 없으면 (배포 직후 등) ApiLog를 (user_id, timestamp) 인덱스 범위 조건으로 센다.
+    """
+    day = (now or datetime.utcnow()).date()
+
+    call_count = db.session.query(ApiCallCounter.call_count).filter(
+        ApiCallCounter.user_id == user_id,
+        ApiCallCounter.call_date == day
+    ).scalar()
+    if call_count is not None:
+        return call_count
+
+    return _count_logged_calls(user_id, day)
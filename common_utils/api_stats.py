@@ -0,0 +1,133 @@
+# common_utils/api_stats.py
+"""
+관리자 API 통계 집계 테이블
+- 일별 / 사용자별 / 엔드포인트별 호출 수를 기록 시점마다 증분 반영
+- 매일 밤 ApiLog(보존 중인 원본) + ApiLogDaily(정리된 원본 요약)로 재계산해 오차 보정
+- 비로그인 호출(user_id 없음)은 증분/재계산 모두 일별·엔드포인트별에만 집계하고 사용자별에서는 제외
+"""
+
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import text
+
+from models import db, User, ApiLog, ApiLogDaily, ApiStatsDaily, ApiStatsUser, ApiStatsEndpoint
+from common_utils.db_helpers import increment_counters
+
+# 집계 테이블별 키 컬럼
+_STATS_TABLES = (
+    (ApiStatsDaily, 'stat_date'),
+    (ApiStatsUser, 'user_id'),
+    (ApiStatsEndpoint, 'endpoint'),
+)
+
+
+def record_api_stats(events):
+    """API 호출 이벤트 묶음을 집계 테이블에 반영 (호출자가 커밋)
+
+    Args:
+        events: user_id, endpoint, timestamp를 가진 이벤트 목록
+    """
+    counts = {
+        ApiStatsDaily: Counter(event['timestamp'].date() for event in events),
+        ApiStatsUser: Counter(event['user_id'] for event in events if event['user_id']),
+        ApiStatsEndpoint: Counter(event['endpoint'] for event in events),
+    }
+    for model, key_column in _STATS_TABLES:
+        for key, count in counts[model].items():
+            increment_counters(model, keys={key_column: key}, increments={'call_count': count})
+
+
+def get_admin_stats(days=30, top_users=20):
+    """관리자 통계 페이지용 데이터 (집계 테이블만 조회)
+
+    집계 테이블이 비어 있으면 (배포 직후) 한 번 재계산한다.
+    """
+    if db.session.query(ApiStatsDaily.id).first() is None:
+        reconcile_api_stats()
+
+    daily_stats = db.session.query(
+        ApiStatsDaily.stat_date.label('date'),
+        ApiStatsDaily.call_count.label('count')
+    ).order_by(ApiStatsDaily.stat_date.desc()).limit(days).all()
+
+    user_stats = db.session.query(
+        User.email,
+        ApiStatsUser.call_count.label('call_count')
+    ).join(User, User.id == ApiStatsUser.user_id).order_by(ApiStatsUser.call_count.desc()).limit(top_users).all()
+
+    endpoint_stats = db.session.query(
+        ApiStatsEndpoint.endpoint,
+        ApiStatsEndpoint.call_count.label('count')
+    ).order_by(ApiStatsEndpoint.call_count.desc()).all()
+
+    return daily_stats, user_stats, endpoint_stats
+
+
+def _as_date(value):
+    # SQLite의 date()는 문자열을 반환
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _compute_stats():
+    """원본(ApiLog) + 정리된 원본 요약(ApiLogDaily) 기준 전체 집계 계산"""
+    stats = {model: Counter() for model, _ in _STATS_TABLES}
+
+    log_date = db.func.date(ApiLog.timestamp)
+    for day, count in db.session.query(log_date, db.func.count()).group_by(log_date):
+        stats[ApiStatsDaily][_as_date(day)] += count
+    for day, count in db.session.query(ApiLogDaily.log_date, db.func.sum(ApiLogDaily.call_count)).group_by(ApiLogDaily.log_date):
+        stats[ApiStatsDaily][_as_date(day)] += int(count or 0)
+
+    for model, source_column, daily_column in (
+        (ApiStatsUser, ApiLog.user_id, ApiLogDaily.user_id),
+        (ApiStatsEndpoint, ApiLog.endpoint, ApiLogDaily.endpoint),
+    ):
+        for key, count in db.session.query(source_column, db.func.count()).group_by(source_column):
+            stats[model][key] += count
+        for key, count in db.session.query(daily_column, db.func.sum(ApiLogDaily.call_count)).group_by(daily_column):
+            stats[model][key] += int(count or 0)
+
+    # 비로그인 호출은 사용자별 집계 대상이 아님 (record_api_stats와 같은 규칙)
+    stats[ApiStatsUser].pop(None, None)
+
+    return stats
+
+
+def reconcile_api_stats():
+    """
+    집계 테이블을 원본 기준으로 다시 계산해 덮어쓰기 (매일 밤 보존 정리 후 실행)
+
+    PostgreSQL에서는 집계 테이블을 잠가 재계산 중 들어온 증분이 덮어쓰기 이후에 반영되도록 한다.
+    보존 정리와 동시에 실행되면 ApiLog -> ApiLogDaily 이동 중인 행이 이중 집계될 수 있으므로 순서대로 실행한다.
+
+    Returns:
+        테이블별 보정된(값이 달라진) 키 수
+    """
+    try:
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text(
+                "LOCK TABLE api_stats_daily, api_stats_user, api_stats_endpoint IN SHARE ROW EXCLUSIVE MODE"
+            ))
+
+        stats = _compute_stats()
+        corrected = {}
+        for model, key_column in _STATS_TABLES:
+            column = getattr(model, key_column)
+            current = dict(db.session.query(column, model.call_count))
+            expected = {key: count for key, count in stats[model].items() if count}
+            corrected[model.__tablename__] = sum(
+                1 for key in set(current) | set(expected) if current.get(key) != expected.get(key)
+            )
+
+            model.query.delete(synchronize_session=False)
+            if expected:
+                db.session.execute(model.__table__.insert(), [
+                    {key_column: key, 'call_count': count} for key, count in expected.items()
+                ])
+
+        db.session.commit()
+        return corrected
+    except Exception:
+        db.session.rollback()
+        raise
@@ -0,0 +1,98 @@
+# common_utils/category_bulk.py
+"""
+카테고리 채널 일괄 추가 (가져오기 / 병합 / 채널 추가 공용)
+- 기존 채널 ID, 기존 카테고리-채널 연결을 테이블당 한 번(청크 단위)에 미리 조회
+- 없는 행만 다중 행 INSERT로 삽입 (채널은 충돌 시 건너뜀)
+"""
+
+from typing import Dict, Iterable, List
+
+from models import db, Channel, CategoryChannel
+from common_utils.db_helpers import insert_ignore_conflicts
+
+# IN 조건 하나에 담을 최대 ID 수
+PRELOAD_CHUNK_SIZE = 500
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def collect_channel_rows(channels: Iterable[dict]) -> Dict[str, dict]:
+    """요청의 채널 목록을 채널 ID -> 행 데이터로 정리 (ID 없는 항목 제외, 중복은 처음 것 사용)"""
+    rows = {}
+    for channel_data in channels or []:
+        if not isinstance(channel_data, dict) or not channel_data.get('id'):
+            continue
+        rows.setdefault(channel_data['id'], {
+            'id': channel_data['id'],
+            'title': channel_data.get('title') or '',
+            'description': channel_data.get('description', ''),
+            'thumbnail': channel_data.get('thumbnail', '')
+        })
+    return rows
+
+
+def ensure_channels(channel_rows: Dict[str, dict]) -> int:
+    """Channel 테이블에 없는 채널만 삽입하고 새로 추가된 채널 수 반환 (기존 채널 정보는 유지)"""
+    channel_ids = list(channel_rows)
+    existing = set()
+    for chunk in _chunks(channel_ids, PRELOAD_CHUNK_SIZE):
+        existing.update(
+            channel_id for (channel_id,) in
+            db.session.query(Channel.id).filter(Channel.id.in_(chunk))
+        )
+
+    missing = [channel_rows[channel_id] for channel_id in channel_ids if channel_id not in existing]
+    insert_ignore_conflicts(Channel, missing, index_elements=['id'])
+    return len(missing)
+
+
+def bulk_add_channels(channels_by_category: Dict[int, Iterable[dict]]) -> Dict[int, int]:
+    """
+    여러 카테고리에 채널을 한 번에 연결 (커밋은 호출하는 쪽에서 수행)
+
+    Args:
+        channels_by_category: 카테고리 ID -> 요청의 채널 목록
+
+    Returns:
+        카테고리 ID -> 새로 연결된 채널 수
+    """
+    rows_by_category = {
+        category_id: collect_channel_rows(channels)
+        for category_id, channels in channels_by_category.items()
+    }
+    added_counts = {category_id: 0 for category_id in rows_by_category}
+
+    all_channels = {}
+    for rows in rows_by_category.values():
+        for channel_id, row in rows.items():
+            all_channels.setdefault(channel_id, row)
+    if not all_channels:
+        return added_counts
+
+    ensure_channels(all_channels)
+
+    # 대상 카테고리의 기존 연결을 한 번에 조회
+    existing_links = set()
+    for chunk in _chunks(list(rows_by_category), PRELOAD_CHUNK_SIZE):
+        existing_links.update(
+            db.session.query(CategoryChannel.category_id, CategoryChannel.channel_id)
+            .filter(CategoryChannel.category_id.in_(chunk))
+        )
+
+    new_links = []
+    for category_id, rows in rows_by_category.items():
+        for channel_id in rows:
+            if (category_id, channel_id) in existing_links:
+                continue
+            new_links.append({'category_id': category_id, 'channel_id': channel_id})
+            added_counts[category_id] += 1
+
+    # category_channel에는 (category_id, channel_id) 유니크 제약이 없으므로 미리 걸러낸 행만 삽입
+    if new_links:
+        for chunk in _chunks(new_links, PRELOAD_CHUNK_SIZE):
+            db.session.execute(CategoryChannel.__table__.insert().values(chunk))
+
+    return added_counts
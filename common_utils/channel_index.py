@@ -0,0 +1,115 @@
+# common_utils/channel_index.py
+"""
+로컬 채널 검색 인덱스
+- Channel 테이블(카테고리에 등록된 채널 + 과거 검색 결과)에서 제목 일치/제목 접두어 검색
+  (lower(title) 인덱스는 schema_migrations에서 생성)
+- 핸들 -> 채널 ID 매핑(ChannelHandle)으로 forHandle 재조회 방지 (핸들 검색은 매핑만 사용)
+- 제목이 정확히 일치하는 채널이 있을 때만 인덱스로 응답하고, 접두어만 일치하면 YouTube search.list(100 유닛) 호출
+  (다른 검색어의 과거 결과가 접두어로 걸려 원하는 채널을 API에서 찾지 못하는 것을 방지)
+  (refresh 요청 시 인덱스를 건너뛰고 API 검색)
+"""
+
+import os
+import logging
+from datetime import datetime
+
+from sqlalchemy import func, case
+
+from models import db, Channel, ChannelHandle
+from common_utils.category_bulk import collect_channel_rows, ensure_channels
+
+# 로컬 인덱스 검색 결과 최대 수 (search.list 요청의 maxResults와 동일)
+CHANNEL_INDEX_MAX_RESULTS = int(os.environ.get('CHANNEL_INDEX_MAX_RESULTS', 5))
+
+logger = logging.getLogger(__name__)
+
+
+def is_handle_query(query):
+    """핸들(@) 또는 채널 URL 형식 검색어인지 확인"""
+    return '@' in query or 'youtube.com/' in query
+
+
+def extract_handle(query):
+    """검색어(@handle, 채널 URL)에서 @를 뗀 핸들 추출"""
+    if 'youtube.com/' in query:
+        for part in query.split('/'):
+            if part.startswith('@'):
+                query = part
+                break
+    return query.replace('@', '')
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _to_dict(channel):
+    return {
+        'id': channel.id,
+        'title': channel.title,
+        'thumbnail': channel.thumbnail or '',
+        'description': channel.description or ''
+    }
+
+
+def lookup_handle(handle):
+    """저장된 핸들 매핑으로 채널 조회 (없으면 None)"""
+    mapping = db.session.get(ChannelHandle, handle.lower())
+    if mapping is None or mapping.channel is None:
+        return None
+    return _to_dict(mapping.channel)
+
+
+def search_local_channels(query, limit=CHANNEL_INDEX_MAX_RESULTS, prefix=True):
+    """
+    채널 제목으로 로컬 인덱스 검색 (대소문자 무시)
+    정확히 일치 > 제목 접두어 순으로 정렬하며, prefix=False면 정확히 일치만 찾는다.
+    (제목 중간 단어 일치는 일반 검색어마다 약한 결과가 API 검색을 막으므로 제외)
+    """
+    term = query.strip().lower()
+    if not term:
+        return []
+
+    title = func.lower(Channel.title)
+    escaped = _escape_like(term)
+    condition = title.like(f'{escaped}%', escape='\\') if prefix else title == term
+
+    rank = case((title == term, 0), else_=1)
+    channels = Channel.query.filter(condition).order_by(rank, Channel.title).limit(limit).all()
+    return [_to_dict(channel) for channel in channels]
+
+
+def find_local_channels(query):
+    """
+    검색어를 로컬 인덱스에서 먼저 찾기 (결과가 없으면 빈 목록 -> YouTube API 호출)
+    - 핸들/URL: 핸들 매핑만 사용 (제목이 핸들과 같은 다른 채널일 수 있으므로 제목 검색 안 함)
+    - 일반 검색어: 제목이 정확히 일치하는 채널이 있을 때만 일치/접두어 검색 결과 반환
+    """
+    if is_handle_query(query):
+        channel = lookup_handle(extract_handle(query))
+        return [channel] if channel else []
+    if not search_local_channels(query, limit=1, prefix=False):
+        return []
+    return search_local_channels(query)
+
+
+def record_channel_lookup(channels, handle=None):
+    """
+    YouTube 조회 결과를 인덱스에 저장 (실패해도 검색 응답에는 영향 없음)
+
+    Args:
+        channels: 조회된 채널 목록 (id, title, thumbnail, description)
+        handle: forHandle로 확인된 핸들 (channels[0]에 매핑)
+    """
+    try:
+        ensure_channels(collect_channel_rows(channels))
+        if handle and channels:
+            db.session.merge(ChannelHandle(
+                handle=handle.lower(),
+                channel_id=channels[0]['id'],
+                resolved_at=datetime.utcnow()
+            ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"채널 인덱스 저장 실패: {str(e)}")
@@ -0,0 +1,80 @@
+# common_utils/db_helpers.py
+"""
+데이터베이스 공통 헬퍼
+- 집계(롤업) 테이블 카운터 증가용 upsert
+- 충돌 무시 다중 행 INSERT
+"""
+
+from typing import Dict, Any, List
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import db
+
+_UPSERT_INSERTS = {
+    'postgresql': pg_insert,
+    'sqlite': sqlite_insert,
+}
+
+# 다중 행 INSERT 한 번에 넣을 최대 행 수 (바인드 변수 개수 제한 대비)
+BULK_INSERT_CHUNK_SIZE = 500
+
+
+def increment_counters(model, keys: Dict[str, Any], increments: Dict[str, Any]):
+    """
+    유니크 키로 식별되는 집계 행의 카운터를 원자적으로 증가시킨다.
+    PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리하고,
+    그 외 DB는 조회 후 갱신으로 대체한다. 커밋은 호출하는 쪽에서 수행한다.
+
+    Args:
+        model: 집계 모델 (keys 컬럼에 유니크 제약이 있어야 함)
+        keys: 행을 식별하는 컬럼 값 (예: user_id, usage_date)
+        increments: 증가시킬 컬럼과 증가량
+    """
+    table = model.__table__
+    insert_fn = _UPSERT_INSERTS.get(db.engine.dialect.name)
+
+    if insert_fn is not None:
+        stmt = insert_fn(table).values(**keys, **increments)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys.keys()),
+            set_={name: table.c[name] + stmt.excluded[name] for name in increments}
+        )
+        db.session.execute(stmt)
+        return
+
+    row = model.query.filter_by(**keys).with_for_update().first()
+    if row is None:
+        db.session.add(model(**keys, **increments))
+    else:
+        for name, amount in increments.items():
+            setattr(row, name, (getattr(row, name) or 0) + amount)
+
+
+def insert_ignore_conflicts(model, rows: List[Dict[str, Any]], index_elements: List[str],
+                            chunk_size: int = BULK_INSERT_CHUNK_SIZE) -> None:
+    """
+    여러 행을 다중 행 INSERT로 삽입하고, 유니크 키가 이미 있는 행은 건너뛴다.
+    PostgreSQL/SQLite는 ON CONFLICT DO NOTHING을 사용하고, 그 외 DB는 일반 INSERT로
+    처리하므로 호출하는 쪽에서 기존 행을 미리 걸러 두어야 한다. 커밋은 호출하는 쪽에서 수행한다.
+
+    Args:
+        model: 대상 모델
+        rows: 삽입할 행 목록 (컬럼명 -> 값)
+        index_elements: 충돌 판단에 사용할 유니크 컬럼
+        chunk_size: INSERT 문 하나에 담을 최대 행 수
+    """
+    if not rows:
+        return
+
+    table = model.__table__
+    insert_fn = _UPSERT_INSERTS.get(db.engine.dialect.name)
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        if insert_fn is not None:
+            stmt = insert_fn(table).values(chunk).on_conflict_do_nothing(index_elements=index_elements)
+        else:
+            stmt = table.insert().values(chunk)
+        db.session.execute(stmt)
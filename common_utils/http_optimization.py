@@ -0,0 +1,123 @@
+# common_utils/http_optimization.py
+import gzip
+import hashlib
+import os
+from flask import request
+
+try:
+    import brotli  # 선택 의존성: 설치된 경우에만 br 인코딩 제공
+except ImportError:
+    brotli = None
+
+# 압축 대상 MIME 타입
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/javascript',
+    'text/html',
+    'text/css',
+    'text/plain',
+    'text/javascript',
+}
+
+
+def compute_etag(body: bytes) -> str:
+    """응답 본문 해시 (get_cache_key와 같은 md5 방식)"""
+    return hashlib.md5(body).hexdigest()
+
+
+def _accepted_encodings(header):
+    """Accept-Encoding 값을 {코딩: q값}으로 변환 (q값이 잘못되면 0으로 취급)"""
+    weights = {}
+    for value in header.split(','):
+        coding, _, params = value.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            name, _, q = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(q.strip())
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    return weights
+
+
+def _coding_weight(weights, coding):
+    """코딩의 q값 (RFC 9110 12.5.3: 명시 > * > identity는 기본 허용, 그 외는 불가)"""
+    if coding in weights:
+        return weights[coding]
+    if '*' in weights:
+        return weights['*']
+    return 1.0 if coding == 'identity' else 0.0
+
+
+def _choose_encoding():
+    """
+    요청의 Accept-Encoding에 따라 사용할 압축 방식 선택 (q값이 같으면 br 우선)
+
+    Returns:
+        (encoding, identity_allowed): encoding은 'br'/'gzip' 또는 None(압축 안 함),
+        identity_allowed는 압축하지 않은 응답 허용 여부 (identity;q=0 또는 *;q=0이면 False)
+    """
+    header = request.headers.get('Accept-Encoding')
+    if header is None:
+        return None, True  # 헤더가 없으면 선호 없음 - 압축하지 않음
+
+    weights = _accepted_encodings(header)
+    candidates = (['br'] if brotli is not None else []) + ['gzip']
+    encoding = max(candidates, key=lambda coding: _coding_weight(weights, coding))
+    weight = _coding_weight(weights, encoding)
+    # 비압축은 identity를 명시해 더 높은 q값을 준 경우에만 압축보다 우선
+    if weight <= 0 or weight < weights.get('identity', 0):
+        encoding = None
+    return encoding, _coding_weight(weights, 'identity') > 0
+
+
+def _compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=min(level, 11))
+    return gzip.compress(body, compresslevel=min(level, 9))
+
+
+def init_response_optimization(app):
+    """
+    앱 전체 응답 최적화 레이어 등록
+    - GET 응답에 ETag 추가, If-None-Match 일치 시 304 반환
+    - Accept-Encoding(q값 포함)에 따라 gzip/br 압축
+    """
+    min_size = int(os.environ.get('RESPONSE_COMPRESS_MIN_SIZE', 1024))
+    level = int(os.environ.get('RESPONSE_COMPRESS_LEVEL', 6))
+
+    @app.after_request
+    def optimize_response(response):
+        # 스트리밍(SSE 등), 파일 전송, 이미 인코딩된 응답은 그대로 전달
+        if response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers:
+            return response
+        if response.status_code != 200:
+            return response
+
+        if request.method in ('GET', 'HEAD') and not response.get_etag()[0]:
+            response.set_etag(compute_etag(response.get_data()), weak=True)
+            response.make_conditional(request)
+            if response.status_code == 304:
+                return response
+
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding, identity_allowed = _choose_encoding()
+        body = response.get_data()
+        # 작은 응답은 압축하지 않음 (비압축이 거부된 경우는 크기와 관계없이 압축)
+        # 받을 수 있는 압축 방식이 없으면 RFC 9110에 따라 406 대신 비압축으로 응답
+        if not encoding or (identity_allowed and len(body) < min_size):
+            return response
+
+        response.set_data(_compress(body, encoding, level))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    return app
@@ -0,0 +1,243 @@
+# key_health.py
+import os
+import time
+import logging
+from enum import Enum
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# 상태 확인용 요청: videos.list(part=id)는 할당량 1 소모 (search.list는 100)
+PROBE_ENDPOINT = 'videos.list'
+PROBE_QUOTA_COST = 1
+
+
+class CircuitState(Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = "closed"        # 정상 - 요청에 사용 가능
+    OPEN = "open"            # 차단 - 요청 경로에서 제외
+    HALF_OPEN = "half_open"  # 시험 중 - 시험 요청 하나(실제 요청 또는 프로버 확인)만 허용
+
+
+class ProbeStatus(Enum):
+    """키 상태 확인 결과"""
+    OK = "ok"
+    QUOTA_EXCEEDED = "quota_exceeded"  # 유효한 키지만 할당량 소진
+    INVALID = "invalid"                # 잘못된 키 / 권한 없음
+    ERROR = "error"                    # 네트워크 등 일시적 오류
+
+
+@dataclass
+class ProbeResult:
+    """키 상태 확인 결과 정보"""
+    status: ProbeStatus
+    response_time: float = 0.0
+    error_message: str = ""
+    items_found: int = 0
+
+
+@dataclass
+class CircuitBreaker:
+    """API 키별 서킷 브레이커"""
+    failure_threshold: int = 3
+    reset_timeout: float = 300.0  # OPEN 후 재시험까지 대기 시간 (초)
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    opened_at: Optional[float] = None
+    last_success_at: Optional[float] = None
+    last_checked_at: Optional[float] = None
+    last_error: str = ""
+    trial_started_at: Optional[float] = None
+
+    def allows_requests(self, now: float, claim_trial: bool = True) -> bool:
+        """
+        요청 경로에서 사용 가능 여부
+        CLOSED는 허용, OPEN은 대기 시간이 지나면 HALF_OPEN으로 전환해 시험 요청 하나만 허용
+        (프로버가 없는 워커에서도 복구되도록). 시험 결과가 대기 시간 안에 기록되지 않으면 다시 시험 허용.
+        claim_trial=False면 상태를 바꾸지 않고 허용 여부만 확인 (상태 조회용)
+        """
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if now - (self.opened_at or 0) < self.reset_timeout:
+                return False
+        elif self.trial_started_at is not None and now - self.trial_started_at < self.reset_timeout:
+            return False  # 다른 시험 요청 진행 중
+        if claim_trial:
+            self.begin_trial(now)
+        return True
+
+    def needs_probe(self, now: float, idle_interval: float) -> bool:
+        """프로버가 확인해야 하는지 여부"""
+        if self.state == CircuitState.OPEN:
+            return now - (self.opened_at or 0) >= self.reset_timeout
+        if self.state == CircuitState.HALF_OPEN:
+            return True
+        # 최근 성공(실제 요청 또는 확인)이 있으면 확인 생략
+        last_seen = max(self.last_success_at or 0, self.last_checked_at or 0)
+        return now - last_seen >= idle_interval
+
+    def begin_trial(self, now: float):
+        """OPEN 상태에서 대기 시간이 지나면 HALF_OPEN으로 전환하고 시험 시작 시각 기록"""
+        if self.state in (CircuitState.OPEN, CircuitState.HALF_OPEN):
+            self.state = CircuitState.HALF_OPEN
+            self.trial_started_at = now
+
+    def record_success(self, now: float):
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at = None
+        self.trial_started_at = None
+        self.last_success_at = now
+        self.last_error = ""
+
+    def record_failure(self, error_message: str, now: float, fatal: bool = False):
+        self.failure_count += 1
+        self.last_error = (error_message or "")[:200]
+        if fatal or self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logger.warning(f"서킷 브레이커 OPEN: 연속 실패 {self.failure_count}회 - {self.last_error}")
+            self.state = CircuitState.OPEN
+            self.opened_at = now
+            self.trial_started_at = None
+
+
+class KeyHealthRegistry:
+    """API 키 상태(서킷 브레이커) 저장소 - 키 참조 문자열 기준"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300.0, clock=time.time):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock  # 테스트에서 대체
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.lock = Lock()
+
+    def _get(self, key_ref: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key_ref)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[key_ref] = breaker
+        return breaker
+
+    def is_available(self, key_ref: str, claim_trial: bool = True) -> bool:
+        """
+        요청 경로에서 키 사용 가능 여부 (기록이 없는 키는 사용 가능)
+        대기 시간이 지난 OPEN 키는 이 호출이 시험 요청이 됨 (상태 조회는 claim_trial=False)
+        """
+        breaker = self._breakers.get(key_ref)
+        if breaker is None or breaker.state == CircuitState.CLOSED:
+            return True
+        with self.lock:
+            return breaker.allows_requests(self.clock(), claim_trial)
+
+    def record_success(self, key_ref: str):
+        with self.lock:
+            self._get(key_ref).record_success(self.clock())
+
+    def record_failure(self, key_ref: str, error_message: str = "", fatal: bool = False):
+        with self.lock:
+            self._get(key_ref).record_failure(error_message, self.clock(), fatal)
+
+    def record_probe(self, key_ref: str, result: ProbeResult):
+        """확인 결과 반영 (할당량 소진은 키 자체는 정상으로 간주)"""
+        with self.lock:
+            breaker = self._get(key_ref)
+            now = self.clock()
+            breaker.last_checked_at = now
+            if result.status in (ProbeStatus.OK, ProbeStatus.QUOTA_EXCEEDED):
+                breaker.record_success(now)
+            else:
+                breaker.record_failure(result.error_message, now,
+                                       fatal=result.status == ProbeStatus.INVALID)
+
+    def keys_to_probe(self, key_refs: List[str], idle_interval: float) -> List[str]:
+        """확인이 필요한 키 목록 반환 (OPEN 키는 HALF_OPEN으로 전환)"""
+        now = self.clock()
+        due = []
+        with self.lock:
+            for key_ref in key_refs:
+                breaker = self._get(key_ref)
+                if breaker.needs_probe(now, idle_interval):
+                    breaker.begin_trial(now)
+                    due.append(key_ref)
+        return due
+
+    def get_status(self) -> Dict:
+        """전체 키 상태 요약"""
+        with self.lock:
+            return {
+                key_ref: {
+                    'state': breaker.state.value,
+                    'failure_count': breaker.failure_count,
+                    'last_error': breaker.last_error,
+                    'opened_at': breaker.opened_at,
+                    'last_success_at': breaker.last_success_at,
+                    'last_checked_at': breaker.last_checked_at
+                }
+                for key_ref, breaker in self._breakers.items()
+            }
+
+
+def system_key_ref(index: int) -> str:
+    """시스템 키 참조 문자열"""
+    return f"system:{index}"
+
+
+def user_key_ref(key_id: int) -> str:
+    """사용자 키 참조 문자열"""
+    return f"user:{key_id}"
+
+
+def is_invalid_key_error(error_str: str) -> bool:
+    """잘못된 키/권한 오류 여부 (할당량 초과는 제외)"""
+    error_lower = (error_str or "").lower()
+    if is_quota_error(error_lower):
+        return False
+    return any(k in error_lower for k in ['keyinvalid', 'api key not valid', 'forbidden', 'accessnotconfigured'])
+
+
+def is_quota_error(error_str: str) -> bool:
+    """할당량/속도 제한 오류 여부"""
+    error_lower = (error_str or "").lower()
+    return any(k in error_lower for k in ['quotaexceeded', 'dailylimitexceeded', 'ratelimitexceeded', 'quota'])
+
+
+def probe_api_key(api_key: str) -> ProbeResult:
+    """할당량 1 단위 요청으로 API 키 상태 확인"""
+    from .search import build_youtube_client
+
+    start_time = time.time()
+    try:
+        youtube = build_youtube_client(api_key, cache_discovery=False)
+        response = youtube.videos().list(part="id", chart="mostPopular", maxResults=1).execute()
+        return ProbeResult(
+            status=ProbeStatus.OK,
+            response_time=time.time() - start_time,
+            items_found=len(response.get('items', []))
+        )
+    except Exception as e:
+        error_message = str(e)
+        if is_quota_error(error_message):
+            status = ProbeStatus.QUOTA_EXCEEDED
+        elif is_invalid_key_error(error_message):
+            status = ProbeStatus.INVALID
+        else:
+            status = ProbeStatus.ERROR
+        return ProbeResult(status=status, response_time=time.time() - start_time, error_message=error_message)
+
+
+# 전역 인스턴스
+_key_health_registry: Optional[KeyHealthRegistry] = None
+
+
+def get_key_health_registry() -> KeyHealthRegistry:
+    """키 상태 저장소 인스턴스 반환 (최초 호출 시 생성)"""
+    global _key_health_registry
+    if _key_health_registry is None:
+        _key_health_registry = KeyHealthRegistry(
+            failure_threshold=int(os.environ.get('KEY_CIRCUIT_FAILURE_THRESHOLD', 3)),
+            reset_timeout=float(os.environ.get('KEY_CIRCUIT_RESET_SECONDS', 300))
+        )
+    return _key_health_registry
@@ -0,0 +1,73 @@
+# common_utils/load_test_auth.py
+"""
+부하 테스트용 로그인 우회
+- LOAD_TEST_AUTH_TOKEN이 설정된 경우에만 POST /_loadtest/login 라우트 등록 (FLASK_ENV=production이면 등록하지 않음)
+- 토큰이 맞으면 loadtest-<번호> 사용자(승인 또는 관리자)를 만들거나 불러와 세션 로그인
+- 응답에 워커 PID와 실행기/DB 풀 설정을 담아 부하 테스트 결과에 구성 정보를 함께 기록
+"""
+import hmac
+import os
+
+LOGIN_PATH = '/_loadtest/login'
+USER_PREFIX = 'loadtest-'
+# 부하 테스트 사용자 번호 범위
+MAX_USERS = 10000
+# 추측 가능한 짧은 토큰으로 열리지 않도록 최소 길이 제한
+MIN_TOKEN_LENGTH = 16
+
+
+def load_test_user_id(index):
+    return f"{USER_PREFIX}{index}"
+
+
+def init_load_test_auth(app, db, user_model, runtime_info=None):
+    """토큰이 설정된 경우 부하 테스트 로그인 라우트 등록 (등록 여부 반환)"""
+    token = os.environ.get('LOAD_TEST_AUTH_TOKEN', '')
+    if not token:
+        return False
+    if os.environ.get('FLASK_ENV') == 'production':
+        # 관리자 계정을 만들 수 있는 라우트이므로 운영 환경에서는 토큰이 있어도 등록하지 않음
+        app.logger.error("운영 환경(FLASK_ENV=production)에 LOAD_TEST_AUTH_TOKEN이 설정되어 있습니다. "
+                         "부하 테스트 로그인을 비활성화합니다 - 토큰을 제거하세요")
+        return False
+    if len(token) < MIN_TOKEN_LENGTH:
+        app.logger.warning(f"LOAD_TEST_AUTH_TOKEN이 {MIN_TOKEN_LENGTH}자 미만이라 부하 테스트 로그인을 비활성화합니다")
+        return False
+
+    from flask import jsonify, request
+    from flask_login import login_user
+
+    @app.route(LOGIN_PATH, methods=['POST'])
+    def load_test_login():
+        data = request.get_json(silent=True) or {}
+        if not hmac.compare_digest(str(data.get('token', '')), token):
+            return jsonify({"status": "error", "message": "인증 실패"}), 403
+
+        try:
+            index = int(data.get('user', 0))
+        except (TypeError, ValueError):
+            index = -1
+        role = data.get('role', 'approved')
+        if not 0 <= index < MAX_USERS or role not in ('approved', 'admin'):
+            return jsonify({"status": "error", "message": "잘못된 요청"}), 400
+
+        user_id = load_test_user_id(index)
+        user = db.session.get(user_model, user_id)
+        if user is None:
+            user = user_model(id=user_id, email=f"{user_id}@loadtest.local", name=f"부하 테스트 {index}", role=role)
+            db.session.add(user)
+        else:
+            user.role = role
+        db.session.commit()
+        login_user(user)
+
+        return jsonify({
+            "status": "success",
+            "user_id": user_id,
+            "role": role,
+            "pid": os.getpid(),
+            "config": runtime_info() if runtime_info else {},
+        })
+
+    app.logger.warning(f"⚠️ 부하 테스트 로그인 활성화: {LOGIN_PATH} (운영 환경에서는 LOAD_TEST_AUTH_TOKEN을 설정하지 마세요)")
+    return True
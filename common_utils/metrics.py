@@ -0,0 +1,361 @@
+# common_utils/metrics.py
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 노출 형식, /metrics)
+- 기록은 스레드별 샤드에 잠금 없이 누적하고 /metrics 조회 시에만 합산
+- gunicorn 워커는 같은 포트를 공유하므로 어느 워커가 /metrics에 응답할지 정해지지 않음
+  METRICS_MULTIPROC_DIR(gunicorn.conf.py가 마스터에서 설정)이 있으면 워커마다 누적값을 파일로 내보내고
+  /metrics에 응답하는 워커가 모든 파일을 합산해 전체 합계를 노출 (다른 워커 값은 최대 내보내기 주기만큼 지연)
+"""
+import atexit
+import bisect
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 응답 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_UNDESCRIBED = ('untyped', '', DEFAULT_BUCKETS)
+
+# 워커별 누적값 파일 내보내기 주기 (초)
+DEFAULT_EXPORT_SECONDS = 5.0
+
+# 내보내기 파일 이름 (워커 PID별, 종료된 워커 파일도 카운터/히스토그램 합계에 유지)
+EXPORT_FILE_PATTERN = 'metrics_*.json'
+
+logger = logging.getLogger(__name__)
+
+
+class _Shard:
+    """한 스레드만 쓰는 메트릭 누적값"""
+    __slots__ = ('thread', 'counters', 'histograms')
+
+    def __init__(self, thread):
+        self.thread = thread
+        self.counters = {}
+        self.histograms = {}
+
+
+class MetricsRegistry:
+    """카운터/히스토그램/게이지 레지스트리"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()  # 샤드 목록 변경/합산 시에만 사용
+        self._shards = []
+        self._retired = _Shard(None)  # 종료된 스레드의 누적값
+        self._metrics = {}  # name -> (type, help, buckets)
+        self._gauges = {}  # name -> callback
+        self._export_dir = None  # 워커 간 합산 디렉터리 (enable_multiprocess)
+        self._export_path = None
+        self._export_interval = DEFAULT_EXPORT_SECONDS
+        self._export_lock = threading.Lock()  # 내보내기 스레드와 /metrics 요청의 동시 기록 방지
+
+    def describe(self, name, metric_type, help_text, buckets=None):
+        """메트릭 종류와 설명 등록 (counter/histogram)"""
+        self._metrics[name] = (metric_type, help_text, tuple(buckets or DEFAULT_BUCKETS))
+
+    def register_gauge(self, name, help_text, callback):
+        """조회 시점에 callback()으로 값을 읽는 게이지 등록"""
+        self._metrics[name] = ('gauge', help_text, ())
+        self._gauges[name] = callback
+
+    def enable_multiprocess(self, directory, interval=DEFAULT_EXPORT_SECONDS):
+        """
+        워커 간 합산 설정: 이 프로세스 누적값을 directory/metrics_<pid>.json에 기록하고
+        render()에서 다른 워커의 파일과 합산
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._export_dir = directory
+        self._export_interval = interval
+        self._export_path = os.path.join(directory, EXPORT_FILE_PATTERN.replace('*', str(os.getpid())))
+
+    def start_export_thread(self):
+        """내보내기 주기마다 누적값을 파일에 기록하는 데몬 스레드 시작 (프로세스 종료 시에도 한 번 기록)"""
+        def export_loop():
+            while True:
+                time.sleep(self._export_interval)
+                self.export()
+
+        threading.Thread(target=export_loop, name='metrics-export', daemon=True).start()
+        atexit.register(self.export)
+
+    def export(self):
+        """현재 누적값과 게이지 값을 파일에 기록 (enable_multiprocess 설정 시)"""
+        if self._export_dir is None:
+            return
+        counters, histograms = self.snapshot()
+        self._write_export(counters, histograms, self._gauge_values())
+
+    def _write_export(self, counters, histograms, gauges):
+        data = {
+            'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+            'histograms': [[name, labels, entry] for (name, labels), entry in histograms.items()],
+            'gauges': gauges,
+        }
+        temp_path = f'{self._export_path}.tmp'
+        try:
+            with self._export_lock:
+                with open(temp_path, 'w') as f:
+                    json.dump(data, f)
+                # 읽는 워커가 쓰다 만 파일을 보지 않도록 교체
+                os.replace(temp_path, self._export_path)
+        except Exception as e:
+            logger.warning(f"메트릭 내보내기 실패: {str(e)}")
+
+    def _merge_other_workers(self, counters, histograms, gauges):
+        """다른 워커의 내보내기 파일을 합산 (게이지는 최근 갱신된 살아 있는 워커 파일만)"""
+        fresh_after = time.time() - self._export_interval * 3
+        for path in glob.glob(os.path.join(self._export_dir, EXPORT_FILE_PATTERN)):
+            if path == self._export_path:
+                continue
+            try:
+                modified_at = os.path.getmtime(path)
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"메트릭 파일 읽기 실패 ({path}): {str(e)}")
+                continue
+            _merge_into_dicts(
+                counters, histograms,
+                {(name, _labels_key(labels)): value for name, labels, value in data['counters']},
+                {(name, _labels_key(labels)): entry for name, labels, entry in data['histograms']}
+            )
+            if modified_at >= fresh_after:
+                for name, value in data['gauges'].items():
+                    gauges[name] = gauges.get(name, 0) + value
+
+    def _gauge_values(self):
+        values = {}
+        for name, callback in self._gauges.items():
+            try:
+                values[name] = callback()
+            except Exception:
+                continue
+        return values
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _retire_dead_shards(self):
+        """종료된 스레드의 샤드를 합쳐 스레드 수만큼 샤드가 쌓이지 않게 함 (self._lock 보유 상태)"""
+        alive = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+            else:
+                _merge_into(self._retired, shard.counters, shard.histograms)
+        self._shards = alive
+
+    def inc(self, name, value=1, **labels):
+        """카운터 증가"""
+        key = (name, tuple(sorted(labels.items())))
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """히스토그램에 값 기록"""
+        key = (name, tuple(sorted(labels.items())))
+        buckets = self._metrics.get(name, _UNDESCRIBED)[2]
+        histograms = self._shard().histograms
+        entry = histograms.get(key)
+        if entry is None:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            entry = histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(buckets, value)] += 1
+        entry[-1] += value
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """블록 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self):
+        """모든 샤드를 합산한 (counters, histograms)"""
+        counters, histograms = {}, {}
+        with self._lock:
+            self._retire_dead_shards()
+            shards = [self._retired] + self._shards
+            for shard in shards:
+                # 다른 스레드가 쓰는 중에도 dict.copy()는 GIL 아래에서 원자적
+                _merge_into_dicts(counters, histograms, shard.counters.copy(), shard.histograms.copy())
+        return counters, histograms
+
+    def reset(self):
+        """모든 누적값 초기화 (테스트용)"""
+        with self._lock:
+            self._shards = []
+            self._retired = _Shard(None)
+        self._local = threading.local()
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식 문자열 (워커 간 합산 설정 시 모든 워커 합계)"""
+        counters, histograms = self.snapshot()
+        gauges = self._gauge_values()
+        if self._export_dir is not None:
+            self._write_export(counters, histograms, gauges)
+            self._merge_other_workers(counters, histograms, gauges)
+        by_name = {}
+        for (name, labels), value in counters.items():
+            by_name.setdefault(name, []).append((labels, value))
+        for (name, labels), entry in histograms.items():
+            by_name.setdefault(name, []).append((labels, entry))
+
+        lines = []
+        for name in sorted(set(by_name) | set(self._metrics)):
+            metric_type, help_text, buckets = self._metrics.get(name, _UNDESCRIBED)
+            if metric_type == 'gauge':
+                if name not in gauges:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_format_value(gauges[name])}")
+                continue
+
+            samples = by_name.get(name)
+            if not samples:
+                continue
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in sorted(samples, key=lambda sample: sample[0]):
+                if metric_type == 'histogram':
+                    lines.extend(_histogram_lines(name, labels, value, buckets))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+def _labels_key(labels):
+    """내보내기 파일(JSON)의 라벨 목록을 메모리 키 형식(튜플)으로 변환"""
+    return tuple((key, value) for key, value in labels)
+
+
+def _merge_into(target, counters, histograms):
+    _merge_into_dicts(target.counters, target.histograms, counters, histograms)
+
+
+def _merge_into_dicts(target_counters, target_histograms, counters, histograms):
+    for key, value in counters.items():
+        target_counters[key] = target_counters.get(key, 0) + value
+    for key, entry in histograms.items():
+        current = target_histograms.get(key)
+        if current is None:
+            target_histograms[key] = list(entry)
+        else:
+            target_histograms[key] = [a + b for a, b in zip(current, entry)]
+
+
+def _histogram_lines(name, labels, entry, buckets):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(buckets + (float('inf'),), entry[:-1]):
+        cumulative += count
+        le = '+Inf' if bound == float('inf') else repr(float(bound))
+        lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(entry[-1])}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return lines
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+_registry = MetricsRegistry()
+
+# 메트릭 목록
+_registry.describe('http_request_duration_seconds', 'histogram', '라우트별 요청 처리 시간')
+_registry.describe('youtube_api_calls_total', 'counter', 'YouTube API 호출 수 (엔드포인트/키/결과별)')
+_registry.describe('youtube_api_call_duration_seconds', 'histogram', 'YouTube API 호출 시간 (엔드포인트별)')
+_registry.describe('youtube_quota_units_total', 'counter', '사용한 YouTube API 할당량 단위 (엔드포인트/키별)')
+_registry.describe('search_cache_hits_total', 'counter', '검색 결과 캐시 적중 수')
+_registry.describe('search_cache_misses_total', 'counter', '검색 결과 캐시 미스 수')
+_registry.describe('search_cache_evictions_total', 'counter', '검색 결과 캐시 제거 수 (만료/크기 제한별)')
+_registry.describe('notification_channel_fetches_total', 'counter',
+                   '알림 틱 채널 조회 수 (planned: 실제 조회, requested: 검색별로 조회했을 때)')
+_registry.describe('notification_user_duration_seconds', 'histogram',
+                   '알림 틱 사용자별 처리 시간 (결과 선택/이메일 생성/발송/이력 기록, 결과별)',
+                   buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+_registry.describe('email_messages_total', 'counter', '이메일 발송 수 (sent/error)')
+_registry.describe('smtp_connections_total', 'counter', '새로 맺은 SMTP 연결 수 (STARTTLS/로그인 포함)')
+_registry.describe('scheduler_job_duration_seconds', 'histogram', '스케줄러 작업 실행 시간',
+                   buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0))
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """전역 메트릭 레지스트리"""
+    return _registry
+
+
+def clear_multiprocess_dir(directory):
+    """이전 실행의 워커 내보내기 파일 삭제 (gunicorn 마스터가 워커 fork 전에 호출)"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, EXPORT_FILE_PATTERN)):
+        os.remove(path)
+
+
+def init_multiprocess_metrics():
+    """METRICS_MULTIPROC_DIR가 설정되어 있으면 워커 간 합산 시작 (python app.py 단일 프로세스는 설정 없음)"""
+    directory = os.environ.get('METRICS_MULTIPROC_DIR')
+    if not directory:
+        return False
+    interval = float(os.environ.get('METRICS_EXPORT_SECONDS', DEFAULT_EXPORT_SECONDS))
+    _registry.enable_multiprocess(directory, interval)
+    _registry.start_export_thread()
+    return True
+
+
+def init_request_metrics(app):
+    """라우트별 요청 처리 시간 기록 (라우트 패턴 기준으로 집계해 라벨 수를 제한)"""
+    from flask import g, request
+
+    @app.before_request
+    def start_request_timer():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_duration(response):
+        started = g.pop('_metrics_started', None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            _registry.observe('http_request_duration_seconds', time.perf_counter() - started,
+                              route=route, method=request.method, status=str(response.status_code))
+        return response
+
+
+def record_youtube_call(endpoint, key, status, seconds, quota_units=0):
+    """YouTube API 호출 1회 기록 (status: success/quota_error/error)"""
+    _registry.inc('youtube_api_calls_total', endpoint=endpoint, key=key, status=status)
+    _registry.observe('youtube_api_call_duration_seconds', seconds, endpoint=endpoint)
+    if quota_units:
+        _registry.inc('youtube_quota_units_total', quota_units, endpoint=endpoint, key=key)
@@ -0,0 +1,117 @@
+# common_utils/notification_plan.py
+"""
+알림 발송 틱의 채널 조회 계획
+- 발송 대상 알림들의 카테고리 검색(채널 목록 + 조건)을 채널 단위로 합쳐 채널마다 한 번만 조회
+  (기간/채널당 결과 수는 가장 넓은 조건, 최소 조회수는 가장 낮은 조건으로 조회)
+- 조회 결과를 각 검색 조건(기간/최소 조회수/최대 결과 수)으로 다시 걸러 사용자별 결과 구성
+- 틱당 할당량이 구독자 수가 아닌 고유 채널 수에 비례
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# get_recent_popular_shorts와 같은 검색당 채널 수 제한
+MAX_CHANNELS_PER_SEARCH = 20
+# search.list maxResults 상한
+MAX_RESULTS_PER_CHANNEL = 50
+
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@dataclass(frozen=True)
+class ChannelSearch:
+    """카테고리 하나의 검색 조건"""
+    channel_ids: tuple
+    min_views: int
+    days_ago: int
+    max_results: int
+    region_code: str = 'KR'
+
+    @classmethod
+    def from_notification_search(cls, search, region_code='KR'):
+        channel_ids = tuple(cat_channel.channel.id for cat_channel in search.category.category_channels)
+        return cls(channel_ids[:MAX_CHANNELS_PER_SEARCH], search.min_views, search.days_ago, search.max_results, region_code)
+
+
+@dataclass
+class ChannelFetch:
+    """채널 하나의 조회 조건 (합쳐진 검색 조건 중 가장 넓은 범위)"""
+    channel_id: str
+    region_code: str
+    min_views: int
+    days_ago: int
+    max_results: int
+    requests: int = 1
+
+    def widen(self, search):
+        self.min_views = min(self.min_views, search.min_views)
+        # days_ago 0은 기간 제한 없음
+        self.days_ago = 0 if 0 in (self.days_ago, search.days_ago) else max(self.days_ago, search.days_ago)
+        self.max_results = min(MAX_RESULTS_PER_CHANNEL, max(self.max_results, search.max_results))
+        self.requests += 1
+
+
+class ChannelFetchPlan:
+    """여러 검색 조건을 채널별 조회로 합친 계획"""
+
+    def __init__(self):
+        self.fetches = {}
+        self.searches = 0
+
+    def add(self, search):
+        self.searches += 1
+        for channel_id in search.channel_ids:
+            key = (channel_id, search.region_code)
+            fetch = self.fetches.get(key)
+            if fetch is None:
+                self.fetches[key] = ChannelFetch(channel_id, search.region_code, search.min_views, search.days_ago,
+                                                 min(MAX_RESULTS_PER_CHANNEL, search.max_results))
+            else:
+                fetch.widen(search)
+        return search
+
+    @property
+    def channel_requests(self):
+        """계획 없이 검색별로 조회했을 때의 채널 조회 수"""
+        return sum(fetch.requests for fetch in self.fetches.values())
+
+    def __len__(self):
+        return len(self.fetches)
+
+    def execute(self, fetch_func, on_error=None):
+        """
+        채널마다 fetch_func(get_recent_popular_shorts 형식)를 한 번씩 호출
+        Returns: {(channel_id, region_code): 영상 목록 (실패 시 None)}
+        """
+        results = {}
+        for key, fetch in self.fetches.items():
+            try:
+                results[key] = fetch_func(
+                    min_views=fetch.min_views,
+                    days_ago=fetch.days_ago,
+                    max_results=fetch.max_results,
+                    channel_ids=fetch.channel_id,
+                    region_code=fetch.region_code
+                )
+            except Exception as e:
+                results[key] = None
+                if on_error:
+                    on_error(fetch, e)
+        return results
+
+
+def select_results(search, fetched, now=None):
+    """
+    채널별 조회 결과에서 검색 조건에 맞는 영상 선택
+    (get_recent_popular_shorts와 같이 채널당 최대 결과 수 → 전체 최신순 → 최대 결과 수)
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(days=search.days_ago) if search.days_ago > 0 else None
+    selected = []
+    for channel_id in search.channel_ids:
+        videos = fetched.get((channel_id, search.region_code)) or []
+        matched = [video for video in videos
+                   if video.get('viewCount', 0) >= search.min_views
+                   and (cutoff is None or datetime.strptime(video['publishedAt'], _TIME_FORMAT) >= cutoff)]
+        selected.extend(matched[:search.max_results])
+
+    selected.sort(key=lambda video: video['publishedAt'], reverse=True)
+    return selected[:search.max_results]
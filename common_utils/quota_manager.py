@@ -9,6 +9,7 @@ import logging
 from dataclasses import dataclass
 from threading import Lock
 import pytz
+from .key_health import KeyHealthRegistry, ProbeResult, ProbeStatus, PROBE_ENDPOINT, system_key_ref
 
 logger = logging.getLogger(__name__)
 
@@ -70,9 +71,12 @@ class YouTubeQuotaManager:
         'comments.list': 1,
     }
     
-    def __init__(self, api_keys: List[str], daily_limit: int = 10000):
+    def __init__(self, api_keys: List[str], daily_limit: int = 10000,
+                 health_registry: Optional[KeyHealthRegistry] = None):
         self.api_keys = api_keys
         self.daily_limit = daily_limit
+        # 키별 서킷 브레이커 (백그라운드 프로버와 실제 호출 결과로 갱신)
+        self.health_registry = health_registry or KeyHealthRegistry()
         self.current_key_index = 0
         self.quota_usage: Dict[int, QuotaUsage] = {}
         self.call_history: List[APICall] = []
@@ -103,6 +107,8 @@ class YouTubeQuotaManager:
             return False
         if usage.is_exceeded():
             return False
+        if not self.health_registry.is_available(system_key_ref(index)):
+            return False
         return True
     
     def get_current_api_key(self) -> Optional[str]:
@@ -144,6 +150,7 @@ class YouTubeQuotaManager:
                 usage = self.quota_usage[key_index]
                 if success:
                     usage.daily_used += cost
+                    self.health_registry.record_success(system_key_ref(key_index))
                 usage.last_request_time = now
                 usage.last_error_reason = "" if success else (error_message or usage.last_error_reason)
                 
@@ -229,6 +236,9 @@ class YouTubeQuotaManager:
                 elif error_type == QuotaErrorType.API_KEY_INVALID:
                     # 잘못된 키는 비활성화 처리
                     usage.disabled = True
+                    self.health_registry.record_failure(
+                        system_key_ref(self.current_key_index), error_message, fatal=True
+                    )
                 elif error_type == QuotaErrorType.RATE_LIMIT_EXCEEDED:
                     # 속도 제한은 일시적인 문제 → 바로 전환할 수 있도록만 기록
                     pass
@@ -240,6 +250,25 @@ class YouTubeQuotaManager:
         
         return error_type, user_message
     
+    def apply_probe_result(self, key_index: int, result: ProbeResult):
+        """백그라운드 키 상태 확인 결과 반영"""
+        with self.lock:
+            usage = self.quota_usage.get(key_index)
+            if usage:
+                if result.status == ProbeStatus.OK and usage.last_error_reason == QuotaErrorType.API_KEY_INVALID.value:
+                    # 잘못된 키로 비활성화됐던 키가 복구된 경우
+                    usage.disabled = False
+                    usage.last_error_reason = ""
+                elif result.status == ProbeStatus.QUOTA_EXCEEDED and 'ratelimit' not in result.error_message.lower():
+                    usage.daily_used = usage.daily_limit
+                elif result.status == ProbeStatus.INVALID:
+                    usage.disabled = True
+                    usage.last_error_reason = QuotaErrorType.API_KEY_INVALID.value
+        if result.status == ProbeStatus.OK:
+            # 확인 요청도 할당량을 소모하므로 기록
+            self.record_api_call(PROBE_ENDPOINT, success=True, key_index=key_index)
+        self.health_registry.record_probe(system_key_ref(key_index), result)
+    
     def _generate_korean_error_message(self, error_type: QuotaErrorType) -> str:
         """사용자 친화적인 한국어 오류 메시지 생성"""
         kst = pytz.timezone('Asia/Seoul')
@@ -319,6 +348,7 @@ class YouTubeQuotaManager:
                     'is_warning': usage.is_warning_level(),
                     'disabled': usage.disabled,
                     'last_error_reason': usage.last_error_reason,
+                    'circuit_available': self.health_registry.is_available(system_key_ref(i), claim_trial=False),
                     'reset_time': usage.reset_time.isoformat() if usage.reset_time else None
                 }
                 status['keys_status'].append(key_status)
@@ -373,13 +403,14 @@ def get_quota_manager() -> Optional[YouTubeQuotaManager]:
 def initialize_quota_manager(api_keys_str: str, daily_limit: int = 10000) -> YouTubeQuotaManager:
     """할당량 매니저 초기화"""
     global _quota_manager
+    from .key_health import get_key_health_registry
     
     if not api_keys_str:
         logger.warning("API 키가 설정되지 않았습니다")
         return None
     
     api_keys = [key.strip() for key in api_keys_str.split(',') if key.strip()]
-    _quota_manager = YouTubeQuotaManager(api_keys, daily_limit)
+    _quota_manager = YouTubeQuotaManager(api_keys, daily_limit, health_registry=get_key_health_registry())
     
     logger.info(f"할당량 매니저 초기화 완료: {len(api_keys)}개 키")
     return _quota_manager
\ No newline at end of file
@@ -0,0 +1,223 @@
+# common_utils/request_profiler.py
+"""
+요청 단위 프로파일링 (cProfile)
+- 관리자가 X-Profile: 1 헤더를 보내거나 REQUEST_PROFILE_SAMPLE_RATE로 표본 추출된 요청만 프로파일링
+- 요청이 백그라운드 실행기에 넘긴 작업(/search 검색 작업 등)도 같은 요청 ID로 프로파일링
+- 결과는 REQUEST_PROFILE_DIR에 .prof(pstats) + .json(요청 파라미터/요약)으로 저장하고 최근 N개만 보관
+- 비활성 상태에서는 헤더 확인과 설정값 비교만 수행
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import re
+import time
+import uuid
+from datetime import datetime
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+# 파라미터 저장 시 값을 가리는 키 (API 키/토큰 등)
+_SENSITIVE_PARAM = re.compile(r'(^|_)(key|token|secret|password|credential)s?$|api_?key', re.IGNORECASE)
+_PROFILE_ID = re.compile(r'^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}(-[a-z_]+)?$')
+
+# 요약에 포함할 누적 시간 상위 함수 수
+SUMMARY_FUNCTIONS = 15
+
+
+def get_profile_dir():
+    return os.environ.get('REQUEST_PROFILE_DIR', os.path.join('logs', 'profiles'))
+
+
+def _new_profile_id():
+    return f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def is_valid_profile_id(profile_id):
+    """경로 조작 방지를 위한 프로파일 ID 형식 확인"""
+    return bool(_PROFILE_ID.match(profile_id or ''))
+
+
+def mask_params(params):
+    """민감한 파라미터 값 가리기"""
+    return {key: ('***' if _SENSITIVE_PARAM.search(key) else value) for key, value in params.items()}
+
+
+def _summarize(profile):
+    """누적 시간 상위 함수 요약 (목록 화면용)"""
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, func), (_, calls, total, cumulative, _) in stats.stats.items():
+        rows.append({
+            'function': f"{os.path.basename(filename)}:{line}({func})",
+            'calls': calls,
+            'total_ms': round(total * 1000, 2),
+            'cumulative_ms': round(cumulative * 1000, 2),
+        })
+    rows.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+    return rows[:SUMMARY_FUNCTIONS]
+
+
+def save_profile(profile, profile_id, meta):
+    """프로파일과 메타데이터 저장 후 보관 개수 초과분 삭제"""
+    profile_dir = get_profile_dir()
+    os.makedirs(profile_dir, exist_ok=True)
+
+    profile.dump_stats(os.path.join(profile_dir, f"{profile_id}.prof"))
+    meta = dict(meta, id=profile_id, top_functions=_summarize(profile))
+    with open(os.path.join(profile_dir, f"{profile_id}.json"), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    _prune(profile_dir, int(os.environ.get('REQUEST_PROFILE_KEEP', 50)))
+    return meta
+
+
+def _prune(profile_dir, keep):
+    profile_ids = sorted(name[:-5] for name in os.listdir(profile_dir) if name.endswith('.json'))
+    for profile_id in profile_ids[:-keep] if keep > 0 else profile_ids:
+        for ext in ('.json', '.prof'):
+            try:
+                os.remove(os.path.join(profile_dir, profile_id + ext))
+            except OSError:
+                pass
+
+
+def list_profiles(limit=50):
+    """최근 프로파일 메타데이터 목록 (최신순)"""
+    profile_dir = get_profile_dir()
+    if not os.path.isdir(profile_dir):
+        return []
+    names = sorted((name for name in os.listdir(profile_dir) if name.endswith('.json')), reverse=True)
+    profiles = []
+    for name in names[:limit]:
+        try:
+            with open(os.path.join(profile_dir, name), encoding='utf-8') as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def get_profile_path(profile_id):
+    """프로파일(.prof) 파일 경로 (없거나 ID 형식이 잘못되면 None)"""
+    if not is_valid_profile_id(profile_id):
+        return None
+    path = os.path.join(get_profile_dir(), f"{profile_id}.prof")
+    return path if os.path.exists(path) else None
+
+
+def render_profile_text(path, sort='cumulative', limit=60):
+    """pstats 텍스트 보고서"""
+    output = io.StringIO()
+    stats = pstats.Stats(path, stream=output)
+    stats.sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+def _enable(profile):
+    """프로파일러 시작 (다른 프로파일러가 이미 동작 중이면 건너뜀)"""
+    try:
+        profile.enable()
+        return True
+    except ValueError:
+        return False
+
+
+def _run_profiled(func, profile_id, meta):
+    """func를 새 프로파일러로 실행하고 저장하는 래퍼 (백그라운드 스레드용)"""
+    def run(*args, **kwargs):
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        if not _enable(profile):
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            try:
+                save_profile(profile, profile_id, dict(meta, duration_ms=round((time.perf_counter() - started) * 1000, 1)))
+            except Exception as e:
+                print(f"⚠️ 프로파일 저장 실패: {str(e)}")
+    return run
+
+
+def propagate_profile(func, kind):
+    """
+    현재 요청이 프로파일링 중이면 func를 같은 요청 ID의 프로파일러로 감싸 반환
+    (cProfile은 스레드 단위라 실행기에 넘긴 작업은 따로 프로파일링해야 함)
+    """
+    from flask import g, has_request_context
+
+    if not has_request_context():
+        return func
+    request_meta = g.get('_profile_meta')
+    if request_meta is None:
+        return func
+    return _run_profiled(func, f"{request_meta['id']}-{kind}", dict(request_meta, kind=kind, parent=request_meta['id']))
+
+
+def init_request_profiler(app):
+    """요청 프로파일링 훅 등록"""
+    from flask import g, request
+    from flask_login import current_user
+
+    sample_rate = float(os.environ.get('REQUEST_PROFILE_SAMPLE_RATE', 0))
+
+    def should_profile():
+        if request.headers.get(PROFILE_HEADER):
+            # 헤더 요청은 관리자만 허용 (헤더가 없는 요청에서는 사용자 조회를 하지 않음)
+            if current_user.is_authenticated and current_user.is_admin():
+                return 'header'
+            return None
+        if sample_rate and random.random() < sample_rate:
+            return 'sample'
+        return None
+
+    @app.before_request
+    def start_request_profile():
+        trigger = should_profile()
+        if trigger is None:
+            return
+        profile = cProfile.Profile()
+        meta = {
+            'id': _new_profile_id(),
+            'kind': 'request',
+            'trigger': trigger,
+            'created_at': datetime.utcnow().isoformat(),
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'params': mask_params({**request.args.to_dict(), **request.form.to_dict(), **(request.view_args or {})}),
+            'user_id': current_user.get_id() if current_user.is_authenticated else None,
+        }
+        if not _enable(profile):
+            return
+        g._profile = profile
+        g._profile_started = time.perf_counter()
+        g._profile_meta = meta
+
+    @app.after_request
+    def finish_request_profile(response):
+        profile = g.pop('_profile', None)
+        if profile is None:
+            return response
+        profile.disable()
+        # _profile_meta는 남겨 두어 스트리밍 응답의 백그라운드 작업도 같은 ID로 연결
+        meta = dict(g._profile_meta, status=response.status_code,
+                    duration_ms=round((time.perf_counter() - g._profile_started) * 1000, 1))
+        try:
+            save_profile(profile, meta['id'], meta)
+            response.headers[PROFILE_ID_HEADER] = meta['id']
+        except Exception as e:
+            app.logger.warning(f"프로파일 저장 실패: {str(e)}")
+        return response
+
+    @app.teardown_request
+    def stop_request_profile(exc):
+        # 처리되지 않은 예외로 after_request가 호출되지 않은 경우 프로파일러 정리
+        profile = g.pop('_profile', None)
+        if profile is not None:
+            profile.disable()
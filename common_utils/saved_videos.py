@@ -0,0 +1,156 @@
+# common_utils/saved_videos.py
+"""
+저장된 영상 목록 조회 / 일괄 작업
+- (saved_at, id) 키셋(커서) 페이지네이션: COUNT(*)와 OFFSET 스캔 없이 idx_user_saved_at 인덱스 범위 조회
+- 일괄 저장(중복 무시 INSERT) / 일괄 삭제 / 일괄 메모 수정을 한 트랜잭션으로 처리
+"""
+
+import base64
+import os
+from datetime import datetime
+
+from sqlalchemy import and_, or_, bindparam
+
+from models import db, SavedVideo
+from common_utils.db_helpers import insert_ignore_conflicts
+
+# 일괄 작업 요청 하나에 담을 수 있는 최대 영상 수
+SAVED_VIDEO_BULK_LIMIT = int(os.environ.get('SAVED_VIDEO_BULK_LIMIT', 500))
+
+REQUIRED_FIELDS = ['video_id', 'video_title', 'channel_title', 'video_url']
+
+
+def encode_cursor(video):
+    """마지막 영상의 (saved_at, id)를 커서 문자열로 변환"""
+    raw = f"{video.saved_at.isoformat()}|{video.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (saved_at, id)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        saved_at, video_id = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        return datetime.fromisoformat(saved_at), int(video_id)
+    except Exception:
+        raise ValueError('유효하지 않은 커서입니다.')
+
+
+def get_saved_videos_page(user_id, cursor=None, per_page=20):
+    """
+    저장된 영상 최신순 한 페이지 조회
+
+    Returns:
+        (영상 목록, 다음 페이지 커서 또는 None)
+    """
+    query = SavedVideo.query.filter(SavedVideo.user_id == user_id)
+    if cursor:
+        saved_at, last_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            SavedVideo.saved_at < saved_at,
+            and_(SavedVideo.saved_at == saved_at, SavedVideo.id < last_id)
+        ))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    videos = query.order_by(SavedVideo.saved_at.desc(), SavedVideo.id.desc()).limit(per_page + 1).all()
+    next_cursor = encode_cursor(videos[per_page - 1]) if len(videos) > per_page else None
+    return videos[:per_page], next_cursor
+
+
+def build_saved_video_values(data):
+    """요청 데이터를 SavedVideo 컬럼 값으로 변환 (필수값 누락 시 ValueError)"""
+    for field in REQUIRED_FIELDS:
+        if not data.get(field):
+            raise ValueError(f'{field}는 필수 입력값입니다.')
+
+    return {
+        'video_id': data['video_id'],
+        'video_title': data['video_title'],
+        'channel_title': data['channel_title'],
+        'channel_id': data.get('channel_id'),
+        'thumbnail_url': data.get('thumbnail_url'),
+        'video_url': data['video_url'],
+        'view_count': data.get('view_count', 0),
+        'duration': data.get('duration'),
+        'published_at': datetime.fromisoformat(data['published_at'].replace('Z', '+00:00')) if data.get('published_at') else None,
+        'notes': data.get('notes', '')
+    }
+
+
+def bulk_save_videos(user_id, items):
+    """
+    여러 영상을 한 번에 저장 (이미 저장된 영상은 건너뜀, 커밋은 호출하는 쪽에서 수행)
+
+    Returns:
+        dict: saved(새로 저장된 SavedVideo 목록), duplicates(이미 저장된 video_id), invalid(검증 실패 항목)
+    """
+    rows = {}
+    invalid = []
+    for index, data in enumerate(items):
+        try:
+            values = build_saved_video_values(data if isinstance(data, dict) else {})
+        except ValueError as e:
+            invalid.append({'index': index, 'message': str(e)})
+            continue
+        rows.setdefault(values['video_id'], values)
+
+    video_ids = list(rows)
+    existing = {
+        video_id for (video_id,) in db.session.query(SavedVideo.video_id).filter(
+            SavedVideo.user_id == user_id, SavedVideo.video_id.in_(video_ids)
+        )
+    } if video_ids else set()
+
+    saved_at = datetime.utcnow()
+    new_rows = [dict(values, user_id=user_id, saved_at=saved_at)
+                for video_id, values in rows.items() if video_id not in existing]
+    # 동시에 같은 영상을 저장한 요청이 있어도 unique_user_video 충돌은 건너뜀
+    insert_ignore_conflicts(SavedVideo, new_rows, index_elements=['user_id', 'video_id'])
+
+    saved = SavedVideo.query.filter(
+        SavedVideo.user_id == user_id,
+        SavedVideo.video_id.in_([row['video_id'] for row in new_rows]),
+        SavedVideo.saved_at == saved_at
+    ).order_by(SavedVideo.id).all() if new_rows else []
+
+    return {
+        'saved': saved,
+        'duplicates': [video_id for video_id in video_ids if video_id in existing],
+        'invalid': invalid
+    }
+
+
+def bulk_delete_videos(user_id, ids):
+    """사용자의 저장된 영상 여러 개를 삭제하고 삭제된 수 반환 (커밋은 호출하는 쪽에서 수행)"""
+    if not ids:
+        return 0
+    return SavedVideo.query.filter(
+        SavedVideo.user_id == user_id, SavedVideo.id.in_(ids)
+    ).delete(synchronize_session=False)
+
+
+def bulk_update_notes(user_id, notes_by_id):
+    """
+    여러 영상의 메모를 한 번에 수정 (커밋은 호출하는 쪽에서 수행)
+
+    Args:
+        notes_by_id: 저장된 영상 ID -> 메모
+
+    Returns:
+        (수정된 영상 ID 목록, 찾을 수 없는 영상 ID 목록)
+    """
+    if not notes_by_id:
+        return [], []
+
+    owned = {
+        video_id for (video_id,) in db.session.query(SavedVideo.id).filter(
+            SavedVideo.user_id == user_id, SavedVideo.id.in_(list(notes_by_id))
+        )
+    }
+    updated = [video_id for video_id in notes_by_id if video_id in owned]
+    if updated:
+        table = SavedVideo.__table__
+        stmt = table.update().where(table.c.id == bindparam('b_id')).values(notes=bindparam('b_notes'))
+        db.session.execute(stmt, [{'b_id': video_id, 'b_notes': notes_by_id[video_id]} for video_id in updated])
+
+    return updated, [video_id for video_id in notes_by_id if video_id not in owned]
@@ -1,14 +1,19 @@
 # core/search.py
 import hashlib
 import json
+import logging
 import time
 import os
-import googleapiclient.discovery
+import threading
 import isodate
 import pytz
 from datetime import datetime, timedelta
-from deep_translator import GoogleTranslator
-from .quota_manager import initialize_quota_manager, get_quota_manager, QuotaErrorType
+from .quota_manager import initialize_quota_manager, get_quota_manager, QuotaErrorType, YouTubeQuotaManager
+from .key_health import system_key_ref
+from .metrics import get_metrics_registry, record_youtube_call
+from .structured_log import log_event
+
+logger = logging.getLogger(__name__)
 
 # 캐시 설정 (API 호출 결과를 메모리에 저장)
 CACHE_TIMEOUT = 28800  # 캐시 유효시간 (초)
@@ -17,19 +22,73 @@ cache = {}
 # 번역 캐시 설정
 translation_cache = {}
 
-# 할당량 관리자 초기화
-api_key_str = os.environ.get('YOUTUBE_API_KEY', '')
-quota_manager = initialize_quota_manager(api_key_str, daily_limit=10000)
+metrics = get_metrics_registry()
+
+# 할당량 관리자 (init_quota_manager()에서 초기화)
+quota_manager = None
+_quota_manager_initialized = False
 
-# 호환성을 위한 기존 변수들
-api_keys = quota_manager.api_keys if quota_manager else []
+# 호환성을 위한 기존 변수들 (다른 모듈이 값으로 임포트하므로 같은 리스트를 제자리에서 채움)
+api_keys = []
 current_key_index = 0
 
-# 보안: API 키 정보 로깅 방지
-if quota_manager:
-    print(f"✅ 할당량 관리자 초기화 완료: {len(api_keys)}개 키 로드")
-else:
-    print("⚠️ 경고: YOUTUBE_API_KEY 환경변수 미설정 또는 할당량 관리자 초기화 실패")
+# 키별 YouTube 클라이언트 캐시 (httplib2 연결은 스레드 간 공유할 수 없으므로 스레드마다 보관)
+_client_cache = threading.local()
+_client_generation = 0  # init_quota_manager(force=True)마다 증가시켜 이전 클라이언트 폐기
+
+
+def init_quota_manager(force=False):
+    """YOUTUBE_API_KEY로 할당량 관리자 초기화 (임포트 시점이 아닌 앱 시작 시 명시적으로 호출)"""
+    global quota_manager, _quota_manager_initialized, _client_generation
+    if _quota_manager_initialized and not force:
+        return quota_manager
+
+    _client_generation += 1
+
+    api_key_str = os.environ.get('YOUTUBE_API_KEY', '')
+    quota_manager = initialize_quota_manager(api_key_str, daily_limit=10000)
+    api_keys[:] = quota_manager.api_keys if quota_manager else []
+    _quota_manager_initialized = True
+
+    # 보안: API 키 정보 로깅 방지
+    if quota_manager:
+        print(f"✅ 할당량 관리자 초기화 완료: {len(api_keys)}개 키 로드")
+    else:
+        print("⚠️ 경고: YOUTUBE_API_KEY 환경변수 미설정 또는 할당량 관리자 초기화 실패")
+    return quota_manager
+
+
+def _ensure_quota_manager():
+    if not _quota_manager_initialized:
+        init_quota_manager()
+
+
+def build_youtube_client(api_key, **kwargs):
+    """
+    YouTube Data API 클라이언트 생성 (googleapiclient는 첫 호출 시 로딩)
+    YOUTUBE_API_BASE_URL이 설정되면 해당 주소로 요청 (로컬 대역 서버 등)
+    """
+    import googleapiclient.discovery
+    base_url = os.environ.get('YOUTUBE_API_BASE_URL')
+    if base_url:
+        kwargs.setdefault('client_options', {'api_endpoint': base_url})
+    return googleapiclient.discovery.build("youtube", "v3", developerKey=api_key, **kwargs)
+
+def _cached_clients():
+    """현재 스레드의 (API 키, 기본 주소) -> 클라이언트 캐시"""
+    if getattr(_client_cache, 'generation', None) != _client_generation:
+        _client_cache.clients = {}
+        _client_cache.generation = _client_generation
+    return _client_cache.clients
+
+def _client_for_key(api_key):
+    """키마다 한 번만 클라이언트를 만들고 재사용 (매 호출 discovery.build 방지)"""
+    clients = _cached_clients()
+    cache_key = (api_key, os.environ.get('YOUTUBE_API_BASE_URL'))
+    client = clients.get(cache_key)
+    if client is None:
+        client = clients[cache_key] = build_youtube_client(api_key)
+    return client
 
 def _key_preview(key: str) -> str:
     """보안: API 키 미리보기 (전체 키 노출 방지)"""
@@ -49,12 +108,14 @@ def _is_quota_or_key_error(error_str: str) -> bool:
 
 def get_current_api_key():
     """현재 사용할 API 키 반환"""
+    _ensure_quota_manager()
     if quota_manager:
         return quota_manager.get_current_api_key()
     return api_keys[current_key_index] if api_keys else None
 
 def get_api_key_info():
     """API 키 정보 반환"""
+    _ensure_quota_manager()
     if quota_manager:
         status = quota_manager.get_quota_status()
         return {
@@ -71,10 +132,11 @@ def get_api_key_info():
 
 def switch_to_next_api_key():
     """다음 API 키로 전환"""
+    _ensure_quota_manager()
     if quota_manager:
         new_key = quota_manager.switch_to_next_key()
         if new_key:
-            print(f"할당량 관리자: 다음 API 키로 전환 완료")
+            log_event(logger, logging.INFO, 'api_key.switched', source='quota_manager')
         return new_key
     
     # 기존 로직 (호환성 유지)
@@ -84,7 +146,7 @@ def switch_to_next_api_key():
         
     current_key_index = (current_key_index + 1) % len(api_keys)
     new_key = get_current_api_key()
-    print(f"ℹ️ API 키 전환: 인덱스 {current_key_index}로 변경됨")
+    log_event(logger, logging.INFO, 'api_key.switched', index=current_key_index)
     return new_key
 
 def translate_text(text, target_lang='ko'):
@@ -104,11 +166,12 @@ def translate_text(text, target_lang='ko'):
     # 캐시에서 번역 확인
     if cache_key in translation_cache:
         # 보안: 캐시 히트 로깅에서 내용 축소
-        print(f"💾 번역 캐시 히트 (길이: {len(text)}자)")
+        log_event(logger, logging.DEBUG, 'translate.cache_hit', sample=50, length=len(text))
         return translation_cache[cache_key]
     
     try:
         # 번역 실행
+        from deep_translator import GoogleTranslator
         translator = GoogleTranslator(source='auto', target=target_lang)
         translated = translator.translate(text)
         
@@ -120,10 +183,10 @@ def translate_text(text, target_lang='ko'):
         translation_cache[cache_key] = translated
         
         # 보안: 번역 로깅에서 내용 축소 
-        print(f"✅ 번역 완료 (입력: {len(text)}자, 출력: {len(translated)}자)")
+        log_event(logger, logging.DEBUG, 'translate.done', input_length=len(text), output_length=len(translated))
         return translated
     except Exception as e:
-        print(f"❌ 번역 오류: {type(e).__name__}")
+        log_event(logger, logging.WARNING, 'translate.error', sample=10, error=type(e).__name__)
         return text  # 오류 시 원본 반환
         
     # 번역 캐시 크기 제한
@@ -143,9 +206,12 @@ def get_from_cache(cache_key):
     if cache_key in cache:
         data, timestamp = cache[cache_key]
         if time.time() - timestamp < CACHE_TIMEOUT:
+            metrics.inc('search_cache_hits_total')
             return data
         else:
             del cache[cache_key]
+            metrics.inc('search_cache_evictions_total', reason='expired')
+    metrics.inc('search_cache_misses_total')
     return None
 
 def save_to_cache(cache_key, data):
@@ -158,7 +224,8 @@ def save_to_cache(cache_key, data):
         sorted_keys = sorted(cache.keys(), key=lambda k: cache[k][1])
         for key in sorted_keys[:20]:
             del cache[key]
-        print(f"🗺️ 캐시 정리: {len(sorted_keys[:20])}개 항목 제거, 현재: {len(cache)}개")
+        metrics.inc('search_cache_evictions_total', len(sorted_keys[:20]), reason='size')
+        log_event(logger, logging.INFO, 'cache.pruned', removed=len(sorted_keys[:20]), size=len(cache))
 
 def get_cache_stats():
     """캐시 통계 반환"""
@@ -186,8 +253,7 @@ def get_youtube_api_service():
         raise Exception("사용 가능한 YouTube API 키가 없습니다.")
         
     try:
-        youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=api_key)
-        return youtube
+        return _client_for_key(api_key)
     except Exception as e:
         error_str = str(e).lower()
         if quota_manager and _is_quota_or_key_error(error_str):
@@ -195,19 +261,30 @@ def get_youtube_api_service():
             error_type, user_message = quota_manager.handle_quota_error(str(e), "get_service")
             next_api_key = quota_manager.switch_to_next_key()
             if next_api_key:
-                print(f"⚠️ 할당량/키 오류로 다음 API 키({_key_preview(next_api_key)})로 전환")
-                return googleapiclient.discovery.build("youtube", "v3", developerKey=next_api_key)
+                log_event(logger, logging.WARNING, 'api_key.switched', stage='get_service', key=_key_preview(next_api_key))
+                return _client_for_key(next_api_key)
             else:
                 raise Exception(user_message)
         elif _is_quota_or_key_error(error_str):
             # 기존 로직 (호환성)
             next_api_key = switch_to_next_api_key()
             if next_api_key:
-                print(f"할당량 초과로 다음 API 키로 전환합니다.")
-                return googleapiclient.discovery.build("youtube", "v3", developerKey=next_api_key)
+                log_event(logger, logging.WARNING, 'api_key.switched', stage='get_service')
+                return _client_for_key(next_api_key)
         # 다른 오류는 그대로 전파
         raise
 
+def _client_for_current_key(youtube):
+    """
+    현재 키의 클라이언트 반환 (execute_youtube_api_call 재시도 중 키가 전환됐으면 새 키의 캐시된 클라이언트)
+    미리 만든 클라이언트를 그대로 재시도하면 소진된 키로 다시 요청하게 됨
+    캐시에서 만든 클라이언트가 아니면 (테스트 대역 등) 그대로 사용
+    """
+    if not any(client is youtube for client in _cached_clients().values()):
+        return youtube
+    api_key = get_current_api_key()
+    return _client_for_key(api_key) if api_key else youtube
+
 def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
     """
     YouTube API 호출을 실행하고 할당량을 추적하는 헬퍼 함수
@@ -224,13 +301,18 @@ def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
         Exception: API 호출 실패 시
     """
     for attempt in range(max_retries):
+        key_label = system_key_ref(quota_manager.current_key_index) if quota_manager else 'system'
+        started = time.perf_counter()
         try:
             # API 호출 실행
             result = api_call_func()
             
             # 성공한 경우 할당량 기록
             if quota_manager:
-                quota_manager.record_api_call(endpoint_name, success=True)
+                cost = quota_manager.record_api_call(endpoint_name, success=True)
+            else:
+                cost = YouTubeQuotaManager.API_COSTS.get(endpoint_name, 1)
+            record_youtube_call(endpoint_name, key_label, 'success', time.perf_counter() - started, cost)
             
             return result
             
@@ -239,6 +321,7 @@ def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
             
             # 할당량/키 관련 오류인지 확인
             if _is_quota_or_key_error(error_str):
+                record_youtube_call(endpoint_name, key_label, 'quota_error', time.perf_counter() - started)
                 if quota_manager:
                     # 할당량 관리자를 통한 오류 처리
                     error_type, user_message = quota_manager.handle_quota_error(str(e), endpoint_name)
@@ -246,7 +329,8 @@ def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
                     # 다른 키로 전환 시도
                     next_key = quota_manager.switch_to_next_key()
                     if next_key and attempt < max_retries - 1:
-                        print(f"🔄 [{endpoint_name}] API 키 전환({_key_preview(next_key)}) 후 재시도 ({attempt + 1}/{max_retries})")
+                        log_event(logger, logging.WARNING, 'youtube.retry', reason='key_switch', endpoint=endpoint_name,
+                                  key=_key_preview(next_key), attempt=attempt + 1, max_retries=max_retries)
                         continue
                     else:
                         # 더 이상 시도할 수 없는 경우
@@ -255,19 +339,22 @@ def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
                     # 기존 로직 (호환성)
                     next_key = switch_to_next_api_key()
                     if next_key and attempt < max_retries - 1:
-                        print(f"🔄 [{endpoint_name}] API 키 전환 후 재시도 ({attempt + 1}/{max_retries})")
+                        log_event(logger, logging.WARNING, 'youtube.retry', reason='key_switch', endpoint=endpoint_name,
+                                  attempt=attempt + 1, max_retries=max_retries)
                         continue
                     else:
                         raise Exception("모든 YouTube API 키의 할당량이 초과되었습니다.")
             else:
                 # 할당량 외 다른 오류
+                record_youtube_call(endpoint_name, key_label, 'error', time.perf_counter() - started)
                 if quota_manager:
                     quota_manager.record_api_call(endpoint_name, success=False, error_message=str(e))
                 
                 # 재시도 가능한 오류인지 확인 (네트워크 오류 등)
                 if any(keyword in error_str for keyword in ['timeout', 'connection', 'network']):
                     if attempt < max_retries - 1:
-                        print(f"🌐 [{endpoint_name}] 네트워크 오류로 재시도 ({attempt + 1}/{max_retries})")
+                        log_event(logger, logging.WARNING, 'youtube.retry', reason='network', endpoint=endpoint_name,
+                                  attempt=attempt + 1, max_retries=max_retries)
                         time.sleep(1)  # 1초 대기 후 재시도
                         continue
                 
@@ -281,10 +368,12 @@ def execute_youtube_api_call(api_call_func, endpoint_name, max_retries=3):
 # 호환성 블록은 그대로 유지합니다.
 
 def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
-                                   category_id=None, region_code="KR", language=None, keyword=None):
+                                   category_id=None, region_code="KR", language=None, keyword=None,
+                                   on_progress=None):
     """
     키워드 기반 영상 검색 - API 키 순환 로직 강화
     제한사항 적용: 최소 조회수 10만, 최대 기간 5일, 최대 20개 결과
+    on_progress: 지정 시 videos.list 배치(50개)마다 해당 배치의 필터링 결과로 호출 (스트리밍용)
     """
     filtered_videos = []
     all_api_keys_exhausted = False  # 모든 API 키 소진 여부 플래그
@@ -311,8 +400,8 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
 
         # 보안: 검색 파라미터에서 API 키 제거 및 제한 반영
         safe_params = {k: v for k, v in search_params.items() if k != 'key' and 'api' not in k.lower()}
-        print(f"🔍 [키워드 검색] 조건: {safe_params}")
-        print(f"⚙️ [제한사항] 최소조회수: {min_views:,}, 기간: {days_ago}일, 최대결과: {max_results}개")
+        log_event(logger, logging.INFO, 'search.keyword.start', params=safe_params,
+                  min_views=min_views, days_ago=days_ago, max_results=max_results)
         all_video_ids = []
         next_page_token = None
 
@@ -330,14 +419,14 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
                 try:
                     youtube = get_youtube_api_service()
                     search_response = execute_youtube_api_call(
-                        lambda: youtube.search().list(**search_params).execute(),
+                        lambda: _client_for_current_key(youtube).search().list(**search_params).execute(),
                         'search.list'
                     )
                     items = search_response.get('items', [])
                     video_ids = [item['id']['videoId'] for item in items]
                     all_video_ids.extend(video_ids)
                     
-                    print(f"📊 페이지 결과: {len(items)}개 항목 발견 (총 {len(all_video_ids)}개)")
+                    log_event(logger, logging.DEBUG, 'search.keyword.page', items=len(items), total=len(all_video_ids))
                     next_page_token = search_response.get('nextPageToken')
                     page_processed = True
                     
@@ -349,15 +438,15 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
                     if _is_quota_or_key_error(error_str):
                         next_key = quota_manager.switch_to_next_key() if quota_manager else switch_to_next_api_key()
                         if next_key:
-                            print(f"⚠️ [검색 중 할당량/키 오류] 다음 API 키({_key_preview(next_key)})로 전환")
+                            log_event(logger, logging.WARNING, 'api_key.switched', stage='search.list', key=_key_preview(next_key))
                             current_attempt += 1
                         else:
-                            print("🚫 [모든 API 키 소진] 더 이상 사용 가능한 API 키가 없음")
+                            log_event(logger, logging.ERROR, 'search.keys_exhausted')
                             all_api_keys_exhausted = True
                             break
                     else:
                         # 할당량 외 다른 오류
-                        print(f"❌ [검색 오류] {type(e).__name__}: {str(e)[:100]}")
+                        log_event(logger, logging.ERROR, 'search.keyword.page_error', error=type(e).__name__, message=str(e)[:100])
                         page_processed = True
                         break
             
@@ -377,12 +466,13 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
             batch_ids = all_video_ids[i:i+50]
             batch_processed = False
             current_attempt = 0
+            batch_start = len(filtered_videos)
             
             while current_attempt < max_api_key_attempts and not batch_processed:
                 try:
                     youtube = get_youtube_api_service()
                     video_response = execute_youtube_api_call(
-                        lambda: youtube.videos().list(
+                        lambda: _client_for_current_key(youtube).videos().list(
                             part='snippet,statistics,contentDetails',
                             id=','.join(batch_ids)
                         ).execute(),
@@ -424,7 +514,7 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
                             })
 
                         except Exception as ve:
-                            print(f"❌ [상세 처리 오류] {type(ve).__name__}")
+                            log_event(logger, logging.WARNING, 'search.video_error', sample=20, error=type(ve).__name__)
                             continue
                             
                     batch_processed = True
@@ -434,18 +524,25 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
                     if _is_quota_or_key_error(error_str):
                         next_key = quota_manager.switch_to_next_key() if quota_manager else switch_to_next_api_key()
                         if next_key:
-                            print(f"⚠️ [상세 조회 중 할당량/키 오류] 다음 API 키({_key_preview(next_key)})로 전환")
+                            log_event(logger, logging.WARNING, 'api_key.switched', stage='videos.list', key=_key_preview(next_key))
                             current_attempt += 1
                         else:
-                            print("🚫 [모든 API 키 소진] 더 이상 사용 가능한 API 키가 없음")
+                            log_event(logger, logging.ERROR, 'search.keys_exhausted')
                             all_api_keys_exhausted = True
                             break
                     else:
                         # 할당량 외 다른 오류
-                        print(f"❌ [상세 조회 오류] {type(e).__name__}: {str(e)[:100]}")
+                        log_event(logger, logging.ERROR, 'search.keyword.videos_error', error=type(e).__name__, message=str(e)[:100])
                         batch_processed = True
                         break
 
+            if on_progress:
+                on_progress({
+                    'source': 'batch',
+                    'batch': i // 50,
+                    'results': filtered_videos[batch_start:]
+                })
+
         # 최신순 정렬 및 제한
         filtered_videos.sort(key=lambda x: datetime.strptime(x['publishedAt'], "%Y-%m-%dT%H:%M:%SZ"), reverse=True)
         # 모든 키 소진 상태에서 결과가 없다면 예외로 상위에 알림
@@ -454,16 +551,17 @@ def search_by_keyword_based_shorts(min_views=100000, days_ago=5, max_results=20,
         return filtered_videos[:max_results]
 
     except Exception as e:
-        print(f"❌ [키워드 기반 검색 오류] {type(e).__name__}: {str(e)[:100]}")
+        log_event(logger, logging.ERROR, 'search.keyword.failed', error=type(e).__name__, message=str(e)[:100])
         # 상위에서 구분 처리할 수 있도록 예외 그대로 전파
         raise
 
 def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                              category_id=None, region_code="KR", language=None,
-                             channel_ids=None, keyword=None):
+                             channel_ids=None, keyword=None, on_progress=None):
     """
     채널 ID 기반 최신 쇼츠 수집 방식 - API 키 순환 로직 강화
     제한사항 적용: 최소 조회수 10만, 최대 기간 5일, 채널당 최대 20개
+    on_progress: 지정 시 채널(키워드 검색은 배치)마다 해당 단위의 필터링 결과로 호출 (스트리밍용)
     """
     all_filtered_videos = []
     all_api_keys_exhausted = False  # 모든 API 키 소진 여부 플래그
@@ -476,17 +574,17 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
     if channel_id_list:
         # 채널 개수 제한 (20개)
         if len(channel_id_list) > 20:
-            print(f"⚠️ [채널 개수 제한] {len(channel_id_list)}개 입력 → 20개로 제한")
+            log_event(logger, logging.INFO, 'search.channels.truncated', requested=len(channel_id_list), limit=20)
             channel_id_list = channel_id_list[:20]
             
-        print(f"📺 총 {len(channel_id_list)}개 채널에서 직접 영상 수집 중...")
-        print(f"⚙️ [제한사항] 최소조회수: {min_views:,}, 기간: {days_ago}일, 채널당 최대: {max_results}개")
-        
         # 날짜 필터 설정
         published_after = None
         if days_ago > 0:
-            published_after = (datetime.utcnow() - timedelta(days=days_ago)).isoformat("T") + "Z"
-            print(f"📅 날짜 필터: {days_ago}일 전 ({published_after}) 이후 영상만 검색")
+            cutoff_date = datetime.utcnow() - timedelta(days=days_ago)
+            published_after = cutoff_date.isoformat("T") + "Z"
+
+        log_event(logger, logging.INFO, 'search.channels.start', channels=len(channel_id_list), min_views=min_views,
+                  days_ago=days_ago, max_results=max_results, published_after=published_after)
 
         for channel_id in channel_id_list:
             # 모든 API 키가 소진되었으면 더 이상 처리하지 않음
@@ -496,6 +594,7 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
             max_api_key_attempts = len(api_keys) if api_keys else 1
             current_attempt = 0
             channel_processed = False  # 현재 채널 처리 완료 여부
+            channel_start = len(all_filtered_videos)
             
             while current_attempt < max_api_key_attempts and not channel_processed:
                 try:
@@ -515,7 +614,7 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                         search_params['publishedAfter'] = published_after
                     
                     search_response = execute_youtube_api_call(
-                        lambda: youtube.search().list(**search_params).execute(),
+                        lambda: _client_for_current_key(youtube).search().list(**search_params).execute(),
                         'search.list'
                     )
 
@@ -528,7 +627,7 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                     # 비디오 상세 정보 조회
                     try:
                         video_response = execute_youtube_api_call(
-                            lambda: youtube.videos().list(
+                            lambda: _client_for_current_key(youtube).videos().list(
                                 part='snippet,statistics,contentDetails',
                                 id=','.join(video_ids)
                             ).execute(),
@@ -544,9 +643,9 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                                 # 추가 날짜 필터링 (클라이언트 사이드에서 한 번 더 확인)
                                 if days_ago > 0:
                                     published_at = datetime.strptime(item['snippet']['publishedAt'], "%Y-%m-%dT%H:%M:%SZ")
-                                    cutoff_date = datetime.utcnow() - timedelta(days=days_ago)
                                     if published_at < cutoff_date:
-                                        print(f"날짜 필터링: {item['snippet']['title']} - 게시일 {published_at.strftime('%Y-%m-%d')}가 기준일 {cutoff_date.strftime('%Y-%m-%d')}보다 이전")
+                                        log_event(logger, logging.DEBUG, 'search.date_filtered', sample=100,
+                                                  video_id=item['id'], published_at=published_at, cutoff=cutoff_date)
                                         continue
 
                                 if view_count < min_views or duration_seconds > 60:
@@ -578,7 +677,8 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                                 })
 
                             except Exception as ve:
-                                print(f"[비디오 개별 처리 오류] {str(ve)}")
+                                log_event(logger, logging.WARNING, 'search.video_error', sample=20, error=type(ve).__name__,
+                                          message=str(ve)[:100])
                                 continue
                         
                         channel_processed = True  # 채널 처리 완료
@@ -589,16 +689,18 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                         if _is_quota_or_key_error(error_str):
                             next_key = quota_manager.switch_to_next_key() if quota_manager else switch_to_next_api_key()
                             if next_key:
-                                print(f"[비디오 조회 중 할당량/키 오류] 채널 {channel_id} - 다음 API 키({_key_preview(next_key)})로 전환")
+                                log_event(logger, logging.WARNING, 'api_key.switched', stage='videos.list', channel_id=channel_id,
+                                          key=_key_preview(next_key))
                                 current_attempt += 1
                                 continue
                             else:
-                                print("[모든 API 키 소진] 더 이상 사용 가능한 API 키가 없습니다.")
+                                log_event(logger, logging.ERROR, 'search.keys_exhausted', channel_id=channel_id)
                                 all_api_keys_exhausted = True
                                 break
                         else:
                             # 할당량 외 다른 오류는 이 채널 건너뛰기
-                            print(f"[비디오 조회 오류] 채널 {channel_id} - {str(e)}")
+                            log_event(logger, logging.ERROR, 'search.channel.videos_error', channel_id=channel_id,
+                                      error=type(e).__name__, message=str(e)[:100])
                             channel_processed = True
                             break
 
@@ -611,19 +713,28 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
                             quota_manager.handle_quota_error(str(e), 'search.list')
                         next_key = quota_manager.switch_to_next_key() if quota_manager else switch_to_next_api_key()
                         if next_key:
-                            print(f"[채널 검색 중 할당량/키 오류] 채널 {channel_id} - 다음 API 키({_key_preview(next_key)})로 전환")
+                            log_event(logger, logging.WARNING, 'api_key.switched', stage='search.list', channel_id=channel_id,
+                                      key=_key_preview(next_key))
                             current_attempt += 1
                             continue
                         else:
-                            print("[모든 API 키 소진] 더 이상 사용 가능한 API 키가 없습니다.")
+                            log_event(logger, logging.ERROR, 'search.keys_exhausted', channel_id=channel_id)
                             all_api_keys_exhausted = True
                             break
                     else:
                         # 할당량 외 다른 오류는 그대로 전파
-                        print(f"[채널 검색 오류] {channel_id} → {str(e)}")
+                        log_event(logger, logging.ERROR, 'search.channel.search_error', channel_id=channel_id,
+                                  error=type(e).__name__, message=str(e)[:100])
                         channel_processed = True
                         break
 
+            if on_progress:
+                on_progress({
+                    'source': 'channel',
+                    'channelId': channel_id,
+                    'results': all_filtered_videos[channel_start:]
+                })
+
         # 최신순 기준 정렬 후 전체에서 max_results개 자르기
         all_filtered_videos.sort(key=lambda x: datetime.strptime(x['publishedAt'], "%Y-%m-%dT%H:%M:%SZ"), reverse=True)
         
@@ -634,9 +745,9 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
     
     # 채널이 없고 키워드만 있는 경우 키워드 기반 검색으로 전환
     if keyword:
-        print("🔍 채널이 지정되지 않아 키워드 기반 검색으로 전환합니다.")
+        log_event(logger, logging.INFO, 'search.fallback_to_keyword')
         if all_api_keys_exhausted:
-            print("모든 API 키가 소진되어 키워드 검색을 건너뜁니다.")
+            log_event(logger, logging.ERROR, 'search.keys_exhausted', stage='keyword_fallback')
             raise Exception("모든 YouTube API 키의 할당량이 초과되었습니다.")
             
         return search_by_keyword_based_shorts(
@@ -646,7 +757,8 @@ def get_recent_popular_shorts(min_views=100000, days_ago=5, max_results=20,
             category_id=category_id, 
             region_code=region_code, 
             language=language,
-            keyword=keyword
+            keyword=keyword,
+            on_progress=on_progress
         )
     
     # 채널도 키워드도 없는 경우
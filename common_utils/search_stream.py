@@ -0,0 +1,60 @@
+# common_utils/search_stream.py
+import json
+import queue
+from .request_profiler import propagate_profile
+
+# 진행 이벤트가 없을 때 연결 유지를 위한 주석 전송 간격 (초)
+HEARTBEAT_INTERVAL = 15
+
+_DONE = object()
+
+
+def format_sse(event, data):
+    """Server-Sent Events 메시지 형식으로 변환"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stream_search(executor, search_func, params, error_formatter, on_success=None,
+                  heartbeat_interval=HEARTBEAT_INTERVAL):
+    """
+    검색을 실행기에서 돌리면서 채널/배치 단위 결과를 SSE 이벤트로 내보내는 제너레이터
+
+    - partial: 채널(키워드 검색은 videos.list 배치)이 끝날 때마다 해당 단위의 결과
+    - done: 전체 결과를 정렬/제한한 최종 요약 (기존 /search 성공 응답과 같은 형식)
+    - error: 검색 실패 시 error_formatter로 변환한 응답
+    """
+    events = queue.Queue()
+
+    def run():
+        try:
+            results = search_func(on_progress=events.put, **params)
+            if on_success:
+                on_success(results)
+            events.put(('done', {
+                "status": "success",
+                "results": results,
+                "count": len(results),
+                "fromCache": False
+            }))
+        except Exception as e:
+            events.put(('error', error_formatter(e)))
+        finally:
+            events.put(_DONE)
+
+    executor.submit(propagate_profile(run, 'search_stream'))
+
+    completed = 0
+    while True:
+        try:
+            event = events.get(timeout=heartbeat_interval)
+        except queue.Empty:
+            yield ": keep-alive\n\n"
+            continue
+
+        if event is _DONE:
+            return
+        if isinstance(event, tuple):
+            yield format_sse(*event)
+        else:
+            completed += 1
+            yield format_sse('partial', dict(event, completed=completed))
@@ -0,0 +1,51 @@
+# common_utils/structured_log.py
+"""
+검색 경로용 구조화 로그
+- log_event(logger, level, event, **fields): "event key=value ..." 형식, fields는 record.fields로도 전달
+- 레벨이 꺼져 있으면 메시지를 만들지 않고, 메시지 문자열은 핸들러가 출력할 때 생성 (지연 포맷팅)
+- sample=N: 같은 이벤트를 N번 중 1번만 기록 (처음 1번은 항상 기록, sampled 필드에 비율 표시)
+"""
+import itertools
+
+# 이벤트별 발생 횟수 (itertools.count의 next()는 GIL 아래에서 원자적이라 잠금 불필요)
+_event_counters = {}
+
+
+class LogEvent:
+    """str() 시점에 메시지를 만드는 지연 포맷팅 객체"""
+    __slots__ = ('event', 'fields')
+
+    def __init__(self, event, fields):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        if not self.fields:
+            return self.event
+        return self.event + ' ' + ' '.join(f"{key}={_format_field(value)}" for key, value in self.fields.items())
+
+
+def _format_field(value):
+    text = str(value)
+    if not text or ' ' in text or '=' in text:
+        return repr(text)
+    return text
+
+
+def log_event(logger, level, event, sample=1, **fields):
+    """구조화 이벤트 기록 (sample=N이면 N번 중 1번)"""
+    if not logger.isEnabledFor(level):
+        return
+    if sample > 1:
+        counter = _event_counters.get(event)
+        if counter is None:
+            counter = _event_counters.setdefault(event, itertools.count())
+        if next(counter) % sample:
+            return
+        fields['sampled'] = f"1/{sample}"
+    logger.log(level, LogEvent(event, fields), extra={'event': event, 'fields': fields}, stacklevel=2)
+
+
+def reset_sampling():
+    """샘플링 카운터 초기화 (테스트용)"""
+    _event_counters.clear()
@@ -1,12 +1,31 @@
 # common_utils/user_search.py
+import os
 import time
+import threading
 import isodate
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from deep_translator import GoogleTranslator
 from services.user_api_service import UserApiKeyManager
-import googleapiclient.discovery
+from common_utils.channel_index import find_local_channels, record_channel_lookup, is_handle_query, extract_handle
 from flask import current_app
 
+# 사용자 한 명이 동시에 실행할 수 있는 채널 검색 수 (여러 요청이 함께 공유)
+CHANNEL_SEARCH_CONCURRENCY = int(os.environ.get('USER_CHANNEL_SEARCH_CONCURRENCY', 4))
+
+_user_semaphores = {}
+_user_semaphores_lock = threading.Lock()
+
+
+def _get_user_semaphore(user_id):
+    """사용자별 동시 실행 제한 세마포어 반환"""
+    with _user_semaphores_lock:
+        semaphore = _user_semaphores.get(user_id)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, CHANNEL_SEARCH_CONCURRENCY))
+            _user_semaphores[user_id] = semaphore
+        return semaphore
+
+
 class UserSearchService:
     """사용자별 API 키를 사용하는 검색 서비스"""
     
@@ -16,9 +35,10 @@ class UserSearchService:
         
     def search_recent_popular_shorts(self, min_views=100000, days_ago=5, max_results=20,
                                    category_id=None, region_code="KR", language=None,
-                                   channel_ids=None, keyword=None):
+                                   channel_ids=None, keyword=None, on_progress=None):
         """
         사용자의 개인 API 키를 사용한 최신 인기 쇼츠 검색
+        on_progress: 지정 시 채널(키워드 검색은 배치)이 끝날 때마다 해당 단위의 결과로 호출 (스트리밍용)
         """
         all_filtered_videos = []
         
@@ -30,21 +50,19 @@ class UserSearchService:
         if channel_id_list:
             # 채널 기반 검색
             return self._search_by_channels(
-                channel_id_list, min_views, days_ago, max_results, region_code
+                channel_id_list, min_views, days_ago, max_results, region_code, on_progress
             )
         elif keyword:
             # 키워드 기반 검색
             return self._search_by_keyword(
                 keyword, min_views, days_ago, max_results, 
-                category_id, region_code, language
+                category_id, region_code, language, on_progress
             )
         
         return []
     
-    def _search_by_channels(self, channel_ids, min_views, days_ago, max_results, region_code):
-        """채널 ID 기반 검색"""
-        all_filtered_videos = []
-        
+    def _search_by_channels(self, channel_ids, min_views, days_ago, max_results, region_code, on_progress=None):
+        """채널 ID 기반 검색 (채널별 요청을 사용자별 동시 실행 한도 내에서 병렬 처리)"""
         # 채널 개수 제한
         if len(channel_ids) > 20:
             current_app.logger.info(f"채널 개수 제한: {len(channel_ids)}개 → 20개")
@@ -57,99 +75,21 @@ class UserSearchService:
         
         current_app.logger.info(f"채널 기반 검색 시작: {len(channel_ids)}개 채널, 최소조회수: {min_views:,}")
         
-        for channel_id in channel_ids:
-            try:
-                # 채널별 영상 검색
-                search_params = {
-                    'part': 'snippet',
-                    'channelId': channel_id,
-                    'order': 'date',
-                    'type': 'video',
-                    'maxResults': min(50, max_results)
-                }
-                
-                if published_after:
-                    search_params['publishedAfter'] = published_after
-                
-                # API 호출
-                def search_call():
-                    youtube = self.api_manager.get_youtube_service()
-                    return youtube.search().list(**search_params).execute()
-                
-                search_response = self.api_manager.execute_api_call(
-                    search_call, 'search.list', quota_cost=100
-                )
-                
-                video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-                
-                if not video_ids:
-                    continue
-                
-                # 비디오 상세 정보 조회
-                def videos_call():
-                    youtube = self.api_manager.get_youtube_service()
-                    return youtube.videos().list(
-                        part='snippet,statistics,contentDetails',
-                        id=','.join(video_ids)
-                    ).execute()
-                
-                video_response = self.api_manager.execute_api_call(
-                    videos_call, 'videos.list', quota_cost=1
-                )
-                
-                # 영상 필터링 및 처리
-                for item in video_response.get('items', []):
-                    try:
-                        view_count = int(item['statistics'].get('viewCount', 0))
-                        duration = item['contentDetails']['duration']
-                        duration_seconds = isodate.parse_duration(duration).total_seconds()
-                        
-                        # 추가 날짜 필터링
-                        if days_ago > 0:
-                            published_at = datetime.strptime(item['snippet']['publishedAt'], "%Y-%m-%dT%H:%M:%SZ")
-                            cutoff_date = datetime.utcnow() - timedelta(days=days_ago)
-                            if published_at < cutoff_date:
-                                continue
-                        
-                        # 조회수 및 길이 필터
-                        if view_count < min_views or duration_seconds > 60:
-                            continue
-                        
-                        title = item['snippet']['title']
-                        translated_title = self._translate_if_needed(title)
-                        
-                        thumbnail_url = item['snippet']['thumbnails'].get('high', {}).get('url', '')
-                        
-                        all_filtered_videos.append({
-                            'id': item['id'],
-                            'title': title,
-                            'translated_title': translated_title,
-                            'channelTitle': item['snippet']['channelTitle'],
-                            'channelId': item['snippet']['channelId'],
-                            'publishedAt': item['snippet']['publishedAt'],
-                            'description': item['snippet'].get('description', ''),
-                            'viewCount': view_count,
-                            'likeCount': int(item['statistics'].get('likeCount', 0)),
-                            'commentCount': int(item['statistics'].get('commentCount', 0)),
-                            'duration': round(duration_seconds),
-                            'url': f"https://www.youtube.com/shorts/{item['id']}",
-                            'thumbnail': thumbnail_url,
-                            'regionCode': region_code,
-                            'isVertical': True
-                        })
-                        
-                    except Exception as ve:
-                        current_app.logger.error(f"영상 개별 처리 오류: {str(ve)}")
-                        continue
-                        
-            except Exception as e:
-                error_str = str(e).lower()
-                if 'api 키' in error_str or '할당량' in error_str:
-                    # 사용자에게 친숙한 메시지로 변환
-                    raise Exception("등록된 API 키의 할당량이 부족합니다. API 키 관리 페이지에서 키를 추가하거나 확인해주세요.")
-                else:
-                    current_app.logger.error(f"채널 검색 오류 ({channel_id}): {str(e)}")
-                    continue
+        search_args = (min_views, days_ago, max_results, region_code, published_after)
+        max_workers = min(CHANNEL_SEARCH_CONCURRENCY, len(channel_ids))
+        
+        if max_workers <= 1:
+            channel_results = []
+            for channel_id in channel_ids:
+                videos = self._search_single_channel(self.api_manager, channel_id, *search_args)
+                channel_results.append(videos)
+                if on_progress:
+                    on_progress({'source': 'channel', 'channelId': channel_id, 'results': videos})
+        else:
+            channel_results = self._search_channels_parallel(channel_ids, search_args, max_workers, on_progress)
+        
+        # 채널 순서대로 합친 뒤 정렬 (순차 실행과 동일한 결과 순서 유지)
+        all_filtered_videos = [video for videos in channel_results for video in videos]
         
         # 최신순 정렬 및 제한
         all_filtered_videos.sort(
@@ -159,8 +99,139 @@ class UserSearchService:
         
         return all_filtered_videos[:max_results]
     
+    def _search_channels_parallel(self, channel_ids, search_args, max_workers, on_progress=None):
+        """채널별 검색을 워커 스레드에서 실행 (스레드마다 앱 컨텍스트/DB 세션/키 관리자 분리)"""
+        app = current_app._get_current_object()
+        user_semaphore = _get_user_semaphore(self.user_id)
+        
+        def run(channel_id):
+            with user_semaphore, app.app_context():
+                # 키 관리자는 current_key 상태를 가지므로 스레드별로 생성
+                return self._search_single_channel(
+                    UserApiKeyManager(self.user_id), channel_id, *search_args
+                )
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='channel-search') as pool:
+            futures = [pool.submit(run, channel_id) for channel_id in channel_ids]
+            try:
+                if on_progress:
+                    # 먼저 끝난 채널부터 전달
+                    channel_by_future = dict(zip(futures, channel_ids))
+                    for future in as_completed(futures):
+                        on_progress({
+                            'source': 'channel',
+                            'channelId': channel_by_future[future],
+                            'results': future.result()
+                        })
+                return [future.result() for future in futures]
+            except Exception:
+                # 할당량 오류 시 아직 시작하지 않은 채널 검색은 취소
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _search_single_channel(self, api_manager, channel_id, min_views, days_ago, max_results,
+                               region_code, published_after):
+        """단일 채널의 최근 쇼츠 검색 (할당량 오류 외의 오류는 기록 후 빈 결과 반환)"""
+        filtered_videos = []
+        
+        try:
+            # 채널별 영상 검색
+            search_params = {
+                'part': 'snippet',
+                'channelId': channel_id,
+                'order': 'date',
+                'type': 'video',
+                'maxResults': min(50, max_results)
+            }
+            
+            if published_after:
+                search_params['publishedAfter'] = published_after
+            
+            # API 호출
+            def search_call():
+                youtube = api_manager.get_youtube_service()
+                return youtube.search().list(**search_params).execute()
+            
+            search_response = api_manager.execute_api_call(
+                search_call, 'search.list', quota_cost=100
+            )
+            
+            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+            
+            if not video_ids:
+                return filtered_videos
+            
+            # 비디오 상세 정보 조회
+            def videos_call():
+                youtube = api_manager.get_youtube_service()
+                return youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(video_ids)
+                ).execute()
+            
+            video_response = api_manager.execute_api_call(
+                videos_call, 'videos.list', quota_cost=1
+            )
+            
+            # 영상 필터링 및 처리
+            for item in video_response.get('items', []):
+                try:
+                    view_count = int(item['statistics'].get('viewCount', 0))
+                    duration = item['contentDetails']['duration']
+                    duration_seconds = isodate.parse_duration(duration).total_seconds()
+                    
+                    # 추가 날짜 필터링
+                    if days_ago > 0:
+                        published_at = datetime.strptime(item['snippet']['publishedAt'], "%Y-%m-%dT%H:%M:%SZ")
+                        cutoff_date = datetime.utcnow() - timedelta(days=days_ago)
+                        if published_at < cutoff_date:
+                            continue
+                    
+                    # 조회수 및 길이 필터
+                    if view_count < min_views or duration_seconds > 60:
+                        continue
+                    
+                    title = item['snippet']['title']
+                    translated_title = self._translate_if_needed(title)
+                    
+                    thumbnail_url = item['snippet']['thumbnails'].get('high', {}).get('url', '')
+                    
+                    filtered_videos.append({
+                        'id': item['id'],
+                        'title': title,
+                        'translated_title': translated_title,
+                        'channelTitle': item['snippet']['channelTitle'],
+                        'channelId': item['snippet']['channelId'],
+                        'publishedAt': item['snippet']['publishedAt'],
+                        'description': item['snippet'].get('description', ''),
+                        'viewCount': view_count,
+                        'likeCount': int(item['statistics'].get('likeCount', 0)),
+                        'commentCount': int(item['statistics'].get('commentCount', 0)),
+                        'duration': round(duration_seconds),
+                        'url': f"https://www.youtube.com/shorts/{item['id']}",
+                        'thumbnail': thumbnail_url,
+                        'regionCode': region_code,
+                        'isVertical': True
+                    })
+                    
+                except Exception as ve:
+                    current_app.logger.error(f"영상 개별 처리 오류: {str(ve)}")
+                    continue
+                    
+        except Exception as e:
+            error_str = str(e).lower()
+            if 'api 키' in error_str or '할당량' in error_str:
+                # 사용자에게 친숙한 메시지로 변환
+                raise Exception("등록된 API 키의 할당량이 부족합니다. API 키 관리 페이지에서 키를 추가하거나 확인해주세요.")
+            else:
+                current_app.logger.error(f"채널 검색 오류 ({channel_id}): {str(e)}")
+                return []
+        
+        return filtered_videos
+    
     def _search_by_keyword(self, keyword, min_views, days_ago, max_results, 
-                          category_id, region_code, language):
+                          category_id, region_code, language, on_progress=None):
         """키워드 기반 검색"""
         filtered_videos = []
         
@@ -216,6 +287,7 @@ class UserSearchService:
             # 영상 상세 정보 가져오기 (50개씩 배치 처리)
             for i in range(0, len(all_video_ids), 50):
                 batch_ids = all_video_ids[i:i+50]
+                batch_start = len(filtered_videos)
                 
                 def videos_call():
                     youtube = self.api_manager.get_youtube_service()
@@ -263,6 +335,9 @@ class UserSearchService:
                     except Exception as ve:
                         current_app.logger.error(f"영상 개별 처리 오류: {str(ve)}")
                         continue
+                
+                if on_progress:
+                    on_progress({'source': 'batch', 'batch': i // 50, 'results': filtered_videos[batch_start:]})
             
             # 최신순 정렬 및 제한
             filtered_videos.sort(
@@ -291,10 +366,15 @@ class UserSearchService:
         except:
             return None
     
-    def search_channels(self, query):
-        """채널 검색 (사용자 API 키 사용)"""
+    def search_channels(self, query, refresh=False):
+        """채널 검색 (사용자 API 키 사용, refresh=True면 로컬 인덱스를 건너뛰고 API 검색)"""
         try:
-            if '@' in query or 'youtube.com/' in query:
+            # 로컬 채널 인덱스를 먼저 확인 (없을 때만 YouTube API 호출)
+            local_channels = [] if refresh else find_local_channels(query)
+            if local_channels:
+                return local_channels
+
+            if is_handle_query(query):
                 # 핸들 또는 URL 검색
                 return self._search_channel_by_handle(query)
             else:
@@ -310,19 +390,8 @@ class UserSearchService:
     
     def _search_channel_by_handle(self, query):
         """핸들로 채널 검색"""
-        # URL에서 핸들 추출
-        if 'youtube.com/' in query:
-            parts = query.split('/')
-            for part in parts:
-                if part.startswith('@'):
-                    query = part
-                    break
-        
-        # @ 기호 처리
-        if not query.startswith('@') and '@' not in query:
-            query = '@' + query
-        
-        handle = query.replace('@', '')
+        # URL 또는 @handle에서 핸들 추출
+        handle = extract_handle(query)
         
         try:
             # forHandle 파라미터로 정확한 핸들 매칭 시도
@@ -340,12 +409,14 @@ class UserSearchService:
             
             if response.get('items'):
                 item = response['items'][0]
-                return [{
+                channels = [{
                     'id': item['id'],
                     'title': item['snippet']['title'],
                     'thumbnail': item['snippet']['thumbnails'].get('default', {}).get('url', ''),
                     'description': item['snippet']['description']
                 }]
+                record_channel_lookup(channels, handle=handle)
+                return channels
                 
         except Exception:
             pass  # forHandle 실패시 일반 검색으로 넘어감
@@ -376,6 +447,7 @@ class UserSearchService:
                     'description': item['snippet']['description']
                 })
         
+        record_channel_lookup(exact_matches[:3])
         return exact_matches[:3] if exact_matches else []
     
     def _search_channels_by_name(self, query):
@@ -402,4 +474,5 @@ class UserSearchService:
                 'description': item['snippet']['description']
             })
         
+        record_channel_lookup(channels)
         return channels
@@ -7,11 +7,18 @@
 """
 
 import os
+import re
 import logging
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# 마스킹 패턴 (모듈 로딩 시 한 번 컴파일)
+_API_KEY_PATTERN = re.compile(r'AIza[A-Za-z0-9_-]{35}')  # Google API 키
+_LONG_KEY_PATTERN = re.compile(r'\b[A-Za-z0-9]{32,}\b')  # 일반적인 키 패턴 (32자 이상의 영숫자 조합)
+_LONG_RUN_PATTERN = re.compile(r'[A-Za-z0-9]{32}')  # 빠른 확인용 (단어 경계 검사 없음)
+_MIN_SENSITIVE_LENGTH = 32
+
 class SecurityConfig:
     """보안 설정 관리 클래스"""
     
@@ -63,18 +70,14 @@ class SecurityConfig:
         Returns:
             str: 마스킹된 텍스트
         """
-        if not text:
+        # 빠른 경로: 가장 짧은 패턴(32자)보다 짧으면 정규식 생략
+        if not text or len(text) < _MIN_SENSITIVE_LENGTH:
             return text
-            
-        # API 키 패턴 마스킹 (AIza로 시작하는 Google API 키)
-        import re
-        
-        # Google API 키 패턴
-        text = re.sub(r'AIza[A-Za-z0-9_-]{35}', f'{replacement}[API_KEY]', text)
-        
-        # 일반적인 키 패턴 (32자 이상의 영숫자 조합)
-        text = re.sub(r'\b[A-Za-z0-9]{32,}\b', f'{replacement}[LONG_KEY]', text)
         
+        if 'AIza' in text:
+            text = _API_KEY_PATTERN.sub(f'{replacement}[API_KEY]', text)
+        if _LONG_RUN_PATTERN.search(text):
+            text = _LONG_KEY_PATTERN.sub(f'{replacement}[LONG_KEY]', text)
         return text
     
     @classmethod
@@ -167,18 +170,23 @@ def validate_required_environment():
     
     logger.info(SecurityConfig.get_environment_status())
 
+class SensitiveDataFilter(logging.Filter):
+    """민감한 데이터 필터링 (레벨 통과 후 포맷팅된 메시지 기준, 인자까지 마스킹)"""
+    
+    def filter(self, record):
+        try:
+            message = record.getMessage()
+        except Exception:
+            # 포맷 오류는 핸들러의 기존 오류 처리에 맡김
+            return True
+        record.msg = SecurityConfig.mask_sensitive_data(message)
+        record.args = None
+        return True
+
+
 # 보안 로거 설정
 def setup_secure_logging():
     """보안 로깅 설정"""
-    
-    class SensitiveDataFilter(logging.Filter):
-        """민감한 데이터 필터링"""
-        
-        def filter(self, record):
-            if hasattr(record, 'msg'):
-                record.msg = SecurityConfig.mask_sensitive_data(str(record.msg))
-            return True
-    
     # 루트 로거에 필터 추가
     root_logger = logging.getLogger()
     root_logger.addFilter(SensitiveDataFilter())
@@ -0,0 +1,49 @@
+# gunicorn.conf.py
+"""
+gunicorn 설정 (작업 디렉터리의 이 파일을 gunicorn이 자동으로 읽음)
+- 마스터 프로세스가 워커 fork 전에 스키마 마이그레이션을 한 번 실행 (실패 시 서버 시작 중단)
+- 워커 간 메트릭 합산 디렉터리 준비 (워커가 환경변수로 물려받음)
+"""
+
+import os
+import time
+import tempfile
+
+
+def _prepare_metrics_dir(server):
+    """METRICS_MULTIPROC_DIR 미설정 시 임시 디렉터리를 만들고, 설정된 경우 이전 실행 파일 정리"""
+    from common_utils.metrics import clear_multiprocess_dir
+
+    directory = os.environ.get('METRICS_MULTIPROC_DIR')
+    if directory:
+        clear_multiprocess_dir(directory)
+    else:
+        directory = tempfile.mkdtemp(prefix='metrics_')
+        os.environ['METRICS_MULTIPROC_DIR'] = directory
+    server.log.info(f"워커 간 메트릭 합산 디렉터리: {directory}")
+
+
+def on_starting(server):
+    """워커 fork 전 마스터에서 한 번 실행"""
+    _prepare_metrics_dir(server)
+
+    if os.environ.get('RUN_MIGRATIONS_ON_START', 'true').lower() != 'true':
+        server.log.info("스키마 마이그레이션 건너뜀 (RUN_MIGRATIONS_ON_START=false)")
+        return
+
+    started = time.perf_counter()
+    try:
+        from schema_migrations import create_migration_app, run_migrations
+        from models import db
+
+        app = create_migration_app()
+        result = run_migrations(app, db)
+        # 마스터의 DB 연결을 워커가 물려받지 않도록 정리
+        with app.app_context():
+            db.engine.dispose()
+        server.log.info(f"스키마 마이그레이션 완료: 적용 {result['applied']}, {time.perf_counter() - started:.2f}초")
+    except Exception as e:
+        # 워커는 부팅 시 테이블을 만들지 않으므로 스키마 없이 요청을 받지 않도록 시작 중단
+        # (헬스체크 실패로 배포가 드러남, 원인 해결 후 재배포 또는 python schema_migrations.py)
+        server.log.error(f"스키마 마이그레이션 실패 (서버 시작 중단): {str(e)}")
+        raise
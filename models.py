@@ -20,6 +20,15 @@ class User(db.Model, UserMixin):
     def is_approved(self):
         return self.role == 'approved' or self.role == 'admin'
 
+class SchemaVersion(db.Model):
+    """적용된 스키마 마이그레이션 기록 (schema_migrations.py에서 관리)"""
+    __tablename__ = 'schema_version'
+
+    version = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(128), nullable=False)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+    duration_ms = db.Column(db.Integer)
+
 class ApiLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(128), db.ForeignKey('user.id'))
@@ -29,6 +38,81 @@ class ApiLog(db.Model):
 
     user = db.relationship('User', backref=db.backref('api_logs', lazy=True))
 
+    __table_args__ = (
+        # 사용자별 기간 조회용 (timestamp 범위 조건으로 사용)
+        db.Index('idx_api_log_user_timestamp', 'user_id', 'timestamp'),
+    )
+
+class ApiLogDaily(db.Model):
+    """API 호출 로그 일별 요약 모델 (보존 기간이 지나 삭제된 ApiLog 롤업)"""
+    __tablename__ = 'api_log_daily'
+
+    id = db.Column(db.Integer, primary_key=True)
+    log_date = db.Column(db.Date, nullable=False)  # UTC 기준 날짜
+    user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=True)  # NULL: 비로그인 호출
+    endpoint = db.Column(db.String(128), nullable=False)
+    call_count = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('log_date', 'user_id', 'endpoint', name='unique_log_date_user_endpoint'),
+    )
+
+class ApiStatsDaily(db.Model):
+    """일별 API 호출 수 (관리자 통계용, 호출 기록 시 증분 갱신 / 매일 밤 재계산)"""
+    __tablename__ = 'api_stats_daily'
+
+    id = db.Column(db.Integer, primary_key=True)
+    stat_date = db.Column(db.Date, nullable=False, unique=True)  # UTC 기준 날짜
+    call_count = db.Column(db.Integer, default=0, nullable=False)
+
+class ApiStatsUser(db.Model):
+    """사용자별 누적 API 호출 수 (관리자 통계용)"""
+    __tablename__ = 'api_stats_user'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False, unique=True)
+    call_count = db.Column(db.Integer, default=0, nullable=False)
+
+class ApiStatsEndpoint(db.Model):
+    """엔드포인트별 누적 API 호출 수 (관리자 통계용)"""
+    __tablename__ = 'api_stats_endpoint'
+
+    id = db.Column(db.Integer, primary_key=True)
+    endpoint = db.Column(db.String(128), nullable=False, unique=True)
+    call_count = db.Column(db.Integer, default=0, nullable=False)
+
+class ApiCallCounter(db.Model):
+    """사용자별 일일 API 호출 수 카운터 (호출 제한 확인용, 호출 기록 시 증분 갱신)"""
+    __tablename__ = 'api_call_counter'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False)
+    call_date = db.Column(db.Date, nullable=False)  # UTC 기준 날짜
+    call_count = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'call_date', name='unique_user_call_date'),
+    )
+
+class SearchJob(db.Model):
+    """비동기 검색 작업 모델 (워커 간 작업 상태/결과 공유)"""
+    __tablename__ = 'search_jobs'
+
+    id = db.Column(db.String(36), primary_key=True)  # UUID
+    user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False)
+    cache_key = db.Column(db.String(64), nullable=False)  # 검색 조건 해시 (중복 작업 합치기)
+    status = db.Column(db.String(20), default='pending', nullable=False)  # pending, running, done
+    params = db.Column(db.Text)  # 검색 조건 JSON
+    result = db.Column(db.Text)  # 완료 시 응답 JSON (성공/오류 모두)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index('idx_search_job_user_key', 'user_id', 'cache_key', 'status'),
+        db.Index('idx_search_job_created', 'created_at'),
+    )
+
 class ChannelCategory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False)
@@ -40,10 +124,20 @@ class ChannelCategory(db.Model):
 
 class Channel(db.Model):
     id = db.Column(db.String(128), primary_key=True)
-    title = db.Column(db.String(255), nullable=False)
+    title = db.Column(db.String(255), nullable=False)  # lower(title) 검색 인덱스는 schema_migrations에서 생성
     description = db.Column(db.Text)
     thumbnail = db.Column(db.String(255))
 
+class ChannelHandle(db.Model):
+    """핸들(@handle) -> 채널 ID 매핑 (forHandle 조회 결과를 저장해 재조회 방지)"""
+    __tablename__ = 'channel_handles'
+
+    handle = db.Column(db.String(128), primary_key=True)  # 소문자, @ 제외
+    channel_id = db.Column(db.String(128), db.ForeignKey('channel.id'), nullable=False)
+    resolved_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    channel = db.relationship('Channel')
+
 class CategoryChannel(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     category_id = db.Column(db.Integer, db.ForeignKey('channel_category.id', ondelete='CASCADE'), nullable=False)
@@ -52,6 +146,11 @@ class CategoryChannel(db.Model):
     category = db.relationship('ChannelCategory', backref=db.backref('category_channels', lazy=True, cascade='all, delete-orphan'))
     channel = db.relationship('Channel', backref=db.backref('category_channels', lazy=True))
 
+    __table_args__ = (
+        # 카테고리별 연결 채널 일괄 조회 (가져오기/병합 시 기존 연결 미리 읽기)
+        db.Index('idx_category_channel_category', 'category_id', 'channel_id'),
+    )
+
 class SearchPreference(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False)
@@ -336,6 +435,7 @@ class SavedVideo(db.Model):
     published_at = db.Column(db.DateTime)  # 영상 업로드 일시
     saved_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # 저장 일시
     notes = db.Column(db.Text)  # 사용자 메모
+    stats_updated_at = db.Column(db.DateTime)  # 조회수 마지막 갱신 일시 (백그라운드 갱신)
     
     # 관계 설정
     user = db.relationship('User', backref='saved_videos')
@@ -344,6 +444,7 @@ class SavedVideo(db.Model):
     __table_args__ = (
         db.Index('idx_user_video_saved', 'user_id', 'video_id'),
         db.Index('idx_user_saved_at', 'user_id', 'saved_at'),
+        db.Index('idx_saved_video_stats_updated', 'stats_updated_at'),
         db.UniqueConstraint('user_id', 'video_id', name='unique_user_video'),
     )
     
@@ -385,6 +486,7 @@ class UserApiKey(db.Model):
     # 관계 설정
     user = db.relationship('User', backref='api_keys')
     usage_logs = db.relationship('ApiKeyUsage', backref='api_key', lazy=True, cascade='all, delete-orphan')
+    daily_rollups = db.relationship('ApiKeyUsageDaily', backref='api_key', lazy=True, cascade='all, delete-orphan')
     
     # 복합 인덱스 설정
     __table_args__ = (
@@ -427,17 +529,26 @@ class UserApiKey(db.Model):
             db.session.commit()
     
     def increment_usage(self):
-        """사용량 증가"""
+        """사용량 증가 (커밋은 호출자)"""
         self.reset_daily_usage()  # 날짜 확인 후 필요시 리셋
-        self.usage_count += 1
-        self.last_used = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self._update_in_db(usage_count=UserApiKey.usage_count + 1, last_used=now, updated_at=now)
     
     def record_error(self, error_message):
-        """오류 기록"""
-        self.last_error = error_message[:500]  # 메시지 길이 제한
-        self.error_count += 1
-        self.updated_at = datetime.utcnow()
+        """오류 기록 (커밋은 호출자)"""
+        self._update_in_db(
+            last_error=error_message[:500],  # 메시지 길이 제한
+            error_count=UserApiKey.error_count + 1,
+            updated_at=datetime.utcnow()
+        )
+    
+    def _update_in_db(self, **values):
+        """
+        동시 요청에서도 누락되지 않도록 DB에서 증가시킨 뒤 인스턴스 값을 다시 읽음
+        (SQL 식을 속성에 대입하면 flush 전까지 is_quota_exceeded/to_dict가 식 객체를 보게 됨)
+        """
+        db.session.execute(db.update(UserApiKey).where(UserApiKey.id == self.id).values(**values))
+        db.session.refresh(self)
     
     def is_quota_exceeded(self):
         """할당량 초과 여부 확인"""
@@ -485,6 +596,36 @@ class ApiKeyUsage(db.Model):
             'timestamp': self.timestamp.isoformat()
         }
 
+class ApiKeyUsageDaily(db.Model):
+    """API 키 일별 사용량 롤업 모델 (ApiKeyUsage 기록 시 증분 갱신)"""
+    __tablename__ = 'api_key_usage_daily'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(128), db.ForeignKey('user.id'), nullable=False)
+    api_key_id = db.Column(db.Integer, db.ForeignKey('user_api_keys.id'), nullable=False)
+    usage_date = db.Column(db.Date, nullable=False)  # UTC 기준 날짜
+    total_calls = db.Column(db.Integer, default=0, nullable=False)
+    successful_calls = db.Column(db.Integer, default=0, nullable=False)
+    quota_units = db.Column(db.Integer, default=0, nullable=False)  # 소모한 할당량 단위 합계
+    total_response_time = db.Column(db.Float, default=0.0, nullable=False)  # 응답 시간 합계 (초)
+    timed_calls = db.Column(db.Integer, default=0, nullable=False)  # 응답 시간이 기록된 호출 수
+    
+    # 인덱스 설정 (사용자+키+날짜 유니크, 사용자별 기간 조회 최적화)
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'api_key_id', 'usage_date', name='unique_user_key_date'),
+        db.Index('idx_usage_daily_user_date', 'user_id', 'usage_date'),
+    )
+    
+    def to_dict(self):
+        return {
+            'api_key_id': self.api_key_id,
+            'usage_date': self.usage_date.isoformat(),
+            'total_calls': self.total_calls,
+            'successful_calls': self.successful_calls,
+            'quota_units': self.quota_units,
+            'avg_response_time': round(self.total_response_time / self.timed_calls, 2) if self.timed_calls else 0.0
+        }
+
 class ApiKeyRotation(db.Model):
     """API 키 순환 로그 모델"""
     __tablename__ = 'api_key_rotations'
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+버전 기반 스키마 마이그레이션
+- 적용된 버전을 schema_version 테이블에 기록하고 아직 적용되지 않은 마이그레이션만 한 번 실행
+- 배포 시 별도 단계(python schema_migrations.py) 또는 gunicorn 마스터 프로세스(fork 전)에서 실행
+- 워커는 부팅 시 스키마를 조회/변경하지 않음
+
+새 컬럼/인덱스 추가 시 MIGRATIONS 끝에 (다음 버전, 이름, 함수)를 추가한다.
+새 테이블은 db.create_all()이 매 실행마다 생성한다.
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+from flask import Flask
+from sqlalchemy import text
+
+# PostgreSQL advisory lock 키 (여러 배포가 동시에 마이그레이션하지 않도록)
+MIGRATION_LOCK_KEY = 7305021
+
+
+def _legacy_auto_migrate(app, db):
+    """기존 자동 마이그레이션(컬럼/인덱스 확인 후 추가)을 한 번 실행"""
+    from auto_migrate import check_and_add_columns
+    if not check_and_add_columns(app, db):
+        raise RuntimeError('기존 자동 마이그레이션 실패')
+
+
+def _channel_title_lower_index(app, db):
+    """로컬 채널 인덱스의 제목 일치/접두어 검색용 lower(title) 인덱스 (PostgreSQL은 LIKE 'x%'에도 쓰이도록 text_pattern_ops)"""
+    if db.engine.dialect.name == 'postgresql':
+        column = 'lower(title) text_pattern_ops'
+    else:
+        column = 'lower(title)'
+    db.session.execute(text(f"CREATE INDEX IF NOT EXISTS idx_channel_title_lower ON channel ({column})"))
+    db.session.commit()
+
+
+# (버전, 이름, 함수) - 순서대로 적용되며 한 번 기록된 버전은 다시 실행하지 않음
+MIGRATIONS = [
+    (1, 'legacy_auto_migrate', _legacy_auto_migrate),
+    (2, 'channel_title_lower_index', _channel_title_lower_index),
+]
+
+
+def create_migration_app():
+    """마이그레이션 전용 최소 Flask 앱 (app.py를 임포트하지 않아 스케줄러/스레드가 시작되지 않음)"""
+    from models import db
+
+    db_url = os.environ.get('DATABASE_URL', '')
+    # Heroku 호환성을 위해 'postgres://'를 'postgresql://'로 변경
+    if db_url.startswith('postgres://'):
+        db_url = db_url.replace('postgres://', 'postgresql://')
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = db_url
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    return app
+
+
+def get_applied_versions(db):
+    """적용된 마이그레이션 버전 목록"""
+    from models import SchemaVersion
+    SchemaVersion.__table__.create(db.engine, checkfirst=True)
+    return {version for (version,) in db.session.query(SchemaVersion.version)}
+
+
+def get_pending_migrations(app, db):
+    """아직 적용되지 않은 마이그레이션 목록"""
+    with app.app_context():
+        applied = get_applied_versions(db)
+        return [(version, name) for version, name, _ in MIGRATIONS if version not in applied]
+
+
+def _acquire_lock(db):
+    if db.engine.dialect.name == 'postgresql':
+        connection = db.engine.connect()
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+        return connection
+    return None
+
+
+def _release_lock(connection):
+    if connection is not None:
+        connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': MIGRATION_LOCK_KEY})
+        connection.close()
+
+
+def run_migrations(app, db):
+    """
+    테이블 생성 후 적용되지 않은 마이그레이션을 순서대로 실행
+
+    Returns:
+        dict: applied(이번에 적용한 버전 목록), elapsed(소요 시간, 초)
+    """
+    from models import SchemaVersion
+
+    started = time.perf_counter()
+    applied_now = []
+
+    with app.app_context():
+        lock = _acquire_lock(db)
+        try:
+            db.create_all()
+            applied = get_applied_versions(db)
+
+            for version, name, migrate in MIGRATIONS:
+                if version in applied:
+                    continue
+
+                print(f"🔄 마이그레이션 {version} ({name}) 적용 중...")
+                migration_started = time.perf_counter()
+                migrate(app, db)
+
+                duration_ms = int((time.perf_counter() - migration_started) * 1000)
+                db.session.add(SchemaVersion(version=version, name=name,
+                                             applied_at=datetime.utcnow(), duration_ms=duration_ms))
+                db.session.commit()
+                applied_now.append(version)
+                print(f"✅ 마이그레이션 {version} ({name}) 완료 ({duration_ms}ms)")
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.remove()
+            _release_lock(lock)
+
+    elapsed = time.perf_counter() - started
+    print(f"🎉 스키마 마이그레이션 완료: 적용 {len(applied_now)}개, {elapsed:.2f}초")
+    return {'applied': applied_now, 'elapsed': elapsed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='데이터베이스 스키마 마이그레이션')
+    parser.add_argument('--status', action='store_true', help='적용되지 않은 마이그레이션만 출력')
+    args = parser.parse_args(argv)
+
+    from models import db
+    app = create_migration_app()
+
+    if args.status:
+        pending = get_pending_migrations(app, db)
+        if not pending:
+            print("✅ 적용할 마이그레이션이 없습니다")
+        for version, name in pending:
+            print(f"⏳ {version}: {name}")
+        return 0
+
+    try:
+        run_migrations(app, db)
+        return 0
+    except Exception as e:
+        print(f"❌ 스키마 마이그레이션 실패: {str(e)}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# services/audit_log_service.py
+import os
+import json
+import queue
+import threading
+import traceback
+from collections import Counter
+from datetime import datetime
+from models import db, User, ApiLog
+from common_utils.api_limits import record_daily_call
+from common_utils.api_stats import record_api_stats
+
+
+class ApiAuditLogger:
+    """API 호출 감사 로그 비동기 기록기
+
+    요청 스레드는 이벤트를 큐에 넣기만 하고, 백그라운드 스레드가 모아서
+    ApiLog 일괄 INSERT와 사용자별 api_calls / 일일 카운터 / 관리자 통계 합산 증가를 한 트랜잭션으로 처리한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.async_enabled = os.environ.get('AUDIT_LOG_ASYNC', 'true').lower() == 'true'
+        self.batch_size = int(os.environ.get('AUDIT_LOG_BATCH_SIZE', 500))
+        self.flush_interval = float(os.environ.get('AUDIT_LOG_FLUSH_INTERVAL', 1.0))
+        # 큐가 가득 찼을 때: drop(즉시 버림) / block(block_timeout 동안 대기 후 버림)
+        self.full_policy = os.environ.get('AUDIT_LOG_FULL_POLICY', 'drop').lower()
+        self.block_timeout = float(os.environ.get('AUDIT_LOG_BLOCK_TIMEOUT', 0.5))
+        self._queue = queue.Queue(maxsize=int(os.environ.get('AUDIT_LOG_QUEUE_SIZE', 10000)))
+        self._stop_event = threading.Event()
+        self._thread = None
+        # 아직 DB에 반영되지 않은 사용자별 호출 수 (호출 제한 확인 시 합산)
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def start(self):
+        """기록 스레드 시작"""
+        if not self.async_enabled or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='api-audit-logger', daemon=True)
+        self._thread.start()
+        self.app.logger.info(f"API 감사 로그 기록기 시작: PID={os.getpid()}, 배치={self.batch_size}")
+
+    def stop(self):
+        """남은 이벤트를 모두 기록한 뒤 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+        # 스레드가 끝난 뒤 남은 이벤트 처리
+        self.flush()
+
+    def log(self, user_id, endpoint, params=None):
+        """API 호출 이벤트 기록 요청 (비동기 모드에서는 DB 작업 없이 반환)"""
+        event = {
+            'user_id': user_id,
+            'endpoint': endpoint,
+            'params': json.dumps(params) if params else None,
+            'timestamp': datetime.utcnow()
+        }
+
+        if not self._is_running():
+            self._write_batch([event], queued=False)
+            return True
+
+        with self._lock:
+            self._pending[user_id] += 1
+        try:
+            if self.full_policy == 'block':
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+            self.stats['enqueued'] += 1
+            return True
+        except queue.Full:
+            with self._lock:
+                self._release_pending(Counter({user_id: 1}))
+            self.stats['dropped'] += 1
+            if self.stats['dropped'] % 100 == 1:
+                self.app.logger.warning(f"API 감사 로그 큐가 가득 차 이벤트를 버렸습니다 (누적 {self.stats['dropped']}개)")
+            return False
+
+    def pending_calls(self, user_id):
+        """아직 기록되지 않은 사용자의 호출 수"""
+        return self._pending.get(user_id, 0)
+
+    def get_status(self):
+        """기록기 상태 요약"""
+        return {
+            'async_enabled': self.async_enabled,
+            'running': self._is_running(),
+            'queue_size': self._queue.qsize(),
+            'queue_capacity': self._queue.maxsize,
+            'full_policy': self.full_policy,
+            'enqueued': self.stats['enqueued'],
+            'written': self.stats['written'],
+            'dropped': self.stats['dropped'],
+            'failed': self.stats['failed']
+        }
+
+    def flush(self):
+        """큐에 쌓인 이벤트를 모두 기록"""
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return
+            self._write_batch(batch)
+
+    def _is_running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop_event.is_set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first] + self._drain(self.batch_size - 1)
+            self._write_batch(batch)
+
+    def _drain(self, limit):
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, events, queued=True):
+        """이벤트 묶음을 한 트랜잭션으로 기록"""
+        calls_by_user = Counter(event['user_id'] for event in events)
+        calls_by_day = Counter((event['user_id'], event['timestamp'].date()) for event in events)
+
+        with self.app.app_context():
+            try:
+                # 일별 호출 카운터가 없으면 기존 ApiLog 수로 채우므로 이번 묶음을 넣기 전에 갱신
+                for (user_id, call_date), count in calls_by_day.items():
+                    record_daily_call(user_id, datetime.combine(call_date, datetime.min.time()), count)
+
+                db.session.execute(ApiLog.__table__.insert(), events)
+
+                for user_id, count in calls_by_user.items():
+                    User.query.filter(User.id == user_id).update(
+                        {User.api_calls: db.func.coalesce(User.api_calls, 0) + count},
+                        synchronize_session=False
+                    )
+
+                # 관리자 통계 집계 테이블 (일별 / 사용자별 / 엔드포인트별)
+                record_api_stats(events)
+
+                db.session.commit()
+                self.stats['written'] += len(events)
+            except Exception as e:
+                db.session.rollback()
+                self.stats['failed'] += len(events)
+                self.app.logger.error(f"API 감사 로그 기록 중 오류 ({len(events)}개 유실): {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+            finally:
+                db.session.remove()
+                if queued:
+                    with self._lock:
+                        self._release_pending(calls_by_user)
+
+    def _release_pending(self, counts):
+        for user_id, count in counts.items():
+            remaining = self._pending[user_id] - count
+            if remaining > 0:
+                self._pending[user_id] = remaining
+            else:
+                self._pending.pop(user_id, None)
@@ -1,9 +1,26 @@
 import smtplib
+import threading
+import time
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 import os
 from jinja2 import Template
+from common_utils.metrics import get_metrics_registry
+
+# SMTP 연결/명령 응답 대기 시간(초)
+SMTP_TIMEOUT = 30
+
+
+class _SMTPConnection:
+    """재사용할 SMTP 연결 (보낸 메시지 수와 마지막 사용 시각 기록)"""
+
+    def __init__(self, server):
+        self.server = server
+        self.messages = 0
+        self.last_used = time.monotonic()
+
 
 class EmailService:
     def __init__(self, app):
@@ -13,9 +30,34 @@ class EmailService:
         self.smtp_username = os.environ.get('SMTP_USERNAME', '')
         self.smtp_password = os.environ.get('SMTP_PASSWORD', '')
         self.sender_email = os.environ.get('SENDER_EMAIL', 'youtubeshortstool@gmail.com')
+        self.use_tls = os.environ.get('SMTP_USE_TLS', 'true').lower() == 'true'
+        # 배치 발송(session) 중 보관할 유휴 연결 수 / 연결당 최대 메시지 수 / 유휴 연결 재사용 한도(초)
+        self.pool_size = int(os.environ.get('SMTP_POOL_SIZE', 4))
+        self.max_messages_per_connection = int(os.environ.get('SMTP_MAX_MESSAGES_PER_CONNECTION', 100))
+        self.idle_timeout = float(os.environ.get('SMTP_IDLE_TIMEOUT', 60))
+        self._pool_lock = threading.Lock()
+        self._idle = []
+        self._sessions = 0
+    
+    @contextmanager
+    def session(self):
+        """
+        배치 발송 구간
+        구간 안의 send_email은 SMTP 연결(STARTTLS/로그인 완료 상태)을 스레드 간에 재사용하고, 구간이 끝나면 연결 종료
+        """
+        with self._pool_lock:
+            self._sessions += 1
+        try:
+            yield self
+        finally:
+            with self._pool_lock:
+                self._sessions -= 1
+                idle, self._idle = (self._idle, []) if self._sessions == 0 else ([], self._idle)
+            for connection in idle:
+                self._close(connection)
     
     def send_email(self, recipient, subject, html_content):
-        """이메일 발송 함수"""
+        """이메일 발송 함수 (재사용한 연결이 끊겨 있으면 새 연결로 한 번 재시도)"""
         try:
             msg = MIMEMultipart('alternative')
             msg['Subject'] = subject
@@ -24,17 +66,92 @@ class EmailService:
             
             html_part = MIMEText(html_content, 'html')
             msg.attach(html_part)
-            
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
-            
-            return True
         except Exception as e:
             self.app.logger.error(f"이메일 발송 오류: {str(e)}")
             return False
+        
+        metrics = get_metrics_registry()
+        for attempt in range(2):
+            connection = None
+            try:
+                connection = self._acquire()
+                connection.server.send_message(msg)
+            except Exception as e:
+                if connection is not None and not self._is_connection_error(e):
+                    # 수신자/메시지 거부: 연결은 그대로 사용 가능
+                    self._release(connection)
+                else:
+                    self._discard(connection)
+                    if connection is not None and connection.messages > 0 and attempt == 0:
+                        self.app.logger.warning(f"SMTP 연결 재사용 실패, 새 연결로 재시도: {str(e)}")
+                        continue
+                self.app.logger.error(f"이메일 발송 오류: {str(e)}")
+                metrics.inc('email_messages_total', status='error')
+                return False
+            
+            connection.messages += 1
+            self._release(connection)
+            metrics.inc('email_messages_total', status='sent')
+            return True
+    
+    def _connect(self):
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.smtp_username:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        get_metrics_registry().inc('smtp_connections_total')
+        return _SMTPConnection(server)
+    
+    def _acquire(self):
+        """유휴 연결 재사용 (오래된 연결은 닫음), 없으면 새 연결"""
+        now = time.monotonic()
+        stale = []
+        connection = None
+        with self._pool_lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used < self.idle_timeout:
+                    connection = candidate
+                    break
+                stale.append(candidate)
+        for candidate in stale:
+            self._close(candidate)
+        return connection or self._connect()
+    
+    def _release(self, connection):
+        """배치 발송 중이면 유휴 연결로 보관, 아니면 종료"""
+        connection.last_used = time.monotonic()
+        with self._pool_lock:
+            if (self._sessions > 0 and connection.messages < self.max_messages_per_connection
+                    and len(self._idle) < self.pool_size):
+                self._idle.append(connection)
+                return
+        self._close(connection)
+    
+    def _discard(self, connection):
+        if connection is not None:
+            try:
+                connection.server.close()
+            except Exception:
+                pass
+    
+    def _close(self, connection):
+        try:
+            connection.server.quit()
+        except Exception:
+            self._discard(connection)
+    
+    @staticmethod
+    def _is_connection_error(e):
+        """연결을 다시 맺어야 하는 오류 (끊김/소켓 오류/421 서비스 종료 응답)"""
+        if isinstance(e, smtplib.SMTPServerDisconnected) or getattr(e, 'smtp_code', None) == 421:
+            return True
+        return isinstance(e, OSError) and not isinstance(e, smtplib.SMTPException)
     
     def format_shorts_email(self, user, search_results, timestamp):
         """쇼츠 이메일 포맷팅"""
@@ -0,0 +1,118 @@
+# services/key_health_prober.py
+import os
+import threading
+import traceback
+from models import db, UserApiKey
+from common_utils.quota_manager import get_quota_manager
+from common_utils.key_health import (
+    get_key_health_registry, probe_api_key, system_key_ref, user_key_ref,
+    ProbeStatus, PROBE_ENDPOINT, PROBE_QUOTA_COST
+)
+from services.user_api_service import UserApiKeyManager
+
+
+class KeyHealthProber:
+    """시스템/사용자 API 키 상태를 주기적으로 확인하여 서킷 브레이커를 갱신하는 백그라운드 프로버
+
+    스케줄러 파일 락을 잡은 프로세스 하나에서만 실행한다. 다른 워커의 서킷 브레이커는 실제 요청 결과로 갱신되고,
+    OPEN 키는 대기 시간이 지나면 다음 실제 요청 하나를 시험 요청으로 보내 복구한다.
+    최근 실제 요청이 성공한 키는 확인을 생략하므로 유휴 키만 할당량 1 단위로 확인한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.tick_seconds = float(os.environ.get('KEY_PROBE_TICK_SECONDS', 60))
+        self.idle_seconds = float(os.environ.get('KEY_PROBE_IDLE_SECONDS', 1800))
+        self.max_probes_per_tick = int(os.environ.get('KEY_PROBE_MAX_PER_TICK', 50))
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """프로버 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='key-health-prober', daemon=True)
+        self._thread.start()
+        self.app.logger.info(f"API 키 상태 프로버 시작: PID={os.getpid()}, 주기={self.tick_seconds}초")
+
+    def stop(self):
+        """프로버 스레드 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.probe_once()
+            except Exception as e:
+                self.app.logger.error(f"API 키 상태 확인 중 오류: {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+            self._stop_event.wait(self.tick_seconds)
+
+    def probe_once(self):
+        """확인이 필요한 키만 한 번씩 확인"""
+        system_count = self._probe_system_keys(self.max_probes_per_tick)
+        user_count = self._probe_user_keys(self.max_probes_per_tick - system_count)
+        return {'system': system_count, 'user': user_count}
+
+    def _probe_system_keys(self, limit):
+        quota_manager = get_quota_manager()
+        if not quota_manager or limit <= 0:
+            return 0
+
+        refs = {system_key_ref(i): i for i in range(len(quota_manager.api_keys))}
+        due = quota_manager.health_registry.keys_to_probe(list(refs), self.idle_seconds)[:limit]
+
+        for key_ref in due:
+            key_index = refs[key_ref]
+            result = probe_api_key(quota_manager.api_keys[key_index])
+            quota_manager.apply_probe_result(key_index, result)
+            if result.status != ProbeStatus.OK:
+                self.app.logger.warning(f"시스템 API 키 {key_index} 상태 확인 실패: {result.status.value}")
+
+        return len(due)
+
+    def _probe_user_keys(self, limit):
+        if limit <= 0:
+            return 0
+
+        with self.app.app_context():
+            registry = get_key_health_registry()
+            keys = UserApiKey.query.filter_by(is_active=True).all()
+            refs = {user_key_ref(key.id): key for key in keys}
+            due = registry.keys_to_probe(list(refs), self.idle_seconds)[:limit]
+
+            managers = {}
+            for key_ref in due:
+                key = refs[key_ref]
+                manager = managers.get(key.user_id)
+                if manager is None:
+                    manager = managers[key.user_id] = UserApiKeyManager(key.user_id)
+
+                try:
+                    api_key = manager.decrypt_api_key(key.api_key)
+                except Exception as e:
+                    registry.record_failure(key_ref, f"API 키 복호화 실패: {str(e)}", fatal=True)
+                    continue
+
+                result = probe_api_key(api_key)
+                registry.record_probe(key_ref, result)
+
+                if result.status == ProbeStatus.OK:
+                    # 확인 요청도 할당량을 소모하므로 사용량에 기록
+                    manager.current_key = key
+                    manager.record_api_usage(PROBE_ENDPOINT, quota_cost=PROBE_QUOTA_COST,
+                                             success=True, response_time=result.response_time)
+                elif result.status != ProbeStatus.QUOTA_EXCEEDED:
+                    try:
+                        key.record_error(result.error_message)
+                        db.session.commit()
+                    except Exception:
+                        db.session.rollback()
+                    self.app.logger.warning(f"사용자 API 키 {key.id} 상태 확인 실패: {result.status.value}")
+
+            db.session.remove()
+
+        return len(due)
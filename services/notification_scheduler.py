@@ -1,11 +1,16 @@
 from common_utils.search import get_recent_popular_shorts
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
 from flask_sqlalchemy import SQLAlchemy
 import datetime
 import pytz
 import os
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from services.retention_service import DataRetentionService
+from common_utils.api_stats import reconcile_api_stats
+from services.saved_video_stats_service import SavedVideoStatsRefresher
+from common_utils.metrics import get_metrics_registry
+from common_utils.notification_plan import ChannelFetchPlan, ChannelSearch, select_results
 from models import (
     db,
     EmailNotification,
@@ -18,16 +23,30 @@ from models import (
     Work
 )
 
+# 틱당 사용자별 알림을 동시에 처리하는 워커 수
+NOTIFICATION_WORKERS = int(os.environ.get('NOTIFICATION_WORKERS', 4))
+# 틱 시작 후 이 시간(초)까지 시작하지 못한 사용자 처리는 건너뜀 (다음 정각 틱과 겹치지 않도록)
+NOTIFICATION_TICK_DEADLINE = float(os.environ.get('NOTIFICATION_TICK_DEADLINE', 3000))
+# 워커 풀 처리 중 마감 시간 확인 주기 (초)
+DEADLINE_CHECK_INTERVAL = 1.0
+
 class NotificationScheduler:
-    def __init__(self, app, db, email_service):
+    def __init__(self, app, db, email_service, clock=time.monotonic):
         self.app = app
         self.db = db
         self.email_service = email_service
-        self.scheduler = BackgroundScheduler(timezone=pytz.UTC)
+        # 틱 마감 시간 계산용 시계 (테스트에서 대체)
+        self.clock = clock
+        # 검색 결과 수집만 하는 요청 경로에서도 생성되므로 apscheduler는 start()에서 로딩
+        self.scheduler = None
         
     def start(self):
         """스케줄러 시작"""
         try:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            from apscheduler.triggers.cron import CronTrigger
+            self.scheduler = BackgroundScheduler(timezone=pytz.UTC)
+
             # 환경 변수 확인 및 로깅
             self.app.logger.info(f"스케줄러 시작 시도: PID={os.getpid()}, 현재 시간(UTC)={datetime.datetime.utcnow()}")
             self.app.logger.info(f"SMTP 설정: Server={self.email_service.smtp_server}, Port={self.email_service.smtp_port}")
@@ -72,6 +91,27 @@ class NotificationScheduler:
                 replace_existing=True
             )
             
+            # 매일 03:00 UTC에 ApiLog/ApiKeyUsage 보존 기간 정리 및 관리자 통계 재계산
+            self.scheduler.add_job(
+                self.run_data_retention,
+                CronTrigger(hour=3, minute=0),
+                id='data_retention_job',
+                replace_existing=True
+            )
+            
+            # 매일 04:00 UTC에 저장된 영상 조회수 갱신 (할당량 예산 내)
+            if os.environ.get('SAVED_VIDEO_REFRESH_ENABLED', 'true').lower() == 'true':
+                self.scheduler.add_job(
+                    self.refresh_saved_video_stats,
+                    CronTrigger(hour=4, minute=0),
+                    id='saved_video_stats_job',
+                    replace_existing=True
+                )
+            
+            # 모든 작업의 실행 시간을 /metrics에 기록
+            for job in self.scheduler.get_jobs():
+                job.modify(func=self._timed_job(job.id, job.func))
+            
             self.scheduler.start()
             self.app.logger.info("알림 스케줄러가 시작되었습니다.")
             
@@ -85,6 +125,21 @@ class NotificationScheduler:
             self.app.logger.error(f"스케줄러 시작 중 오류 발생: {str(e)}")
             self.app.logger.error(traceback.format_exc())
     
+    def _timed_job(self, job_id, func):
+        """작업 실행 시간을 scheduler_job_duration_seconds 히스토그램에 기록하는 래퍼"""
+        def run(*args, **kwargs):
+            status = 'success'
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                status = 'error'
+                raise
+            finally:
+                get_metrics_registry().observe('scheduler_job_duration_seconds', time.perf_counter() - started,
+                                               job=job_id, status=status)
+        return run
+    
     def test_scheduler_running(self):
         """스케줄러가 실행 중인지 확인하는 테스트 함수"""
         with self.app.app_context():
@@ -105,6 +160,8 @@ class NotificationScheduler:
         """이메일 알림 체크 및 발송"""
         with self.app.app_context():
             try:
+                started = self.clock()
+                
                 # 현재 시간 (UTC)
                 now = datetime.datetime.utcnow()
                 
@@ -123,6 +180,8 @@ class NotificationScheduler:
                 
                 self.app.logger.info(f"활성화된 알림 수: {len(notifications)}")
                 
+                # 발송 대상 알림을 먼저 모아 채널 조회를 한 번에 계획 (같은 채널은 틱당 한 번만 조회)
+                due = []
                 for notification in notifications:
                     # 선호 시간 확인
                     preferred_times = [int(t) for t in notification.preferred_times.split(',')]
@@ -142,63 +201,179 @@ class NotificationScheduler:
                                 self.app.logger.error(f"사용자 ID: {notification.user_id}를 찾을 수 없음")
                                 continue
                             
-                            self.app.logger.info(f"사용자 {user.email}에게 이메일 발송 준비 중")
-                            
-                            # 검색 결과 수집
-                            search_results = self.collect_search_results(notification)
-                            
-                            # KST 시간대 문자열
-                            kst_timestamp = kst_now.strftime('%Y-%m-%d %H:%M:%S KST')
-                            
-                            # 이메일 발송
-                            email_html = self.email_service.format_shorts_email(
-                                user,
-                                search_results,
-                                kst_timestamp
-                            )
-                            
-                            self.app.logger.info(f"이메일 발송 시도: 사용자={user.email}")
-                            
-                            success = self.email_service.send_email(
-                                user.email,
-                                f"YouTube Shorts 인기 영상 알림 ({kst_now.strftime('%Y-%m-%d %H:%M')})",
-                                email_html
-                            )
-                            
-                            if success:
-                                # 마지막 발송 시간 업데이트
-                                notification.last_sent = now
-                                self.db.session.commit()
-                                
-                                # 발송된 영상들을 이력에 기록
-                                self.record_sent_videos(user.id, search_results)
-                                
-                                self.app.logger.info(f"사용자 {user.email}에게 알림 이메일 발송 성공")
-                            else:
-                                self.app.logger.error(f"사용자 {user.email}에게 이메일 발송 실패")
+                            due.append((notification, user))
                     else:
                         self.app.logger.info(f"알림 ID: {notification.id}는 현재 시간({current_hour})에 발송되지 않음 (선호 시간: {preferred_times})")
+                
+                if not due:
+                    return
+                
+                # 모든 발송 대상의 카테고리 검색을 채널 단위로 합쳐 한 번씩 조회
+                plan = ChannelFetchPlan()
+                for notification, _ in due:
+                    for search in notification.searches:
+                        plan.add(ChannelSearch.from_notification_search(search))
+                fetched = self.execute_fetch_plan(plan)
+                
+                # 사용자별 처리는 워커가 자체 앱 컨텍스트/세션에서 다시 조회하므로 ID만 전달하고,
+                # 틱이 끝날 때까지 트랜잭션을 열어두지 않도록 현재 세션 정리
+                notification_ids = [notification.id for notification, _ in due]
+                self.db.session.close()
+                
+                deadline = started + NOTIFICATION_TICK_DEADLINE
+                # 틱 동안 워커들이 SMTP 연결을 재사용 (사용자마다 TLS 핸드셰이크/로그인 반복하지 않음)
+                with self.email_service.session():
+                    statuses = self.process_notifications(notification_ids, fetched, now, kst_now, deadline)
+                
+                summary = {status: statuses.count(status) for status in set(statuses)}
+                self.app.logger.info(f"알림 발송 완료: 대상 {len(notification_ids)}명, 결과 {summary}, "
+                                     f"소요 {self.clock() - started:.1f}초")
             
             except Exception as e:
                 self.app.logger.error(f"알림 체크 중 오류 발생: {str(e)}")
                 self.app.logger.error(traceback.format_exc())
     
-    def collect_search_results(self, notification):
-        """사용자의 검색 조건에 따라 영상 검색 결과 수집"""
+    def process_notifications(self, notification_ids, fetched, now, kst_now, deadline):
+        """
+        사용자별 알림 처리를 워커 풀에서 실행 (한 사용자의 실패가 다른 사용자에 영향 없음)
+        deadline(self.clock 기준)까지 시작하지 못한 사용자는 건너뛰고, 이미 시작한 사용자는 끝날 때까지 기다림
+        (틱의 SMTP 배치 세션이 발송 중에 닫히지 않도록)
+        Returns: 알림 순서대로 처리 결과 목록
+        """
+        max_workers = min(NOTIFICATION_WORKERS, len(notification_ids))
+        
+        if max_workers <= 1:
+            return [self.process_notification(notification_id, fetched, now, kst_now, deadline)
+                    for notification_id in notification_ids]
+        
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='notification')
+        futures = [pool.submit(self.process_notification, notification_id, fetched, now, kst_now, deadline)
+                   for notification_id in notification_ids]
+        pending = set(futures)
+        while pending and self.clock() < deadline:
+            _, pending = wait(pending, timeout=DEADLINE_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+        # 마감 시간이 지나면 대기 중인 작업은 취소하고, 이미 실행 중인 발송은 끝날 때까지 기다림
+        pool.shutdown(wait=True, cancel_futures=True)
+        
+        statuses = []
+        for notification_id, future in zip(notification_ids, futures):
+            if future.cancelled():
+                self.app.logger.warning(f"알림 ID: {notification_id} 마감 시간 초과로 건너뜀")
+                self._observe_notification(0, 'deadline')
+                statuses.append('deadline')
+            else:
+                statuses.append(future.result())
+        return statuses
+    
+    def process_notification(self, notification_id, fetched, now, kst_now, deadline=None):
+        """
+        사용자 한 명의 알림 처리 (결과 선택 → 이메일 생성 → 발송 → 이력 기록)
+        워커 스레드마다 앱 컨텍스트를 열어 별도 DB 세션 사용 (컨텍스트 종료 시 세션 정리)
+        Returns: 'sent' / 'failed'(발송 실패) / 'error'(처리 중 오류) / 'deadline'(마감 시간 초과) / 'skipped'(사용자 없음)
+        """
+        if deadline is not None and self.clock() >= deadline:
+            self.app.logger.warning(f"알림 ID: {notification_id} 마감 시간 초과로 건너뜀")
+            self._observe_notification(0, 'deadline')
+            return 'deadline'
+        
+        started = time.perf_counter()
+        status = 'error'
+        with self.app.app_context():
+            try:
+                notification = self.db.session.get(EmailNotification, notification_id)
+                user = self.db.session.get(User, notification.user_id) if notification else None
+                if not user:
+                    status = 'skipped'
+                    return status
+                
+                self.app.logger.info(f"사용자 {user.email}에게 이메일 발송 준비 중")
+                
+                # 검색 결과 수집 (조회 결과를 사용자의 검색 조건으로 선택)
+                search_results = self.collect_search_results(notification, fetched)
+                
+                # KST 시간대 문자열
+                kst_timestamp = kst_now.strftime('%Y-%m-%d %H:%M:%S KST')
+                
+                # 이메일 발송
+                email_html = self.email_service.format_shorts_email(
+                    user,
+                    search_results,
+                    kst_timestamp
+                )
+                
+                self.app.logger.info(f"이메일 발송 시도: 사용자={user.email}")
+                
+                success = self.email_service.send_email(
+                    user.email,
+                    f"YouTube Shorts 인기 영상 알림 ({kst_now.strftime('%Y-%m-%d %H:%M')})",
+                    email_html
+                )
+                
+                if success:
+                    # 마지막 발송 시간 업데이트
+                    notification.last_sent = now
+                    self.db.session.commit()
+                    
+                    # 발송된 영상들을 이력에 기록
+                    self.record_sent_videos(user.id, search_results)
+                    
+                    self.app.logger.info(f"사용자 {user.email}에게 알림 이메일 발송 성공")
+                    status = 'sent'
+                else:
+                    self.app.logger.error(f"사용자 {user.email}에게 이메일 발송 실패")
+                    status = 'failed'
+                return status
+            except Exception as e:
+                self.db.session.rollback()
+                self.app.logger.error(f"알림 ID: {notification_id} 처리 중 오류 발생: {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+                return status
+            finally:
+                elapsed = time.perf_counter() - started
+                self._observe_notification(elapsed, status)
+                self.app.logger.info(f"알림 ID: {notification_id} 처리 시간 {elapsed:.2f}초 ({status})")
+    
+    def _observe_notification(self, seconds, status):
+        get_metrics_registry().observe('notification_user_duration_seconds', seconds, status=status)
+    
+    def execute_fetch_plan(self, plan):
+        """채널 조회 계획 실행 (채널마다 get_recent_popular_shorts 한 번)"""
+        self.app.logger.info(f"채널 조회 계획: 카테고리 검색 {plan.searches}건, "
+                             f"채널 조회 {plan.channel_requests}건 → 고유 채널 {len(plan)}건")
+        metrics = get_metrics_registry()
+        metrics.inc('notification_channel_fetches_total', len(plan), kind='planned')
+        metrics.inc('notification_channel_fetches_total', plan.channel_requests, kind='requested')
+        
+        def on_error(fetch, e):
+            self.app.logger.error(f"채널 {fetch.channel_id} 조회 중 오류: {str(e)}")
+        
+        return plan.execute(get_recent_popular_shorts, on_error=on_error)
+    
+    def collect_search_results(self, notification, fetched=None):
+        """
+        사용자의 검색 조건에 따라 영상 검색 결과 수집
+        fetched: 틱 단위로 미리 조회한 채널별 결과 (없으면 이 알림의 채널만 조회)
+        """
         results = []
         
         try:
             self.app.logger.info(f"검색 결과 수집 시작: 알림 ID={notification.id}")
             
-            for search in notification.searches:
+            channel_searches = [(search, ChannelSearch.from_notification_search(search))
+                                for search in notification.searches]
+            if fetched is None:
+                plan = ChannelFetchPlan()
+                for _, channel_search in channel_searches:
+                    plan.add(channel_search)
+                fetched = self.execute_fetch_plan(plan)
+            
+            for search, channel_search in channel_searches:
                 # 카테고리 정보 가져오기
                 category = search.category
                 self.app.logger.info(f"카테고리: {category.name} 처리 중")
                 
-                # 카테고리에 속한 채널 목록 가져오기
-                channels = []
-                for cat_channel in category.category_channels:
-                    channels.append(cat_channel.channel.id)
+                # 카테고리에 속한 채널 목록
+                channels = channel_search.channel_ids
                 
                 self.app.logger.info(f"카테고리 {category.name}에 속한 채널 수: {len(channels)}")
                 
@@ -215,13 +390,7 @@ class NotificationScheduler:
                 try:
                     self.app.logger.info(f"검색 조건: 카테고리={category.name}, 최소 조회수={search.min_views:,}회, 기간={search.days_ago}일, 최대 결과={search.max_results}개, 채널 수={len(channels)}개")
                     
-                    videos = get_recent_popular_shorts(
-                        min_views=search.min_views,
-                        days_ago=search.days_ago,
-                        max_results=search.max_results,
-                        channel_ids=','.join(channels),
-                        region_code='KR'
-                    )
+                    videos = select_results(channel_search, fetched)
                     
                     # 이미 발송된 영상 제외
                     videos = self.filter_already_sent_videos(notification.user_id, videos)
@@ -334,6 +503,25 @@ class NotificationScheduler:
             self.app.logger.error(f"발송 이력 정리 중 오류: {str(e)}")
             db.session.rollback()
 
+    def run_data_retention(self):
+        """보존 기간이 지난 API 로그 요약 및 정리, 관리자 통계 재계산"""
+        with self.app.app_context():
+            try:
+                result = DataRetentionService(self.app).run()
+                self.app.logger.info(f"데이터 보존 정리 완료: {result}")
+
+                # 정리가 끝난 뒤 관리자 통계 집계 테이블 재계산 (ApiLog -> ApiLogDaily 이동 완료 후)
+                corrected = reconcile_api_stats()
+                self.app.logger.info(f"관리자 통계 재계산 완료 (보정된 항목: {corrected})")
+            except Exception as e:
+                self.app.logger.error(f"데이터 보존 정리 중 오류: {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+
+    def refresh_saved_video_stats(self):
+        """저장된 영상 조회수 일괄 갱신"""
+        result = SavedVideoStatsRefresher(self.app).run()
+        self.app.logger.info(f"저장 영상 조회수 갱신 완료: {result}")
+
     def send_weekly_settlement_reports(self):
         """매주 월요일 10시(KST)에 전주 정산 리포트를 발송"""
         with self.app.app_context():
@@ -352,62 +540,64 @@ class NotificationScheduler:
                 week_end = (now_kst.date() - datetime.timedelta(days=1))  # 전주 일요일
                 week_start = week_end - datetime.timedelta(days=6)  # 전주 월요일
 
-                for notif in active_notifications:
-                    user = User.query.get(notif.user_id)
-                    if not user:
-                        continue
+                # 발송 대상 전체에 SMTP 연결 재사용
+                with self.email_service.session():
+                    for notif in active_notifications:
+                        user = User.query.get(notif.user_id)
+                        if not user:
+                            continue
 
-                    # 전주 기간에 해당하는 작업 수집
-                    items = []
-                    # User.works 관계 사용
-                    works = Work.query.filter(
-                        Work.user_id == user.id,
-                        Work.work_date >= week_start,
-                        Work.work_date <= week_end
-                    ).order_by(Work.work_date.asc()).all()
+                        # 전주 기간에 해당하는 작업 수집
+                        items = []
+                        # User.works 관계 사용
+                        works = Work.query.filter(
+                            Work.user_id == user.id,
+                            Work.work_date >= week_start,
+                            Work.work_date <= week_end
+                        ).order_by(Work.work_date.asc()).all()
 
-                    settled_amount = 0
-                    pending_amount = 0
-                    settlement_works = 0
-                    completed_works = 0
+                        settled_amount = 0
+                        pending_amount = 0
+                        settlement_works = 0
+                        completed_works = 0
 
-                    for w in works:
-                        completed_works += 1
-                        if w.settlement_status == 'settled':
-                            settlement_works += 1
-                            settled_amount += (w.settlement_amount or w.rate or 0)
-                        else:
-                            pending_amount += (w.rate or 0)
-                        items.append({
-                            'editor_name': w.editor.name if w.editor else '-',
-                            'title': w.title,
-                            'work_type': w.work_type,
-                            'work_date': w.work_date.strftime('%Y-%m-%d'),
-                            'settlement_status': w.settlement_status,
-                            'rate': (w.settlement_amount or w.rate or 0)
-                        })
+                        for w in works:
+                            completed_works += 1
+                            if w.settlement_status == 'settled':
+                                settlement_works += 1
+                                settled_amount += (w.settlement_amount or w.rate or 0)
+                            else:
+                                pending_amount += (w.rate or 0)
+                            items.append({
+                                'editor_name': w.editor.name if w.editor else '-',
+                                'title': w.title,
+                                'work_type': w.work_type,
+                                'work_date': w.work_date.strftime('%Y-%m-%d'),
+                                'settlement_status': w.settlement_status,
+                                'rate': (w.settlement_amount or w.rate or 0)
+                            })
 
-                    summary = type('Summary', (), {
-                        'completed_works': completed_works,
-                        'settlement_works': settlement_works,
-                        'settled_amount': settled_amount,
-                        'pending_amount': pending_amount
-                    })()
+                        summary = type('Summary', (), {
+                            'completed_works': completed_works,
+                            'settlement_works': settlement_works,
+                            'settled_amount': settled_amount,
+                            'pending_amount': pending_amount
+                        })()
 
-                    html = self.email_service.format_weekly_settlement_email(
-                        user=user,
-                        week_start_date=week_start,
-                        week_end_date=week_end,
-                        summary=summary,
-                        items=items
-                    )
+                        html = self.email_service.format_weekly_settlement_email(
+                            user=user,
+                            week_start_date=week_start,
+                            week_end_date=week_end,
+                            summary=summary,
+                            items=items
+                        )
 
-                    subject = f"주간 정산 리포트 ({week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')})"
-                    ok = self.email_service.send_email(user.email, subject, html)
-                    if ok:
-                        self.app.logger.info(f"주간 정산 리포트 발송 성공: {user.email}")
-                    else:
-                        self.app.logger.error(f"주간 정산 리포트 발송 실패: {user.email}")
+                        subject = f"주간 정산 리포트 ({week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')})"
+                        ok = self.email_service.send_email(user.email, subject, html)
+                        if ok:
+                            self.app.logger.info(f"주간 정산 리포트 발송 성공: {user.email}")
+                        else:
+                            self.app.logger.error(f"주간 정산 리포트 발송 실패: {user.email}")
 
             except Exception as e:
                 self.app.logger.error(f"주간 정산 리포트 발송 중 오류: {str(e)}")
@@ -0,0 +1,179 @@
+# services/retention_service.py
+import os
+import gzip
+import json
+import shutil
+import tempfile
+import time
+import datetime
+from collections import Counter
+from sqlalchemy import text
+from models import db, ApiLog, ApiLogDaily, ApiKeyUsage, SearchJob
+from common_utils.db_helpers import increment_counters
+
+
+class DataRetentionService:
+    """ApiLog / ApiKeyUsage 보존 기간 관리 (요약 → 보관 → 청크 단위 삭제)"""
+
+    def __init__(self, app):
+        self.app = app
+        # 테이블별 보존 기간 (일)
+        self.api_log_retention_days = int(os.environ.get('API_LOG_RETENTION_DAYS', 90))
+        self.api_key_usage_retention_days = int(os.environ.get('API_KEY_USAGE_RETENTION_DAYS', 90))
+        # 비동기 검색 작업 결과 보관 시간 (시간)
+        self.search_job_retention_hours = int(os.environ.get('SEARCH_JOB_RETENTION_HOURS', 24))
+        # 한 트랜잭션에서 처리할 최대 행 수 (락 보유 시간 제한)
+        self.batch_size = int(os.environ.get('RETENTION_BATCH_SIZE', 1000))
+        # 청크 사이 대기 시간 (초) - 다른 쓰기 작업에 락 양보
+        self.batch_pause = float(os.environ.get('RETENTION_BATCH_PAUSE', 0.05))
+        # 설정 시 삭제 전 원본 행을 gzip JSONL로 보관
+        self.archive_dir = os.environ.get('RETENTION_ARCHIVE_DIR', '')
+
+    def run(self):
+        """전체 보존 정책 실행"""
+        return {
+            'api_log': self.purge_api_logs(),
+            'api_key_usage': self.purge_api_key_usage(),
+            'search_jobs': self.purge_search_jobs()
+        }
+
+    def purge_api_logs(self, now=None):
+        """보존 기간이 지난 ApiLog를 일별 요약에 반영한 뒤 삭제"""
+        cutoff = self._cutoff(self.api_log_retention_days, now)
+
+        def summarize(rows):
+            counts = Counter(
+                (row.timestamp.date(), row.user_id, row.endpoint)
+                for row in rows
+            )
+            for (log_date, user_id, endpoint), count in counts.items():
+                if user_id is None:
+                    # 비로그인 호출은 user_id NULL 행에 요약 (NULL은 유니크 충돌로 잡히지 않아 조회 후 갱신)
+                    self._increment_anonymous(log_date, endpoint, count)
+                    continue
+                increment_counters(
+                    ApiLogDaily,
+                    keys={'log_date': log_date, 'user_id': user_id, 'endpoint': endpoint},
+                    increments={'call_count': count}
+                )
+
+        return self._purge_in_batches(ApiLog, cutoff, summarize)
+
+    def _increment_anonymous(self, log_date, endpoint, count):
+        row = ApiLogDaily.query.filter(
+            ApiLogDaily.log_date == log_date,
+            ApiLogDaily.user_id.is_(None),
+            ApiLogDaily.endpoint == endpoint
+        ).with_for_update().first()
+        if row is None:
+            db.session.add(ApiLogDaily(log_date=log_date, user_id=None, endpoint=endpoint, call_count=count))
+        else:
+            row.call_count += count
+
+    def purge_api_key_usage(self, now=None):
+        """보존 기간이 지난 ApiKeyUsage 삭제
+        (일별 요약은 api_key_usage_daily에 기록 시점마다 증분 반영되어 있음)
+        """
+        cutoff = self._cutoff(self.api_key_usage_retention_days, now)
+        return self._purge_in_batches(ApiKeyUsage, cutoff)
+
+    def purge_search_jobs(self, now=None):
+        """보관 시간이 지난 검색 작업 삭제 (결과 JSON만 담고 있어 요약 불필요)"""
+        cutoff = (now or datetime.datetime.utcnow()) - datetime.timedelta(hours=self.search_job_retention_hours)
+        try:
+            deleted = SearchJob.query.filter(SearchJob.created_at < cutoff).delete(synchronize_session=False)
+            db.session.commit()
+            return deleted
+        except Exception as e:
+            db.session.rollback()
+            self.app.logger.error(f"search_jobs 보존 정리 중 오류: {str(e)}")
+            return 0
+
+    def _cutoff(self, retention_days, now=None):
+        now = now or datetime.datetime.utcnow()
+        return now - datetime.timedelta(days=retention_days)
+
+    def _purge_in_batches(self, model, cutoff, summarize=None):
+        """id 순으로 batch_size개씩 요약/보관/삭제 후 커밋 (청크마다 짧은 트랜잭션)"""
+        table_name = model.__tablename__
+        total_deleted = 0
+        last_id = 0
+
+        while True:
+            try:
+                self._set_lock_timeout()
+
+                rows = model.query.filter(
+                    model.id > last_id,
+                    model.timestamp < cutoff
+                ).order_by(model.id).limit(self.batch_size).all()
+
+                if not rows:
+                    db.session.commit()
+                    break
+
+                if summarize:
+                    summarize(rows)
+                # 보관 내용은 임시 파일에 먼저 쓰고, 삭제가 커밋된 뒤에만 보관 파일에 추가 (실패/재시도 시 중복 방지)
+                pending_archive = self._write_archive_batch(table_name, rows) if self.archive_dir else None
+
+                ids = [row.id for row in rows]
+                try:
+                    model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+                    db.session.commit()
+                except Exception:
+                    if pending_archive:
+                        os.remove(pending_archive)
+                    raise
+                if pending_archive:
+                    self._commit_archive_batch(table_name, pending_archive)
+
+                total_deleted += len(ids)
+                last_id = ids[-1]
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"{table_name} 보존 정리 중 오류 (다음 실행 시 재시도): {str(e)}")
+                break
+
+            if len(rows) < self.batch_size:
+                break
+            time.sleep(self.batch_pause)
+
+        if total_deleted > 0:
+            self.app.logger.info(f"{table_name}: 보존 기간({cutoff:%Y-%m-%d}) 이전 기록 {total_deleted}개 정리 완료")
+
+        return total_deleted
+
+    def _set_lock_timeout(self):
+        """PostgreSQL에서는 락 대기 시간을 제한해 다른 요청을 오래 막지 않도록 함"""
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text("SET LOCAL lock_timeout = '2s'"))
+
+    def _archive_path(self, table_name):
+        return os.path.join(self.archive_dir, f"{table_name}_{datetime.datetime.utcnow():%Y%m%d}.jsonl.gz")
+
+    def _write_archive_batch(self, table_name, rows):
+        """삭제할 원본 행을 임시 gzip JSONL 파일에 기록 (경로 반환)"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        columns = [column.name for column in rows[0].__table__.columns]
+        fd, path = tempfile.mkstemp(prefix=f".{table_name}_", suffix='.jsonl.gz.part', dir=self.archive_dir)
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                for row in rows:
+                    record = {name: getattr(row, name) for name in columns}
+                    f.write(json.dumps(record, default=str, ensure_ascii=False) + '\n')
+        except Exception:
+            os.remove(path)
+            raise
+        return path
+
+    def _commit_archive_batch(self, table_name, path):
+        """커밋된 청크의 임시 파일을 날짜별 보관 파일 끝에 추가 (gzip 멤버 연결)"""
+        try:
+            with open(path, 'rb') as src, open(self._archive_path(table_name), 'ab') as dst:
+                shutil.copyfileobj(src, dst)
+        except Exception as e:
+            # 원본은 이미 삭제되었으므로 임시 파일을 남겨 수동 복구 가능하게 함
+            self.app.logger.error(f"{table_name} 보관 파일 추가 실패 (임시 파일 {path} 유지): {str(e)}")
+            return
+        os.remove(path)
@@ -0,0 +1,120 @@
+# services/saved_video_stats_service.py
+import os
+import datetime
+import traceback
+from sqlalchemy import bindparam, or_
+from models import db, SavedVideo
+from common_utils.search import get_youtube_api_service, execute_youtube_api_call
+
+# videos.list 한 번에 조회할 수 있는 최대 영상 수
+VIDEOS_PER_REQUEST = 50
+
+# 배치당 최대 시도 횟수 (키 전환/네트워크 오류 재시도 포함)
+MAX_ATTEMPTS_PER_BATCH = 3
+
+
+def fetch_video_statistics(video_ids, max_attempts=MAX_ATTEMPTS_PER_BATCH, on_attempt=None):
+    """
+    시스템 API 키로 videos.list(part=statistics) 호출 (요청마다 할당량 1 단위)
+    재시도를 포함해 최대 max_attempts번 요청하며, 실제 요청 직전마다 on_attempt()를 호출한다.
+    """
+    def api_call():
+        if on_attempt is not None:
+            on_attempt()
+        return get_youtube_api_service().videos().list(
+            part='statistics',
+            id=','.join(video_ids),
+            maxResults=VIDEOS_PER_REQUEST
+        ).execute()
+
+    return execute_youtube_api_call(api_call, 'videos.list', max_retries=max_attempts)
+
+
+class SavedVideoStatsRefresher:
+    """저장된 영상 조회수 백그라운드 갱신
+
+    모든 사용자의 저장 영상을 video_id로 묶어 오래된 것부터 50개씩 videos.list로 조회하고,
+    같은 영상을 저장한 모든 사용자의 행을 한 번에 갱신한다. 실행당 할당량 예산을 넘지 않는다.
+    (재시도 요청도 예산에서 차감하고, 배치별 시도 횟수는 남은 예산으로 제한)
+    """
+
+    def __init__(self, app, fetch_statistics=None):
+        self.app = app
+        # 실행 1회에 사용할 최대 할당량 (videos.list 1회 = 1 단위 = 최대 50개 영상)
+        self.quota_budget = int(os.environ.get('SAVED_VIDEO_REFRESH_QUOTA_BUDGET', 200))
+        # 마지막 갱신 후 이 시간이 지난 영상만 갱신
+        self.stale_hours = float(os.environ.get('SAVED_VIDEO_REFRESH_STALE_HOURS', 24))
+        self.fetch_statistics = fetch_statistics or fetch_video_statistics
+
+    def run(self, now=None):
+        """갱신이 필요한 영상을 예산 안에서 갱신하고 결과 요약 반환"""
+        now = now or datetime.datetime.utcnow()
+        result = {'requests': 0, 'quota_units': 0, 'videos': 0, 'missing': 0}
+
+        def charge_attempt():
+            result['quota_units'] += 1
+
+        with self.app.app_context():
+            try:
+                video_ids = self._stale_video_ids(now, self.quota_budget * VIDEOS_PER_REQUEST)
+
+                for start in range(0, len(video_ids), VIDEOS_PER_REQUEST):
+                    remaining = self.quota_budget - result['quota_units']
+                    if remaining <= 0:
+                        break  # 재시도로 예산을 모두 사용함 - 남은 영상은 다음 실행에서 갱신
+                    batch = video_ids[start:start + VIDEOS_PER_REQUEST]
+                    try:
+                        response = self.fetch_statistics(batch, max_attempts=min(MAX_ATTEMPTS_PER_BATCH, remaining),
+                                                         on_attempt=charge_attempt)
+                    except Exception as e:
+                        # 할당량 소진 등: 남은 영상은 다음 실행에서 이어서 갱신
+                        self.app.logger.warning(f"저장 영상 조회수 갱신 중단: {str(e)}")
+                        break
+                    result['requests'] += 1
+
+                    view_counts = {
+                        item['id']: int(item.get('statistics', {}).get('viewCount', 0))
+                        for item in response.get('items', [])
+                    }
+                    missing = [video_id for video_id in batch if video_id not in view_counts]
+                    self._apply_batch(view_counts, missing, now)
+                    result['videos'] += len(view_counts)
+                    result['missing'] += len(missing)
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"저장 영상 조회수 갱신 중 오류: {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+            finally:
+                db.session.remove()
+
+        return result
+
+    def _stale_video_ids(self, now, limit):
+        """갱신이 필요한 영상 ID (중복 제거, 가장 오래 갱신되지 않은 영상부터)"""
+        cutoff = now - datetime.timedelta(hours=self.stale_hours)
+        oldest = db.func.min(SavedVideo.stats_updated_at)
+        rows = db.session.query(SavedVideo.video_id, oldest).filter(
+            or_(SavedVideo.stats_updated_at.is_(None), SavedVideo.stats_updated_at < cutoff)
+        ).group_by(SavedVideo.video_id).order_by(oldest.asc().nullsfirst(), SavedVideo.video_id).limit(limit).all()
+        return [video_id for video_id, _ in rows]
+
+    def _apply_batch(self, view_counts, missing, now):
+        """한 배치의 조회수를 같은 영상을 저장한 모든 사용자의 행에 반영"""
+        table = SavedVideo.__table__
+
+        if view_counts:
+            stmt = table.update().where(table.c.video_id == bindparam('b_video_id')).values(
+                view_count=bindparam('b_view_count'),
+                stats_updated_at=now
+            )
+            db.session.execute(stmt, [
+                {'b_video_id': video_id, 'b_view_count': count} for video_id, count in view_counts.items()
+            ])
+
+        if missing:
+            # 삭제/비공개 영상은 조회수를 유지하고 갱신 일시만 기록 (매 실행마다 재조회 방지)
+            db.session.execute(
+                table.update().where(table.c.video_id.in_(missing)).values(stats_updated_at=now)
+            )
+
+        db.session.commit()
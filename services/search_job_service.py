@@ -0,0 +1,102 @@
+# services/search_job_service.py
+import os
+import json
+import uuid
+import traceback
+from datetime import datetime, timedelta
+from models import db, SearchJob
+from common_utils.request_profiler import propagate_profile
+
+
+class SearchJobService:
+    """검색을 백그라운드 작업으로 실행하고 상태/결과를 DB에 공유하는 서비스
+
+    요청 스레드는 작업을 등록하고 바로 반환하며, 결과는 작업 ID로 조회한다.
+    작업 상태가 DB에 있으므로 어느 워커로 조회 요청이 가도 같은 결과를 돌려준다.
+    """
+
+    def __init__(self, app, executor, error_formatter=None):
+        self.app = app
+        self.executor = executor
+        # 예외를 응답 JSON으로 변환하는 함수 (기존 /search 오류 응답과 동일한 형식 유지)
+        self.error_formatter = error_formatter or (lambda e: {"status": "error", "message": str(e)})
+        # 이 시간 안에 끝나지 않은 작업은 워커 종료 등으로 유실된 것으로 간주 (초)
+        self.job_timeout = int(os.environ.get('SEARCH_JOB_TIMEOUT', 120))
+
+    def submit(self, user_id, cache_key, params, search_func, on_success=None):
+        """검색 작업 등록 (같은 사용자의 같은 조건 작업이 진행 중이면 해당 작업 반환)"""
+        active_since = datetime.utcnow() - timedelta(seconds=self.job_timeout)
+        existing = SearchJob.query.filter(
+            SearchJob.user_id == user_id,
+            SearchJob.cache_key == cache_key,
+            SearchJob.status.in_(['pending', 'running']),
+            SearchJob.created_at >= active_since
+        ).first()
+        if existing:
+            return existing
+
+        job = SearchJob(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            cache_key=cache_key,
+            params=json.dumps(params, ensure_ascii=False)
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        # 프로파일링 중인 요청이면 백그라운드 검색도 같은 요청 ID로 프로파일링
+        self.executor.submit(propagate_profile(self._run, 'search_job'), job.id, params, search_func, on_success)
+        return job
+
+    def get_job_response(self, job_id, user_id):
+        """작업 상태 응답 (본인 작업이 아니거나 없으면 None)"""
+        job = db.session.get(SearchJob, job_id)
+        if not job or job.user_id != user_id:
+            return None
+
+        if job.status == 'done':
+            response = json.loads(job.result)
+            response['job_id'] = job.id
+            return response
+
+        if job.created_at < datetime.utcnow() - timedelta(seconds=self.job_timeout):
+            return {
+                "status": "error",
+                "job_id": job.id,
+                "message": "검색 작업 시간이 초과되었습니다. 다시 시도해주세요."
+            }
+
+        return {"status": job.status, "job_id": job.id}
+
+    def _run(self, job_id, params, search_func, on_success):
+        """워커 스레드에서 검색 실행 후 결과 저장"""
+        with self.app.app_context():
+            try:
+                self._update(job_id, status='running', started_at=datetime.utcnow())
+
+                try:
+                    results = search_func(**params)
+                    if on_success:
+                        on_success(results)
+                    response = {
+                        "status": "success",
+                        "results": results,
+                        "count": len(results),
+                        "fromCache": False
+                    }
+                except Exception as e:
+                    self.app.logger.error(f"검색 작업 {job_id} 실패: {str(e)}")
+                    response = self.error_formatter(e)
+
+                self._update(job_id, status='done', finished_at=datetime.utcnow(),
+                             result=json.dumps(response, ensure_ascii=False))
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"검색 작업 {job_id} 상태 저장 중 오류: {str(e)}")
+                self.app.logger.error(traceback.format_exc())
+            finally:
+                db.session.remove()
+
+    def _update(self, job_id, **values):
+        SearchJob.query.filter(SearchJob.id == job_id).update(values, synchronize_session=False)
+        db.session.commit()
@@ -1,11 +1,15 @@
 # services/user_api_service.py
 import os
 import time
-import googleapiclient.discovery
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from cryptography.fernet import Fernet
 from flask import current_app
-from models import db, UserApiKey, ApiKeyUsage, ApiKeyRotation
+from models import db, UserApiKey, ApiKeyUsage, ApiKeyUsageDaily, ApiKeyRotation
+from common_utils.db_helpers import increment_counters
+from common_utils.metrics import record_youtube_call
+from common_utils.key_health import (
+    get_key_health_registry, probe_api_key, is_invalid_key_error, is_quota_error, user_key_ref, ProbeStatus
+)
 import logging
 
 class UserApiKeyManager:
@@ -78,21 +82,10 @@ class UserApiKeyManager:
             return False, "API 키 추가 중 오류가 발생했습니다."
     
     def _validate_api_key(self, api_key):
-        """API 키 유효성 검증"""
-        try:
-            youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=api_key)
-            # 간단한 테스트 요청
-            youtube.search().list(part="snippet", q="test", type="video", maxResults=1).execute()
-            return True
-        except Exception as e:
-            error_str = str(e).lower()
-            # API 키가 잘못되었거나 권한이 없는 경우
-            if 'api key not valid' in error_str or 'forbidden' in error_str:
-                return False
-            # 할당량 초과는 유효한 키로 간주
-            if 'quota' in error_str or 'exceeded' in error_str:
-                return True
-            return False
+        """API 키 유효성 검증 (할당량 1 단위 요청 사용)"""
+        result = probe_api_key(api_key)
+        # 할당량 초과는 유효한 키로 간주
+        return result.status in (ProbeStatus.OK, ProbeStatus.QUOTA_EXCEEDED)
     
     def get_user_api_keys(self):
         """사용자의 모든 API 키 조회"""
@@ -171,9 +164,13 @@ class UserApiKeyManager:
         # 사용자 개인 키가 있는 경우 우선 사용
         if available_keys:
             # 일일 사용량 리셋 및 건강한 키 찾기
+            health_registry = get_key_health_registry()
             for key in available_keys:
                 key.reset_daily_usage()
-                if key.is_healthy() and not key.is_quota_exceeded():
+                if not key.is_healthy() or key.is_quota_exceeded():
+                    continue
+                # 서킷 브레이커가 열린 키는 요청 경로에서 제외 (대기 시간이 지났으면 이 요청이 시험 요청)
+                if health_registry.is_available(user_key_ref(key.id)):
                     self.current_key = key
                     return self.decrypt_api_key(key.api_key)
         
@@ -227,11 +224,18 @@ class UserApiKeyManager:
             return
         
         try:
-            # 사용량 증가
+            # 사용량 증가 및 키 상태(서킷 브레이커) 갱신
+            key_ref = user_key_ref(self.current_key.id)
             if success:
                 self.current_key.increment_usage()
+                get_key_health_registry().record_success(key_ref)
             else:
                 self.current_key.record_error(error_message or "Unknown error")
+                # 할당량 초과는 키 이상이 아니므로 브레이커에 반영하지 않음
+                if not is_quota_error(error_message or ""):
+                    get_key_health_registry().record_failure(
+                        key_ref, error_message or "", fatal=is_invalid_key_error(error_message or "")
+                    )
             
             # 사용 이력 기록
             usage_log = ApiKeyUsage(
@@ -245,39 +249,60 @@ class UserApiKeyManager:
             )
             
             db.session.add(usage_log)
+            
+            # 일별 롤업 증분 갱신 (같은 트랜잭션에서 처리)
+            self._increment_daily_rollup(quota_cost, success, response_time)
             db.session.commit()
             
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"API 사용 기록 중 오류: {str(e)}")
     
+    def _increment_daily_rollup(self, quota_cost, success, response_time):
+        """현재 키의 오늘자 롤업 행 증가"""
+        increment_counters(
+            ApiKeyUsageDaily,
+            keys={
+                'user_id': self.user_id,
+                'api_key_id': self.current_key.id,
+                'usage_date': datetime.utcnow().date()
+            },
+            increments={
+                'total_calls': 1,
+                'successful_calls': 1 if success else 0,
+                'quota_units': quota_cost if success else 0,
+                'total_response_time': response_time or 0.0,
+                'timed_calls': 1 if response_time is not None else 0
+            }
+        )
+    
     def get_usage_statistics(self, days=7):
-        """사용 통계 조회"""
+        """사용 통계 조회 (일별 롤업 테이블 기반, 조회 비용은 기간 일수에 비례)"""
         from sqlalchemy import func
-        from datetime import timedelta
         
         try:
-            start_date = datetime.utcnow() - timedelta(days=days)
+            start_date = (datetime.utcnow() - timedelta(days=days)).date()
             
             # 일별 사용량
             daily_usage = db.session.query(
-                func.date(ApiKeyUsage.timestamp).label('date'),
-                func.count().label('total_calls'),
-                func.sum(func.case([(ApiKeyUsage.success == True, 1)], else_=0)).label('successful_calls'),
-                func.avg(ApiKeyUsage.response_time).label('avg_response_time')
+                ApiKeyUsageDaily.usage_date.label('date'),
+                func.sum(ApiKeyUsageDaily.total_calls).label('total_calls'),
+                func.sum(ApiKeyUsageDaily.successful_calls).label('successful_calls'),
+                func.sum(ApiKeyUsageDaily.total_response_time).label('total_response_time'),
+                func.sum(ApiKeyUsageDaily.timed_calls).label('timed_calls')
             ).filter(
-                ApiKeyUsage.user_id == self.user_id,
-                ApiKeyUsage.timestamp >= start_date
-            ).group_by(func.date(ApiKeyUsage.timestamp)).all()
+                ApiKeyUsageDaily.user_id == self.user_id,
+                ApiKeyUsageDaily.usage_date >= start_date
+            ).group_by(ApiKeyUsageDaily.usage_date).order_by(ApiKeyUsageDaily.usage_date).all()
             
             # API 키별 사용량
             key_usage = db.session.query(
                 UserApiKey.name,
-                func.count(ApiKeyUsage.id).label('total_calls'),
-                func.sum(func.case([(ApiKeyUsage.success == True, 1)], else_=0)).label('successful_calls')
-            ).join(ApiKeyUsage).filter(
+                func.sum(ApiKeyUsageDaily.total_calls).label('total_calls'),
+                func.sum(ApiKeyUsageDaily.successful_calls).label('successful_calls')
+            ).join(ApiKeyUsageDaily, ApiKeyUsageDaily.api_key_id == UserApiKey.id).filter(
                 UserApiKey.user_id == self.user_id,
-                ApiKeyUsage.timestamp >= start_date
+                ApiKeyUsageDaily.usage_date >= start_date
             ).group_by(UserApiKey.id, UserApiKey.name).all()
             
             # 안전한 데이터 변환
@@ -285,7 +310,8 @@ class UserApiKeyManager:
             for day in daily_usage:
                 total_calls = int(day.total_calls) if day.total_calls else 0
                 successful_calls = int(day.successful_calls) if day.successful_calls else 0
-                avg_response_time = float(day.avg_response_time) if day.avg_response_time else 0.0
+                timed_calls = int(day.timed_calls) if day.timed_calls else 0
+                avg_response_time = float(day.total_response_time) / timed_calls if timed_calls else 0.0
                 
                 daily_usage_data.append({
                     'date': day.date.isoformat(),
@@ -327,8 +353,9 @@ class UserApiKeyManager:
             raise Exception("사용 가능한 YouTube API 키가 없습니다. API 키를 추가하거나 할당량을 확인해주세요.")
         
         try:
+            from common_utils.search import build_youtube_client
             start_time = time.time()
-            youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=api_key)
+            youtube = build_youtube_client(api_key)
             response_time = time.time() - start_time
             
             # 개인 키 사용 시에만 사용량 기록
@@ -346,6 +373,10 @@ class UserApiKeyManager:
             
             raise
     
+    def _metrics_key_label(self):
+        """메트릭 라벨용 키 참조 (개인 키 ID 또는 system)"""
+        return user_key_ref(self.current_key.id) if self.current_key else 'system'
+    
     def execute_api_call(self, api_call_func, endpoint_name, quota_cost=1, max_retries=3):
         """API 호출 실행 (재시도 및 키 순환 로직 포함)"""
         last_error = None
@@ -357,6 +388,7 @@ class UserApiKeyManager:
                 response_time = time.time() - start_time
                 
                 # 성공 기록 (개인 키 사용 시에만)
+                record_youtube_call(endpoint_name, self._metrics_key_label(), 'success', response_time, quota_cost)
                 self.record_api_usage(endpoint_name, quota_cost, success=True, response_time=response_time)
                 return result
                 
@@ -367,6 +399,7 @@ class UserApiKeyManager:
                 
                 # 할당량 초과 또는 키 오류인 경우
                 if any(keyword in error_str for keyword in ['quota', 'exceeded', 'invalid', 'forbidden']):
+                    record_youtube_call(endpoint_name, self._metrics_key_label(), 'quota_error', response_time)
                     # 오류 기록 (개인 키 사용 시에만)
                     self.record_api_usage(endpoint_name, quota_cost, success=False, 
                                         error_message=str(e), response_time=response_time)
@@ -401,6 +434,7 @@ class UserApiKeyManager:
                         raise Exception("모든 API 키의 할당량이 초과되었거나 사용할 수 없습니다.")
                 else:
                     # 다른 오류는 기록하고 재시도
+                    record_youtube_call(endpoint_name, self._metrics_key_label(), 'error', response_time)
                     self.record_api_usage(endpoint_name, quota_cost, success=False, 
                                         error_message=str(e), response_time=response_time)
                     
@@ -412,3 +446,73 @@ class UserApiKeyManager:
         
         # 모든 재시도 실패
         raise last_error or Exception(f"API 호출 실패: {endpoint_name}")
+
+
+def rebuild_usage_rollup(start_date, end_date=None, user_id=None):
+    """
+    원본 ApiKeyUsage 기록으로부터 지정한 날짜 범위의 일별 롤업 재구성 (백필)
+    
+    범위 안의 롤업은 삭제 후 원본 기준으로 다시 만들고, 범위 밖의 롤업은 그대로 둔다.
+    보존 기간 정리로 원본이 일부라도 삭제된 날짜를 범위에 넣으면 그날 롤업이 줄어들므로
+    원본이 온전히 남아 있는 날짜만 지정한다 (어느 날짜까지 정리됐는지는 호출자가 판단).
+    
+    Args:
+        start_date: 재구성 시작일 (포함, date)
+        end_date: 재구성 종료일 (포함, date, None이면 마지막 원본 날짜까지)
+        user_id: 특정 사용자만 재구성할 경우 지정 (None이면 전체)
+    
+    Returns:
+        int: 생성된 롤업 행 수
+    """
+    from sqlalchemy import func, case
+    
+    usage_date = func.date(ApiKeyUsage.timestamp)
+    query = db.session.query(
+        ApiKeyUsage.user_id,
+        ApiKeyUsage.api_key_id,
+        usage_date.label('usage_date'),
+        func.count().label('total_calls'),
+        func.sum(case((ApiKeyUsage.success == True, 1), else_=0)).label('successful_calls'),
+        func.sum(case((ApiKeyUsage.success == True, ApiKeyUsage.quota_cost), else_=0)).label('quota_units'),
+        func.sum(ApiKeyUsage.response_time).label('total_response_time'),
+        func.count(ApiKeyUsage.response_time).label('timed_calls')
+    ).filter(
+        ApiKeyUsage.timestamp.isnot(None),
+        ApiKeyUsage.timestamp >= datetime.combine(start_date, datetime.min.time())
+    )
+    delete_query = ApiKeyUsageDaily.query.filter(ApiKeyUsageDaily.usage_date >= start_date)
+    
+    if end_date is not None:
+        query = query.filter(ApiKeyUsage.timestamp < datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+        delete_query = delete_query.filter(ApiKeyUsageDaily.usage_date <= end_date)
+    
+    if user_id:
+        query = query.filter(ApiKeyUsage.user_id == user_id)
+        delete_query = delete_query.filter(ApiKeyUsageDaily.user_id == user_id)
+    
+    rows = []
+    for row in query.group_by(ApiKeyUsage.user_id, ApiKeyUsage.api_key_id, usage_date).all():
+        # SQLite의 date()는 문자열을 반환하므로 date 객체로 변환
+        day = row.usage_date if isinstance(row.usage_date, date) else date.fromisoformat(str(row.usage_date))
+        rows.append({
+            'user_id': row.user_id,
+            'api_key_id': row.api_key_id,
+            'usage_date': day,
+            'total_calls': int(row.total_calls or 0),
+            'successful_calls': int(row.successful_calls or 0),
+            'quota_units': int(row.quota_units or 0),
+            'total_response_time': float(row.total_response_time or 0.0),
+            'timed_calls': int(row.timed_calls or 0)
+        })
+    
+    try:
+        delete_query.delete(synchronize_session=False)
+        
+        if rows:
+            db.session.execute(ApiKeyUsageDaily.__table__.insert(), rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    
+    return len(rows)
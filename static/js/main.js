@@ -436,6 +436,17 @@ const searchChannel = debounce(function(query) {
         });
 }, 300);
 
+// 비동기 검색 작업 결과 대기 (작업이 끝날 때까지 주기적으로 상태 조회)
+function waitForSearchJob(data, interval = 1000) {
+    if (data.status !== 'pending' && data.status !== 'running') {
+        return Promise.resolve(data);
+    }
+    return new Promise(resolve => setTimeout(resolve, interval))
+        .then(() => fetch(`/search/jobs/${data.job_id}`))
+        .then(response => response.json())
+        .then(next => waitForSearchJob(next, interval));
+}
+
 // 검색 및 결과 처리 함수
 function performSearch(form) {
     // 로딩 및 프로그레스 표시
@@ -453,6 +464,7 @@ function performSearch(form) {
         body: formData
     })
     .then(response => response.json())
+    .then(data => waitForSearchJob(data))
     .then(data => {
         // 로딩 및 프로그레스 숨기기
         hideSearchProgress();
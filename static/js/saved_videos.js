@@ -2,7 +2,8 @@
 
 let savedVideos = [];
 let currentPage = 1;
-let totalPages = 1;
+// 페이지별 커서 (pageCursors[n - 1] = n 페이지 조회용 커서, 1 페이지는 null)
+let pageCursors = [null];
 let currentSort = 'saved_at_desc';
 let editingVideoId = null;
 let deletingVideoId = null;
@@ -72,14 +73,22 @@ function loadSavedVideos(page = 1, sort = 'saved_at_desc') {
     currentPage = page;
     currentSort = sort;
     
-    fetch(`/api/saved-videos?page=${page}&per_page=20`)
+    if (page === 1) {
+        pageCursors = [null];
+    }
+    const cursor = pageCursors[page - 1];
+    const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+    
+    fetch(`/api/saved-videos?per_page=20${cursorParam}`)
         .then(response => response.json())
         .then(data => {
             loadingSpinner.style.display = 'none';
             
             if (data.success) {
                 savedVideos = data.videos;
-                totalPages = data.pagination.pages;
+                data.pagination.page = page;
+                data.pagination.has_prev = page > 1;
+                pageCursors[page] = data.pagination.next_cursor;
                 
                 if (savedVideos.length === 0) {
                     // 빈 상태 표시
@@ -93,8 +102,10 @@ function loadSavedVideos(page = 1, sort = 'saved_at_desc') {
                     paginationContainer.style.display = 'block';
                 }
                 
-                // 총 개수 업데이트
-                document.getElementById('totalCount').textContent = `${data.pagination.total}개`;
+                // 총 개수 업데이트 (전체 개수는 첫 페이지 응답에만 포함)
+                if (data.pagination.total !== undefined) {
+                    document.getElementById('totalCount').textContent = `${data.pagination.total}개`;
+                }
             } else {
                 showToast(data.message || '영상 목록을 불러올 수 없습니다.', 'error');
                 emptyState.style.display = 'block';
@@ -252,7 +263,7 @@ function renderPagination(pagination) {
     const paginationElement = document.getElementById('pagination');
     paginationElement.innerHTML = '';
     
-    if (pagination.pages <= 1) {
+    if (!pagination.has_prev && !pagination.has_next) {
         document.getElementById('paginationContainer').style.display = 'none';
         return;
     }
@@ -265,16 +276,11 @@ function renderPagination(pagination) {
         paginationElement.appendChild(prevLi);
     }
     
-    // 페이지 번호들
-    const startPage = Math.max(1, pagination.page - 2);
-    const endPage = Math.min(pagination.pages, pagination.page + 2);
-    
-    for (let i = startPage; i <= endPage; i++) {
-        const li = document.createElement('li');
-        li.className = `page-item ${i === pagination.page ? 'active' : ''}`;
-        li.innerHTML = `<a class="page-link" href="#" onclick="loadSavedVideos(${i}, '${currentSort}')">${i}</a>`;
-        paginationElement.appendChild(li);
-    }
+    // 현재 페이지 (커서 방식이라 전체 페이지 수 없이 이전/다음으로 이동)
+    const currentLi = document.createElement('li');
+    currentLi.className = 'page-item active';
+    currentLi.innerHTML = `<span class="page-link">${pagination.page}</span>`;
+    paginationElement.appendChild(currentLi);
     
     // 다음 페이지 버튼
     if (pagination.has_next) {
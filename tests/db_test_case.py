@@ -0,0 +1,44 @@
+# db_test_case.py
+import unittest
+import os
+import sys
+
+from flask import Flask
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db, User
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """인메모리 SQLite 앱 컨텍스트에서 실행하는 테스트 기반 클래스
+
+    setUp에서 테이블을 만들고 users에 지정한 승인 사용자를 추가하며, tearDown에서 모두 정리한다.
+    하위 클래스는 환경변수 패치 등을 먼저 한 뒤 super().setUp()을 호출한다.
+    """
+
+    # 미리 만들 사용자 ID (u1 -> '테스터', u2 -> '테스터2')
+    users = ('u1',)
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        for index, user_id in enumerate(self.users):
+            name = '테스터' if index == 0 else f'테스터{index + 1}'
+            db.session.add(User(id=user_id, email=f'{user_id}@test.com', name=name, role='approved'))
+        db.session.commit()
+
+    def tearDown(self):
+        """테스트 정리"""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
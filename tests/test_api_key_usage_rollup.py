@@ -0,0 +1,147 @@
+# test_api_key_usage_rollup.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+from cryptography.fernet import Fernet
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, UserApiKey, ApiKeyUsage, ApiKeyUsageDaily
+from services.user_api_service import UserApiKeyManager, rebuild_usage_rollup
+
+
+class TestApiKeyUsageRollup(DatabaseTestCase):
+    """API 키 일별 롤업 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        os.environ.setdefault('API_ENCRYPTION_KEY', Fernet.generate_key().decode())
+
+        super().setUp()
+
+        self.key = UserApiKey(user_id='u1', name='개인용', api_key='encrypted')
+        db.session.add(self.key)
+        db.session.commit()
+
+        self.manager = UserApiKeyManager('u1')
+        self.manager.current_key = self.key
+
+    def test_record_api_usage_updates_rollup(self):
+        """API 사용 기록 시 롤업 행이 증분 갱신되는지 확인"""
+        self.manager.record_api_usage('search.list', quota_cost=100, success=True, response_time=0.5)
+        self.manager.record_api_usage('videos.list', quota_cost=1, success=True, response_time=0.25)
+        self.manager.record_api_usage('videos.list', quota_cost=1, success=False, error_message='err')
+
+        rows = ApiKeyUsageDaily.query.all()
+        self.assertEqual(len(rows), 1)
+
+        row = rows[0]
+        self.assertEqual(row.usage_date, datetime.utcnow().date())
+        self.assertEqual(row.total_calls, 3)
+        self.assertEqual(row.successful_calls, 2)
+        self.assertEqual(row.quota_units, 101)
+        self.assertAlmostEqual(row.total_response_time, 0.75)
+        self.assertEqual(row.timed_calls, 2)
+
+    def test_usage_counters_readable_before_commit(self):
+        """사용량/오류 증가 직후(커밋 전)에도 키 상태 확인이 실제 값으로 계산되는지 확인"""
+        self.key.daily_quota = 2
+        db.session.commit()
+
+        self.key.increment_usage()
+        self.assertEqual(self.key.usage_count, 1)
+        self.assertFalse(self.key.is_quota_exceeded())
+        self.key.increment_usage()
+        self.assertTrue(self.key.is_quota_exceeded())
+        self.assertEqual(self.key.to_dict()['usage_percentage'], 100.0)
+
+        for _ in range(5):
+            self.key.record_error('backendError')
+        self.assertEqual(self.key.error_count, 5)
+        self.assertFalse(self.key.is_healthy())
+
+        # 다른 세션 객체의 증가도 덮어쓰지 않고 누적
+        db.session.commit()
+        db.session.execute(db.update(UserApiKey).values(usage_count=UserApiKey.usage_count + 10))
+        self.key.increment_usage()
+        db.session.commit()
+        self.assertEqual(self.key.usage_count, 13)
+
+    def test_statistics_read_from_rollup(self):
+        """통계 조회가 롤업 테이블 기준으로 계산되는지 확인"""
+        self.manager.record_api_usage('search.list', quota_cost=100, success=True, response_time=1.0)
+        self.manager.record_api_usage('search.list', quota_cost=100, success=False)
+
+        stats = self.manager.get_usage_statistics(days=7)
+
+        self.assertEqual(len(stats['daily_usage']), 1)
+        today = stats['daily_usage'][0]
+        self.assertEqual(today['total_calls'], 2)
+        self.assertEqual(today['successful_calls'], 1)
+        self.assertEqual(today['success_rate'], 50.0)
+        self.assertEqual(today['avg_response_time'], 1.0)
+
+        self.assertEqual(stats['key_usage'], [{
+            'key_name': '개인용',
+            'total_calls': 2,
+            'successful_calls': 1,
+            'success_rate': 50.0
+        }])
+
+    def test_rebuild_usage_rollup_from_raw_rows(self):
+        """원본 기록으로부터 롤업 재구성 테스트"""
+        yesterday = datetime.utcnow() - timedelta(days=1)
+        db.session.add_all([
+            ApiKeyUsage(api_key_id=self.key.id, user_id='u1', endpoint='search.list',
+                        quota_cost=100, success=True, response_time=2.0, timestamp=yesterday),
+            ApiKeyUsage(api_key_id=self.key.id, user_id='u1', endpoint='videos.list',
+                        quota_cost=1, success=False, timestamp=yesterday),
+            ApiKeyUsage(api_key_id=self.key.id, user_id='u1', endpoint='videos.list',
+                        quota_cost=1, success=True, response_time=0.5),
+        ])
+        # 재구성 시 기존 롤업은 대체되어야 함
+        db.session.add(ApiKeyUsageDaily(user_id='u1', api_key_id=self.key.id,
+                                        usage_date=yesterday.date(), total_calls=999))
+        db.session.commit()
+
+        row_count = rebuild_usage_rollup(yesterday.date())
+        self.assertEqual(row_count, 2)
+
+        rows = {r.usage_date: r for r in ApiKeyUsageDaily.query.all()}
+        self.assertEqual(rows[yesterday.date()].total_calls, 2)
+        self.assertEqual(rows[yesterday.date()].successful_calls, 1)
+        self.assertEqual(rows[yesterday.date()].quota_units, 100)
+        self.assertEqual(rows[yesterday.date()].timed_calls, 1)
+        self.assertEqual(rows[datetime.utcnow().date()].quota_units, 1)
+
+    def test_rebuild_only_requested_dates(self):
+        """지정한 날짜 범위만 재구성하고 범위 밖(원본이 정리된 날짜 포함) 롤업은 유지하는지 확인"""
+        now = datetime.utcnow()
+        purged_day = (now - timedelta(days=120)).date()
+        partial = now - timedelta(days=91)  # 보존 기간 정리로 일부만 남은 날짜
+        db.session.add_all([
+            ApiKeyUsageDaily(user_id='u1', api_key_id=self.key.id, usage_date=purged_day, total_calls=50),
+            ApiKeyUsageDaily(user_id='u1', api_key_id=self.key.id, usage_date=partial.date(), total_calls=40),
+            ApiKeyUsage(api_key_id=self.key.id, user_id='u1', endpoint='videos.list',
+                        quota_cost=1, success=True, timestamp=partial),
+            ApiKeyUsage(api_key_id=self.key.id, user_id='u1', endpoint='videos.list',
+                        quota_cost=1, success=True, timestamp=now),
+        ])
+        db.session.commit()
+
+        self.assertEqual(rebuild_usage_rollup(partial.date() + timedelta(days=1), user_id='u1'), 1)
+
+        rows = {r.usage_date: r.total_calls for r in ApiKeyUsageDaily.query.all()}
+        self.assertEqual(rows, {purged_day: 50, partial.date(): 40, now.date(): 1})
+
+        # 종료일까지 지정하면 그 범위만 재구성
+        self.assertEqual(rebuild_usage_rollup(partial.date(), partial.date(), user_id='u1'), 1)
+        rows = {r.usage_date: r.total_calls for r in ApiKeyUsageDaily.query.all()}
+        self.assertEqual(rows, {purged_day: 50, partial.date(): 1, now.date(): 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# test_api_limits.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, ApiLog, ApiCallCounter
+from common_utils.api_limits import record_daily_call, get_daily_call_count
+
+
+class TestDailyCallCounter(DatabaseTestCase):
+    """일일 API 호출 카운터 테스트"""
+
+    def test_counter_increments_per_day(self):
+        """카운터가 날짜별로 따로 증가하는지 확인"""
+        now = datetime.utcnow()
+        yesterday = now - timedelta(days=1)
+
+        for _ in range(3):
+            record_daily_call('u1', now)
+        record_daily_call('u1', yesterday)
+        db.session.commit()
+
+        self.assertEqual(ApiCallCounter.query.count(), 2)
+        self.assertEqual(get_daily_call_count('u1', now), 3)
+        self.assertEqual(get_daily_call_count('u1', yesterday), 1)
+
+    def test_fallback_counts_api_log_range(self):
+        """카운터가 없으면 ApiLog를 날짜 범위로 세는지 확인"""
+        now = datetime.utcnow()
+        start_of_day = datetime.combine(now.date(), datetime.min.time())
+        db.session.add_all([
+            ApiLog(user_id='u1', endpoint='search', timestamp=start_of_day),
+            ApiLog(user_id='u1', endpoint='search', timestamp=now),
+            ApiLog(user_id='u1', endpoint='search', timestamp=start_of_day - timedelta(seconds=1)),
+        ])
+        db.session.commit()
+
+        self.assertEqual(get_daily_call_count('u1', now), 2)
+
+    def test_new_counter_is_seeded_from_api_log(self):
+        """그날 카운터가 처음 만들어질 때 이미 기록된 ApiLog 호출 수를 이어받는지 확인"""
+        now = datetime.utcnow()
+        start_of_day = datetime.combine(now.date(), datetime.min.time())
+        db.session.add_all(ApiLog(user_id='u1', endpoint='search', timestamp=start_of_day) for _ in range(4))
+        db.session.commit()
+
+        record_daily_call('u1', now, count=2)
+        record_daily_call('u1', now)
+        db.session.commit()
+
+        self.assertEqual(get_daily_call_count('u1', now), 7)
+
+    def test_api_log_has_user_timestamp_index(self):
+        """ApiLog에 (user_id, timestamp) 복합 인덱스가 있는지 확인"""
+        indexes = {index['name']: index['column_names'] for index in db.inspect(db.engine).get_indexes('api_log')}
+        self.assertEqual(indexes.get('idx_api_log_user_timestamp'), ['user_id', 'timestamp'])
+
+
+if __name__ == '__main__':
+    unittest.main()
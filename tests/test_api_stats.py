@@ -0,0 +1,114 @@
+# test_api_stats.py
+import unittest
+import os
+import sys
+from datetime import datetime, date, timedelta
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, ApiLog, ApiLogDaily, ApiStatsDaily, ApiStatsUser, ApiStatsEndpoint
+from common_utils.api_stats import get_admin_stats, reconcile_api_stats, record_api_stats
+from services.audit_log_service import ApiAuditLogger
+from services.retention_service import DataRetentionService
+
+
+class TestApiStats(DatabaseTestCase):
+    """관리자 API 통계 집계 테이블 테스트"""
+
+    users = ('u1', 'u2')
+
+    def _snapshot(self):
+        db.session.expire_all()
+        return (
+            {row.stat_date: row.call_count for row in ApiStatsDaily.query},
+            {row.user_id: row.call_count for row in ApiStatsUser.query},
+            {row.endpoint: row.call_count for row in ApiStatsEndpoint.query},
+        )
+
+    def test_logging_path_updates_stats(self):
+        """감사 로그 기록 시 집계 테이블이 증분 갱신되고 재계산 결과와 같은지 확인"""
+        audit_logger = ApiAuditLogger(self.app)
+        audit_logger._write_batch([
+            {'user_id': 'u1', 'endpoint': 'search', 'params': None, 'timestamp': datetime(2026, 1, 1, 10)},
+            {'user_id': 'u1', 'endpoint': 'search', 'params': None, 'timestamp': datetime(2026, 1, 2, 10)},
+            {'user_id': 'u2', 'endpoint': 'channel-search', 'params': None, 'timestamp': datetime(2026, 1, 2, 11)},
+        ], queued=False)
+
+        incremental = self._snapshot()
+        self.assertEqual(incremental, (
+            {date(2026, 1, 1): 1, date(2026, 1, 2): 2},
+            {'u1': 2, 'u2': 1},
+            {'search': 2, 'channel-search': 1},
+        ))
+
+        self.assertEqual(reconcile_api_stats(),
+                         {'api_stats_daily': 0, 'api_stats_user': 0, 'api_stats_endpoint': 0})
+        self.assertEqual(self._snapshot(), incremental)
+
+    def test_anonymous_calls_counted_same_way_by_reconcile(self):
+        """비로그인 호출 증분 집계가 재계산(보존 정리 전후)에서도 그대로 유지되는지 확인"""
+        old = datetime.utcnow() - timedelta(days=120)
+        events = [
+            {'user_id': None, 'endpoint': 'channel-search', 'timestamp': old},
+            {'user_id': None, 'endpoint': 'search', 'timestamp': old},
+            {'user_id': 'u1', 'endpoint': 'search', 'timestamp': old},
+        ]
+        db.session.execute(ApiLog.__table__.insert(), events)
+        record_api_stats(events)
+        db.session.commit()
+
+        incremental = self._snapshot()
+        self.assertEqual(incremental, (
+            {old.date(): 3},
+            {'u1': 1},
+            {'search': 2, 'channel-search': 1},
+        ))
+
+        self.assertEqual(sum(reconcile_api_stats().values()), 0)
+        self.assertEqual(self._snapshot(), incremental)
+
+        # ApiLog -> ApiLogDaily 이동 후에도 같은 값
+        self.assertEqual(DataRetentionService(self.app).purge_api_logs(), 3)
+        self.assertEqual(sum(reconcile_api_stats().values()), 0)
+        self.assertEqual(self._snapshot(), incremental)
+
+    def test_reconcile_includes_purged_rollups(self):
+        """재계산 시 보존 정리된 ApiLogDaily 요약도 포함하고 어긋난 값을 보정하는지 확인"""
+        db.session.add(ApiLog(user_id='u1', endpoint='search', timestamp=datetime(2026, 3, 1, 9)))
+        db.session.add(ApiLogDaily(log_date=date(2025, 12, 1), user_id='u1', endpoint='search', call_count=10))
+        # 비로그인 호출 요약은 일별/엔드포인트별에만 포함
+        db.session.add(ApiLogDaily(log_date=date(2025, 12, 1), user_id=None, endpoint='search', call_count=5))
+        db.session.add(ApiStatsUser(user_id='u2', call_count=3))  # 원본에 없는 잘못된 값
+        db.session.commit()
+
+        corrected = reconcile_api_stats()
+
+        self.assertEqual(corrected['api_stats_user'], 2)
+        self.assertEqual(self._snapshot(), (
+            {date(2026, 3, 1): 1, date(2025, 12, 1): 15},
+            {'u1': 11},
+            {'search': 16},
+        ))
+
+    def test_admin_stats_reads_aggregates(self):
+        """관리자 통계가 템플릿 형식(date/count, email/call_count, endpoint/count)으로 반환되는지 확인"""
+        for hour in range(3):
+            db.session.add(ApiLog(user_id='u2', endpoint='search', timestamp=datetime(2026, 3, 1, hour)))
+        db.session.add(ApiLog(user_id='u1', endpoint='channel-search', timestamp=datetime(2026, 3, 2, 0)))
+        db.session.commit()
+
+        # 집계 테이블이 비어 있으면 첫 조회 시 재계산
+        daily_stats, user_stats, endpoint_stats = get_admin_stats()
+
+        self.assertEqual([(stat.date, stat.count) for stat in daily_stats],
+                         [(date(2026, 3, 2), 1), (date(2026, 3, 1), 3)])
+        self.assertEqual([(stat.email, stat.call_count) for stat in user_stats],
+                         [('u2@test.com', 3), ('u1@test.com', 1)])
+        self.assertEqual([(stat.endpoint, stat.count) for stat in endpoint_stats],
+                         [('search', 3), ('channel-search', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
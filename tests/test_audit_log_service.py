@@ -0,0 +1,89 @@
+# test_audit_log_service.py
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, User, ApiLog, ApiCallCounter
+from services.audit_log_service import ApiAuditLogger
+
+
+class TestApiAuditLogger(DatabaseTestCase):
+    """API 호출 감사 로그 비동기 기록기 테스트"""
+
+    users = ('u1', 'u2')
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        self.env_patcher = patch.dict(os.environ, {
+            'AUDIT_LOG_QUEUE_SIZE': '2',
+            'AUDIT_LOG_FLUSH_INTERVAL': '0.05'
+        })
+        self.env_patcher.start()
+
+        super().setUp()
+
+        db.session.get(User, 'u1').api_calls = 5
+        db.session.commit()
+
+    def tearDown(self):
+        """테스트 정리"""
+        super().tearDown()
+        self.env_patcher.stop()
+
+    def _assert_written(self, expected_calls):
+        db.session.expire_all()
+        for user_id, (api_calls, daily_calls) in expected_calls.items():
+            self.assertEqual(db.session.get(User, user_id).api_calls, api_calls)
+            self.assertEqual(ApiCallCounter.query.filter_by(user_id=user_id).one().call_count, daily_calls)
+
+    def test_sync_write_when_not_started(self):
+        """기록 스레드가 없으면 즉시 기록하는지 확인"""
+        audit_logger = ApiAuditLogger(self.app)
+        audit_logger.log('u1', 'search', {'keyword': 'test'})
+
+        log = ApiLog.query.one()
+        self.assertEqual(log.endpoint, 'search')
+        self.assertEqual(log.params, '{"keyword": "test"}')
+        self._assert_written({'u1': (6, 1)})
+
+    def test_batched_write_and_flush_on_stop(self):
+        """큐에 쌓인 이벤트가 합산 기록되고 종료 시 모두 반영되는지 확인"""
+        with patch.dict(os.environ, {'AUDIT_LOG_QUEUE_SIZE': '100'}):
+            audit_logger = ApiAuditLogger(self.app)
+        audit_logger.start()
+
+        for endpoint in ('search', 'search', 'channel-search'):
+            audit_logger.log('u1', endpoint)
+        audit_logger.log('u2', 'search')
+        audit_logger.stop()
+
+        self.assertEqual(ApiLog.query.count(), 4)
+        self._assert_written({'u1': (8, 3), 'u2': (1, 1)})
+        self.assertEqual(audit_logger.pending_calls('u1'), 0)
+        self.assertEqual(audit_logger.get_status()['written'], 4)
+
+    def test_drop_policy_when_queue_full(self):
+        """큐가 가득 차면 이벤트를 버리고 대기 중 호출 수에서도 제외하는지 확인"""
+        audit_logger = ApiAuditLogger(self.app)
+
+        with patch.object(audit_logger, '_is_running', return_value=True):
+            results = [audit_logger.log('u1', 'search') for _ in range(3)]
+
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(audit_logger.pending_calls('u1'), 2)
+        self.assertEqual(ApiLog.query.count(), 0)
+
+        audit_logger.flush()
+
+        self.assertEqual(ApiLog.query.count(), 2)
+        self.assertEqual(audit_logger.pending_calls('u1'), 0)
+        self.assertEqual(audit_logger.get_status()['dropped'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
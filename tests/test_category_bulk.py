@@ -0,0 +1,78 @@
+# test_category_bulk.py
+import unittest
+import os
+import sys
+
+from sqlalchemy import event
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.micro_benchmarks import make_channels, measure_category_import
+from db_test_case import DatabaseTestCase
+from models import db, Channel, ChannelCategory, CategoryChannel
+from common_utils.category_bulk import bulk_add_channels
+
+
+class TestCategoryBulk(DatabaseTestCase):
+    """카테고리 채널 일괄 추가 테스트"""
+
+    def _create_categories(self, count):
+        categories = [ChannelCategory(user_id='u1', name=f'카테고리 {i}') for i in range(count)]
+        db.session.add_all(categories)
+        db.session.flush()
+        return categories
+
+    def _count_statements(self, func):
+        """func 실행 중 DB로 전송된 SQL 문 개수와 결과 반환"""
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_execute)
+        try:
+            result = func()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_execute)
+        return result, len(statements)
+
+    def test_skips_existing_channels_and_links(self):
+        """기존 채널 정보는 유지하고 이미 연결된 채널은 다시 연결하지 않는지 확인"""
+        category, other = self._create_categories(2)
+        db.session.add(Channel(id='UC000000', title='기존 제목'))
+        db.session.add(CategoryChannel(category_id=category.id, channel_id='UC000000'))
+        db.session.commit()
+
+        channels = make_channels(0, 3) + [{'id': 'UC000001'}, {'title': 'ID 없음'}]
+        added = bulk_add_channels({category.id: channels, other.id: make_channels(1, 1)})
+        db.session.commit()
+
+        self.assertEqual(added, {category.id: 2, other.id: 1})
+        self.assertEqual(db.session.get(Channel, 'UC000000').title, '기존 제목')
+        self.assertEqual(Channel.query.count(), 3)
+        self.assertEqual(CategoryChannel.query.filter_by(category_id=category.id).count(), 3)
+
+        # 같은 요청을 다시 보내도 중복 연결이 생기지 않음
+        self.assertEqual(bulk_add_channels({category.id: channels}), {category.id: 0})
+
+    def test_empty_input(self):
+        """추가할 채널이 없으면 쿼리 없이 0을 반환하는지 확인"""
+        (category,) = self._create_categories(1)
+        added, statements = self._count_statements(lambda: bulk_add_channels({category.id: [{}]}))
+        self.assertEqual(added, {category.id: 0})
+        self.assertEqual(statements, 0)
+
+    def test_import_10k_channels_statement_budget(self):
+        """채널 10,000개 가져오기가 SQL 문 수 예산 이내로 끝나는지 확인 (측정: benchmarks.micro_benchmarks)"""
+        result = measure_category_import('u1')
+
+        self.assertEqual(result['added'], 10000)
+        self.assertEqual(Channel.query.count(), 10000)
+        self.assertEqual(CategoryChannel.query.count(), 10000)
+        # 채널 조회 20 + 채널 삽입 18 + 연결 조회 1 + 연결 삽입 20 (청크 500 기준)
+        self.assertLessEqual(result['statements'], 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
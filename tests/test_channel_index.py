@@ -0,0 +1,110 @@
+# test_channel_index.py
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+from cryptography.fernet import Fernet
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, Channel, ChannelHandle
+from common_utils.channel_index import find_local_channels, record_channel_lookup, extract_handle
+from common_utils.user_search import UserSearchService
+
+
+class TestChannelIndex(DatabaseTestCase):
+    """로컬 채널 인덱스 테스트"""
+
+    users = ()
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        os.environ.setdefault('API_ENCRYPTION_KEY', Fernet.generate_key().decode())
+        super().setUp()
+
+        db.session.add_all([
+            Channel(id='UC1', title='Cooking Daily'),
+            Channel(id='UC2', title='Daily Cooking Tips'),
+            Channel(id='UC3', title='cooking'),
+            Channel(id='UC4', title='100%_real'),
+        ])
+        db.session.commit()
+
+    def _service(self, youtube):
+        """API 호출 엔드포인트를 기록하는 사용자 검색 서비스"""
+        service = UserSearchService('u1')
+        service.calls = []
+
+        def execute_api_call(func, endpoint, quota_cost=1):
+            service.calls.append(endpoint)
+            return func()
+
+        service.api_manager = MagicMock()
+        service.api_manager.get_youtube_service.return_value = youtube
+        service.api_manager.execute_api_call.side_effect = execute_api_call
+        return service
+
+    def test_title_match_ranking(self):
+        """정확히 일치 > 제목 접두어 순으로 반환되고 제목 중간 단어 일치는 제외되는지 확인"""
+        self.assertEqual([c['id'] for c in find_local_channels('Cooking')], ['UC3', 'UC1'])
+        self.assertEqual(find_local_channels('tips'), [])
+        # LIKE 특수문자는 그대로 비교
+        db.session.add_all([Channel(id='UC6', title='100%_real tips'), Channel(id='UC7', title='100ab_real tips')])
+        db.session.commit()
+        self.assertEqual([c['id'] for c in find_local_channels('100%_REAL')], ['UC4', 'UC6'])
+
+    def test_prefix_only_match_is_not_an_answer(self):
+        """제목이 정확히 일치하는 채널이 없으면 접두어 일치가 있어도 빈 목록 (API 검색으로 넘김)"""
+        self.assertEqual(find_local_channels('Cook'), [])
+        self.assertEqual(find_local_channels('Daily'), [])
+        self.assertEqual(find_local_channels('100%_'), [])
+
+    def test_handle_mapping(self):
+        """저장된 핸들 매핑으로 조회되는지 확인"""
+        self.assertEqual(extract_handle('https://www.youtube.com/@CookingDaily/shorts'), 'CookingDaily')
+        self.assertEqual(find_local_channels('@cookingdaily'), [])
+        # 제목이 핸들과 같은 채널이 있어도 매핑이 없으면 API 조회로 넘김
+        db.session.add(Channel(id='UC5', title='cookingdaily'))
+        db.session.commit()
+        self.assertEqual(find_local_channels('@cookingdaily'), [])
+
+        record_channel_lookup([{'id': 'UC1', 'title': 'Cooking Daily'}], handle='CookingDaily')
+
+        self.assertEqual(db.session.get(ChannelHandle, 'cookingdaily').channel_id, 'UC1')
+        self.assertEqual([c['id'] for c in find_local_channels('youtube.com/@CookingDaily')], ['UC1'])
+
+    def test_user_search_checks_index_first(self):
+        """인덱스에 있으면 API를 호출하지 않고, 없을 때만 호출 후 인덱스에 저장하는지 확인"""
+        youtube = MagicMock()
+        youtube.channels().list().execute.return_value = {'items': [{
+            'id': 'UC9', 'snippet': {'title': 'New Channel', 'description': '', 'thumbnails': {}}
+        }]}
+        service = self._service(youtube)
+
+        self.assertEqual([c['id'] for c in service.search_channels('cooking')], ['UC3', 'UC1'])
+        self.assertEqual(service.calls, [])
+
+        self.assertEqual([c['id'] for c in service.search_channels('@newchannel')], ['UC9'])
+        self.assertEqual(service.calls, ['channels.list'])
+
+        # 같은 핸들 재검색은 인덱스에서 응답
+        self.assertEqual([c['id'] for c in service.search_channels('@NewChannel')], ['UC9'])
+        self.assertEqual(service.calls, ['channels.list'])
+
+        # 접두어만 일치하는 검색어는 API 검색 결과 반환
+        youtube.search().list().execute.return_value = {'items': [{
+            'id': {'channelId': 'UC8'}, 'snippet': {'title': 'Cooker Reviews', 'description': '', 'thumbnails': {}}
+        }]}
+        self.assertEqual([c['id'] for c in service.search_channels('Cook')], ['UC8'])
+        self.assertEqual(service.calls, ['channels.list', 'search.list'])
+
+        # refresh 요청은 인덱스를 건너뛰고 API 조회
+        self.assertEqual([c['id'] for c in service.search_channels('@NewChannel', refresh=True)], ['UC9'])
+        self.assertEqual(service.calls, ['channels.list', 'search.list', 'channels.list'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# test_email_service.py
+import unittest
+import os
+import sys
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.smtp_server import SMTPStandInServer, create_email_service, measure_throughput
+
+
+class TestEmailServiceSession(unittest.TestCase):
+    """SMTP 연결 재사용 테스트 (로컬 SMTP 대역 서버 사용)"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.server = SMTPStandInServer().start()
+        self.host, self.port = self.server.address
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.server.stop()
+
+    def _service(self, **env):
+        return create_email_service(self.host, self.port, **env)
+
+    def test_send_without_session_uses_new_connection(self):
+        """배치 세션 밖에서는 메시지마다 연결을 맺고 닫는지 확인 (기존 동작)"""
+        service = self._service()
+        for i in range(3):
+            self.assertTrue(service.send_email(f'u{i}@test.com', '제목', '<p>본문</p>'))
+
+        stats = self.server.state.stats()
+        self.assertEqual((stats['connections'], stats['messages']), (3, 3))
+        self.assertEqual(self.server.state.messages[0]['to'], ['<u0@test.com>'])
+
+    def test_session_reuses_connection(self):
+        """배치 세션 안에서는 연결 하나로 여러 메시지를 보내고 세션이 끝나면 닫는지 확인"""
+        service = self._service()
+        with service.session():
+            for i in range(10):
+                self.assertTrue(service.send_email(f'u{i}@test.com', '제목', '<p>본문</p>'))
+            self.assertEqual(self.server.state.stats()['connections'], 1)
+
+        self.assertEqual(service._idle, [])
+        self.assertEqual(self.server.state.stats()['messages'], 10)
+
+    def test_session_shared_across_threads(self):
+        """여러 스레드가 발송해도 연결 수가 스레드 수를 넘지 않는지 확인"""
+        service = self._service(SMTP_POOL_SIZE=4)
+        result = measure_throughput(service, 40, workers=4, batch=True)
+
+        self.assertEqual(result['sent'], 40)
+        self.assertLessEqual(self.server.state.stats()['connections'], 4)
+        self.assertGreater(result['messages_per_second'], 0)
+
+    def test_reconnects_after_disconnect(self):
+        """재사용하려던 연결이 끊겨 있으면 새 연결로 다시 보내는지 확인"""
+        service = self._service()
+        with service.session():
+            self.assertTrue(service.send_email('a@test.com', '제목', '<p>본문</p>'))
+            self.server.state.drop_connections()
+            self.assertTrue(service.send_email('b@test.com', '제목', '<p>본문</p>'))
+
+        stats = self.server.state.stats()
+        self.assertEqual((stats['connections'], stats['messages']), (2, 2))
+
+    def test_max_messages_per_connection(self):
+        """서버의 연결당 메시지 제한(421)과 클라이언트 제한 모두에서 새 연결로 이어서 보내는지 확인"""
+        self.server.state.max_messages_per_connection = 3
+        service = self._service()
+        with service.session():
+            results = [service.send_email(f'u{i}@test.com', '제목', '<p>본문</p>') for i in range(7)]
+        self.assertTrue(all(results))
+        self.assertEqual(self.server.state.stats()['messages'], 7)
+
+        self.server.state.reset()
+        self.server.state.max_messages_per_connection = 0
+        service = self._service(SMTP_MAX_MESSAGES_PER_CONNECTION=2)
+        with service.session():
+            for i in range(5):
+                service.send_email(f'u{i}@test.com', '제목', '<p>본문</p>')
+        self.assertEqual(self.server.state.stats()['connections'], 3)
+
+    def test_unreachable_server_returns_false(self):
+        """서버에 연결할 수 없으면 재시도 없이 False를 반환하는지 확인"""
+        self.server.stop()
+        service = self._service()
+        with service.session():
+            self.assertFalse(service.send_email('a@test.com', '제목', '<p>본문</p>'))
+        self.server = SMTPStandInServer().start()
+
+
+if __name__ == '__main__':
+    unittest.main()
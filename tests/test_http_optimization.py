@@ -0,0 +1,133 @@
+# test_http_optimization.py
+import unittest
+import os
+import sys
+import gzip
+import json
+from unittest.mock import patch
+
+from flask import Flask, jsonify, Response
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.micro_benchmarks import make_search_results, poll_bytes
+from common_utils import http_optimization
+from common_utils.http_optimization import init_response_optimization
+
+
+class TestResponseOptimization(unittest.TestCase):
+    """ETag / 압축 응답 레이어 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.results = make_search_results()
+
+        def create_app(optimized):
+            app = Flask(__name__)
+
+            @app.route('/search/jobs/<job_id>')
+            def job(job_id):
+                return jsonify({"status": "success", "results": self.results, "count": len(self.results)})
+
+            @app.route('/stream')
+            def stream():
+                return Response(iter(['data: 1\n\n']), mimetype='text/event-stream')
+
+            if optimized:
+                init_response_optimization(app)
+            return app.test_client()
+
+        self.client = create_app(optimized=True)
+        self.plain_client = create_app(optimized=False)
+
+    def test_gzip_and_not_modified(self):
+        """gzip 압축 후 같은 ETag 재요청 시 304가 반환되는지 확인"""
+        response = self.client.get('/search/jobs/job1', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        body = json.loads(gzip.decompress(response.get_data()))
+        self.assertEqual(body['count'], 20)
+
+        again = self.client.get('/search/jobs/job1', headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']
+        })
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.get_data(), b'')
+
+    def test_etag_changes_with_results(self):
+        """결과가 바뀌면 ETag도 바뀌어 200이 반환되는지 확인"""
+        etag = self.client.get('/search/jobs/job1').headers['ETag']
+        self.results.append(make_search_results(1)[0])
+
+        response = self.client.get('/search/jobs/job1', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_identity_when_not_accepted(self):
+        """압축을 지원하지 않는 요청은 원본 그대로 전달되는지 확인"""
+        response = self.client.get('/search/jobs/job1')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(json.loads(response.get_data())['count'], 20)
+
+    def test_brotli_preferred_when_available(self):
+        """brotli 사용 가능 시 br 인코딩이 우선 선택되는지 확인"""
+        fake_brotli = type('FakeBrotli', (), {'compress': staticmethod(lambda body, quality: b'br:' + body[:10])})
+        with patch.object(http_optimization, 'brotli', fake_brotli):
+            response = self.client.get('/search/jobs/job1', headers={'Accept-Encoding': 'gzip, br'})
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+
+    def test_quality_values(self):
+        """q=0인 코딩은 제외하고 q값이 높은 코딩을 선택하는지 확인 (RFC 9110)"""
+        fake_brotli = type('FakeBrotli', (), {'compress': staticmethod(lambda body, quality: b'br:' + body[:10])})
+
+        def encoding_for(accept_encoding, path='/search/jobs/job1'):
+            with patch.object(http_optimization, 'brotli', fake_brotli):
+                response = self.client.get(path, headers={'Accept-Encoding': accept_encoding})
+            return response.headers.get('Content-Encoding')
+
+        self.assertIsNone(encoding_for('gzip;q=0'))
+        self.assertIsNone(encoding_for('gzip;q=0, br;q=0'))
+        self.assertIsNone(encoding_for(''))
+        self.assertEqual(encoding_for('br;q=0, gzip'), 'gzip')
+        self.assertEqual(encoding_for('br;q=0.5, gzip;q=0.8'), 'gzip')
+        self.assertEqual(encoding_for('gzip, br;Q=1.0'), 'br')
+        self.assertEqual(encoding_for('*'), 'br')
+        self.assertEqual(encoding_for('*, br;q=0'), 'gzip')
+        self.assertIsNone(encoding_for('*;q=0, identity'))
+        # 비압축을 더 선호하면 압축하지 않음
+        self.assertIsNone(encoding_for('identity, gzip;q=0.5'))
+
+    def test_identity_refused(self):
+        """identity;q=0 또는 *;q=0이면 작은 응답도 압축하고, 가능한 압축이 없으면 비압축으로 응답하는지 확인"""
+        self.results[:] = make_search_results(1)[:1]
+        self.results[0]['description'] = ''
+
+        small = self.client.get('/search/jobs/job1', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', small.headers)
+
+        for accept_encoding in ('gzip, identity;q=0', 'gzip, *;q=0'):
+            response = self.client.get('/search/jobs/job1', headers={'Accept-Encoding': accept_encoding})
+            self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+            self.assertEqual(json.loads(gzip.decompress(response.get_data()))['count'], 1)
+
+        response = self.client.get('/search/jobs/job1', headers={'Accept-Encoding': 'br, identity;q=0'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_streaming_response_untouched(self):
+        """SSE 스트리밍 응답은 압축/ETag 대상에서 제외되는지 확인"""
+        response = self.client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertNotIn('ETag', response.headers)
+
+    def test_bytes_saved_on_repeated_polling(self):
+        """같은 검색 결과 반복 조회 시 전송 바이트가 90% 이상 줄어드는지 확인 (측정: benchmarks.micro_benchmarks)"""
+        plain_bytes = poll_bytes(self.plain_client, 10)
+        optimized_bytes = poll_bytes(self.client, 10, headers={'Accept-Encoding': 'gzip'})
+
+        # 첫 응답만 압축 전송되고 나머지는 304
+        self.assertGreater(1 - optimized_bytes / plain_bytes, 0.9)
+
+if __name__ == '__main__':
+    unittest.main()
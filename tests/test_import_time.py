@@ -0,0 +1,56 @@
+# test_import_time.py
+"""
+워커 부팅 시 임포트 시간 점검 (python -X importtime)
+
+직접 프로파일링: python -m benchmarks.import_time
+"""
+import unittest
+import os
+import subprocess
+import sys
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.import_time import PROJECT_DIR, BOOT_MODULES, measure_import_time, total_import_ms
+
+# 실제 사용 시점에 임포트해야 하는 무거운 의존성
+LAZY_MODULES = ['googleapiclient.discovery', 'deep_translator', 'apscheduler', 'google_auth_oauthlib']
+
+# 부팅 모듈 전체 임포트 예산 (ms, 느린 CI에서는 환경변수로 조정)
+IMPORT_TIME_BUDGET_MS = int(os.environ.get('IMPORT_TIME_BUDGET_MS', 2000))
+
+
+class TestImportTime(unittest.TestCase):
+    """부팅 모듈 임포트 시간 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.entries = measure_import_time(BOOT_MODULES)
+        cls.imported = {name for name, _, _, _ in cls.entries}
+
+    def test_heavy_dependencies_are_lazy(self):
+        """무거운 의존성이 부팅 모듈 임포트만으로 로딩되지 않는지 확인"""
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, self.imported)
+
+    def test_import_time_budget(self):
+        """부팅 모듈 임포트 시간이 예산 이내인지 확인"""
+        self.assertLess(total_import_ms(self.entries), IMPORT_TIME_BUDGET_MS)
+
+    def test_quota_manager_initialized_explicitly(self):
+        """search 모듈 임포트 시 할당량 관리자가 초기화되지 않고 init_quota_manager()에서 초기화되는지 확인"""
+        code = ('import common_utils.search as s, common_utils.quota_manager as q\n'
+                'keys = s.api_keys\n'
+                'print(s.quota_manager is None and q.get_quota_manager() is None)\n'
+                's.init_quota_manager()\n'
+                'print(s.api_keys is keys and len(keys) == 2 and q.get_quota_manager() is s.quota_manager)')
+        env = dict(os.environ, YOUTUBE_API_KEY='test-key-1,test-key-2')
+        result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_DIR, env=env,
+                                capture_output=True, text=True, check=True)
+        checks = [line for line in result.stdout.splitlines() if line in ('True', 'False')]
+        self.assertEqual(checks, ['True', 'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+# test_key_health.py
+import unittest
+import os
+import sys
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common_utils.key_health import (
+    KeyHealthRegistry, CircuitState, ProbeResult, ProbeStatus,
+    system_key_ref, is_invalid_key_error, is_quota_error
+)
+from common_utils.quota_manager import YouTubeQuotaManager
+
+
+class FakeClock:
+    """테스트에서 직접 앞으로 돌리는 시계"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestKeyHealthRegistry(unittest.TestCase):
+    """API 키 서킷 브레이커 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.clock = FakeClock()
+        self.registry = KeyHealthRegistry(failure_threshold=2, reset_timeout=300, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패 시 OPEN 되고 성공 시 CLOSED로 복구되는지 확인"""
+        self.registry.record_failure('user:1', 'timeout')
+        self.assertTrue(self.registry.is_available('user:1'))
+
+        self.registry.record_failure('user:1', 'timeout')
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        self.registry.record_success('user:1')
+        self.assertTrue(self.registry.is_available('user:1'))
+
+    def test_fatal_failure_opens_immediately(self):
+        """잘못된 키 오류는 즉시 OPEN 되는지 확인"""
+        self.registry.record_failure('user:1', 'API key not valid', fatal=True)
+        self.assertFalse(self.registry.is_available('user:1'))
+
+    def test_keys_to_probe_skips_recently_used_keys(self):
+        """최근 성공한 키는 확인 대상에서 제외되는지 확인"""
+        self.registry.record_success('user:1')
+
+        due = self.registry.keys_to_probe(['user:1', 'user:2'], idle_interval=3600)
+
+        self.assertEqual(due, ['user:2'])
+
+    def test_open_key_moves_to_half_open_for_probe(self):
+        """OPEN 키가 대기 후 HALF_OPEN으로 시험되고 결과가 반영되는지 확인"""
+        self.registry.record_failure('user:1', 'forbidden', fatal=True)
+        self.assertEqual(self.registry.keys_to_probe(['user:1'], idle_interval=3600), [])
+
+        self.clock.advance(300)
+        due = self.registry.keys_to_probe(['user:1'], idle_interval=3600)
+        self.assertEqual(due, ['user:1'])
+        self.assertEqual(self.registry.get_status()['user:1']['state'], CircuitState.HALF_OPEN.value)
+        # 시험 중에는 요청 경로에서 제외
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        self.registry.record_probe('user:1', ProbeResult(status=ProbeStatus.ERROR, error_message='timeout'))
+        self.assertEqual(self.registry.get_status()['user:1']['state'], CircuitState.OPEN.value)
+
+        self.clock.advance(300)
+        self.registry.keys_to_probe(['user:1'], idle_interval=3600)
+        self.registry.record_probe('user:1', ProbeResult(status=ProbeStatus.QUOTA_EXCEEDED))
+        self.assertTrue(self.registry.is_available('user:1'))
+
+    def test_open_key_recovers_without_prober(self):
+        """프로버 없이도 대기 시간이 지나면 실제 요청 하나를 시험으로 허용하고 결과로 복구되는지 확인"""
+        for _ in range(2):
+            self.registry.record_failure('user:1', 'timeout')
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        self.clock.advance(300)
+        # 상태 조회는 시험 기회를 쓰지 않음
+        self.assertTrue(self.registry.is_available('user:1', claim_trial=False))
+        self.assertEqual(self.registry.get_status()['user:1']['state'], CircuitState.OPEN.value)
+
+        # 시험 요청은 하나만 허용
+        self.assertTrue(self.registry.is_available('user:1'))
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        # 시험 실패 시 다시 대기
+        self.registry.record_failure('user:1', 'timeout')
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        self.clock.advance(300)
+        self.assertTrue(self.registry.is_available('user:1'))
+        self.registry.record_success('user:1')
+        self.assertEqual(self.registry.get_status()['user:1']['state'], CircuitState.CLOSED.value)
+        self.assertTrue(self.registry.is_available('user:1'))
+        self.assertTrue(self.registry.is_available('user:1'))
+
+    def test_abandoned_trial_is_retried(self):
+        """시험 요청 결과가 기록되지 않으면 대기 시간 후 다른 요청이 다시 시험하는지 확인"""
+        self.registry.record_failure('user:1', 'forbidden', fatal=True)
+        self.clock.advance(300)
+        self.assertTrue(self.registry.is_available('user:1'))
+        self.assertFalse(self.registry.is_available('user:1'))
+
+        self.clock.advance(300)
+        self.assertTrue(self.registry.is_available('user:1'))
+
+    def test_error_classification(self):
+        """오류 메시지 분류 테스트"""
+        self.assertTrue(is_quota_error('quotaExceeded'))
+        self.assertTrue(is_invalid_key_error('API key not valid. Please pass a valid API key.'))
+        self.assertFalse(is_invalid_key_error('403 quotaExceeded'))
+
+
+class TestQuotaManagerKeyHealth(unittest.TestCase):
+    """할당량 관리자와 서킷 브레이커 연동 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.clock = FakeClock()
+        self.registry = KeyHealthRegistry(failure_threshold=1, reset_timeout=300, clock=self.clock)
+        self.quota_manager = YouTubeQuotaManager(
+            api_keys=['test_key_1', 'test_key_2'],
+            daily_limit=1000,
+            health_registry=self.registry
+        )
+
+    def test_open_circuit_key_is_skipped(self):
+        """OPEN 상태의 키는 요청 경로에서 건너뛰는지 확인"""
+        self.registry.record_failure(system_key_ref(0), 'timeout')
+
+        self.assertEqual(self.quota_manager.get_current_api_key(), 'test_key_2')
+
+    def test_open_system_keys_recover_without_prober(self):
+        """모든 시스템 키가 OPEN이어도 대기 시간이 지나면 요청 경로에서 다시 시험되는지 확인"""
+        self.registry.record_failure(system_key_ref(0), 'timeout')
+        self.registry.record_failure(system_key_ref(1), 'timeout')
+        self.assertIsNone(self.quota_manager.get_current_api_key())
+
+        self.clock.advance(300)
+        self.assertEqual(self.quota_manager.get_current_api_key(), 'test_key_1')
+
+    def test_apply_probe_result(self):
+        """확인 결과가 키 상태와 사용량에 반영되는지 확인"""
+        self.quota_manager.apply_probe_result(0, ProbeResult(status=ProbeStatus.INVALID, error_message='keyInvalid'))
+        self.assertTrue(self.quota_manager.quota_usage[0].disabled)
+
+        self.quota_manager.apply_probe_result(0, ProbeResult(status=ProbeStatus.OK, response_time=0.1))
+        self.assertFalse(self.quota_manager.quota_usage[0].disabled)
+        self.assertEqual(self.quota_manager.quota_usage[0].daily_used, 1)
+        self.assertTrue(self.registry.is_available(system_key_ref(0)))
+
+        self.quota_manager.apply_probe_result(1, ProbeResult(status=ProbeStatus.QUOTA_EXCEEDED,
+                                                             error_message='quotaExceeded'))
+        self.assertTrue(self.quota_manager.quota_usage[1].is_exceeded())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# test_load_test.py
+import unittest
+import os
+import sys
+import threading
+from unittest.mock import patch, MagicMock
+
+from flask import Flask, jsonify
+from flask_login import LoginManager, login_required, current_user
+from werkzeug.serving import make_server
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db, User
+from common_utils.load_test_auth import init_load_test_auth
+from benchmarks.load_test import (
+    build_parser, classify_response, format_report, parse_mix, percentile, run_load_test, VirtualUser, LoadStats
+)
+
+TOKEN = 'load-test-token-0123456789'
+
+
+def create_app():
+    """부하 테스트 로그인과 로그인 필요 라우트 하나만 있는 앱"""
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test'
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    login_manager = LoginManager()
+    login_manager.init_app(app)
+    login_manager.user_loader(lambda user_id: db.session.get(User, user_id))
+
+    with patch.dict(os.environ, {'LOAD_TEST_AUTH_TOKEN': TOKEN, 'FLASK_ENV': 'dev'}):
+        init_load_test_auth(app, db, User, runtime_info=lambda: {'executor_workers': 10})
+
+    @app.route('/api/youtube/dashboard')
+    @login_required
+    def dashboard():
+        return jsonify({"status": "success", "user": current_user.id})
+
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+class TestLoadTestAuth(unittest.TestCase):
+    """부하 테스트 로그인 우회 테스트"""
+
+    def test_disabled_without_token(self):
+        """토큰이 없거나 짧으면 라우트를 등록하지 않는지 확인"""
+        for token in ('', 'short'):
+            app = Flask(__name__)
+            with patch.dict(os.environ, {'LOAD_TEST_AUTH_TOKEN': token}):
+                self.assertFalse(init_load_test_auth(app, db, User))
+            self.assertEqual(app.test_client().post('/_loadtest/login', json={'token': token}).status_code, 404)
+
+    def test_disabled_in_production(self):
+        """운영 환경에서는 토큰이 설정되어 있어도 라우트를 등록하지 않는지 확인"""
+        app = Flask(__name__)
+        with patch.dict(os.environ, {'LOAD_TEST_AUTH_TOKEN': TOKEN, 'FLASK_ENV': 'production'}), \
+                self.assertLogs(app.logger, level='ERROR'):
+            self.assertFalse(init_load_test_auth(app, db, User))
+        self.assertEqual(app.test_client().post('/_loadtest/login', json={'token': TOKEN}).status_code, 404)
+
+    def test_login_creates_user(self):
+        """올바른 토큰이면 부하 테스트 사용자를 만들어 로그인하고 서버 구성을 돌려주는지 확인"""
+        app = create_app()
+        client = app.test_client()
+
+        self.assertEqual(client.post('/_loadtest/login', json={'token': 'wrong'}).status_code, 403)
+        self.assertEqual(client.post('/_loadtest/login', json={'token': TOKEN, 'role': 'owner'}).status_code, 400)
+
+        response = client.post('/_loadtest/login', json={'token': TOKEN, 'user': 3, 'role': 'admin'})
+        self.assertEqual(response.json['user_id'], 'loadtest-3')
+        self.assertEqual(response.json['config'], {'executor_workers': 10})
+        self.assertEqual(client.get('/api/youtube/dashboard').json['user'], 'loadtest-3')
+        with app.app_context():
+            self.assertTrue(db.session.get(User, 'loadtest-3').is_admin())
+
+
+class TestLoadTestHarness(unittest.TestCase):
+    """부하 테스트 하네스 테스트"""
+
+    def _options(self, *argv):
+        return build_parser().parse_args(['--token', TOKEN, '--warmup', '0', *argv])
+
+    def test_percentile_and_mix(self):
+        """백분위수(nearest-rank)와 트래픽 비율 파싱 확인"""
+        values = list(range(1, 101))
+        self.assertEqual([percentile(values, p) for p in (50, 95, 99, 100)], [50, 95, 99, 100])
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(parse_mix('search_hit=3, dashboard=1'), {'search_hit': 3.0, 'dashboard': 1.0})
+        with self.assertRaises(ValueError):
+            parse_mix('unknown=1')
+
+    def test_classify_response(self):
+        """HTTP 상태와 응답 본문의 오류 표시를 오류로 분류하는지 확인"""
+        def response(status, body):
+            mock = MagicMock(status_code=status)
+            mock.json.return_value = body
+            return mock
+
+        self.assertIsNone(classify_response(response(202, {'status': 'pending'})))
+        self.assertEqual(classify_response(response(200, {'status': 'error'})), 'error')
+        self.assertEqual(classify_response(response(409, {'success': False})), 'http_409')
+        self.assertEqual(classify_response(response(200, {'success': False})), 'failed')
+        self.assertEqual(classify_response(response(302, {})), 'redirect')
+
+    def test_run_with_operation_mix(self):
+        """가상 사용자가 비율대로 작업을 반복하고 종류별 통계가 집계되는지 확인"""
+        options = self._options('--users', '4', '--duration', '0.3', '--mix', 'dashboard=1,categories=1')
+
+        def runner(user, name):
+            user.stats.record(name, 0.001, 'http_500' if name == 'categories' and user.index == 0 else None)
+
+        summary = run_load_test(options, operation_runner=runner)
+        operations = {row['name']: row for row in summary['operations']}
+
+        self.assertEqual(set(operations), {'dashboard', 'categories'})
+        self.assertGreater(summary['requests'], 0)
+        self.assertEqual(operations['dashboard']['error_rate'], 0)
+        self.assertGreater(operations['categories']['errors']['http_500'], 0)
+        self.assertIn('Δreq/s +0.0%', format_report(summary, baseline=summary))
+
+    def test_virtual_user_over_http(self):
+        """실제 HTTP로 로그인 세션을 유지하며 요청을 기록하는지 확인"""
+        server = make_server('127.0.0.1', 0, create_app(), threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            options = self._options('--base-url', f'http://127.0.0.1:{server.server_port}')
+            stats = LoadStats()
+            user = VirtualUser(1, options, stats)
+            user.login()
+            user.dashboard()
+        finally:
+            server.shutdown()
+
+        self.assertEqual(user.server_info['user_id'], 'loadtest-1')
+        stats.started, stats.finished = 0, 1
+        dashboard = stats.summary()['operations'][0]
+        self.assertEqual((dashboard['name'], dashboard['count'], dashboard['error_rate']), ('dashboard', 1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+# test_metrics.py
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from flask import Flask
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.micro_benchmarks import measure_metrics_overhead
+from common_utils import search
+from common_utils.metrics import MetricsRegistry, get_metrics_registry, init_request_metrics, clear_multiprocess_dir
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """메트릭 레지스트리 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.registry = MetricsRegistry()
+        self.registry.describe('calls_total', 'counter', '호출 수')
+        self.registry.describe('latency_seconds', 'histogram', '응답 시간', buckets=(0.1, 1.0))
+
+    def test_render_exposition_format(self):
+        """카운터/히스토그램/게이지가 텍스트 노출 형식으로 출력되는지 확인"""
+        self.registry.inc('calls_total', endpoint='search.list')
+        self.registry.inc('calls_total', 2, endpoint='search.list')
+        self.registry.observe('latency_seconds', 0.05, route='/search')
+        self.registry.observe('latency_seconds', 0.1, route='/search')
+        self.registry.observe('latency_seconds', 3, route='/search')
+        self.registry.register_gauge('queue_depth', '대기 작업 수', lambda: 4)
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('# TYPE calls_total counter', lines)
+        self.assertIn('calls_total{endpoint="search.list"} 3', lines)
+        self.assertIn('latency_seconds_bucket{route="/search",le="0.1"} 2', lines)
+        self.assertIn('latency_seconds_bucket{route="/search",le="1.0"} 2', lines)
+        self.assertIn('latency_seconds_bucket{route="/search",le="+Inf"} 3', lines)
+        self.assertIn('latency_seconds_count{route="/search"} 3', lines)
+        self.assertIn('latency_seconds_sum{route="/search"} 3.15', lines)
+        self.assertIn('queue_depth 4', lines)
+
+    def test_label_escaping(self):
+        """라벨 값의 따옴표/줄바꿈이 이스케이프되는지 확인"""
+        self.registry.inc('calls_total', endpoint='a"b\nc')
+        self.assertIn('calls_total{endpoint="a\\"b\\nc"} 1', self.registry.render())
+
+    def test_counts_from_many_threads(self):
+        """여러 스레드(종료된 스레드 포함)의 기록이 빠짐없이 합산되는지 확인"""
+        def work():
+            for _ in range(1000):
+                self.registry.inc('calls_total', endpoint='videos.list')
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        # 기록 중에도 조회 가능
+        self.registry.render()
+        for thread in threads:
+            thread.join()
+
+        self.assertIn('calls_total{endpoint="videos.list"} 8000', self.registry.render())
+        # 종료된 스레드 샤드는 합쳐져 남지 않음
+        self.registry.inc('calls_total', endpoint='videos.list')
+        self.assertEqual(len(self.registry._shards), 1)
+        self.assertIn('calls_total{endpoint="videos.list"} 8001', self.registry.render())
+
+    def test_recording_overhead(self):
+        """YouTube 호출 1회 기록 비용이 예산 이내인지 확인 (측정: benchmarks.micro_benchmarks)"""
+        # 실제 API 호출(수십~수백 ms) 대비 무시할 수준
+        self.assertLess(measure_metrics_overhead(self.registry), 100)
+
+
+class TestMultiprocessMetrics(unittest.TestCase):
+    """gunicorn 워커 간 메트릭 합산 테스트 (워커는 PID가 다른 레지스트리로 대신함)"""
+
+    def setUp(self):
+        """테스트 세트업 (임시 합산 디렉터리)"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.temp_dir.cleanup()
+
+    def _worker(self, pid, queue_depth):
+        registry = MetricsRegistry()
+        registry.describe('calls_total', 'counter', '호출 수')
+        registry.describe('latency_seconds', 'histogram', '응답 시간', buckets=(0.1, 1.0))
+        registry.register_gauge('queue_depth', '대기 작업 수', lambda: queue_depth)
+        with patch('common_utils.metrics.os.getpid', return_value=pid):
+            registry.enable_multiprocess(self.directory, interval=5)
+        return registry
+
+    def test_any_worker_renders_totals(self):
+        """어느 워커가 응답해도 모든 워커의 합계가 노출되는지 확인"""
+        first, second = self._worker(101, 2), self._worker(102, 3)
+        first.inc('calls_total', endpoint='search.list')
+        first.observe('latency_seconds', 0.05, route='/search')
+        second.inc('calls_total', 2, endpoint='search.list')
+        second.inc('calls_total', endpoint='videos.list')
+        second.observe('latency_seconds', 3, route='/search')
+        first.export()
+        second.export()
+
+        for registry in (first, second):
+            lines = registry.render().splitlines()
+            self.assertIn('calls_total{endpoint="search.list"} 3', lines)
+            self.assertIn('calls_total{endpoint="videos.list"} 1', lines)
+            self.assertIn('latency_seconds_bucket{route="/search",le="0.1"} 1', lines)
+            self.assertIn('latency_seconds_count{route="/search"} 2', lines)
+            self.assertIn('queue_depth 5', lines)
+
+        # 응답한 워커의 값은 내보내기 주기와 관계없이 최신
+        first.inc('calls_total', endpoint='search.list')
+        self.assertIn('calls_total{endpoint="search.list"} 4', first.render().splitlines())
+
+    def test_stopped_worker_keeps_counters_but_not_gauges(self):
+        """종료된 워커 파일의 카운터는 합계에 남고 게이지는 제외되는지 확인"""
+        first, second = self._worker(101, 2), self._worker(102, 3)
+        second.inc('calls_total', 5, endpoint='search.list')
+        second.export()
+        stale = time.time() - 60
+        os.utime(second._export_path, (stale, stale))
+
+        lines = first.render().splitlines()
+        self.assertIn('calls_total{endpoint="search.list"} 5', lines)
+        self.assertIn('queue_depth 2', lines)
+
+        clear_multiprocess_dir(self.directory)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestSearchMetrics(unittest.TestCase):
+    """검색/할당량 경로 메트릭 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.registry = get_metrics_registry()
+        self.registry.reset()
+        search.cache.clear()
+
+    def tearDown(self):
+        """테스트 정리"""
+        search.cache.clear()
+        self.registry.reset()
+
+    def test_youtube_call_recorded(self):
+        """execute_youtube_api_call 성공/오류가 엔드포인트·키별로 기록되는지 확인"""
+        with patch.object(search, 'quota_manager', None):
+            search.execute_youtube_api_call(lambda: {'items': []}, 'search.list')
+            with self.assertRaises(ValueError):
+                search.execute_youtube_api_call(self._raise(ValueError('bad request')), 'videos.list')
+
+        output = self.registry.render()
+        self.assertIn('youtube_api_calls_total{endpoint="search.list",key="system",status="success"} 1', output)
+        self.assertIn('youtube_api_calls_total{endpoint="videos.list",key="system",status="error"} 1', output)
+        self.assertIn('youtube_quota_units_total{endpoint="search.list",key="system"} 100', output)
+        self.assertIn('youtube_api_call_duration_seconds_count{endpoint="search.list"} 1', output)
+
+    def test_cache_hits_misses_evictions(self):
+        """검색 캐시 적중/미스/제거가 기록되는지 확인"""
+        search.get_from_cache('missing')
+        for i in range(201):
+            search.save_to_cache(f'key{i}', i)
+        search.get_from_cache('key200')
+
+        output = self.registry.render()
+        self.assertIn('search_cache_misses_total 1', output)
+        self.assertIn('search_cache_hits_total 1', output)
+        self.assertIn('search_cache_evictions_total{reason="size"} 20', output)
+
+    def test_request_duration_by_route(self):
+        """라우트 패턴별 요청 처리 시간이 기록되는지 확인"""
+        app = Flask(__name__)
+        init_request_metrics(app)
+
+        @app.route('/search/jobs/<job_id>')
+        def job_status(job_id):
+            return 'ok'
+
+        client = app.test_client()
+        client.get('/search/jobs/a')
+        client.get('/search/jobs/b')
+        client.get('/nope')
+
+        output = self.registry.render()
+        self.assertIn('http_request_duration_seconds_count{method="GET",route="/search/jobs/<job_id>",status="200"} 2',
+                      output)
+        self.assertIn('http_request_duration_seconds_count{method="GET",route="unmatched",status="404"} 1', output)
+
+    @staticmethod
+    def _raise(error):
+        def call():
+            raise error
+        return call
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# test_notification_plan.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+from flask import Flask
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db, User, Channel, ChannelCategory, CategoryChannel, EmailNotification, NotificationSearch, EmailSentVideo
+from common_utils.notification_plan import ChannelFetchPlan, ChannelSearch, select_results
+from services.notification_scheduler import NotificationScheduler
+
+NOW = datetime.utcnow()
+# 채널마다 (경과 시간, 조회수) 영상 4개
+VIDEO_SPECS = [(1, 50000), (30, 150000), (60, 300000), (100, 1000000)]
+
+
+def make_video(channel_id, hours_ago, views):
+    return {
+        'id': f"{channel_id}-{hours_ago}h",
+        'title': f"{channel_id} 영상",
+        'channelTitle': channel_id,
+        'channelId': channel_id,
+        'publishedAt': (NOW - timedelta(hours=hours_ago)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        'viewCount': views,
+    }
+
+
+class FakeSearch:
+    """get_recent_popular_shorts 대역 (채널 하나씩 호출되는지 기록)"""
+
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+
+    def __call__(self, min_views, days_ago, max_results, channel_ids, region_code='KR', **kwargs):
+        self.calls.append({'channel_ids': channel_ids, 'min_views': min_views, 'days_ago': days_ago,
+                           'max_results': max_results})
+        if channel_ids in self.failing:
+            raise Exception('quotaExceeded')
+        cutoff = NOW - timedelta(days=days_ago)
+        videos = [make_video(channel_ids, hours, views) for hours, views in VIDEO_SPECS
+                  if NOW - timedelta(hours=hours) >= cutoff][:max_results]
+        return [video for video in videos if video['viewCount'] >= min_views]
+
+
+class TestChannelFetchPlan(unittest.TestCase):
+    """채널 조회 계획 테스트"""
+
+    def test_plan_merges_channels_with_widest_filters(self):
+        """같은 채널을 여러 검색이 요청해도 한 번만, 가장 넓은 조건으로 조회하는지 확인"""
+        plan = ChannelFetchPlan()
+        plan.add(ChannelSearch(('a', 'b'), min_views=200000, days_ago=1, max_results=5))
+        plan.add(ChannelSearch(('b', 'c'), min_views=100000, days_ago=3, max_results=10))
+        plan.add(ChannelSearch(('b',), min_views=500000, days_ago=2, max_results=3))
+
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan.channel_requests, 5)
+        fetch = plan.fetches[('b', 'KR')]
+        self.assertEqual((fetch.min_views, fetch.days_ago, fetch.max_results), (100000, 3, 10))
+
+    def test_select_results_applies_each_search_filter(self):
+        """넓은 조건의 조회 결과에서 각 검색 조건에 맞는 영상만 고르는지 확인"""
+        fake = FakeSearch()
+        plan = ChannelFetchPlan()
+        narrow = plan.add(ChannelSearch(('a', 'b'), min_views=200000, days_ago=3, max_results=3))
+        wide = plan.add(ChannelSearch(('a',), min_views=100000, days_ago=5, max_results=10))
+        fetched = plan.execute(fake)
+
+        self.assertEqual(len(fake.calls), 2)
+        # 기간 3일(72시간) 이내 + 조회수 20만 이상 → 채널별 60시간 영상, 최신순 3개 제한
+        self.assertEqual([video['id'] for video in select_results(narrow, fetched, now=NOW)], ['a-60h', 'b-60h'])
+        self.assertEqual([video['id'] for video in select_results(wide, fetched, now=NOW)], ['a-30h', 'a-60h', 'a-100h'])
+
+    def test_failed_channel_is_skipped(self):
+        """조회에 실패한 채널은 결과에서 빠지고 나머지 채널은 유지되는지 확인"""
+        errors = []
+        plan = ChannelFetchPlan()
+        search = plan.add(ChannelSearch(('a', 'b'), min_views=100000, days_ago=5, max_results=10))
+        fetched = plan.execute(FakeSearch(failing={'a'}), on_error=lambda fetch, e: errors.append(fetch.channel_id))
+
+        self.assertEqual(errors, ['a'])
+        self.assertEqual({video['channelId'] for video in select_results(search, fetched, now=NOW)}, {'b'})
+
+
+class TestNotificationTickPlan(unittest.TestCase):
+    """알림 틱 채널 조회 중복 제거 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (같은 채널을 구독하는 사용자 여러 명)"""
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        channel_ids = [f'UC{i}' for i in range(5)]
+        db.session.add_all(Channel(id=channel_id, title=channel_id) for channel_id in channel_ids)
+        all_hours = ','.join(str(hour) for hour in range(24))
+        for i in range(8):
+            user_id = f'u{i}'
+            db.session.add(User(id=user_id, email=f'{user_id}@test.com', name=user_id, role='approved'))
+            category = ChannelCategory(user_id=user_id, name='구독')
+            # 사용자마다 앞 3개 채널 + 다른 채널 하나
+            for channel_id in channel_ids[:3] + [channel_ids[3 + i % 2]]:
+                category.category_channels.append(CategoryChannel(channel_id=channel_id))
+            db.session.add(category)
+            notification = EmailNotification(user_id=user_id, active=True, preferred_times=all_hours)
+            notification.searches.append(NotificationSearch(category=category, min_views=100000 * (1 + i % 3),
+                                                            days_ago=1 + i % 5, max_results=5))
+            db.session.add(notification)
+        db.session.commit()
+
+        self.email_service = MagicMock()
+        self.email_service.format_shorts_email.side_effect = lambda user, results, timestamp: results
+        self.email_service.send_email.return_value = True
+
+    def tearDown(self):
+        """테스트 정리"""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_tick_fetches_each_channel_once(self):
+        """틱당 채널 조회 수가 사용자 수가 아닌 고유 채널 수와 같고 결과가 사용자 조건별로 나뉘는지 확인"""
+        fake = FakeSearch()
+        # 메모리 SQLite는 연결 하나를 공유하므로 사용자 처리는 순차 실행
+        with patch('services.notification_scheduler.get_recent_popular_shorts', fake), \
+                patch('services.notification_scheduler.NOTIFICATION_WORKERS', 1):
+            NotificationScheduler(self.app, db, self.email_service).check_and_send_notifications()
+
+        self.assertEqual(sorted(call['channel_ids'] for call in fake.calls), [f'UC{i}' for i in range(5)])
+        self.assertEqual(self.email_service.send_email.call_count, 8)
+
+        # 사용자 조건(최소 조회수/기간)대로 선택되었는지 확인
+        sent = {call.args[0]: call.args[2] for call in self.email_service.send_email.call_args_list}
+        u0_videos = sent['u0@test.com'][0]['videos']  # 10만 이상, 1일 이내
+        self.assertEqual({video['id'].split('-')[1] for video in u0_videos}, set())
+        u3_videos = sent['u3@test.com'][0]['videos']  # 10만 이상, 4일 이내
+        self.assertEqual({video['id'].split('-')[1] for video in u3_videos}, {'30h', '60h'})
+        self.assertEqual(EmailSentVideo.query.filter_by(user_id='u3').count(), len(u3_videos))
+
+    def test_collect_without_prefetch(self):
+        """미리 조회한 결과 없이 호출하면 해당 알림의 채널만 조회하는지 확인 (테스트 발송 경로)"""
+        fake = FakeSearch()
+        scheduler = NotificationScheduler(self.app, db, self.email_service)
+        with patch('services.notification_scheduler.get_recent_popular_shorts', fake):
+            results = scheduler.collect_search_results(EmailNotification.query.filter_by(user_id='u1').one())
+
+        self.assertEqual(sorted(call['channel_ids'] for call in fake.calls), ['UC0', 'UC1', 'UC2', 'UC4'])
+        self.assertEqual(results[0]['name'], '구독')
+
+
+if __name__ == '__main__':
+    unittest.main()
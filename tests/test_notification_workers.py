@@ -0,0 +1,150 @@
+# test_notification_workers.py
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+from flask import Flask
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db, User, Channel, ChannelCategory, CategoryChannel, EmailNotification, NotificationSearch
+from common_utils.metrics import get_metrics_registry
+from services.notification_scheduler import NotificationScheduler
+
+USERS = 8
+
+
+class FakeClock:
+    """테스트에서 직접 앞으로 돌리는 시계 (마감 시간 확인용)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestNotificationWorkers(unittest.TestCase):
+    """알림 틱 사용자별 병렬 처리 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (워커 스레드마다 별도 연결을 쓰도록 파일 SQLite 사용)"""
+        self.db_fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{self.db_path}'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        db.session.add(Channel(id='UC0', title='UC0'))
+        all_hours = ','.join(str(hour) for hour in range(24))
+        for i in range(USERS):
+            user_id = f'u{i}'
+            db.session.add(User(id=user_id, email=f'{user_id}@test.com', name=user_id, role='approved'))
+            category = ChannelCategory(user_id=user_id, name='구독')
+            category.category_channels.append(CategoryChannel(channel_id='UC0'))
+            notification = EmailNotification(user_id=user_id, active=True, preferred_times=all_hours)
+            notification.searches.append(NotificationSearch(category=category, min_views=100000, days_ago=5,
+                                                            max_results=5))
+            db.session.add(notification)
+        db.session.commit()
+
+        self.email_service = MagicMock()
+        self.email_service.format_shorts_email.return_value = '<html></html>'
+        self.email_service.send_email.return_value = True
+        self.clock = FakeClock()
+        self.scheduler = NotificationScheduler(self.app, db, self.email_service, clock=self.clock)
+        get_metrics_registry().reset()
+
+    def tearDown(self):
+        """테스트 정리"""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        os.close(self.db_fd)
+        os.unlink(self.db_path)
+
+    def _run_tick(self, workers=4, deadline=3000):
+        with patch('services.notification_scheduler.get_recent_popular_shorts', return_value=[]), \
+                patch('services.notification_scheduler.NOTIFICATION_WORKERS', workers), \
+                patch('services.notification_scheduler.NOTIFICATION_TICK_DEADLINE', deadline):
+            self.scheduler.check_and_send_notifications()
+
+    def _sent_users(self):
+        return {notification.user_id for notification in EmailNotification.query.all() if notification.last_sent}
+
+    def _durations(self):
+        _, histograms = get_metrics_registry().snapshot()
+        return {dict(labels)['status']: sum(entry[:-1]) for (name, labels), entry in histograms.items()
+                if name == 'notification_user_duration_seconds'}
+
+    def test_users_processed_in_parallel(self):
+        """사용자별 처리가 워커 스레드에서 동시에 실행되는지 확인"""
+        threads = set()
+
+        def send_email(to, subject, html):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.2)
+            return True
+
+        self.email_service.send_email.side_effect = send_email
+        started = time.perf_counter()
+        self._run_tick(workers=4)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(self._sent_users(), {f'u{i}' for i in range(USERS)})
+        self.assertEqual(len(threads), 4)
+        self.assertLess(elapsed, 0.2 * USERS * 0.75)
+        self.assertEqual(self._durations(), {'sent': USERS})
+
+    def test_one_user_failure_does_not_abort_others(self):
+        """한 사용자의 오류/발송 실패가 다른 사용자 발송을 막지 않는지 확인"""
+        def send_email(to, subject, html):
+            if to == 'u1@test.com':
+                raise Exception('SMTP 연결 끊김')
+            return to != 'u2@test.com'
+
+        self.email_service.send_email.side_effect = send_email
+        self._run_tick(workers=4)
+
+        self.assertEqual(self._sent_users(), {f'u{i}' for i in range(USERS)} - {'u1', 'u2'})
+        self.assertEqual(self._durations(), {'sent': USERS - 2, 'error': 1, 'failed': 1})
+
+    def test_deadline_skips_pending_users(self):
+        """마감 시간이 지나면 시작하지 못한 사용자는 건너뛰고 이미 시작한 발송은 끝까지 기다리는지 확인"""
+        # 워커 2개가 모두 발송을 시작하면 (둘 다 진행하기 전에) 마감 시간 경과
+        both_sending = threading.Barrier(2, action=lambda: self.clock.advance(60), timeout=5)
+
+        def send_email(to, subject, html):
+            both_sending.wait()
+            return True
+
+        self.email_service.send_email.side_effect = send_email
+        self._run_tick(workers=2, deadline=60)
+
+        # 마감 전에 시작한 2명만 발송 (실행 중인 발송은 중단하지 않음)
+        self.assertEqual(len(self._sent_users()), 2)
+        self.assertEqual(self._durations(), {'sent': 2, 'deadline': USERS - 2})
+
+    def test_sequential_with_single_worker(self):
+        """워커 수가 1이면 현재 스레드에서 순서대로 처리하는지 확인"""
+        threads = set()
+        self.email_service.send_email.side_effect = lambda *args: threads.add(threading.current_thread()) or True
+        self._run_tick(workers=1)
+
+        self.assertEqual(threads, {threading.current_thread()})
+        self.assertEqual(len(self._sent_users()), USERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# test_request_profiler.py
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+from flask import Flask, jsonify
+from flask_login import LoginManager, UserMixin
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common_utils import request_profiler
+from common_utils.request_profiler import init_request_profiler, list_profiles, propagate_profile, get_profile_path
+
+
+class FakeUser(UserMixin):
+    def __init__(self, user_id, admin):
+        self.id = user_id
+        self.admin = admin
+
+    def is_admin(self):
+        return self.admin
+
+
+class TestRequestProfiler(unittest.TestCase):
+    """요청 프로파일링 훅 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (임시 프로파일 디렉터리)"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.env_patcher = patch.dict(os.environ, {'REQUEST_PROFILE_DIR': self.temp_dir.name,
+                                                   'REQUEST_PROFILE_KEEP': '3'})
+        self.env_patcher.start()
+        self.background = []
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.env_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _create_app(self):
+        app = Flask(__name__)
+        app.config['SECRET_KEY'] = 'test'
+        login_manager = LoginManager()
+        login_manager.init_app(app)
+
+        users = {'admin': FakeUser('admin', True), 'user': FakeUser('user', False)}
+
+        @login_manager.request_loader
+        def load_user_from_request(req):
+            return users.get(req.headers.get('X-Test-User'))
+
+        init_request_profiler(app)
+
+        @app.route('/search', methods=['POST'])
+        def search():
+            sum(i * i for i in range(1000))
+            # 실행기에 넘기는 작업 (테스트에서는 응답 후 직접 실행)
+            self.background.append(propagate_profile(lambda: sum(range(1000)), 'search_job'))
+            return jsonify({"status": "pending"})
+
+        return app
+
+    def _post(self, app, user=None, profile=False):
+        headers = {}
+        if user:
+            headers['X-Test-User'] = user
+        if profile:
+            headers['X-Profile'] = '1'
+        return app.test_client().post('/search', data={'keyword': '요리', 'api_key': 'AIza-secret'}, headers=headers)
+
+    def test_disabled_creates_no_profiler(self):
+        """헤더/표본 추출이 없으면 프로파일러를 만들지 않는지 확인"""
+        app = self._create_app()
+        with patch.object(request_profiler.cProfile, 'Profile', side_effect=AssertionError('프로파일러 생성됨')):
+            response = self._post(app, user='admin')
+            for task in self.background:
+                task()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response.headers)
+        self.assertEqual(list_profiles(), [])
+
+    def test_header_requires_admin(self):
+        """일반 사용자의 X-Profile 헤더는 무시되는지 확인"""
+        response = self._post(self._create_app(), user='user', profile=True)
+        self.assertNotIn('X-Profile-Id', response.headers)
+        self.assertEqual(list_profiles(), [])
+
+    def test_admin_profile_with_background_job(self):
+        """관리자 요청과 백그라운드 작업 프로파일이 요청 파라미터와 함께 저장되는지 확인"""
+        response = self._post(self._create_app(), user='admin', profile=True)
+        for task in self.background:
+            task()
+
+        profile_id = response.headers['X-Profile-Id']
+        profiles = {profile['id']: profile for profile in list_profiles()}
+        self.assertEqual(set(profiles), {profile_id, f'{profile_id}-search_job'})
+
+        request_profile = profiles[profile_id]
+        self.assertEqual(request_profile['trigger'], 'header')
+        self.assertEqual(request_profile['path'], '/search')
+        self.assertEqual(request_profile['params'], {'keyword': '요리', 'api_key': '***'})
+        self.assertEqual(request_profile['status'], 200)
+        self.assertTrue(request_profile['top_functions'])
+
+        job_profile = profiles[f'{profile_id}-search_job']
+        self.assertEqual(job_profile['parent'], profile_id)
+        self.assertEqual(job_profile['kind'], 'search_job')
+        self.assertIsNotNone(get_profile_path(job_profile['id']))
+
+    def test_sampling_and_retention(self):
+        """표본 추출 비율 1이면 모든 요청을 프로파일링하고 최근 N개만 보관하는지 확인"""
+        with patch.dict(os.environ, {'REQUEST_PROFILE_SAMPLE_RATE': '1'}):
+            app = self._create_app()
+        for _ in range(5):
+            response = self._post(app)
+            self.assertIn('X-Profile-Id', response.headers)
+
+        profiles = list_profiles()
+        self.assertEqual(len(profiles), 3)
+        self.assertEqual({profile['trigger'] for profile in profiles}, {'sample'})
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 6)
+
+    def test_invalid_profile_id(self):
+        """경로 조작 형식의 프로파일 ID는 거부되는지 확인"""
+        self.assertIsNone(get_profile_path('../../etc/passwd'))
+        self.assertIsNone(get_profile_path('20260101T000000-deadbeef/../x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
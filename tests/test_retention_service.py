@@ -0,0 +1,140 @@
+# test_retention_service.py
+import unittest
+import os
+import sys
+import gzip
+import json
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, ApiLog, ApiLogDaily, UserApiKey, ApiKeyUsage
+from services.retention_service import DataRetentionService
+
+
+class TestDataRetentionService(DatabaseTestCase):
+    """로그 보존 정책 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        self.env_patcher = patch.dict(os.environ, {
+            'API_LOG_RETENTION_DAYS': '30',
+            'API_KEY_USAGE_RETENTION_DAYS': '7',
+            'RETENTION_BATCH_SIZE': '2',
+            'RETENTION_BATCH_PAUSE': '0'
+        })
+        self.env_patcher.start()
+
+        super().setUp()
+
+        self.now = datetime.utcnow()
+        self.old_day = self.now - timedelta(days=40)
+
+    def tearDown(self):
+        """테스트 정리"""
+        super().tearDown()
+        self.env_patcher.stop()
+
+    def _add_logs(self, count, timestamp, endpoint='search'):
+        for _ in range(count):
+            db.session.add(ApiLog(user_id='u1', endpoint=endpoint, timestamp=timestamp))
+        db.session.commit()
+
+    def test_purge_api_logs_rolls_up_and_deletes_in_batches(self):
+        """오래된 로그는 요약 후 삭제되고 최근 로그는 유지되는지 확인"""
+        self._add_logs(3, self.old_day, 'search')
+        self._add_logs(2, self.old_day, 'channel-search')
+        self._add_logs(4, self.now, 'search')
+
+        service = DataRetentionService(self.app)
+        deleted = service.purge_api_logs()
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(ApiLog.query.count(), 4)
+
+        summary = {row.endpoint: row for row in ApiLogDaily.query.all()}
+        self.assertEqual(summary['search'].call_count, 3)
+        self.assertEqual(summary['channel-search'].call_count, 2)
+        self.assertEqual(summary['search'].log_date, self.old_day.date())
+
+    def test_purge_is_idempotent(self):
+        """재실행 시 요약이 중복 반영되지 않는지 확인"""
+        self._add_logs(3, self.old_day)
+
+        service = DataRetentionService(self.app)
+        service.purge_api_logs()
+        self.assertEqual(service.purge_api_logs(), 0)
+
+        self.assertEqual(ApiLogDaily.query.one().call_count, 3)
+
+    def test_purge_api_key_usage_uses_own_window(self):
+        """테이블별 보존 기간이 따로 적용되는지 확인"""
+        key = UserApiKey(user_id='u1', name='개인용', api_key='encrypted')
+        db.session.add(key)
+        db.session.commit()
+
+        for days in (10, 3):
+            db.session.add(ApiKeyUsage(api_key_id=key.id, user_id='u1', endpoint='search.list',
+                                       timestamp=self.now - timedelta(days=days)))
+        db.session.commit()
+
+        deleted = DataRetentionService(self.app).purge_api_key_usage()
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(ApiKeyUsage.query.count(), 1)
+
+    def test_archive_rows_before_delete(self):
+        """보관 디렉토리 설정 시 삭제 전 원본이 보관되는지 확인"""
+        self._add_logs(3, self.old_day)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with patch.dict(os.environ, {'RETENTION_ARCHIVE_DIR': archive_dir}):
+                DataRetentionService(self.app).purge_api_logs()
+
+            files = os.listdir(archive_dir)
+            self.assertEqual(len(files), 1)
+            with gzip.open(os.path.join(archive_dir, files[0]), 'rt', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]['endpoint'], 'search')
+
+    def test_anonymous_logs_are_summarized(self):
+        """user_id가 없는 로그도 요약에 NULL 사용자로 반영된 뒤 삭제되는지 확인"""
+        self._add_logs(2, self.old_day)
+        for _ in range(3):
+            db.session.add(ApiLog(user_id=None, endpoint='channel-search', timestamp=self.old_day))
+        db.session.commit()
+
+        service = DataRetentionService(self.app)
+        self.assertEqual(service.purge_api_logs(), 5)
+
+        summary = {(row.user_id, row.endpoint): row.call_count for row in ApiLogDaily.query.all()}
+        self.assertEqual(summary, {('u1', 'search'): 2, (None, 'channel-search'): 3})
+
+    def test_failed_batch_is_not_archived(self):
+        """삭제 커밋에 실패한 청크는 보관되지 않고, 재시도 시 한 번만 보관되는지 확인"""
+        self._add_logs(2, self.old_day)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with patch.dict(os.environ, {'RETENTION_ARCHIVE_DIR': archive_dir}):
+                service = DataRetentionService(self.app)
+            with patch.object(db.session, 'commit', side_effect=Exception('lock timeout')):
+                self.assertEqual(service.purge_api_logs(), 0)
+            self.assertEqual(os.listdir(archive_dir), [])
+
+            self.assertEqual(service.purge_api_logs(), 2)
+            files = os.listdir(archive_dir)
+            with gzip.open(os.path.join(archive_dir, files[0]), 'rt', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(len(records), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# test_saved_video_stats.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, SavedVideo
+from common_utils import search
+from services.saved_video_stats_service import SavedVideoStatsRefresher
+
+
+class FakeStatistics:
+    """videos.list(part=statistics) 대역 (요청별 영상 ID 기록)"""
+
+    def __init__(self, deleted=(), fail_after=None):
+        self.requests = []
+        self.deleted = set(deleted)
+        self.fail_after = fail_after
+
+    def __call__(self, video_ids, max_attempts=1, on_attempt=None):
+        if on_attempt is not None:
+            on_attempt()
+        if self.fail_after is not None and len(self.requests) >= self.fail_after:
+            raise Exception('모든 YouTube API 키의 할당량이 초과되었습니다.')
+        self.requests.append(list(video_ids))
+        return {'items': [{'id': video_id, 'statistics': {'viewCount': str(1000 + int(video_id[1:]))}}
+                          for video_id in video_ids if video_id not in self.deleted]}
+
+
+class TestSavedVideoStatsRefresher(DatabaseTestCase):
+    """저장 영상 조회수 일괄 갱신 테스트"""
+
+    users = ('u1', 'u2')
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite)"""
+        self.env_patcher = patch.dict(os.environ, {'SAVED_VIDEO_REFRESH_QUOTA_BUDGET': '3'})
+        self.env_patcher.start()
+
+        super().setUp()
+
+        self.now = datetime(2026, 3, 1, 4)
+
+    def tearDown(self):
+        """테스트 정리"""
+        super().tearDown()
+        self.env_patcher.stop()
+
+    def _save(self, user_id, video_id, stats_updated_at=None):
+        db.session.add(SavedVideo(user_id=user_id, video_id=video_id, video_title=video_id, channel_title='채널',
+                                  video_url=f'https://youtu.be/{video_id}', view_count=1,
+                                  stats_updated_at=stats_updated_at))
+
+    def _view_counts(self):
+        db.session.expire_all()
+        return {(video.user_id, video.video_id): video.view_count for video in SavedVideo.query}
+
+    def test_shared_video_fetched_once(self):
+        """같은 영상을 여러 사용자가 저장해도 한 번만 조회하고 모든 행을 갱신하는지 확인"""
+        self._save('u1', 'v1')
+        self._save('u2', 'v1')
+        self._save('u2', 'v2')
+        self._save('u1', 'v3', stats_updated_at=self.now - timedelta(hours=1))  # 최근 갱신됨
+        self._save('u1', 'v4')
+        db.session.commit()
+
+        fake = FakeStatistics(deleted={'v4'})
+        result = SavedVideoStatsRefresher(self.app, fetch_statistics=fake).run(now=self.now)
+
+        self.assertEqual(fake.requests, [['v1', 'v2', 'v4']])
+        self.assertEqual(result, {'requests': 1, 'quota_units': 1, 'videos': 2, 'missing': 1})
+        self.assertEqual(self._view_counts(), {
+            ('u1', 'v1'): 1001, ('u2', 'v1'): 1001, ('u2', 'v2'): 1002, ('u1', 'v3'): 1, ('u1', 'v4'): 1
+        })
+
+        # 삭제된 영상도 갱신 일시가 기록되어 바로 재조회하지 않음
+        SavedVideoStatsRefresher(self.app, fetch_statistics=fake).run(now=self.now)
+        self.assertEqual(len(fake.requests), 1)
+
+    def test_quota_budget_and_oldest_first(self):
+        """예산만큼만 50개 단위로 요청하고, 오래된 영상부터 갱신하는지 확인"""
+        for i in range(200):
+            self._save('u1', f'v{i}', stats_updated_at=self.now - timedelta(days=2, minutes=i))
+        db.session.commit()
+
+        fake = FakeStatistics()
+        result = SavedVideoStatsRefresher(self.app, fetch_statistics=fake).run(now=self.now)
+
+        self.assertEqual([len(batch) for batch in fake.requests], [50, 50, 50])
+        self.assertEqual(result['videos'], 150)
+        self.assertEqual(fake.requests[0][0], 'v199')
+
+    def test_stops_on_quota_error(self):
+        """할당량 오류 시 중단하고 이미 반영한 배치는 유지하는지 확인"""
+        for i in range(120):
+            self._save('u1', f'v{i}')
+        db.session.commit()
+
+        fake = FakeStatistics(fail_after=1)
+        result = SavedVideoStatsRefresher(self.app, fetch_statistics=fake).run(now=self.now)
+
+        self.assertEqual(result['requests'], 1)
+        self.assertEqual(SavedVideo.query.filter(SavedVideo.stats_updated_at.isnot(None)).count(), 50)
+
+    def test_retries_charged_to_budget(self):
+        """재시도 요청도 예산에서 차감해 실행당 예산을 넘겨 요청하지 않는지 확인"""
+        for i in range(200):
+            self._save('u1', f'v{i}')
+        db.session.commit()
+
+        youtube = MagicMock()
+        execute = youtube.videos.return_value.list.return_value.execute
+        execute.side_effect = [Exception('connection reset'), {'items': []},
+                               Exception('connection reset'), {'items': []}]
+        with patch.object(search, 'quota_manager', None), patch.object(search.time, 'sleep'), \
+                patch('services.saved_video_stats_service.get_youtube_api_service', return_value=youtube):
+            result = SavedVideoStatsRefresher(self.app).run(now=self.now)
+
+        # 첫 배치 2회(재시도 1회) + 둘째 배치는 남은 예산 1회만 시도하고 중단
+        self.assertEqual(execute.call_count, 3)
+        self.assertEqual(result['quota_units'], 3)
+        self.assertEqual(result['requests'], 1)
+        self.assertEqual(SavedVideo.query.filter(SavedVideo.stats_updated_at.isnot(None)).count(), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# test_saved_videos.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, SavedVideo
+from common_utils.saved_videos import (
+    get_saved_videos_page, bulk_save_videos, bulk_delete_videos, bulk_update_notes
+)
+
+
+def make_video_data(video_id, **overrides):
+    data = {
+        'video_id': video_id,
+        'video_title': f'영상 {video_id}',
+        'channel_title': '테스트 채널',
+        'video_url': f'https://www.youtube.com/shorts/{video_id}',
+        'published_at': '2026-01-01T00:00:00Z',
+    }
+    data.update(overrides)
+    return data
+
+
+class TestSavedVideos(DatabaseTestCase):
+    """저장된 영상 키셋 페이지네이션 / 일괄 작업 테스트"""
+
+    users = ('u1', 'u2')
+
+    def _add_video(self, user_id, video_id, saved_at):
+        video = SavedVideo(user_id=user_id, video_id=video_id, video_title=video_id, channel_title='채널',
+                           video_url=f'https://youtu.be/{video_id}', saved_at=saved_at)
+        db.session.add(video)
+        return video
+
+    def test_keyset_pages_cover_all_videos(self):
+        """같은 saved_at을 가진 영상이 있어도 페이지 사이에 누락/중복이 없는지 확인"""
+        base = datetime(2026, 1, 1)
+        for i in range(7):
+            # 두 개씩 같은 저장 시각
+            self._add_video('u1', f'v{i}', base + timedelta(minutes=i // 2))
+        self._add_video('u2', 'other', base)
+        db.session.commit()
+
+        seen, cursor = [], None
+        while True:
+            videos, cursor = get_saved_videos_page('u1', cursor, per_page=3)
+            seen.extend(video.video_id for video in videos)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, ['v6', 'v5', 'v4', 'v3', 'v2', 'v1', 'v0'])
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 ValueError로 처리되는지 확인"""
+        with self.assertRaises(ValueError):
+            get_saved_videos_page('u1', 'not-a-cursor')
+
+    def test_bulk_save_skips_duplicates_and_invalid(self):
+        """이미 저장된 영상과 필수값 누락 항목을 건너뛰고 나머지를 저장하는지 확인"""
+        self._add_video('u1', 'v1', datetime(2026, 1, 1))
+        db.session.commit()
+
+        result = bulk_save_videos('u1', [
+            make_video_data('v1'),
+            make_video_data('v2'),
+            make_video_data('v2'),
+            make_video_data('v3', video_title=''),
+            make_video_data('v4'),
+        ])
+        db.session.commit()
+
+        self.assertEqual([video.video_id for video in result['saved']], ['v2', 'v4'])
+        self.assertEqual(result['duplicates'], ['v1'])
+        self.assertEqual(result['invalid'], [{'index': 3, 'message': 'video_title는 필수 입력값입니다.'}])
+        self.assertEqual(SavedVideo.query.filter_by(user_id='u1').count(), 3)
+
+    def test_bulk_delete_and_notes_only_touch_own_videos(self):
+        """다른 사용자의 영상은 일괄 삭제/메모 수정 대상에서 제외되는지 확인"""
+        for i in range(3):
+            self._add_video('u1', f'v{i}', datetime(2026, 1, 1))
+        self._add_video('u2', 'x', datetime(2026, 1, 1))
+        db.session.commit()
+        mine = [video.id for video in SavedVideo.query.filter_by(user_id='u1').order_by(SavedVideo.id)]
+        other = SavedVideo.query.filter_by(user_id='u2').one().id
+
+        updated, not_found = bulk_update_notes('u1', {mine[0]: '메모1', mine[1]: '메모2', other: '침범'})
+        deleted = bulk_delete_videos('u1', [mine[2], other])
+        db.session.commit()
+        db.session.expire_all()
+
+        self.assertEqual(updated, [mine[0], mine[1]])
+        self.assertEqual(not_found, [other])
+        self.assertEqual(deleted, 1)
+        self.assertEqual(db.session.get(SavedVideo, mine[1]).notes, '메모2')
+        self.assertIsNone(db.session.get(SavedVideo, other).notes)
+        self.assertIsNone(db.session.get(SavedVideo, mine[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
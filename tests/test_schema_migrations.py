@@ -0,0 +1,86 @@
+# test_schema_migrations.py
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.micro_benchmarks import measure_schema_boot
+import schema_migrations
+from schema_migrations import create_migration_app, run_migrations, get_pending_migrations
+from models import db, SchemaVersion
+
+
+class TestSchemaMigrations(unittest.TestCase):
+    """버전 기반 스키마 마이그레이션 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (파일 SQLite)"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.temp_dir.name, 'test.db')
+        with patch.dict(os.environ, {'DATABASE_URL': f'sqlite:///{db_path}'}):
+            self.app = create_migration_app()
+
+    def tearDown(self):
+        """테스트 정리"""
+        with self.app.app_context():
+            db.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def test_applies_each_version_once(self):
+        """마이그레이션이 한 번만 적용되고 버전이 기록되는지 확인"""
+        versions = [version for version, _, _ in schema_migrations.MIGRATIONS]
+        self.assertEqual(get_pending_migrations(self.app, db),
+                         [(version, name) for version, name, _ in schema_migrations.MIGRATIONS])
+
+        self.assertEqual(run_migrations(self.app, db)['applied'], versions)
+        self.assertEqual(run_migrations(self.app, db)['applied'], [])
+
+        with self.app.app_context():
+            self.assertEqual(sorted(row.version for row in SchemaVersion.query), versions)
+        self.assertEqual(get_pending_migrations(self.app, db), [])
+
+    def test_new_migration_runs_after_existing(self):
+        """추가된 마이그레이션만 순서대로 실행되는지 확인"""
+        run_migrations(self.app, db)
+
+        calls = []
+        next_version = schema_migrations.MIGRATIONS[-1][0] + 1
+        migrations = schema_migrations.MIGRATIONS + [(next_version, 'add_something', lambda app, db: calls.append(next_version))]
+        with patch.object(schema_migrations, 'MIGRATIONS', migrations):
+            self.assertEqual(run_migrations(self.app, db)['applied'], [next_version])
+
+        self.assertEqual(calls, [next_version])
+
+    def test_failed_migration_is_not_recorded(self):
+        """실패한 마이그레이션은 기록되지 않아 다음 실행에서 재시도되는지 확인"""
+        def failing(app, db):
+            raise RuntimeError('실패')
+
+        with patch.object(schema_migrations, 'MIGRATIONS', [(1, 'failing', failing)]):
+            with self.assertRaises(RuntimeError):
+                run_migrations(self.app, db)
+            self.assertEqual(get_pending_migrations(self.app, db), [(1, 'failing')])
+
+    def test_channel_title_lower_index(self):
+        """로컬 채널 검색의 lower(title) 조건이 인덱스를 사용하는지 확인"""
+        run_migrations(self.app, db)
+
+        with self.app.app_context():
+            plan = db.session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM channel WHERE lower(title) = 'cooking'"
+            )).fetchall()
+        self.assertIn('idx_channel_title_lower', ' '.join(str(row) for row in plan))
+
+    def test_boot_schema_work_measurement(self):
+        """마이그레이션 확인이 기존 워커 부팅 스키마 작업보다 SQL 문이 적은지 확인 (측정: benchmarks.micro_benchmarks)"""
+        result = measure_schema_boot(self.app)
+        self.assertLess(result['upgraded_statements'], result['legacy_statements'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# test_search_job_service.py
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_test_case import DatabaseTestCase
+from models import db, SearchJob
+from services.search_job_service import SearchJobService
+
+
+class ManualExecutor:
+    """제출된 작업을 직접 실행할 때까지 보관하는 실행기"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args):
+        self.tasks.append((fn, args))
+
+    def run_all(self):
+        while self.tasks:
+            fn, args = self.tasks.pop(0)
+            fn(*args)
+        # 작업은 별도 앱 컨텍스트(세션)에서 저장되므로 조회 전 캐시 만료
+        db.session.expire_all()
+
+
+class TestSearchJobService(DatabaseTestCase):
+    """비동기 검색 작업 테스트"""
+
+    users = ('u1', 'u2')
+
+    def setUp(self):
+        """테스트 세트업 (인메모리 SQLite, 직접 실행하는 실행기)"""
+        super().setUp()
+        self.executor = ManualExecutor()
+        self.service = SearchJobService(
+            self.app, self.executor,
+            error_formatter=lambda e: {"status": "quota_exceeded", "message": str(e)}
+        )
+        self.params = {'keyword': 'test', 'max_results': 20}
+
+    def test_job_lifecycle(self):
+        """작업 등록 직후 pending, 실행 후 결과가 조회되는지 확인"""
+        cached = []
+        job = self.service.submit('u1', 'key1', self.params, lambda **params: [{'id': 'v1'}],
+                                  on_success=cached.append)
+
+        self.assertEqual(self.service.get_job_response(job.id, 'u1'), {"status": "pending", "job_id": job.id})
+
+        self.executor.run_all()
+
+        response = self.service.get_job_response(job.id, 'u1')
+        self.assertEqual(response['status'], 'success')
+        self.assertEqual(response['results'], [{'id': 'v1'}])
+        self.assertEqual(response['count'], 1)
+        self.assertEqual(cached, [[{'id': 'v1'}]])
+
+    def test_error_uses_formatter(self):
+        """검색 실패 시 오류 응답 형식이 유지되는지 확인"""
+        def failing_search(**params):
+            raise Exception('quotaExceeded')
+
+        job = self.service.submit('u1', 'key1', self.params, failing_search)
+        self.executor.run_all()
+
+        self.assertEqual(self.service.get_job_response(job.id, 'u1'),
+                         {"status": "quota_exceeded", "message": 'quotaExceeded', "job_id": job.id})
+
+    def test_duplicate_submit_reuses_active_job(self):
+        """같은 조건의 진행 중 작업은 새로 만들지 않는지 확인"""
+        search = lambda **params: []
+        first = self.service.submit('u1', 'key1', self.params, search)
+        second = self.service.submit('u1', 'key1', self.params, search)
+        other_user = self.service.submit('u2', 'key1', self.params, search)
+
+        self.assertEqual(first.id, second.id)
+        self.assertNotEqual(first.id, other_user.id)
+        self.assertEqual(len(self.executor.tasks), 2)
+
+    def test_other_users_job_is_hidden(self):
+        """다른 사용자의 작업은 조회되지 않는지 확인"""
+        job = self.service.submit('u1', 'key1', self.params, lambda **params: [])
+        self.assertIsNone(self.service.get_job_response(job.id, 'u2'))
+        self.assertIsNone(self.service.get_job_response('missing', 'u1'))
+
+    def test_stale_job_reported_as_timeout(self):
+        """제한 시간이 지난 미완료 작업은 오류로 응답하는지 확인"""
+        job = self.service.submit('u1', 'key1', self.params, lambda **params: [])
+        SearchJob.query.filter_by(id=job.id).update(
+            {'created_at': datetime.utcnow() - timedelta(seconds=self.service.job_timeout + 1)}
+        )
+        db.session.commit()
+
+        self.assertEqual(self.service.get_job_response(job.id, 'u1')['status'], 'error')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# test_search_replay.py
+import unittest
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.youtube_replay import ReplayYouTube, YouTubeCorpus
+from benchmarks.search_benchmark import run_scenario, format_report
+
+
+class TestYouTubeCorpus(unittest.TestCase):
+    """재생 말뭉치 응답 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.corpus = YouTubeCorpus.synthetic(channels=3, videos_per_channel=30, seed=1)
+
+    def test_channel_search_filters_and_pages(self):
+        """채널 검색이 게시 시각 필터/최신순/페이지 토큰을 따르는지 확인"""
+        published_after = (self.corpus.now - timedelta(days=2)).isoformat("T") + "Z"
+        params = {'channelId': 'UCbench0000', 'order': 'date', 'maxResults': 5, 'publishedAfter': published_after}
+        first = self.corpus.search(params)
+        second = self.corpus.search(dict(params, pageToken=first['nextPageToken']))
+
+        ids = [item['id']['videoId'] for item in first['items'] + second['items']]
+        self.assertEqual(len(set(ids)), len(ids))
+        published = [self.corpus.videos[video_id]['published_at'] for video_id in ids]
+        self.assertEqual(published, sorted(published, reverse=True))
+        self.assertTrue(all(p >= self.corpus.now - timedelta(days=2) for p in published))
+
+    def test_keyword_search_short_by_views(self):
+        """키워드 검색이 짧은 영상만 조회수순으로 반환하는지 확인"""
+        response = self.corpus.search({'q': '요리', 'order': 'viewCount', 'videoDuration': 'short', 'maxResults': 50})
+        videos = [self.corpus.videos[item['id']['videoId']] for item in response['items']]
+
+        self.assertTrue(videos)
+        self.assertTrue(all('요리' in video['keywords'] and video['duration'] < 240 for video in videos))
+        views = [video['viewCount'] for video in videos]
+        self.assertEqual(views, sorted(views, reverse=True))
+
+    def test_save_load_keeps_relative_age(self):
+        """저장 후 다른 시각에 불러와도 영상 나이가 유지되는지 확인"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'fixture.json')
+            self.corpus.save(path)
+            later = datetime.utcnow() + timedelta(days=30)
+            loaded = YouTubeCorpus.load(path, now=later)
+
+        video_id = next(iter(self.corpus.videos))
+        self.assertEqual(later - loaded.videos[video_id]['published_at'],
+                         self.corpus.now - self.corpus.videos[video_id]['published_at'])
+
+    def test_replay_counts_quota(self):
+        """재생 클라이언트가 엔드포인트별 호출 수와 할당량을 세는지 확인"""
+        youtube = ReplayYouTube(self.corpus)
+        response = youtube.search().list(part='id', channelId='UCbench0001', maxResults=3).execute()
+        video_ids = ','.join(item['id']['videoId'] for item in response['items'])
+        videos = youtube.videos().list(part='snippet', id=video_ids).execute()
+
+        self.assertEqual(len(videos['items']), 3)
+        self.assertEqual(youtube.calls, {'search.list': 1, 'videos.list': 1})
+        self.assertEqual(youtube.quota_units, 101)
+
+
+class TestSearchBenchmark(unittest.TestCase):
+    """검색 엔진 재생 벤치마크 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.corpus = YouTubeCorpus.synthetic(channels=5, videos_per_channel=20, seed=7)
+
+    def test_engines_report_same_quota(self):
+        """시스템/사용자 엔진이 같은 시나리오에서 같은 호출 수와 결과를 보고하는지 확인"""
+        rows = [run_scenario(engine, 'channels-5', self.corpus, repeat=1) for engine in ('system', 'user')]
+
+        for row in rows:
+            self.assertEqual(row['calls'], {'search.list': 5, 'videos.list': 5})
+            self.assertEqual(row['quota_units'], 505)
+            self.assertGreater(row['shorts'], 0)
+            self.assertEqual(row['quota_per_short'], round(505 / row['shorts'], 1))
+            self.assertGreater(row['alloc_peak_kb'], 0)
+        self.assertEqual(rows[0]['shorts'], rows[1]['shorts'])
+
+        report = format_report(rows, baseline=rows)
+        self.assertIn('Δwall +0.0%', report)
+
+    def test_keyword_scenario(self):
+        """키워드 시나리오가 키워드 검색 경로를 사용하는지 확인"""
+        row = run_scenario('system', 'keyword', self.corpus, repeat=1)
+        self.assertGreaterEqual(row['calls']['search.list'], 1)
+        self.assertEqual(row['quota_units'], 100 * row['calls']['search.list'] + row['calls']['videos.list'])
+        self.assertGreater(row['shorts'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
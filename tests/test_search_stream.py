@@ -0,0 +1,111 @@
+# test_search_stream.py
+import unittest
+import os
+import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common_utils import search
+from common_utils.search_stream import stream_search, format_sse
+
+
+def parse_events(chunks):
+    """SSE 문자열 목록을 (event, data) 목록으로 변환 (주석 제외)"""
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(':'):
+            continue
+        event_line, data_line = chunk.strip().split('\n')
+        events.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+    return events
+
+
+def make_video(video_id, channel_id, hours_ago):
+    published_at = (datetime.utcnow() - timedelta(hours=hours_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        'id': video_id,
+        'snippet': {'title': '테스트 영상', 'channelTitle': channel_id, 'channelId': channel_id,
+                    'publishedAt': published_at, 'thumbnails': {}},
+        'statistics': {'viewCount': '200000'},
+        'contentDetails': {'duration': 'PT30S'}
+    }
+
+
+class TestStreamSearch(unittest.TestCase):
+    """SSE 검색 스트리밍 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.executor.shutdown(wait=True)
+
+    def test_partial_events_then_ordered_summary(self):
+        """단위별 partial 이벤트 후 최종 done 이벤트가 오는지 확인"""
+        def fake_search(on_progress, keyword):
+            on_progress({'source': 'channel', 'channelId': 'a', 'results': [{'id': 'a1'}]})
+            on_progress({'source': 'channel', 'channelId': 'b', 'results': [{'id': 'b1'}]})
+            return [{'id': 'b1'}, {'id': 'a1'}]
+
+        cached = []
+        events = parse_events(stream_search(self.executor, fake_search, {'keyword': 'x'},
+                                            lambda e: {}, on_success=cached.append))
+
+        self.assertEqual([event for event, _ in events], ['partial', 'partial', 'done'])
+        self.assertEqual(events[0][1]['channelId'], 'a')
+        self.assertEqual(events[1][1]['completed'], 2)
+        self.assertEqual(events[2][1], {"status": "success", "results": [{'id': 'b1'}, {'id': 'a1'}],
+                                        "count": 2, "fromCache": False})
+        self.assertEqual(cached, [[{'id': 'b1'}, {'id': 'a1'}]])
+
+    def test_error_event(self):
+        """검색 실패 시 error 이벤트로 끝나는지 확인"""
+        def failing_search(on_progress):
+            raise Exception('quotaExceeded')
+
+        events = parse_events(stream_search(self.executor, failing_search, {},
+                                            lambda e: {"status": "quota_exceeded", "message": str(e)}))
+
+        self.assertEqual(events, [('error', {"status": "quota_exceeded", "message": 'quotaExceeded'})])
+
+    def test_format_sse(self):
+        """SSE 메시지 형식 확인"""
+        self.assertEqual(format_sse('done', {'count': 1}), 'event: done\ndata: {"count": 1}\n\n')
+
+
+class TestChannelSearchProgress(unittest.TestCase):
+    """get_recent_popular_shorts 채널별 진행 콜백 테스트"""
+
+    def test_progress_per_channel(self):
+        """채널마다 해당 채널 결과로 콜백이 호출되고 최종 결과는 정렬되는지 확인"""
+        videos = {
+            'ch1': [make_video('c1v1', 'ch1', 5)],
+            'ch2': [make_video('c2v1', 'ch2', 1), make_video('c2v2', 'ch2', 3)],
+        }
+        youtube = MagicMock()
+        youtube.search().list.side_effect = lambda **params: MagicMock(execute=lambda: {
+            'items': [{'id': {'videoId': v['id']}} for v in videos[params['channelId']]]
+        })
+        youtube.videos().list.side_effect = lambda **params: MagicMock(execute=lambda: {
+            'items': [v for vs in videos.values() for v in vs if v['id'] in params['id'].split(',')]
+        })
+
+        progress = []
+        with patch.object(search, 'get_youtube_api_service', return_value=youtube), \
+             patch.object(search, 'quota_manager', None):
+            results = search.get_recent_popular_shorts(channel_ids='ch1,ch2', on_progress=progress.append)
+
+        self.assertEqual([(p['channelId'], [v['id'] for v in p['results']]) for p in progress],
+                         [('ch1', ['c1v1']), ('ch2', ['c2v1', 'c2v2'])])
+        self.assertEqual([v['id'] for v in results], ['c2v1', 'c2v2', 'c1v1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
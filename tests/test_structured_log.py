@@ -0,0 +1,105 @@
+# test_structured_log.py
+import unittest
+import os
+import sys
+import logging
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.micro_benchmarks import measure_disabled_log_event
+from common_utils.structured_log import log_event, reset_sampling
+from config.security import SecurityConfig, SensitiveDataFilter
+
+API_KEY = 'AIza' + 'B' * 35
+
+
+class ListHandler(logging.Handler):
+    """기록된 레코드 수집"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class ExplodingValue:
+    """문자열로 바뀌면 실패 (지연 포맷팅 확인용)"""
+
+    def __str__(self):
+        raise AssertionError('비활성 레벨에서 포맷팅됨')
+
+
+class TestStructuredLog(unittest.TestCase):
+    """구조화 로그 테스트"""
+
+    def setUp(self):
+        """테스트 세트업"""
+        reset_sampling()
+        self.logger = logging.getLogger('tests.structured_log')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.handler = ListHandler()
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.logger.removeHandler(self.handler)
+
+    def test_event_format_and_fields(self):
+        """이벤트 이름과 key=value 필드로 기록되고 필드가 레코드에 담기는지 확인"""
+        log_event(self.logger, logging.INFO, 'search.channels.start', channels=3, published_after=None,
+                  params={'q': '요리 영상'})
+
+        record = self.handler.records[0]
+        self.assertEqual(record.getMessage(),
+                         "search.channels.start channels=3 published_after=None params=\"{'q': '요리 영상'}\"")
+        self.assertEqual(record.event, 'search.channels.start')
+        self.assertEqual(record.fields['channels'], 3)
+
+    def test_disabled_level_is_not_formatted(self):
+        """비활성 레벨 이벤트는 필드를 문자열로 만들지 않는지 확인"""
+        log_event(self.logger, logging.DEBUG, 'search.date_filtered', video_id=ExplodingValue())
+        self.assertEqual(self.handler.records, [])
+
+    def test_sampling(self):
+        """sample=N이면 첫 이벤트와 이후 N번마다 한 번씩만 기록되는지 확인"""
+        for i in range(250):
+            log_event(self.logger, logging.INFO, 'search.video_error', sample=100, index=i)
+
+        self.assertEqual([record.fields['index'] for record in self.handler.records], [0, 100, 200])
+        self.assertEqual(self.handler.records[0].fields['sampled'], '1/100')
+
+    def test_disabled_hot_path_cost(self):
+        """결과 수가 늘어도 비활성 레벨 이벤트 비용이 무시할 수준인지 확인 (측정: benchmarks.micro_benchmarks)"""
+        self.assertLess(measure_disabled_log_event(self.logger), 20)
+
+
+class TestSensitiveDataFilter(unittest.TestCase):
+    """로그 마스킹 필터 테스트"""
+
+    def _filtered(self, msg, *args):
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, msg, args, None)
+        SensitiveDataFilter().filter(record)
+        return record.getMessage()
+
+    def test_masks_formatted_args(self):
+        """메시지 템플릿뿐 아니라 인자로 전달된 키도 마스킹되는지 확인"""
+        self.assertEqual(self._filtered('키 사용: %s', API_KEY), '키 사용: ••••[API_KEY]')
+        self.assertEqual(self._filtered('토큰 %s', 'a1' * 20), '토큰 ••••[LONG_KEY]')
+
+    def test_short_messages_untouched(self):
+        """짧은 메시지는 그대로 유지되는지 확인"""
+        self.assertEqual(self._filtered('검색 완료: %d개', 20), '검색 완료: 20개')
+
+    def test_mask_sensitive_data(self):
+        """기존 마스킹 결과와 같은지 확인"""
+        text = f'key={API_KEY} hash={"f" * 40} 일반 텍스트'
+        self.assertEqual(SecurityConfig.mask_sensitive_data(text),
+                         'key=••••[API_KEY] hash=••••[LONG_KEY] 일반 텍스트')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# test_user_search_parallel.py
+import unittest
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+from cryptography.fernet import Fernet
+from flask import Flask
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db, User, UserApiKey, ApiKeyUsage
+import common_utils.key_health as key_health
+from common_utils.user_search import UserSearchService
+from services.user_api_service import UserApiKeyManager
+
+
+class FakeYouTube:
+    """채널별 고정 응답을 돌려주는 YouTube API 대역"""
+
+    def __init__(self, quota_error_channels=(), slow_channels=()):
+        self.quota_error_channels = set(quota_error_channels)
+        self.slow_channels = {channel_id: threading.Event() for channel_id in slow_channels}
+        self.published_at = (datetime.utcnow() - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def search(self):
+        resource = MagicMock()
+        resource.list.side_effect = lambda **params: self._request(self._search, params)
+        return resource
+
+    def videos(self):
+        resource = MagicMock()
+        resource.list.side_effect = lambda **params: self._request(self._videos, params)
+        return resource
+
+    def _request(self, handler, params):
+        request = MagicMock()
+        request.execute.side_effect = lambda: handler(params)
+        return request
+
+    def _search(self, params):
+        channel_id = params['channelId']
+        if channel_id in self.quota_error_channels:
+            raise Exception('quotaExceeded')
+        if channel_id in self.slow_channels:
+            self.slow_channels[channel_id].wait(timeout=5)
+        return {'items': [{'id': {'videoId': f'{channel_id}-v{i}'}} for i in range(2)]}
+
+    def _videos(self, params):
+        return {'items': [{
+            'id': video_id,
+            'snippet': {
+                'title': video_id,
+                'channelTitle': video_id.split('-')[0],
+                'channelId': video_id.split('-')[0],
+                # 채널 간 게시 시각이 같아도 순차 실행과 같은 순서가 나와야 함
+                'publishedAt': self.published_at,
+                'thumbnails': {}
+            },
+            'statistics': {'viewCount': '5000'},
+            'contentDetails': {'duration': 'PT30S'}
+        } for video_id in params['id'].split(',')]}
+
+
+class TestParallelChannelSearch(unittest.TestCase):
+    """채널 기반 검색 병렬화 테스트"""
+
+    def setUp(self):
+        """테스트 세트업 (스레드 간 공유를 위해 파일 SQLite 사용)"""
+        os.environ.setdefault('API_ENCRYPTION_KEY', Fernet.generate_key().decode())
+        key_health._key_health_registry = None
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        manager = UserApiKeyManager('u1')
+        db.session.add(User(id='u1', email='u1@test.com', name='테스터', role='approved'))
+        db.session.add(UserApiKey(user_id='u1', name='개인용', api_key=manager.encrypt_api_key('key-1')))
+        db.session.commit()
+
+        self.channels = [f'ch{i}' for i in range(6)]
+
+    def tearDown(self):
+        """테스트 정리"""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        self.temp_dir.cleanup()
+        key_health._key_health_registry = None
+
+    def _search(self, youtube, concurrency, on_progress=None):
+        with patch('googleapiclient.discovery.build', return_value=youtube), \
+             patch('common_utils.user_search.CHANNEL_SEARCH_CONCURRENCY', concurrency):
+            return UserSearchService('u1').search_recent_popular_shorts(
+                min_views=1000, days_ago=5, max_results=50, channel_ids=self.channels,
+                on_progress=on_progress
+            )
+
+    def test_parallel_matches_serial_results(self):
+        """병렬 실행 결과가 순차 실행과 같고 사용량이 모두 기록되는지 확인"""
+        serial = self._search(FakeYouTube(), concurrency=1)
+        parallel = self._search(FakeYouTube(), concurrency=4)
+
+        self.assertEqual(len(serial), 12)
+        self.assertEqual([v['id'] for v in parallel], [v['id'] for v in serial])
+
+        # 채널당 service.build 2회 + search.list + videos.list, 두 번 실행
+        expected_calls = len(self.channels) * 4 * 2
+        self.assertEqual(ApiKeyUsage.query.count(), expected_calls)
+        db.session.expire_all()
+        self.assertEqual(UserApiKey.query.one().usage_count, expected_calls)
+
+    def test_progress_reports_fastest_channel_first(self):
+        """병렬 실행 시 먼저 끝난 채널 결과가 먼저 전달되는지 확인"""
+        youtube = FakeYouTube(slow_channels={'ch0'})
+        progress = []
+
+        def on_progress(event):
+            progress.append(event['channelId'])
+            # 나머지 채널이 모두 끝나면 느린 채널 진행
+            if len(progress) == len(self.channels) - 1:
+                youtube.slow_channels['ch0'].set()
+
+        results = self._search(youtube, concurrency=len(self.channels), on_progress=on_progress)
+
+        self.assertEqual(len(progress), len(self.channels))
+        self.assertEqual(progress[-1], 'ch0')
+        self.assertEqual(len(results), 12)
+
+    def test_quota_error_message_preserved(self):
+        """한 채널의 할당량 오류가 순차 실행과 같은 메시지로 전달되는지 확인"""
+        with patch('services.user_api_service.time.sleep'):
+            with self.assertRaises(Exception) as serial_error:
+                self._search(FakeYouTube(quota_error_channels={'ch3'}), concurrency=1)
+            with self.assertRaises(Exception) as parallel_error:
+                self._search(FakeYouTube(quota_error_channels={'ch3'}), concurrency=4)
+
+        self.assertEqual(str(parallel_error.exception), str(serial_error.exception))
+        self.assertIn('할당량', str(parallel_error.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
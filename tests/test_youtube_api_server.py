@@ -0,0 +1,130 @@
+# test_youtube_api_server.py
+import unittest
+import os
+import sys
+import json
+import io
+import contextlib
+from urllib.request import Request, urlopen
+from unittest.mock import patch
+
+from googleapiclient.errors import HttpError
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.youtube_replay import YouTubeCorpus, uploads_playlist_id
+from benchmarks.youtube_api_server import YouTubeStandInServer
+from common_utils import search
+import common_utils.key_health as key_health
+
+
+class TestYouTubeStandInServer(unittest.TestCase):
+    """로컬 YouTube API 대역 서버 테스트 (실제 googleapiclient HTTP 경로 사용)"""
+
+    def setUp(self):
+        """테스트 세트업 (빈 포트로 서버 시작, 앱 클라이언트가 서버를 바라보도록 설정)"""
+        self.server = YouTubeStandInServer(YouTubeCorpus.synthetic(channels=3, videos_per_channel=30, seed=3)).start()
+        self.env_patcher = patch.dict(os.environ, {'YOUTUBE_API_BASE_URL': self.server.base_url})
+        self.env_patcher.start()
+        key_health._key_health_registry = None
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.env_patcher.stop()
+        self.server.stop()
+        key_health._key_health_registry = None
+
+    def _control(self, name, payload):
+        request = Request(f"{self.server.base_url}/_standin/{name}", data=json.dumps(payload).encode(),
+                          headers={'Content-Type': 'application/json'}, method='POST')
+        with urlopen(request) as response:
+            return json.load(response)
+
+    def _error_reason(self, call):
+        with self.assertRaises(HttpError) as ctx:
+            call()
+        return ctx.exception.resp.status, ctx.exception.error_details[0]['reason'], str(ctx.exception)
+
+    def test_search_pagination_and_quota(self):
+        """search.list 페이지 토큰을 따라가고 키별 할당량이 차감되는지 확인"""
+        youtube = search.build_youtube_client('key-a')
+        first = youtube.search().list(part='id', channelId='UCbench0000', maxResults=20).execute()
+        second = youtube.search().list(part='id', channelId='UCbench0000', maxResults=20,
+                                       pageToken=first['nextPageToken']).execute()
+        video_ids = [item['id']['videoId'] for item in first['items'] + second['items']]
+        videos = youtube.videos().list(part='snippet,statistics', id=','.join(video_ids[:50])).execute()
+
+        self.assertEqual(len(set(video_ids)), 30)
+        self.assertNotIn('nextPageToken', second)
+        self.assertEqual(len(videos['items']), 30)
+        self.assertEqual(self.server.state.stats()['quota_used'], {'key-a': 201})
+
+    def test_channels_and_playlist_items(self):
+        """channels.list 업로드 재생목록으로 playlistItems.list를 조회할 수 있는지 확인"""
+        youtube = search.build_youtube_client('key-a')
+        channel = youtube.channels().list(part='contentDetails', forHandle='@benchchannel1').execute()['items'][0]
+        uploads = channel['contentDetails']['relatedPlaylists']['uploads']
+        items = youtube.playlistItems().list(part='contentDetails', playlistId=uploads, maxResults=50).execute()
+
+        self.assertEqual(uploads, uploads_playlist_id('UCbench0001'))
+        self.assertEqual(len(items['items']), 30)
+
+    def test_quota_exceeded_payload(self):
+        """키 할당량 초과 시 실제와 같은 quotaExceeded 오류가 나고 앱이 할당량 오류로 인식하는지 확인"""
+        self._control('config', {'key_quotas': {'key-a': 150}})
+        youtube = search.build_youtube_client('key-a')
+        youtube.search().list(part='id', q='요리').execute()
+
+        status, reason, message = self._error_reason(lambda: youtube.search().list(part='id', q='요리').execute())
+        self.assertEqual((status, reason), (403, 'quotaExceeded'))
+        self.assertTrue(search._is_quota_or_key_error(message.lower()))
+        self.assertTrue(key_health.is_quota_error(message))
+        # 다른 키는 영향 없음
+        search.build_youtube_client('key-b').videos().list(part='id', id='vid0000x0000').execute()
+
+    def test_rate_limit_and_injected_errors(self):
+        """초당 요청 제한, 키별 강제 오류, 잘못된 키 응답 확인"""
+        self._control('config', {'rate_limit': 2, 'fail_keys': {'key-bad': 'keyInvalid'}})
+        youtube = search.build_youtube_client('key-a')
+        youtube.videos().list(part='id', id='vid0000x0000').execute()
+        youtube.videos().list(part='id', id='vid0000x0000').execute()
+
+        status, reason, _ = self._error_reason(lambda: youtube.videos().list(part='id', id='vid0000x0000').execute())
+        self.assertEqual((status, reason), (403, 'rateLimitExceeded'))
+
+        bad = search.build_youtube_client('key-bad')
+        status, reason, _ = self._error_reason(lambda: bad.videos().list(part='id', id='x').execute())
+        self.assertEqual((status, reason), (400, 'badRequest'))
+        self.assertEqual(self.server.state.stats()['errors'], {'rateLimitExceeded': 1, 'keyInvalid': 1})
+
+    def test_search_fails_over_to_next_key(self):
+        """첫 키 할당량이 소진되면 검색이 다음 키로 전환해 결과를 반환하는지 확인"""
+        self._control('config', {'key_quotas': {'key-a': 0}})
+        with patch.dict(os.environ, {'YOUTUBE_API_KEY': 'key-a,key-b'}), \
+             contextlib.redirect_stdout(io.StringIO()):
+            search.init_quota_manager(force=True)
+            results = search.get_recent_popular_shorts(min_views=1, days_ago=10, max_results=10,
+                                                       channel_ids=['UCbench0000', 'UCbench0001'])
+
+        stats = self.server.state.stats()
+        self.assertTrue(results)
+        self.assertEqual(stats['errors'], {'quotaExceeded': 1})
+        self.assertEqual(stats['quota_used'], {'key-b': 202})
+
+    def test_clients_built_once_per_key_after_failover(self):
+        """키 전환 후 이어지는 검색이 클라이언트를 다시 만들지 않고 키별로 재사용하는지 확인"""
+        self._control('config', {'key_quotas': {'key-a': 0}})
+        with patch.dict(os.environ, {'YOUTUBE_API_KEY': 'key-a,key-b'}), \
+             patch.object(search, 'build_youtube_client', wraps=search.build_youtube_client) as build, \
+             contextlib.redirect_stdout(io.StringIO()):
+            search.init_quota_manager(force=True)
+            for _ in range(3):
+                self.assertTrue(search.get_recent_popular_shorts(min_views=1, days_ago=10, max_results=10,
+                                                                 channel_ids=['UCbench0000', 'UCbench0001']))
+
+        self.assertEqual([call.args[0] for call in build.call_args_list], ['key-a', 'key-b'])
+
+
+if __name__ == '__main__':
+    unittest.main()